@@ -0,0 +1,123 @@
+"""
+Project Entity Model Benchmark
+Builds a synthetic project (see bench_file_loading.build_project), loads it eagerly and compares
+ProjectData holding plain dicts vs __slots__ entities (models.entities):
+retained memory of the loaded data, and chapter-by-number / character-by-name lookup cost
+(the old linear scan vs the ProjectData indexes).
+
+Usage:
+    python bench_entities.py --files 2000 --scenes 10 --lookups 20000
+"""
+
+import sys
+import os
+import argparse
+import gc
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_file_loading import build_project
+from models.project_data import ProjectData
+from services.file_service import FileService
+from utils.file_utils import normalize_character_name
+
+
+def load_raw(root):
+    """Plain dicts as FileService returns them (eager chapter bodies)."""
+    service = FileService(root, lazy_chapters=False)
+    return {
+        "synopsis": {"title": "bench", "chapters": {}},
+        "characters": service.load_characters(),
+        "chapters": service.load_chapters(),
+    }
+
+
+def measure_memory(root, typed):
+    """Bytes still allocated after loading into ProjectData (dict loading garbage excluded)."""
+    gc.collect()
+    tracemalloc.start()
+    project_data = ProjectData(str(root), typed_entities=typed)
+    project_data.load_data(load_raw(root))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, project_data
+
+
+def linear_chapter(chapters, number):
+    for chapter in chapters:
+        if chapter.get("chapter_number") == number:
+            return chapter
+    return None
+
+
+def linear_character(characters, name):
+    wanted = normalize_character_name(name)
+    for character in characters:
+        if normalize_character_name(character.get("name", "")) == wanted:
+            return character
+    return None
+
+
+def time_lookups(func, keys):
+    started = time.perf_counter()
+    for key in keys:
+        func(key)
+    return (time.perf_counter() - started) / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProjectData entity model benchmark (dicts vs __slots__ entities)")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--scenes", type=int, default=10, help="scenes per episode file")
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="bench_entities_"))
+    root = base / "project"
+    try:
+        num_characters, num_episodes = build_project(root, args.files, args.scenes)
+
+        dict_bytes, dict_data = measure_memory(root, typed=False)
+        entity_bytes, entity_data = measure_memory(root, typed=True)
+
+        print("=" * 72)
+        print(f"Entity model benchmark: {num_characters} characters, {num_episodes} episodes "
+              f"x {args.scenes} scenes")
+        print("=" * 72)
+        print(f"{'representation':<20}{'retained':>14}{'per entity':>14}")
+        entities = num_characters + num_episodes
+        for label, size in (("dicts", dict_bytes), ("slots entities", entity_bytes)):
+            print(f"{label:<20}{size / (1024 * 1024):>12.1f}MB{size / entities:>13.0f}B")
+        print(f"{'saved':<20}{(dict_bytes - entity_bytes) / (1024 * 1024):>12.1f}MB"
+              f"{(1 - entity_bytes / dict_bytes) * 100:>13.1f}%")
+
+        rng = random.Random(0)
+        chapter_keys = [rng.randint(1, num_episodes) for _ in range(args.lookups)]
+        character_keys = [f"인물{rng.randint(1, num_characters)}" for _ in range(args.lookups)]
+        chapters = dict_data.get_chapters()
+        characters = dict_data.get_characters()
+
+        print()
+        print(f"{'lookup':<28}{'linear scan':>14}{'indexed':>14}{'speedup':>10}")
+        rows = (
+            ("chapter by number",
+             lambda n: linear_chapter(chapters, n), entity_data.get_chapter_by_number, chapter_keys),
+            ("character by name",
+             lambda n: linear_character(characters, n), entity_data.get_character_by_name, character_keys),
+        )
+        for label, linear, indexed, keys in rows:
+            before = time_lookups(linear, keys)
+            after = time_lookups(indexed, keys)
+            print(f"{label:<28}{before * 1e6:>12.2f}us{after * 1e6:>12.2f}us{before / after:>9.1f}x")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
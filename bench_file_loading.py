@@ -0,0 +1,162 @@
+"""
+Project File Loading Benchmark
+Builds a synthetic project (character profiles, character details and episode files under
+scenes/) and times FileService.load_characters / load_character_details / load_chapters
+with sequential reads vs the shared I/O thread pool, on a cold and a warm OS page cache.
+
+Usage:
+    python bench_file_loading.py --files 500 --workers 8 --repeat 5
+"""
+
+import sys
+import os
+import argparse
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.file_service import FileService
+from services.project_index import ProjectIndex
+from utils.file_utils import get_numbered_character_profile_filename, get_numbered_character_detail_filename
+from utils.parallel_io import set_io_workers
+
+
+def build_project(root, num_files, scenes_per_episode):
+    """Synthetic project: 20% profiles, 20% details, 60% episodes split over three act folders."""
+    num_characters = max(1, num_files // 5)
+    num_episodes = max(1, num_files - 2 * num_characters)
+
+    characters_dir = root / "characters"
+    details_dir = root / "02_characters" / "details"
+    characters_dir.mkdir(parents=True)
+    details_dir.mkdir(parents=True)
+    for i in range(1, num_characters + 1):
+        name = f"인물{i}"
+        profile = {
+            "name": name,
+            "age": 30 + i % 40,
+            "gender": "남성" if i % 2 else "여성",
+            "personality": "침착하고 신중한 성격. " * 20,
+            "background": "벤치마크용 인물 배경 설명입니다. " * 40,
+            "image_generation_prompts": {},
+        }
+        detail = {
+            "name": name,
+            "appearance": "벤치마크용 외모 묘사입니다. " * 30,
+            "relationships": [{"name": f"인물{j}", "relation": "지인"} for j in range(1, 6)],
+        }
+        with open(characters_dir / get_numbered_character_profile_filename(i, name), "w", encoding="utf-8") as f:
+            json.dump(profile, f, ensure_ascii=False, indent=2)
+        with open(details_dir / get_numbered_character_detail_filename(i, name), "w", encoding="utf-8") as f:
+            json.dump(detail, f, ensure_ascii=False, indent=2)
+
+    for i in range(1, num_episodes + 1):
+        act = (i - 1) * 3 // num_episodes + 1
+        act_dir = root / "scenes" / f"{act}막"
+        act_dir.mkdir(parents=True, exist_ok=True)
+        episode = {
+            "metadata": {"episode": i, "episode_title": f"제목{i}", "act": act, "total_scenes": scenes_per_episode},
+            "episode_info": {"characters": [f"인물{i % num_characters + 1}"], "core_emotion": "긴장"},
+            "scenes": [
+                {
+                    "scene_number": s,
+                    "title": f"장면 {s}",
+                    "script": "벤치마크 대본 문장입니다. " * 60,
+                    "image_prompt": "cinematic still, warm light, " * 10,
+                }
+                for s in range(1, scenes_per_episode + 1)
+            ],
+            "key_objects": ["편지", "열쇠"],
+        }
+        with open(act_dir / f"EP{i:03d}_제목{i}.json", "w", encoding="utf-8") as f:
+            json.dump(episode, f, ensure_ascii=False, indent=2)
+
+    return num_characters, num_episodes
+
+
+def drop_page_cache(root):
+    """Ask the OS to evict the project files from the page cache (best effort, no-op on tmpfs)."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in root.rglob("*.json"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def load_all(root, index_path):
+    """One project open: the three bulk loaders on a fresh FileService."""
+    index = ProjectIndex(index_path) if index_path else None
+    service = FileService(root, index=index, lazy_chapters=False)
+    started = time.perf_counter()
+    characters = service.load_characters()
+    details = service.load_character_details()
+    chapters = service.load_chapters()
+    wall = time.perf_counter() - started
+    if index is not None:
+        index.close()
+    return wall, len(characters) + len(details) + len(chapters)
+
+
+def run(root, workers, cache, repeat, index_path):
+    """Median wall time of `repeat` project opens."""
+    set_io_workers(workers)
+    load_all(root, index_path)  # warm-up (thread pool, imports, index rows)
+    timings = []
+    loaded = 0
+    for _ in range(repeat):
+        if cache == "cold":
+            drop_page_cache(root)
+        wall, loaded = load_all(root, index_path)
+        timings.append(wall)
+    return statistics.median(timings), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project file loading benchmark (sequential vs thread pool)")
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--scenes", type=int, default=10, help="scenes per episode file")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dir", default="", help="build the project here (default: temp dir; use a real disk for cold runs)")
+    parser.add_argument("--with-index", action="store_true", help="also time with a project index (warm SQLite rows)")
+    args = parser.parse_args()
+
+    base = Path(args.dir) if args.dir else Path(tempfile.mkdtemp(prefix="bench_files_"))
+    root = base / "project"
+    if root.exists():
+        shutil.rmtree(root)
+    num_characters, num_episodes = build_project(root, args.files, args.scenes)
+    total_mb = sum(p.stat().st_size for p in root.rglob("*.json")) / (1024 * 1024)
+
+    print("=" * 72)
+    print(f"File loading benchmark: {num_characters} profiles, {num_characters} details, "
+          f"{num_episodes} episodes ({total_mb:.1f} MB)")
+    print("=" * 72)
+    print(f"{'cache':<8}{'index':<8}{'workers':>8}{'files':>8}{'median':>12}{'speedup':>10}")
+
+    index_modes = [None, base / "index.sqlite3"] if args.with_index else [None]
+    try:
+        for index_path in index_modes:
+            for cache in ("cold", "warm"):
+                baseline = None
+                for workers in (1, args.workers):
+                    wall, loaded = run(root, workers, cache, args.repeat, index_path)
+                    baseline = baseline or wall
+                    print(f"{cache:<8}{'yes' if index_path else 'no':<8}{workers:>8}{loaded:>8}"
+                          f"{wall * 1000:>10.1f}ms{baseline / wall:>9.2f}x")
+    finally:
+        if not args.dir:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+LLM Pipeline Throughput Benchmark
+Drives ContentGenerator (scripts, scenes, image prompts, whole series) against the mock
+provider and compares sequential calls with the concurrent batch engine / job scheduler.
+No API credits used.
+
+Usage:
+    python bench_llm_pipeline.py --chapters 10 --characters 4 --latency-ms 800 --concurrency 4
+"""
+
+import sys
+import os
+import argparse
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.llm_service import LLMService
+from services.content_generator import ContentGenerator
+
+
+class BenchConfig:
+    """In-memory config (keeps the user's ~/.senior_contents_config.json untouched)."""
+
+    def __init__(self, values):
+        self._values = dict(values)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key, value):
+        self._values[key] = value
+
+
+def build_config(args):
+    """Mock provider config without response cache or rate limits."""
+    return BenchConfig({
+        "provider": "mock",
+        "llm_cache_enabled": False,
+        "llm_rate_limits": {},
+        "llm_concurrency": args.concurrency,
+        "llm_log_token_usage": False,
+        "llm_retry": {"max_attempts": 4, "base_delay": 0.05, "max_delay": 1.0, "deadline_seconds": 120},
+        "mock_llm": {
+            "latency_ms": args.latency_ms,
+            "latency_jitter_ms": args.jitter_ms,
+            "latency_distribution": args.distribution,
+            "error_rate": args.error_rate,
+            "seed": args.seed,
+            "recordings_path": args.recordings or "",
+        },
+    })
+
+
+def build_project(num_chapters, num_characters):
+    """Synthetic synopsis / chapters / characters."""
+    synopsis = {
+        "title": "Benchmark Story",
+        "full_story": "벤치마크용 전체 줄거리입니다. " * 80,
+        "characters": [],
+    }
+    characters = []
+    for i in range(1, num_characters + 1):
+        character = {
+            "name": f"인물{i}",
+            "age": 40 + i * 5,
+            "gender": "남성" if i % 2 else "여성",
+            "personality": "침착하고 신중함",
+            "background": "벤치마크 배경",
+        }
+        characters.append(character)
+        synopsis["characters"].append({"name": character["name"], "age": character["age"]})
+
+    chapters = []
+    for i in range(1, num_chapters + 1):
+        chapters.append({
+            "chapter_number": i,
+            "title": f"챕터 {i}",
+            "summary": f"챕터 {i} 요약",
+            "script": "벤치마크 대본 문장입니다. " * 200,
+        })
+
+    characters_info = "\n".join(
+        f"- {c['name']} ({c['age']}세, {c['gender']}): {c['personality']}" for c in characters
+    )
+    return synopsis, chapters, characters, characters_info
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def run_workload(args, workload, mode):
+    """Run one workload in one mode with a fresh LLMService and collect stats."""
+    llm = LLMService(build_config(args))
+    generator = ContentGenerator(llm)
+    synopsis, chapters, characters, characters_info = build_project(args.chapters, args.characters)
+
+    started = time.perf_counter()
+    if workload == "scripts":
+        if mode == "sequential":
+            results = [generator.generate_script(ch, synopsis, characters_info) for ch in chapters]
+        else:
+            results = generator.generate_scripts_batch(chapters, synopsis, characters_info)
+    elif workload == "scenes":
+        if mode == "sequential":
+            results = [generator.generate_scenes(ch, synopsis, characters_info) for ch in chapters]
+        else:
+            results = generator.generate_scenes_batch(chapters, synopsis, characters_info)
+    elif workload == "series":
+        # scripts -> scenes per chapter plus character image prompts
+        if mode == "sequential":
+            results = []
+            previous = ""
+            for ch in chapters:
+                target = dict(ch, script="")
+                script = generator.generate_script(target, synopsis, characters_info, previous[-1000:])
+                target["script"] = script or ""
+                previous = script or ""
+                results.append(script)
+                results.append(generator.generate_scenes(target, synopsis, characters_info))
+            for character in characters:
+                results.append(generator.generate_image_prompts(character, synopsis, 0))
+        else:
+            empty = [dict(ch, script="") for ch in chapters]
+            series = generator.generate_series(empty, synopsis, characters_info, characters)
+            results = (list(series["scripts"].values()) + list(series["scenes"].values())
+                       + list(series["image_prompts"].values()) + [None] * len(series["failed"]))
+    elif workload == "image_prompts_grouped":
+        # K characters per call vs one call per character (both concurrent)
+        if mode == "sequential":
+            results = generator.generate_image_prompts_batch(characters, synopsis)
+        else:
+            results = generator.generate_image_prompts_grouped(characters, synopsis)
+    else:
+        if mode == "sequential":
+            results = []
+            for character in characters:
+                try:
+                    results.append(generator.generate_image_prompts(character, synopsis, 0))
+                except Exception as e:
+                    print(f"  image prompt error: {e}")
+                    results.append(None)
+        else:
+            results = generator.generate_image_prompts_batch(characters, synopsis)
+    wall = time.perf_counter() - started
+
+    attempts = llm.telemetry.get_recent(limit=100000)
+    latencies = [a["latency"] for a in attempts if a["outcome"] == "ok"]
+    return {
+        "workload": workload,
+        "mode": mode,
+        "requests": len(results),
+        "ok": sum(1 for r in results if r),
+        "attempts": len(attempts),
+        "retries": sum(1 for a in attempts if a["outcome"] == "retry"),
+        "wall": wall,
+        "rps": len(results) / wall if wall > 0 else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+    }
+
+
+def format_row(row):
+    return (
+        f"{row['workload']:<22}{row['mode']:<12}{row['requests']:>5}{row['ok']:>5}"
+        f"{row['attempts']:>6}{row['retries']:>6}{row['wall']:>9.2f}s{row['rps']:>8.2f}"
+        f"{row['p50'] * 1000:>9.0f}ms{row['p95'] * 1000:>9.0f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM pipeline throughput benchmark (mock provider)")
+    parser.add_argument("--chapters", type=int, default=10)
+    parser.add_argument("--characters", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--jitter-ms", type=float, default=300.0)
+    parser.add_argument("--distribution", default="lognormal", choices=("fixed", "uniform", "normal", "lognormal"))
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--recordings", default="", help="JSON file of recorded responses to replay")
+    parser.add_argument("--workloads", default="scripts,scenes,image_prompts",
+                        help="comma separated: scripts, scenes, image_prompts, image_prompts_grouped, series")
+    parser.add_argument("--output", default="", help="also write the report to this file")
+    args = parser.parse_args()
+
+    lines = [
+        "=" * 102,
+        f"LLM pipeline benchmark: latency {args.latency_ms:.0f}ms +/- {args.jitter_ms:.0f}ms "
+        f"({args.distribution}), error rate {args.error_rate:.0%}, concurrency {args.concurrency}",
+        "=" * 102,
+        f"{'workload':<22}{'mode':<12}{'req':>5}{'ok':>5}{'tries':>6}{'retry':>6}{'wall':>10}{'req/s':>8}"
+        f"{'p50':>11}{'p95':>11}",
+    ]
+    print("\n".join(lines))
+
+    for workload in [w.strip() for w in args.workloads.split(",") if w.strip()]:
+        rows = []
+        for mode in ("sequential", "concurrent"):
+            row = run_workload(args, workload, mode)
+            rows.append(row)
+            line = format_row(row)
+            lines.append(line)
+            print(line)
+        if rows[1]["wall"] > 0:
+            line = f"{'':<22}speedup x{rows[0]['wall'] / rows[1]['wall']:.2f}"
+            lines.append(line)
+            print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
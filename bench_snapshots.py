@@ -0,0 +1,103 @@
+"""
+Project Snapshot Benchmark
+Builds a synthetic project (see bench_file_loading.build_project) and compares copying the whole
+project folder (the manual backup users make before regenerations) with SnapshotStore
+(services.snapshot_service): first snapshot, unchanged snapshot (stat only + manifest write),
+snapshot after editing a few files, diff against the working tree, restore and gc.
+
+Usage:
+    python bench_snapshots.py --files 2000 --scenes 10 --changed 20
+"""
+
+import sys
+import os
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_file_loading import build_project
+from services.snapshot_service import SnapshotStore, SNAPSHOT_DIR_NAME
+
+
+def dir_size(path):
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project snapshot benchmark (folder copy vs content-addressed snapshots)")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--scenes", type=int, default=10, help="scenes per episode file")
+    parser.add_argument("--changed", type=int, default=20, help="files edited between snapshots")
+    parser.add_argument("--fsync", action="store_true", help="fsync objects and manifests (app default)")
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="bench_snapshots_"))
+    root = base / "project"
+    try:
+        num_characters, num_episodes = build_project(root, args.files, args.scenes)
+        project_bytes = dir_size(root)
+        # freshly written files fall inside the racy mtime window; age them so reuse is measured
+        old = time.time() - 3600
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                os.utime(os.path.join(dirpath, name), (old, old))
+
+        _, copy_time = timed(lambda: shutil.copytree(root, base / "copy"))
+
+        store = SnapshotStore(root, fsync=args.fsync)
+        first, first_time = timed(lambda: store.create_snapshot("first"))
+        unchanged, unchanged_time = timed(lambda: store.create_snapshot("unchanged"))
+
+        json_files = sorted(p for p in root.rglob("*.json") if SNAPSHOT_DIR_NAME not in p.parts)
+        rng = random.Random(0)
+        for path in rng.sample(json_files, min(args.changed, len(json_files))):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n")
+        edited, edited_time = timed(lambda: store.create_snapshot("edited"))
+        diff, diff_time = timed(lambda: store.diff(first["id"]))
+        restored, restore_time = timed(lambda: store.restore(first["id"], backup=False))
+        snapshot_bytes = dir_size(root / SNAPSHOT_DIR_NAME)
+        store.delete_snapshot(edited["id"])
+        collected, gc_time = timed(store.gc)
+
+        print("=" * 72)
+        print(f"Snapshot benchmark: {num_characters} characters, {num_episodes} episodes "
+              f"x {args.scenes} scenes, {project_bytes / (1024 * 1024):.1f}MB")
+        print("=" * 72)
+        print(f"{'operation':<28}{'time':>10}{'files read':>12}{'new objects':>13}{'written':>10}")
+        print(f"{'folder copy':<28}{copy_time * 1000:>8.0f}ms{first['files']:>12}{'-':>13}"
+              f"{project_bytes / 1024:>8.0f}KB")
+        for label, result, elapsed in (("first snapshot", first, first_time),
+                                       ("unchanged snapshot", unchanged, unchanged_time),
+                                       (f"snapshot, {args.changed} edited", edited, edited_time)):
+            print(f"{label:<28}{elapsed * 1000:>8.0f}ms{result['hashed']:>12}{result['new_objects']:>13}"
+                  f"{result['bytes_written'] / 1024:>8.0f}KB")
+        print()
+        print(f"diff vs first snapshot      {diff_time * 1000:>8.0f}ms  modified {len(diff['modified'])}")
+        print(f"restore first snapshot      {restore_time * 1000:>8.0f}ms  rewritten {len(restored['written'])}")
+        print(f"gc after deleting 1 snapshot{gc_time * 1000:>8.0f}ms  objects {collected['deleted_objects']}")
+        print(f"store size for 3 snapshots  {snapshot_bytes / 1024:>8.0f}KB "
+              f"({snapshot_bytes / project_bytes * 100:.0f}% of one folder copy)")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
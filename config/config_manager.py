@@ -27,6 +27,72 @@ class ConfigManager:
             "anthropic_api_key": "",
             "anthropic_model": "claude-3-5-haiku-20241022",
             "image_system_prompt": self._get_default_image_system_prompt(),
+            # LLM 응답 캐시 설정
+            "llm_cache_enabled": True,
+            "llm_cache_path": str(Path.home() / ".senior_contents_llm_cache.sqlite3"),
+            "llm_cache_max_entries": 2000,
+            "llm_cache_max_mb": 200,
+            "llm_cache_ttl_days": 30,
+            # 배치 생성 동시 실행 개수 및 제공자별 요청 한도
+            "llm_concurrency": 4,
+            "llm_rate_limits": {
+                "gemini": {"rpm": 15, "tpm": 1000000},
+                "openai": {"rpm": 500, "tpm": 200000},
+                "anthropic": {"rpm": 50, "tpm": 50000},
+            },
+            # 일시적 오류(429, 5xx, 타임아웃) 재시도 및 대체 제공자 순서
+            "llm_retry": {
+                "max_attempts": 4,
+                "base_delay": 2.0,
+                "max_delay": 60.0,
+                "deadline_seconds": 600,
+            },
+            "llm_fallback_providers": [],
+            # 공통 앞부분(시놉시스/인물 정보) 제공자 프롬프트 캐시 사용
+            "llm_prompt_cache_enabled": True,
+            # 요청당 입력 토큰 예산 (넘으면 이전 대본 → 줄거리 → 인물 정보 순으로 줄임, 0이면 제한 없음)
+            "llm_input_token_budget": 16000,
+            # 호출마다 추정/실제 입력 토큰 출력
+            "llm_log_token_usage": True,
+            # 캐릭터 이미지 프롬프트를 한 번의 호출로 묶어 생성할 최대 인원 (응답 토큰 상한에 맞춰 자동으로 줄어듦)
+            "image_prompts_group_size": 4,
+            # 장면/이미지 프롬프트/프로필 응답에 빠진 부분이 있으면 그 부분만 다시 요청
+            "llm_repair_enabled": True,
+            "llm_repair_max_rounds": 2,
+            # 배치 작업 백엔드 ("auto": OpenAI/Anthropic은 제공자 Batch API, 그 외는 로컬), 결과 확인 간격(초)
+            "llm_batch_backend": "auto",
+            "llm_batch_poll_seconds": 60,
+            # 로컬 배치 백엔드가 제출 후 완료로 처리하기까지의 시간(초)
+            "llm_batch_local_delay_seconds": 0,
+            # 프로젝트 JSON 파싱 결과 인덱스 (stat이 바뀐 파일만 다시 파싱)
+            "project_index_enabled": True,
+            "project_index_path": str(Path.home() / ".senior_contents_project_index.sqlite3"),
+            # 에피소드 장면 본문은 처음 접근할 때 읽고, 최근 사용한 본문만 메모리에 유지
+            "lazy_chapters_enabled": True,
+            "chapter_body_cache_size": 32,
+            # 프로젝트 JSON 파일을 동시에 읽는 공용 스레드 수 (1이면 순차)
+            "file_io_workers": 8,
+            # 저장은 백그라운드에서 처리 (같은 파일 연속 저장은 마지막 내용만), 파일마다 fsync 후 교체
+            "write_behind_enabled": True,
+            "write_fsync": True,
+            # 프로젝트 폴더 외부 변경 감시 (watchdog이 없거나 project_watch_native가 False면 주기적 스캔)
+            "project_watch_enabled": True,
+            "project_watch_native": True,
+            "project_watch_poll_seconds": 2.0,
+            # 로드한 시놉시스/캐릭터/챕터를 __slots__ 엔티티로 보관 (메모리 절약, 문제 시 끄면 딕셔너리)
+            "typed_entities_enabled": True,
+            # 프로젝트 스냅샷 (project/.snapshots/, 같은 내용은 한 번만 압축 저장), 보관 개수 (0이면 자동 정리 안 함)
+            "snapshot_enabled": True,
+            "snapshot_keep": 30,
+            # 모의 제공자 설정 (provider를 "mock"으로 지정하면 API 호출 없이 동작)
+            "mock_llm": {
+                "latency_ms": 800,
+                "latency_jitter_ms": 300,
+                "latency_distribution": "lognormal",
+                "error_rate": 0.0,
+                "seed": None,
+                "recordings_path": "",
+            },
             # 구글 시트 설정
             "google_sheets_enabled": False,
             "google_sheets_spreadsheet_id": "",
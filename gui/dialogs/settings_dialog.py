@@ -280,7 +280,7 @@ class SettingsDialog:
         llm = LLMService(temp_config)
 
         try:
-            response = llm.call("안녕하세요")
+            response = llm.call("안녕하세요", use_cache=False)
             if response:
                 messagebox.showinfo("연결 테스트", f"{provider.upper()} API 연결 성공!")
         except Exception as e:
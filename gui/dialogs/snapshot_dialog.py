@@ -0,0 +1,253 @@
+"""
+스냅샷 다이얼로그
+프로젝트 스냅샷을 만들고, 현재 파일과 비교하거나 이전 시점으로 복원합니다.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog
+
+
+class SnapshotDialog:
+    """스냅샷 기록 다이얼로그 클래스"""
+
+    def __init__(self, parent, snapshot_store, file_service, project_data=None, keep: int = 0, on_restored=None):
+        """
+        Args:
+            parent: 부모 윈도우
+            snapshot_store: SnapshotStore 인스턴스 (현재 프로젝트)
+            file_service: FileService 인스턴스 (스냅샷 전에 예약된 저장을 마침)
+            project_data: ProjectData 인스턴스 (저장하지 않은 변경 확인용, 선택사항)
+            keep: 보관할 스냅샷 수 (0이면 자동 정리 안 함)
+            on_restored: 복원 후 호출할 함수 (프로젝트 다시 로드)
+        """
+        self.parent = parent
+        self.store = snapshot_store
+        self.file_service = file_service
+        self.project_data = project_data
+        self.keep = keep
+        self.on_restored = on_restored
+        self.snapshots = []
+        self._busy = False
+
+        # 다이얼로그 생성
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"스냅샷 기록 - {self.store.project_path.name}")
+        self.window.geometry("760x560")
+        self.window.transient(parent)
+        self.window.grab_set()
+        self.window.resizable(True, True)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+
+        # UI 생성
+        self._create_ui()
+        self._refresh()
+
+    def _create_ui(self):
+        """UI 생성"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 스냅샷 목록
+        columns = ("created_at", "label", "files", "size")
+        self.tree = ttk.Treeview(main_frame, columns=columns, show="headings", height=10, selectmode="browse")
+        self.tree.heading("created_at", text="생성 시각")
+        self.tree.heading("label", text="설명")
+        self.tree.heading("files", text="파일 수")
+        self.tree.heading("size", text="크기")
+        self.tree.column("created_at", width=150, anchor=tk.W)
+        self.tree.column("label", width=360, anchor=tk.W)
+        self.tree.column("files", width=70, anchor=tk.E)
+        self.tree.column("size", width=90, anchor=tk.E)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._show_diff())
+
+        # 버튼
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=8)
+        self.buttons = [
+            ttk.Button(button_frame, text="📸 스냅샷 저장", command=self._create_snapshot),
+            ttk.Button(button_frame, text="↩ 이 시점으로 복원", command=self._restore),
+            ttk.Button(button_frame, text="삭제", command=self._delete),
+            ttk.Button(button_frame, text="정리", command=self._gc),
+        ]
+        for button in self.buttons:
+            button.pack(side=tk.LEFT, padx=3)
+        ttk.Button(button_frame, text="닫기", command=self._close).pack(side=tk.RIGHT, padx=3)
+
+        # 선택한 스냅샷과 현재 파일 비교 결과
+        ttk.Label(main_frame, text="현재 파일과 비교:", font=("맑은 고딕", 10, "bold")).pack(anchor=tk.W)
+        self.diff_text = tk.Text(main_frame, height=10, wrap=tk.NONE, font=("맑은 고딕", 9))
+        self.diff_text.pack(fill=tk.BOTH, expand=True)
+        self.diff_text.config(state=tk.DISABLED)
+
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(main_frame, textvariable=self.status_var).pack(anchor=tk.W, pady=(5, 0))
+
+    def _refresh(self):
+        """스냅샷 목록 다시 읽기"""
+        self.snapshots = self.store.list_snapshots()
+        self.tree.delete(*self.tree.get_children())
+        for snapshot in self.snapshots:
+            self.tree.insert("", tk.END, iid=snapshot["id"], values=(
+                snapshot["created_at"].replace("T", " "),
+                snapshot["label"],
+                snapshot["files"],
+                f"{snapshot['size'] / 1024:.0f}KB",
+            ))
+        self._set_diff_text("")
+
+    def _close(self):
+        """닫기 (작업 중에는 끝날 때까지 닫지 않음)"""
+        if self._busy:
+            self.status_var.set("작업이 끝난 뒤 닫을 수 있습니다")
+            return
+        self.window.destroy()
+
+    def _selected_id(self):
+        selection = self.tree.selection()
+        return selection[0] if selection else None
+
+    def _set_diff_text(self, text: str):
+        self.diff_text.config(state=tk.NORMAL)
+        self.diff_text.delete("1.0", tk.END)
+        self.diff_text.insert("1.0", text)
+        self.diff_text.config(state=tk.DISABLED)
+
+    def _run(self, status: str, work, done):
+        """
+        백그라운드에서 작업 실행 후 결과를 UI 스레드로 전달
+
+        Args:
+            status: 실행 중 표시할 문구
+            work: 백그라운드에서 실행할 함수 (반환값이 done에 전달됨)
+            done: UI 스레드에서 호출할 함수
+        """
+        if self._busy:
+            return
+        self._busy = True
+        self.status_var.set(status)
+        for button in self.buttons:
+            button.state(["disabled"])
+
+        def worker():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.window.after(0, lambda: finish(result, error))
+
+        def finish(result, error):
+            self._busy = False
+            for button in self.buttons:
+                button.state(["!disabled"])
+            if error is not None:
+                self.status_var.set(f"오류: {error}")
+                messagebox.showerror("스냅샷 오류", str(error), parent=self.window)
+                return
+            done(result)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_diff(self):
+        """선택한 스냅샷 이후 바뀐 파일 표시"""
+        snapshot_id = self._selected_id()
+        if snapshot_id is None or self._busy:
+            return
+
+        def done(diff):
+            lines = []
+            for key, mark in (("modified", "수정"), ("added", "추가"), ("removed", "삭제")):
+                lines.extend(f"[{mark}] {rel}" for rel in diff[key])
+            self._set_diff_text("\n".join(lines) if lines else "바뀐 파일 없음")
+            self.status_var.set(
+                f"수정 {len(diff['modified'])}개, 추가 {len(diff['added'])}개, 삭제 {len(diff['removed'])}개"
+            )
+
+        self._run("비교 중...", lambda: self.store.diff(snapshot_id), done)
+
+    def _create_snapshot(self):
+        """현재 프로젝트 스냅샷 저장"""
+        label = simpledialog.askstring("스냅샷 저장", "설명 (선택사항):", parent=self.window)
+        if label is None:
+            return
+        if self.project_data is not None and self.project_data.has_unsaved_changes():
+            if not messagebox.askyesno(
+                "스냅샷 저장",
+                "저장하지 않은 변경사항은 스냅샷에 포함되지 않습니다.\n계속하시겠습니까?",
+                parent=self.window
+            ):
+                return
+
+        def work():
+            self.file_service.flush_writes()
+            result = self.store.create_snapshot(label.strip())
+            if self.keep > 0:
+                self.store.prune(self.keep)
+            return result
+
+        def done(result):
+            self._refresh()
+            self.status_var.set(
+                f"스냅샷 저장 완료: 파일 {result['files']}개 "
+                f"(새로 읽음 {result['hashed']}, 새 객체 {result['new_objects']}, "
+                f"{result['bytes_written'] / 1024:.0f}KB)"
+            )
+
+        self._run("스냅샷 저장 중...", work, done)
+
+    def _restore(self):
+        """선택한 스냅샷 시점으로 복원 (복원 전 상태는 자동 스냅샷으로 남김)"""
+        snapshot_id = self._selected_id()
+        if snapshot_id is None:
+            messagebox.showwarning("복원", "복원할 스냅샷을 선택해주세요.", parent=self.window)
+            return
+        message = (
+            f"프로젝트 파일을 {snapshot_id} 시점으로 되돌립니다.\n"
+            "현재 상태는 자동으로 스냅샷에 저장됩니다.\n"
+        )
+        if self.project_data is not None and self.project_data.has_unsaved_changes():
+            message += "\n⚠ 저장하지 않은 변경사항은 사라집니다.\n"
+        if not messagebox.askyesno("복원", message + "\n계속하시겠습니까?", parent=self.window):
+            return
+
+        def work():
+            self.file_service.flush_writes()
+            return self.store.restore(snapshot_id)
+
+        def done(result):
+            self._refresh()
+            self.status_var.set(
+                f"복원 완료: 다시 쓴 파일 {len(result['written'])}개, 삭제한 파일 {len(result['removed'])}개"
+            )
+            if self.on_restored is not None:
+                self.on_restored()
+
+        self._run("복원 중...", work, done)
+
+    def _delete(self):
+        """선택한 스냅샷 삭제 후 쓰지 않는 객체 정리"""
+        snapshot_id = self._selected_id()
+        if snapshot_id is None:
+            return
+        if not messagebox.askyesno("삭제", f"스냅샷 {snapshot_id}을(를) 삭제하시겠습니까?", parent=self.window):
+            return
+
+        def work():
+            self.store.delete_snapshot(snapshot_id)
+            return self.store.gc()
+
+        def done(result):
+            self._refresh()
+            self.status_var.set(f"삭제 완료 (정리한 객체 {result['deleted_objects']}개, "
+                                f"{result['freed_bytes'] / 1024:.0f}KB)")
+
+        self._run("삭제 중...", work, done)
+
+    def _gc(self):
+        """어떤 스냅샷에서도 쓰지 않는 객체 정리"""
+        def done(result):
+            self.status_var.set(f"정리 완료 (객체 {result['deleted_objects']}개, "
+                                f"{result['freed_bytes'] / 1024:.0f}KB)")
+
+        self._run("정리 중...", self.store.gc, done)
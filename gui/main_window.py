@@ -21,9 +21,28 @@ from gui.tabs.episode_splitter_tab import EpisodeSplitterTab
 
 # 다이얼로그 import
 from gui.dialogs.settings_dialog import SettingsDialog
+from gui.dialogs.snapshot_dialog import SnapshotDialog
 
 # 유틸리티 import
 from utils.word_converter import convert_word_to_markdown
+from services.project_watcher import ProjectWatcher, apply_project_changes
+from services.snapshot_service import SnapshotStore
+
+# 외부 파일 변경 종류별로 다시 그려야 하는 탭
+CHANGE_KIND_TABS = {
+    "synopsis": ("synopsis", "characters", "chapters"),
+    "character": ("characters", "scene_prompts", "comfyui"),
+    "character_detail": ("characters",),
+    "image_prompts": ("characters", "comfyui"),
+    "chapter": ("chapters", "scripts", "scene_prompts", "comfyui", "tts"),
+    "episode": ("chapters", "scripts", "scene_prompts", "comfyui", "tts"),
+    "script": ("chapters", "scripts", "tts"),
+    "episode_script": ("scripts", "tts", "episode_splitter"),
+    "media": ("characters", "comfyui", "tts"),
+}
+
+# 외부 변경 확인 간격(ms)
+PROJECT_WATCH_POLL_MS = 500
 
 
 class MainWindow:
@@ -46,6 +65,7 @@ class MainWindow:
         self.project_data = project_data
         self.file_service = file_service
         self.content_generator = content_generator
+        self.snapshot_store = None  # 현재 프로젝트 스냅샷 저장소 (처음 사용할 때 생성)
 
         # 프로젝트 목록
         self.project_list = []
@@ -71,6 +91,15 @@ class MainWindow:
         # 탭들 초기화
         self._initialize_tabs()
 
+        # 프로젝트 폴더 외부 변경 감시 (바뀐 엔티티만 다시 읽음)
+        self.project_watcher = None
+        if self.config.get("project_watch_enabled", True):
+            self.project_watcher = ProjectWatcher(
+                poll_interval=self.config.get("project_watch_poll_seconds", 2.0),
+                use_native=self.config.get("project_watch_native", True),
+            )
+            self.root.after(PROJECT_WATCH_POLL_MS, self._poll_project_changes)
+
         # 마지막 프로젝트 자동 선택
         self._select_last_project()
 
@@ -128,6 +157,8 @@ class MainWindow:
         file_menu.add_command(label="새로고침", command=self._refresh_project_list, accelerator="F5")
         file_menu.add_separator()
         file_menu.add_command(label="저장", command=self._save_all, accelerator="Ctrl+S")
+        if self.config.get("snapshot_enabled", True):
+            file_menu.add_command(label="스냅샷 기록...", command=self._open_snapshots)
         file_menu.add_separator()
         file_menu.add_command(label="종료", command=self.root.quit)
 
@@ -313,7 +344,7 @@ class MainWindow:
         self.project_path = self.prompts_path / selected_project
 
         # 파일 서비스 경로 업데이트
-        self.file_service.project_path = self.project_path
+        self.file_service.set_project_path(self.project_path)
         self.project_data.project_path = self.project_path
 
         # 설정에 저장
@@ -322,6 +353,10 @@ class MainWindow:
         # 프로젝트 데이터 로드
         self._load_project_data()
 
+        # 새 프로젝트 폴더 감시
+        if self.project_watcher is not None:
+            self.project_watcher.start(self.project_path)
+
         # 모든 탭에 dirty 플래그 설정 (다음 탭 전환 시 업데이트 필요)
         if hasattr(self, 'tabs'):
             for tab in self.tabs.values():
@@ -341,6 +376,30 @@ class MainWindow:
         # 윈도우 제목 업데이트
         self.root.title(f"시니어 콘텐츠 에디터 - {selected_project}")
 
+    def _poll_project_changes(self):
+        """외부에서 바뀐 파일을 ProjectData에 반영하고 관련 탭에 업데이트 표시"""
+        try:
+            changes = self.project_watcher.drain()
+            if changes and self.project_path is not None:
+                result = apply_project_changes(self.project_data, self.file_service, changes)
+                tab_ids = set()
+                for kind in result["kinds"]:
+                    tab_ids.update(CHANGE_KIND_TABS.get(kind, ()))
+                for tab_id in tab_ids:
+                    if tab_id in self.tabs:
+                        self.tabs[tab_id]._needs_update = True
+
+                if result["conflicts"]:
+                    self.status_var.set(
+                        f"외부 변경 감지: 편집 중인 항목은 반영하지 않음 ({', '.join(result['conflicts'][:3])})"
+                    )
+                elif result["updated"] or tab_ids:
+                    self.status_var.set(f"외부 변경 반영: 파일 {len(changes)}개 (탭을 다시 열면 표시)")
+        except Exception as e:
+            print(f"외부 변경 반영 오류: {e}")
+        finally:
+            self.root.after(PROJECT_WATCH_POLL_MS, self._poll_project_changes)
+
     def _initialize_tabs(self):
         """탭들 초기화"""
         # 탭 인스턴스 생성
@@ -384,7 +443,7 @@ class MainWindow:
 
             # 모든 데이터 로드
             data = self.file_service.load_all_data()
-            self.project_data.data = data
+            self.project_data.load_data(data)
 
             # 프로젝트 경로 업데이트
             self.project_data.project_path = self.project_path
@@ -408,6 +467,8 @@ class MainWindow:
             success_count = 0
             fail_count = 0
             failed_tabs = []
+            written_before = self.file_service.get_write_stats()
+            failed_before, _ = self.file_service.get_write_failures()
 
             # 각 탭의 저장 메서드 호출
             for tab_id, tab in self.tabs.items():
@@ -423,18 +484,39 @@ class MainWindow:
                     fail_count += 1
                     failed_tabs.append(tab_id)
 
-            self.project_data.clear_unsaved()
-            self.status_var.set(f"저장 완료! (성공: {success_count}, 실패: {fail_count})")
-
-            if fail_count > 0:
-                messagebox.showwarning(
-                    "저장 결과",
-                    "일부 탭 저장에 실패했습니다.\n\n"
-                    f"- 성공: {success_count}\n"
-                    f"- 실패: {fail_count}\n\n"
-                    "실패 탭:\n"
-                    + "\n".join(f"- {t}" for t in failed_tabs)
-                )
+            # 백그라운드 저장이 끝날 때까지 기다린 뒤 이번 저장에서 실패한 파일 확인
+            self.file_service.flush_writes()
+            failed_after, write_errors = self.file_service.get_write_failures()
+            new_failures = failed_after - failed_before
+            failed_files = write_errors[-new_failures:] if new_failures > 0 else []
+
+            # 파일 쓰기에 실패했으면 다시 저장할 수 있도록 변경 표시 유지
+            if new_failures == 0:
+                self.project_data.clear_unsaved()
+            write_stats = self.file_service.get_write_stats()
+            written = write_stats["written"] - written_before["written"]
+            skipped = write_stats["skipped"] - written_before["skipped"]
+            self.status_var.set(
+                f"저장 완료! (성공: {success_count}, 실패: {fail_count}, "
+                f"변경된 파일: {written}, 변경 없음: {skipped}, 쓰기 실패: {new_failures})"
+            )
+
+            if fail_count > 0 or new_failures > 0:
+                message = "일부 저장에 실패했습니다.\n\n"
+                if fail_count > 0:
+                    message += (
+                        f"- 성공: {success_count}\n"
+                        f"- 실패: {fail_count}\n\n"
+                        "실패 탭:\n"
+                        + "\n".join(f"- {t}" for t in failed_tabs)
+                        + "\n\n"
+                    )
+                if new_failures > 0:
+                    message += (
+                        f"파일 쓰기 실패: {new_failures}개\n"
+                        + "\n".join(f"- {Path(path).name}: {error}" for path, error in failed_files)
+                    )
+                messagebox.showwarning("저장 결과", message.rstrip())
             else:
                 messagebox.showinfo("저장", "모든 변경사항이 저장되었습니다.")
         except Exception as e:
@@ -445,6 +527,28 @@ class MainWindow:
         """설정 창 열기"""
         SettingsDialog(self.root, self.config, self.project_data, self.file_service)
 
+    def _open_snapshots(self):
+        """스냅샷 기록 창 열기 (스냅샷 저장/비교/복원)"""
+        if self.project_path is None or not self.project_path.exists():
+            messagebox.showwarning("스냅샷", "프로젝트를 먼저 선택해주세요.")
+            return
+        if self.snapshot_store is None or self.snapshot_store.project_path != self.project_path:
+            self.snapshot_store = SnapshotStore(self.project_path, fsync=self.config.get("write_fsync", True))
+        SnapshotDialog(
+            self.root,
+            self.snapshot_store,
+            self.file_service,
+            project_data=self.project_data,
+            keep=self.config.get("snapshot_keep", 30),
+            on_restored=self._on_snapshot_restored,
+        )
+
+    def _on_snapshot_restored(self):
+        """스냅샷 복원 후 프로젝트 다시 로드 (파일 캐시와 외부 변경 감시도 초기화)"""
+        self.project_data.clear_unsaved()
+        self._on_project_selected()
+        self.status_var.set(f"스냅샷 복원 완료: {self.project_path}")
+
     def _convert_word_to_md(self):
         """Word 파일을 Markdown으로 변환"""
         # 파일 선택 대화상자
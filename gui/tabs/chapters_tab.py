@@ -8,10 +8,14 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from datetime import datetime
 import re
+import threading
 from typing import Optional, Dict, List, Any
 from .base_tab import BaseTab
+from models.project_data import entity_key
 from utils.file_utils import get_chapter_filename, get_character_filename
 from utils.ui_helpers import ActEpisodeTreeView
+from services.story_state import StoryStateCache
+from services.provenance import ProvenanceManifest, script_inputs
 
 
 class ChaptersTab(BaseTab):
@@ -183,7 +187,7 @@ class ChaptersTab(BaseTab):
         # 파일에서 최신 데이터 로드
         try:
             all_data = self.file_service.load_all_data()
-            self.project_data.data = all_data
+            self.project_data.load_data(all_data)
         except Exception as e:
             print(f"데이터 로드 오류: {e}")
 
@@ -563,14 +567,7 @@ class ChaptersTab(BaseTab):
             return
 
         # 챕터 찾기
-        chapters = self.project_data.get_chapters()
-        chapter = None
-        chapter_index = -1
-        for i, ch in enumerate(chapters):
-            if ch.get("chapter_number") == self.current_chapter_num:
-                chapter = ch
-                chapter_index = i
-                break
+        chapter = self.project_data.get_chapter_by_number(self.current_chapter_num)
 
         if not chapter:
             messagebox.showerror("오류", f"챕터 {self.current_chapter_num}을 찾을 수 없습니다.")
@@ -583,50 +580,108 @@ class ChaptersTab(BaseTab):
         characters = self.project_data.get_characters()
         characters_info = self._format_characters_for_prompt(characters)
 
-        # 이전 챕터 대본
-        previous_script = ""
-        if self.current_chapter_num > 1:
-            try:
-                prev_data = self.file_service.load_script_file(self.current_chapter_num - 1)
-                if isinstance(prev_data, dict):
-                    prev_script_full = str(prev_data.get("script", "") or "")
-                    if len(prev_script_full) > 1000:
-                        prev_script_full = "..." + prev_script_full[-1000:]
-                    previous_script = prev_script_full
-            except Exception:
-                pass
+        # 이전 챕터 대본 (요약은 백그라운드 스레드에서 캐시를 확인해 필요한 챕터만 생성)
+        previous_scripts = {}
+        for ch in self.project_data.get_chapters():
+            number = ch.get("chapter_number")
+            if not isinstance(number, int) or number >= self.current_chapter_num:
+                continue
+            script = str(ch.get("script", "") or "")
+            if not script:
+                try:
+                    prev_data = self.file_service.load_script_file(number)
+                    if isinstance(prev_data, dict):
+                        script = str(prev_data.get("script", "") or "")
+                except Exception:
+                    pass
+            if script:
+                previous_scripts[number] = script
+
+        # 스트리밍 출력을 위해 대본 영역 비우기
+        if self.script_text:
+            self.script_text.delete(1.0, tk.END)
+
+        # LLM 호출은 백그라운드 스레드에서 (받은 조각은 메인 스레드에서 표시)
+        chapter_num = self.current_chapter_num
+        thread = threading.Thread(
+            target=self._stream_script_worker,
+            args=(chapter_num, chapter, synopsis, characters_info, previous_scripts),
+            daemon=True
+        )
+        thread.start()
+
+    def _stream_script_worker(self, chapter_num: int, chapter: dict, synopsis: dict,
+                              characters_info: str, previous_scripts: dict):
+        """대본 스트리밍 생성 (백그라운드 스레드)"""
+        def on_delta(delta: str):
+            self.frame.after(0, lambda: self._append_script_delta(chapter_num, delta))
 
-        # LLM 호출
         try:
-            script = self.content_generator.generate_script(
+            story_state = StoryStateCache(self.file_service.get_story_state_path())
+            previous_script = self.content_generator.build_story_context(chapter_num, previous_scripts, story_state)
+            script = self.content_generator.stream_script(
                 chapter,
                 synopsis,
                 characters_info,
-                previous_script
+                previous_script,
+                # 사용자가 직접 누른 생성은 항상 새로 호출 (결과로 캐시만 갱신)
+                use_cache=False,
+                on_delta=on_delta,
+                partial_path=self.file_service.get_partial_script_path(chapter_num)
             )
+            inputs = script_inputs(chapter, synopsis, characters_info)
+            self.frame.after(0, lambda: self._on_script_generated(chapter_num, chapter, script, inputs))
+        except Exception as e:
+            # except 블록이 끝나면 e가 해제되므로 메시지를 미리 만들어 전달
+            msg = str(e)
+            self.frame.after(0, lambda: messagebox.showerror("오류", f"대본 생성 중 오류: {msg}"))
+
+    def _append_script_delta(self, chapter_num: int, delta: str):
+        """스트리밍으로 받은 대본 조각 표시 (선택된 챕터가 같을 때만)"""
+        if self.script_text and self.current_chapter_num == chapter_num:
+            self.script_text.insert(tk.END, delta)
+            self.script_text.see(tk.END)
+
+    def _on_script_generated(self, chapter_num: int, chapter: dict, script: Optional[str],
+                             inputs: Optional[dict] = None):
+        """대본 생성 완료 처리 (메인 스레드)"""
+        if not script:
+            messagebox.showerror(
+                "오류",
+                "대본 생성에 실패했습니다.\n"
+                "받은 내용까지는 임시 초안 파일로 남아 있습니다.\n"
+                f"{self.file_service.get_partial_script_path(chapter_num)}"
+            )
+            return
 
-            if not script:
-                messagebox.showerror("오류", "대본 생성에 실패했습니다.")
-                return
-
+        try:
             # 대본 저장
             script = script.strip()
             chapter["script"] = script
             chapter["script_length"] = len(script)
             chapter["script_generated_at"] = datetime.now().isoformat()
 
-            chapters[chapter_index] = chapter
+            chapters = self.project_data.get_chapters()
+            for i, ch in enumerate(chapters):
+                if ch.get("chapter_number") == chapter_num:
+                    chapters[i] = chapter
+                    break
             self.project_data.set_chapters(chapters)
 
-            # 파일에 저장
-            self.file_service.save_script_file(self.current_chapter_num, script)
+            # 파일에 저장 (저장 후 임시 초안 삭제)
+            if self.file_service.save_script_file(chapter_num, script):
+                self.file_service.remove_partial_script(chapter_num)
+                if inputs:
+                    ProvenanceManifest(self.file_service.get_provenance_path()).record(
+                        "script", chapter_num, inputs, script
+                    )
 
-            # UI 업데이트
-            if self.script_text:
+            # UI 업데이트 (스트리밍 중 쌓인 텍스트를 정리된 최종본으로 교체)
+            if self.script_text and self.current_chapter_num == chapter_num:
                 self.script_text.delete(1.0, tk.END)
                 self.script_text.insert(1.0, script)
 
-            messagebox.showinfo("완료", f"챕터 {self.current_chapter_num}의 대본이 생성되었습니다.\n글자 수: {len(script)}자")
+            messagebox.showinfo("완료", f"챕터 {chapter_num}의 대본이 생성되었습니다.\n글자 수: {len(script)}자")
 
         except Exception as e:
             messagebox.showerror("오류", f"대본 생성 중 오류: {e}")
@@ -657,6 +712,28 @@ class ChaptersTab(BaseTab):
             chapters = self.project_data.get_chapters()
             if not isinstance(chapters, list):
                 return False
-            return self.file_service.save_chapters(chapters)
+            # 마지막 저장 이후 바뀐 챕터만 저장
+            dirty = self.project_data.get_dirty_entities("chapters")
+            if not dirty:
+                return True
+            # 번호 없는 챕터가 바뀌었으면 전체 저장 (파일 내용이 같은 챕터는 어차피 쓰지 않음)
+            numbers = None if any(key.startswith("#") for key in dirty) else dirty
+            failed_before, _ = self.file_service.get_write_failures()
+            if not self.file_service.save_chapters(chapters, chapter_numbers=numbers):
+                return False
+
+            # 예약된 쓰기가 끝난 뒤 실제로 써진 챕터만 저장된 것으로 기록 (실패한 챕터는 다음 저장에서 다시 씀)
+            self.file_service.flush_writes()
+            failed_paths = {path for path, _ in self.file_service.get_write_failures_since(failed_before)}
+            if not failed_paths:
+                self.project_data.mark_persisted("chapters")
+                return True
+            written = [
+                entity_key("chapters", chapter, position)
+                for position, chapter in enumerate(chapters, start=1)
+                if str(self.file_service.get_chapter_path(chapter)) not in failed_paths
+            ]
+            self.project_data.mark_persisted("chapters", keys=written)
+            return False
         except Exception:
             return False
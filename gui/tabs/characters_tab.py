@@ -86,7 +86,7 @@ class CharactersTab(BaseTab):
         # 파일에서 최신 데이터 다시 로드 (인물/세부정보 입력 탭에서 저장한 데이터 반영)
         try:
             all_data = self.file_service.load_all_data()
-            self.project_data.data = all_data
+            self.project_data.load_data(all_data)
         except Exception as e:
             print(f"데이터 로드 오류: {e}")
 
@@ -199,8 +199,11 @@ class CopyPasteTab(BaseTab):
                     prompt_content = char.get('image_generation_prompt', '')
                 
                 if prompt_content:
-                    # JSON 형식의 중괄호 제거
-                    prompt_clean = self._remove_json_braces(prompt_content)
+                    # JSON 형식의 중괄호 제거 (메모리의 프롬프트는 dict)
+                    if isinstance(prompt_content, dict):
+                        prompt_clean = self._extract_content_from_json(prompt_content)
+                    else:
+                        prompt_clean = self._remove_json_braces(prompt_content)
                     # TSV 형식: 탭으로 구분, 줄바꿈 제거
                     prompt_clean = prompt_clean.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
                     line = f"{char_name}\t{prompt_num}\t{prompt_clean}"
@@ -8,7 +8,8 @@ import json
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from .base_tab import BaseTab
-from utils.json_utils import format_json, safe_json_loads, extract_json_from_text
+from utils.json_utils import format_json, safe_json_loads, extract_json_from_text, decode_prompt, decode_prompts, encode_prompt
+from services.provenance import ProvenanceManifest, image_prompts_inputs
 
 
 # 이미지 타입 번호 및 제목 매핑 (8개 → 12개 확장)
@@ -93,6 +94,14 @@ class ImagePromptsTab(BaseTab):
         )
         generate_btn.pack(side=tk.LEFT, padx=5)
 
+        # 캐시 무시 (기본은 같은 입력으로 이전에 생성한 결과 재사용)
+        self.prompts_fresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            button_frame,
+            text="새로 생성 (캐시 사용 안 함)",
+            variable=self.prompts_fresh_var
+        ).pack(side=tk.LEFT, padx=5)
+
         # 구분선
         ttk.Separator(button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, padx=10, fill=tk.Y)
 
@@ -349,15 +358,11 @@ class ImagePromptsTab(BaseTab):
         한 인물의 프롬프트 1~8을 모두 표시
         형식: "인물1, 1. 제목: 전신샷"
         """
-        # image_generation_prompts는 dict가 정상이며,
-        # 과거 데이터/수동 편집으로 문자열(JSON)로 저장된 경우가 있어 방어적으로 정규화한다.
+        # image_generation_prompts는 dict(값도 dict)가 정상이며,
+        # 과거 데이터/수동 편집으로 문자열(JSON)로 들어온 경우가 있어 방어적으로 정규화한다.
         prompts_obj = char.get('image_generation_prompts', {})
-        if isinstance(prompts_obj, str):
-            parsed = safe_json_loads(prompts_obj)
-            prompts_obj = parsed if isinstance(parsed, dict) else {}
-            char['image_generation_prompts'] = prompts_obj
-        elif not isinstance(prompts_obj, dict):
-            prompts_obj = {}
+        if not isinstance(prompts_obj, dict):
+            prompts_obj = decode_prompts(prompts_obj)
             char['image_generation_prompts'] = prompts_obj
         char_name = char.get('name', '알 수 없음')
 
@@ -378,18 +383,15 @@ class ImagePromptsTab(BaseTab):
                 prompt_content = char.get('image_generation_prompt', '')
 
             # 프롬프트가 없으면 표시용 placeholder
-            display_content = prompt_content if prompt_content else "(비어있음)"
+            display_content = encode_prompt(prompt_content) if prompt_content else "(비어있음)"
 
             # 이미지 타입 제목 가져오기 (프롬프트 JSON에 shot_name이 있으면 우선 사용)
             image_type_title = IMAGE_TYPE_TITLES.get(prompt_num, f"이미지 타입 {prompt_num}")
-            try:
-                prompt_json = safe_json_loads(prompt_content)
-                if isinstance(prompt_json, dict):
-                    shot_name = prompt_json.get('shot_name')
-                    if isinstance(shot_name, str) and shot_name.strip():
-                        image_type_title = shot_name.strip()
-            except Exception:
-                pass
+            prompt_json = decode_prompt(prompt_content)
+            if isinstance(prompt_json, dict):
+                shot_name = prompt_json.get('shot_name')
+                if isinstance(shot_name, str) and shot_name.strip():
+                    image_type_title = shot_name.strip()
 
             # 각 프롬프트를 위한 서브 프레임
             # 제목 형식: "인물1, 1. 제목: 전신샷"
@@ -479,36 +481,27 @@ class ImagePromptsTab(BaseTab):
         # 각 인물별로 7가지 프롬프트를 생성
         total_characters = len(characters)
         success_count = 0
+        manifest = ProvenanceManifest(self.file_service.get_provenance_path())
+
+        # 생성 결과를 넣기 전의 프로필로 입력 해시 계산
+        inputs_list = [image_prompts_inputs(char, synopsis) for char in characters]
+
+        # 여러 인물을 한 번의 호출로 묶어 생성 (응답에서 빠진 인물만 개별 재생성)
+        try:
+            all_prompts = self.content_generator.generate_image_prompts_grouped(
+                characters, synopsis, use_cache=not self.prompts_fresh_var.get()
+            )
+        except Exception as e:
+            messagebox.showerror("오류", f"이미지 프롬프트 생성 중 오류가 발생했습니다:\n\n{e}")
+            return
 
         for char_idx, char in enumerate(characters):
             char_name = char.get('name', '알 수 없음')
+            prompts = all_prompts[char_idx]
 
-            # 나이 조정 (나이대별 차감 규칙, 최소 25세)
-            char_age = char.get('age', 35)
-            if isinstance(char_age, str):
-                try:
-                    char_age = int(char_age)
-                except:
-                    char_age = 35
-            # 60세 이상: 20세 차감, 50세 이상: 15세 차감, 40세 이상: 10세 차감, 30세 이상: 7세 차감
-            if char_age >= 60:
-                age_deduction = 20
-            elif char_age >= 50:
-                age_deduction = 15
-            elif char_age >= 40:
-                age_deduction = 10
-            elif char_age >= 30:
-                age_deduction = 7
-            else:
-                # 30세 미만은 최소값 적용
-                age_deduction = 0
-            visual_age = max(25, char_age - age_deduction)
-
-            # ContentGenerator를 사용하여 프롬프트 생성
             try:
-                prompts = self.content_generator.generate_image_prompts(char, synopsis, visual_age)
-
                 if prompts:
+                    manifest.record("image_prompts", char_name, inputs_list[char_idx], prompts)
                     # image_generation_prompts 초기화
                     if 'image_generation_prompts' not in char:
                         char['image_generation_prompts'] = {}
@@ -532,11 +525,11 @@ class ImagePromptsTab(BaseTab):
                     for num, key in prompt_mapping.items():
                         prompt_content = prompts.get(key, "")
                         if prompt_content:
-                            char['image_generation_prompts'][f'prompt_{num}'] = prompt_content
+                            char['image_generation_prompts'][f'prompt_{num}'] = decode_prompt(prompt_content)
 
                     # 첫 번째 프롬프트를 기본값으로도 설정
                     if prompts.get("basic_front"):
-                        char['image_generation_prompt'] = prompts.get("basic_front")
+                        char['image_generation_prompt'] = encode_prompt(prompts.get("basic_front"))
 
                     success_count += 1
             except Exception as e:
@@ -582,7 +575,9 @@ class ImagePromptsTab(BaseTab):
                 for prompt_item in prompts_data:
                     char_name = prompt_item.get('character_name', '')
                     prompt_num = prompt_item.get('prompt_number', 1)
-                    prompt_text = prompt_item.get('prompt', '')
+                    # 에디터에서는 객체 또는 JSON 문자열 모두 허용 (메모리에는 dict로)
+                    prompt_value = decode_prompt(prompt_item.get('prompt', ''))
+                    has_prompt = bool(prompt_value) and (not isinstance(prompt_value, str) or bool(prompt_value.strip()))
                     prompt_key = f"prompt_{prompt_num}"
 
                     # 프롬프트 번호 유효 범위 (1~12)
@@ -592,17 +587,17 @@ class ImagePromptsTab(BaseTab):
                     # 해당 인물 찾기
                     for char in characters:
                         if char.get('name') == char_name:
-                            # 프롬프트 저장/삭제(빈 문자열이면 제거)
-                            if isinstance(prompt_text, str) and prompt_text.strip():
-                                char['image_generation_prompts'][prompt_key] = prompt_text
+                            # 프롬프트 저장/삭제(빈 값이면 제거)
+                            if has_prompt:
+                                char['image_generation_prompts'][prompt_key] = prompt_value
                             else:
                                 if prompt_key in char['image_generation_prompts']:
                                     char['image_generation_prompts'].pop(prompt_key, None)
                             
                             # 프롬프트 1을 기본값으로도 설정
                             if prompt_num == 1:
-                                if isinstance(prompt_text, str) and prompt_text.strip():
-                                    char['image_generation_prompt'] = prompt_text
+                                if has_prompt:
+                                    char['image_generation_prompt'] = encode_prompt(prompt_value)
                                 else:
                                     char['image_generation_prompt'] = ""
                             break
@@ -765,10 +760,8 @@ class ImagePromptsTab(BaseTab):
                         "filename_prefix": version.get('filename_prefix', '')
                     }
 
-                    # JSON 문자열로 저장
-                    matched_char['image_generation_prompts'][f'prompt_{prompt_num}'] = json.dumps(
-                        comfyui_prompt, ensure_ascii=False
-                    )
+                    # dict로 저장 (프로필 파일에는 save_characters가 JSON 문자열로 기록)
+                    matched_char['image_generation_prompts'][f'prompt_{prompt_num}'] = comfyui_prompt
 
                 print(f"[ComfyUI] '{char_name}' 프롬프트 로드 완료 ({len(versions)}개 버전)")
 
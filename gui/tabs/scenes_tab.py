@@ -9,9 +9,9 @@ from tkinter import ttk, scrolledtext, messagebox
 from datetime import datetime
 from typing import Optional, Dict, List
 from .base_tab import BaseTab
-from utils.json_utils import extract_json_from_text
+from utils.json_utils import extract_json_from_text, encode_prompt
+from services.provenance import ProvenanceManifest, scenes_inputs
 import threading
-import time
 
 
 class ScenesTab(BaseTab):
@@ -27,6 +27,8 @@ class ScenesTab(BaseTab):
         self.scenes_tab_canvas = None
         self.scenes_tab_right_frame = None
         self.scenes_tab_paned = None
+        # 배치 생성 시 챕터 데이터 갱신 보호용
+        self._chapters_lock = threading.Lock()
 
         # 부모 클래스 초기화
         super().__init__(parent, project_data, file_service, content_generator)
@@ -86,6 +88,14 @@ class ScenesTab(BaseTab):
         )
         all_scenes_gen_btn.pack(side=tk.LEFT, padx=5)
 
+        # 일괄 생성 시 캐시 무시 (기본은 이전에 생성한 챕터 결과 재사용)
+        self.scenes_fresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            chapter_select_frame,
+            text="새로 생성 (캐시 사용 안 함)",
+            variable=self.scenes_fresh_var
+        ).pack(side=tk.LEFT, padx=5)
+
         # 대본 표시 영역 (세로로 길게)
         script_display_frame = ttk.Frame(left_frame)
         script_display_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -234,12 +244,7 @@ class ScenesTab(BaseTab):
             return
 
         # 해당 챕터 찾기
-        chapters = self.project_data.get_chapters()
-        chapter = None
-        for ch in chapters:
-            if ch.get('chapter_number') == chapter_num:
-                chapter = ch
-                break
+        chapter = self.project_data.get_chapter_by_number(chapter_num)
 
         if not chapter:
             print(f"챕터 {chapter_num}을 찾을 수 없습니다.")
@@ -498,55 +503,56 @@ class ScenesTab(BaseTab):
         result = messagebox.askyesno(
             "모든 챕터 장면 생성",
             f"총 {len(chapters_with_script)}개 챕터의 대본을 분석하여 각각 10개의 장면을 생성하시겠습니까?\n\n"
-            f"각 챕터마다 3초씩 딜레이가 있으며, 전체 작업은 시간이 오래 걸릴 수 있습니다.\n\n"
+            f"여러 챕터를 동시에 생성하며, 전체 작업은 시간이 걸릴 수 있습니다.\n\n"
             f"진행 중에는 창을 닫지 마세요."
         )
         if not result:
             return
 
-        # 백그라운드 스레드에서 순차적으로 처리
+        # 백그라운드 스레드에서 배치로 처리
         thread = threading.Thread(
-            target=self._generate_all_scenes_sequential,
-            args=(chapters_with_script,),
+            target=self._generate_all_scenes_batch,
+            args=(chapters_with_script, not self.scenes_fresh_var.get()),
             daemon=True
         )
         thread.start()
 
-    def _generate_all_scenes_sequential(self, chapters):
+    def _generate_all_scenes_batch(self, chapters, use_cache: bool = True):
         """
-        모든 챕터에 대해 순차적으로 장면 생성
-        원본 _generate_all_scenes_sequential() 메서드의 로직을 완전히 이식
+        모든 챕터의 장면을 동시에 생성
+        고정 딜레이 대신 제공자별 요청 한도(RPM/TPM) 안에서 병렬로 호출
+        use_cache가 True면 중단 후 다시 실행할 때 이미 생성한 챕터는 캐시된 결과를 재사용
         """
-        total = len(chapters)
+        synopsis, characters_info, character_prompts_info = self._collect_scene_inputs()
+        manifest = ProvenanceManifest(self.file_service.get_provenance_path())
         success_count = 0
         fail_count = 0
 
-        for idx, chapter in enumerate(chapters, 1):
-            chapter_num = chapter.get('chapter_number', idx)
-            chapter_title = chapter.get('title', '제목 없음')
-
-            # 챕터 인덱스 찾기
-            chapter_index = -1
-            all_chapters = self.project_data.get_chapters()
-            for i, ch in enumerate(all_chapters):
-                if ch.get('chapter_number') == chapter_num:
-                    chapter_index = i
-                    break
-
-            # 장면 생성
-            try:
-                success = self._generate_scenes(chapter_num, chapter, chapter_index, show_message=False)
-                if success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-            except Exception as e:
+        # 챕터 1개가 끝날 때마다 워커 스레드에서 호출됨
+        def on_chapter_done(chapter, scenes):
+            nonlocal success_count, fail_count
+            chapter_num = chapter.get('chapter_number', 0)
+            if scenes and self._apply_generated_scenes(chapter_num, chapter, scenes):
+                manifest.record("scenes", chapter_num, scenes_inputs(
+                    chapter, chapter.get('script', ''), synopsis, characters_info, character_prompts_info
+                ), scenes)
+                success_count += 1
+            else:
                 fail_count += 1
-                print(f"챕터 {chapter_num} 장면 생성 오류: {e}")
+                print(f"챕터 {chapter_num} 장면 생성 실패")
 
-            # 마지막 챕터가 아니면 3초 딜레이
-            if idx < total:
-                time.sleep(3)
+        try:
+            self.content_generator.generate_scenes_batch(
+                chapters,
+                synopsis,
+                characters_info,
+                character_prompts_info,
+                use_cache=use_cache,
+                on_result=on_chapter_done
+            )
+        except Exception as e:
+            print(f"전체 장면 생성 오류: {e}")
+            fail_count = len(chapters) - success_count
 
         # 완료 메시지
         def show_completion():
@@ -563,10 +569,12 @@ class ScenesTab(BaseTab):
         # GUI 업데이트는 메인 스레드에서
         self.frame.after(0, show_completion)
 
-    def _generate_scenes(self, chapter_num: int, chapter: dict, chapter_index: int, show_message: bool = True) -> bool:
+    def _collect_scene_inputs(self):
         """
-        챕터 장면 생성 (내부 함수)
-        원본 _generate_scenes() 메서드의 로직을 완전히 이식
+        장면 생성에 공통으로 쓰이는 프롬프트 입력 수집
+
+        Returns:
+            (synopsis, characters_info, character_prompts_info)
         """
         # 시놉시스 정보
         synopsis = self.project_data.get_synopsis()
@@ -575,11 +583,6 @@ class ScenesTab(BaseTab):
         characters = self.project_data.get_characters()
         characters_info = self._format_characters_for_prompt(characters)
 
-        # 챕터 정보
-        chapter_title = chapter.get('title', '')
-        chapter_summary = chapter.get('summary', '')
-        script = chapter.get('script', '')
-
         # 인물별 이미지 프롬프트 정보 수집
         character_prompts_info = ""
         for char in characters:
@@ -587,17 +590,28 @@ class ScenesTab(BaseTab):
             prompts = char.get('image_generation_prompts', {})
             if prompts:
                 # 첫 번째 프롬프트를 참고용으로 사용
-                first_prompt = prompts.get('prompt_1', char.get('image_generation_prompt', ''))
+                first_prompt = encode_prompt(prompts.get('prompt_1', char.get('image_generation_prompt', '')))
                 if first_prompt:
                     character_prompts_info += f"\n- {char_name}: {first_prompt[:200]}...\n"
 
+        return synopsis, characters_info, character_prompts_info
+
+    def _generate_scenes(self, chapter_num: int, chapter: dict, chapter_index: int, show_message: bool = True) -> bool:
+        """
+        챕터 장면 생성 (내부 함수)
+        원본 _generate_scenes() 메서드의 로직을 완전히 이식
+        """
+        synopsis, characters_info, character_prompts_info = self._collect_scene_inputs()
+
         # LLM 호출
         try:
+            # 사용자가 직접 누른 생성은 항상 새로 호출 (결과로 캐시만 갱신)
             scenes = self.content_generator.generate_scenes(
                 chapter,
                 synopsis,
                 characters_info,
-                character_prompts_info
+                character_prompts_info,
+                use_cache=False
             )
 
             if not scenes:
@@ -612,30 +626,10 @@ class ScenesTab(BaseTab):
                         f"10개의 장면이 생성되지 않았습니다. (생성된 장면: {len(scenes)}개)"
                     )
 
-            # 챕터 데이터에 장면 저장 (참조용)
-            chapter['scenes'] = scenes
-            chapter['scenes_generated_at'] = datetime.now().isoformat()
-
-            # 데이터 업데이트
-            chapters = self.project_data.get_chapters()
-            chapters[chapter_index] = chapter
-            self.project_data.set_chapters(chapters)
-
-            # 대본 파일에 장면 정보 저장 (04_scripts/ 폴더)
-            try:
-                self.file_service.save_scenes_to_script(
-                    chapter_number=chapter_num,
-                    scenes=scenes
-                )
-            except Exception as save_error:
-                print(f"경고: 대본 파일에 장면 저장 중 오류 발생: {save_error}")
-            
-            # 챕터 파일도 저장 (참조용)
-            try:
-                single_chapter_list = [chapter]
-                self.file_service.save_chapters(single_chapter_list)
-            except Exception as save_error:
-                print(f"경고: 챕터 파일 저장 중 오류 발생: {save_error}")
+            if self._apply_generated_scenes(chapter_num, chapter, scenes):
+                ProvenanceManifest(self.file_service.get_provenance_path()).record("scenes", chapter_num, scenes_inputs(
+                    chapter, chapter.get('script', ''), synopsis, characters_info, character_prompts_info
+                ), scenes)
 
             if show_message:
                 messagebox.showinfo("완료", f"챕터 {chapter_num}의 장면이 생성되고 자동 저장되었습니다.\n생성된 장면: {len(scenes)}개")
@@ -647,6 +641,56 @@ class ScenesTab(BaseTab):
                 messagebox.showerror("오류", f"장면 생성 중 오류 발생:\n{e}")
             return False
 
+    def _apply_generated_scenes(self, chapter_num: int, chapter: dict, scenes: list) -> bool:
+        """
+        생성된 장면을 챕터 데이터에 반영하고 파일에 저장
+
+        Args:
+            chapter_num: 챕터 번호
+            chapter: 챕터 데이터
+            scenes: 생성된 장면 리스트
+
+        Returns:
+            챕터 데이터 반영 성공 여부 (파일 저장 오류는 경고만 출력)
+        """
+        if len(scenes) != 10:
+            print(f"경고: 챕터 {chapter_num} 장면 {len(scenes)}개 생성됨 (기대값 10개)")
+
+        # 챕터 데이터에 장면 저장 (참조용)
+        chapter['scenes'] = scenes
+        chapter['scenes_generated_at'] = datetime.now().isoformat()
+
+        # 데이터 업데이트 (배치 생성 중 여러 챕터가 동시에 끝날 수 있으므로 잠금)
+        with self._chapters_lock:
+            chapters = self.project_data.get_chapters()
+            chapter_index = -1
+            for i, ch in enumerate(chapters):
+                if ch.get('chapter_number') == chapter_num:
+                    chapter_index = i
+                    break
+            if chapter_index < 0:
+                return False
+            chapters[chapter_index] = chapter
+            self.project_data.set_chapters(chapters)
+
+        # 대본 파일에 장면 정보 저장 (04_scripts/ 폴더)
+        try:
+            self.file_service.save_scenes_to_script(
+                chapter_number=chapter_num,
+                scenes=scenes
+            )
+        except Exception as save_error:
+            print(f"경고: 대본 파일에 장면 저장 중 오류 발생: {save_error}")
+
+        # 챕터 파일도 저장 (참조용)
+        try:
+            single_chapter_list = [chapter]
+            self.file_service.save_chapters(single_chapter_list)
+        except Exception as save_error:
+            print(f"경고: 챕터 파일 저장 중 오류 발생: {save_error}")
+
+        return True
+
     def _format_characters_for_prompt(self, characters: list) -> str:
         """인물 정보를 프롬프트용 텍스트로 포맷팅"""
         if not characters:
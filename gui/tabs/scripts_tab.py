@@ -94,9 +94,9 @@ class ScriptsTab(BaseTab):
         self.script_viewer.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
     def update_display(self):
-        """화면 업데이트 - MD 파일 로드"""
-        # 에피소드 스크립트 로드
-        self.episodes_by_act = self.file_service.load_episode_scripts()
+        """화면 업데이트 - MD 파일 목록 로드 (내용은 에피소드 선택 시 읽음)"""
+        # 에피소드 스크립트 목록 로드
+        self.episodes_by_act = self.file_service.scan_episode_scripts()
 
         if not self.episodes_by_act:
             self._show_no_data_message()
@@ -136,9 +136,12 @@ class ScriptsTab(BaseTab):
         self.current_act = act_name
         self.current_episode_num = episode_data.get("episode_num", 0)
 
+        # 대본 내용 읽기 (선택한 에피소드 1개만)
+        content = self.file_service.read_episode_script(episode_data)
+
         # 정보 표시
         ep_title = episode_data.get("title", "")
-        char_count = episode_data.get("char_count", 0)
+        char_count = len(content)
         act_display = self._get_act_display_short(act_name)
 
         if self.info_label:
@@ -147,7 +150,6 @@ class ScriptsTab(BaseTab):
             )
 
         # 대본 내용 표시
-        content = episode_data.get("content", "")
         if self.script_viewer:
             self.script_viewer.config(state=tk.NORMAL)
             self.script_viewer.delete(1.0, tk.END)
@@ -187,7 +189,7 @@ class ScriptsTab(BaseTab):
         for ep in episodes:
             ep_num = ep.get("episode_num", 0)
             ep_title = ep.get("title", "")
-            content = ep.get("content", "")
+            content = self.file_service.read_episode_script(ep, save_manifest=False)
             char_count = len(content)
             total_chars += char_count
 
@@ -203,6 +205,7 @@ class ScriptsTab(BaseTab):
         lines.append(f"  총 {len(episodes)}개 에피소드, {total_chars:,}자")
         lines.append("=" * 70)
 
+        self.file_service.save_episode_manifest()
         full_text = "\n".join(lines)
 
         # 정보 표시
@@ -255,7 +258,7 @@ class ScriptsTab(BaseTab):
             for ep in episodes:
                 ep_num = ep.get("episode_num", 0)
                 ep_title = ep.get("title", "")
-                content = ep.get("content", "")
+                content = self.file_service.read_episode_script(ep, save_manifest=False)
                 char_count = len(content)
                 total_chars += char_count
                 total_episodes += 1
@@ -272,6 +275,7 @@ class ScriptsTab(BaseTab):
         lines.append(f"  전체 {len(sorted_acts)}막, {total_episodes}개 에피소드, {total_chars:,}자")
         lines.append("=" * 70)
 
+        self.file_service.save_episode_manifest()
         full_text = "\n".join(lines)
 
         # 정보 표시
@@ -26,6 +26,9 @@ except ImportError:
 from config.config_manager import ConfigManager
 from models.project_data import ProjectData
 from services.file_service import FileService
+from services.project_index import ProjectIndex, DEFAULT_INDEX_PATH
+from services.write_queue import WriteBehindQueue
+from utils.parallel_io import set_io_workers, DEFAULT_IO_WORKERS
 from services.llm_service import LLMService
 from services.content_generator import ContentGenerator
 from gui.main_window import MainWindow
@@ -83,11 +86,27 @@ def main():
     # 초기 프로젝트 경로 (빈 경로로 시작, MainWindow에서 선택)
     initial_project_path = prompts_path
 
-    # 프로젝트 데이터 모델 생성
-    project_data = ProjectData(str(initial_project_path))
-
-    # 파일 서비스 생성
-    file_service = FileService(initial_project_path)
+    # 프로젝트 데이터 모델 생성 (로드한 엔티티를 __slots__ 객체로 보관)
+    project_data = ProjectData(str(initial_project_path),
+                               typed_entities=config_manager.get("typed_entities_enabled", True))
+
+    # 프로젝트 파일 동시 읽기 스레드 수
+    set_io_workers(config_manager.get("file_io_workers", DEFAULT_IO_WORKERS))
+
+    # 파일 서비스 생성 (프로젝트 인덱스 사용 시 바뀌지 않은 JSON 파일은 다시 파싱하지 않음)
+    project_index = None
+    if config_manager.get("project_index_enabled", True):
+        project_index = ProjectIndex(Path(config_manager.get("project_index_path", "") or DEFAULT_INDEX_PATH))
+    write_queue = None
+    if config_manager.get("write_behind_enabled", True):
+        write_queue = WriteBehindQueue(fsync=config_manager.get("write_fsync", True))
+    file_service = FileService(
+        initial_project_path,
+        index=project_index,
+        lazy_chapters=config_manager.get("lazy_chapters_enabled", True),
+        chapter_body_cache_size=config_manager.get("chapter_body_cache_size", 32),
+        write_queue=write_queue,
+    )
 
     # LLM 서비스 생성
     llm_service = LLMService(config_manager)
@@ -114,6 +133,13 @@ def main():
     # 메인 루프 실행
     root.mainloop()
 
+    # 종료 전 예약된 저장 마무리
+    if write_queue is not None:
+        write_queue.close()
+        failed = write_queue.get_stats()["failed"]
+        if failed:
+            print(f"[종료] 파일 {failed}개 저장 실패")
+
 
 if __name__ == "__main__":
     main()
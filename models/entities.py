@@ -0,0 +1,197 @@
+"""
+프로젝트 엔티티 모델
+시놉시스, 캐릭터, 챕터(에피소드), 이미지 프롬프트를 __slots__ 기반 객체로 표현합니다.
+딕셔너리와 같은 방식(get, [], in, items)으로 사용할 수 있고, 기존 JSON 형식으로 손실 없이 변환됩니다.
+엔티티 안의 값(장면 리스트, 중첩 딕셔너리)은 JSON에서 읽은 그대로 두므로 isinstance(x, dict) 검사도 그대로 통과합니다.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# 슬롯에 값이 없음을 나타내는 표시
+_MISSING = object()
+
+# 같은 키 순서는 튜플 하나를 공유 (엔티티마다 키 목록을 따로 두지 않음)
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class Entity(MutableMapping):
+    """
+    엔티티 기본 클래스
+
+    FIELDS에 있는 키는 슬롯에, 그 밖의 키는 _extra 딕셔너리에 저장한다.
+    키 순서(_keys)를 함께 보관하므로 to_dict() 결과는 원래 JSON과 키 순서까지 같다.
+    """
+
+    __slots__ = ("_keys", "_extra")
+    _FIELD_SET: frozenset = frozenset()
+
+    # 슬롯으로 저장할 키 (하위 클래스에서 __slots__와 같게 지정)
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        clashes = [name for name in cls.FIELDS if hasattr(Entity, name)]
+        if clashes:
+            raise TypeError(f"{cls.__name__}: 필드 이름이 메서드와 겹침 {clashes}")
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, data: Optional[Mapping] = None):
+        self._keys: Tuple[str, ...] = ()
+        self._extra: Optional[Dict[str, Any]] = None
+        if data:
+            self._assign(data)
+
+    def _assign(self, data: Mapping):
+        """빈 엔티티에 키/값 채우기 (키 순서 유지)"""
+        fields = self._FIELD_SET
+        extra = None
+        for key, value in data.items():
+            if key in fields:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+        self._keys = _intern_keys(tuple(data.keys()))
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Entity":
+        """JSON에서 읽은 딕셔너리로 엔티티 생성"""
+        entity = cls.__new__(cls)
+        entity._keys = ()
+        entity._extra = None
+        entity._assign(data)
+        return entity
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원래 JSON 형식의 딕셔너리로 변환 (키 순서 유지, 값에 넣은 엔티티도 변환)"""
+        result: Dict[str, Any] = {}
+        for key in self._keys:
+            value = self[key]
+            if isinstance(value, Entity):
+                value = value.to_dict()
+            result[key] = value
+        return result
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELD_SET:
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        if key not in self._keys:
+            self._keys = _intern_keys(self._keys + (key,))
+
+    def __delitem__(self, key: str):
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self._FIELD_SET:
+            object.__delattr__(self, key)
+        else:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+        self._keys = _intern_keys(tuple(k for k in self._keys if k != key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def copy(self) -> "Entity":
+        """얕은 복사 (dict.copy와 같음)"""
+        return type(self).from_dict(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Chapter(Entity):
+    """챕터 (03_chapters 챕터 파일 또는 scenes 폴더 에피소드, scenes는 딕셔너리 리스트 그대로)"""
+    FIELDS = ("_filename", "_folder", "_source", "chapter_number", "title", "summary", "script",
+              "act", "act_title", "work_title", "main_locations", "characters", "core_emotion",
+              "key_events", "mood", "scenes", "total_scenes", "key_objects")
+    __slots__ = FIELDS
+
+
+class Character(Entity):
+    """캐릭터 프로필"""
+    FIELDS = ("_filename", "_original_structure", "name", "name_en", "age", "prompt_age", "gender",
+              "role", "occupation", "personality", "appearance", "background", "symbolic_item",
+              "work_title", "versions", "relationships", "character_detail",
+              "image_generation_prompt", "image_generation_prompts")
+    __slots__ = FIELDS
+
+
+class Synopsis(Entity):
+    """시놉시스"""
+    FIELDS = ("title", "genre", "logline", "theme", "setting", "synopsis", "full_story",
+              "total_chapters", "acts", "chapters", "characters")
+    __slots__ = FIELDS
+
+
+class ImagePrompt(Entity):
+    """캐릭터 이미지 프롬프트 파일 (02_characters/image_prompts/)"""
+    FIELDS = ("character_name", "image_generation_prompts", "updated_at")
+    __slots__ = FIELDS
+
+
+# ProjectData.data 키별 엔티티 클래스
+ENTITY_CLASSES: Dict[str, type] = {
+    "synopsis": Synopsis,
+    "characters": Character,
+    "chapters": Chapter,
+}
+
+
+def to_entity(kind: str, value: Any) -> Any:
+    """
+    JSON에서 읽은 값을 엔티티로 변환 (딕셔너리 하위 클래스인 지연 로딩 챕터, 이미 변환된 값은 그대로)
+
+    Args:
+        kind: "synopsis", "characters", "chapters"
+        value: 딕셔너리 또는 딕셔너리 리스트
+
+    Returns:
+        엔티티 또는 엔티티 리스트
+    """
+    entity_cls = ENTITY_CLASSES[kind]
+    if isinstance(value, list):
+        return [entity_cls.from_dict(v) if type(v) is dict else v for v in value]
+    if type(value) is dict:
+        return entity_cls.from_dict(value)
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps(default=...)용 변환 (엔티티 -> 딕셔너리)"""
+    if isinstance(value, Entity):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
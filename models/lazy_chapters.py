@@ -0,0 +1,198 @@
+"""
+지연 로딩 챕터
+에피소드 파일의 가벼운 정보(번호, 제목, 막, 파일 경로, 장면 수)만 먼저 들고 있다가
+장면 본문은 처음 접근할 때 읽습니다. 읽은 본문은 최근 사용 순서(LRU)로 일정 개수만 메모리에 둡니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Tuple
+
+# 본문(장면 등)을 지연 로딩하는 키
+LAZY_CHAPTER_KEYS = ("scenes", "key_objects")
+
+# 메모리에 둘 에피소드 본문 수
+DEFAULT_BODY_CACHE_SIZE = 32
+
+
+class ChapterBodyCache:
+    """에피소드 본문 LRU 캐시 (파일이 바뀌면 다시 읽음)"""
+
+    def __init__(self, load: Callable[[Path], Dict[str, Any]], max_entries: int = DEFAULT_BODY_CACHE_SIZE):
+        """
+        Args:
+            load: 파일 경로를 받아 {"scenes": [...], "key_objects": [...]}를 반환하는 함수
+            max_entries: 메모리에 둘 최대 본문 수
+        """
+        self._load = load
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        # 경로 -> ((mtime_ns, size), 본문)
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "loads": 0, "evictions": 0}
+
+    def get(self, path: Path) -> Dict[str, Any]:
+        """
+        본문 조회 (없거나 파일이 바뀌었으면 읽기)
+
+        Args:
+            path: 에피소드 파일 경로
+
+        Returns:
+            {"scenes": [...], "key_objects": [...]} (읽기 실패 시 빈 값)
+        """
+        key = str(path)
+        try:
+            st = os.stat(path)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = (0, 0)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+
+        try:
+            body = self._load(Path(path))
+        except Exception as e:
+            print(f"에피소드 본문 로드 오류 ({Path(path).name}): {e}")
+            body = {}
+        body = {k: body.get(k, []) for k in LAZY_CHAPTER_KEYS}
+
+        with self._lock:
+            self.stats["loads"] += 1
+            self._entries[key] = (signature, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return body
+
+    def discard(self, path: Path):
+        """본문 항목 삭제"""
+        with self._lock:
+            self._entries.pop(str(path), None)
+
+    def clear(self):
+        """모든 본문 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """적중/로드/삭제 횟수와 현재 항목 수"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            return stats
+
+
+class LazyChapter(dict):
+    """
+    장면 본문을 지연 로딩하는 챕터 딕셔너리
+
+    일반 dict처럼 쓰되 "scenes", "key_objects"는 처음 접근할 때 ChapterBodyCache에서 가져온다.
+    값을 직접 대입한 키는 캐시와 관계없이 그대로 유지된다 (편집 중인 장면이 사라지지 않음).
+    캐시에서 받은 목록을 제자리에서 고칠 때는 먼저 load()로 고정하거나 새 목록을 대입해야 한다.
+    """
+
+    def __init__(self, metadata: Dict[str, Any], path: Path, body_cache: ChapterBodyCache):
+        """
+        Args:
+            metadata: 본문을 제외한 챕터 정보 (chapter_number, title, act, total_scenes 등)
+            path: 에피소드 파일 경로
+            body_cache: 본문 캐시
+        """
+        super().__init__(metadata)
+        self._path = Path(path)
+        self._body_cache = body_cache
+
+    @property
+    def source_path(self) -> Path:
+        """에피소드 파일 경로"""
+        return self._path
+
+    def is_loaded(self) -> bool:
+        """본문이 이 챕터에 직접 들어 있는지 (대입했거나 load()로 고정한 경우)"""
+        return all(dict.__contains__(self, key) for key in LAZY_CHAPTER_KEYS)
+
+    def load(self) -> "LazyChapter":
+        """본문을 읽어 챕터에 고정 (이후 캐시에서 밀려나도 유지)"""
+        body = self._body_cache.get(self._path)
+        for key in LAZY_CHAPTER_KEYS:
+            if not dict.__contains__(self, key):
+                dict.__setitem__(self, key, body.get(key, []))
+        return self
+
+    def __missing__(self, key):
+        if key in LAZY_CHAPTER_KEYS:
+            return self._body_cache.get(self._path).get(key, [])
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key) or key in LAZY_CHAPTER_KEYS:
+            return self[key]
+        return default
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in LAZY_CHAPTER_KEYS
+
+    def keys(self):
+        return list(self.__iter__())
+
+    def __iter__(self):
+        yield from dict.__iter__(self)
+        for key in LAZY_CHAPTER_KEYS:
+            if not dict.__contains__(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + sum(1 for key in LAZY_CHAPTER_KEYS if not dict.__contains__(self, key))
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def pop(self, key, *default):
+        if key in LAZY_CHAPTER_KEYS and not dict.__contains__(self, key):
+            dict.__setitem__(self, key, self[key])
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key in LAZY_CHAPTER_KEYS and not dict.__contains__(self, key):
+            dict.__setitem__(self, key, self[key])
+        return dict.setdefault(self, key, default)
+
+    def copy(self) -> Dict[str, Any]:
+        """본문까지 포함한 일반 dict 복사본"""
+        return dict(self.items())
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        import copy
+        return copy.deepcopy(self.copy(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, dict):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyChapter({dict.__repr__(self)}, path={self._path.name!r}, loaded={self.is_loaded()})"
@@ -3,21 +3,96 @@
 시놉시스, 캐릭터, 챕터 등의 데이터 구조를 정의합니다.
 """
 
-from typing import Dict, List, Any, Optional
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from pathlib import Path
+from utils.file_utils import normalize_character_name
+from models.entities import Entity, to_entity, json_default
+
+# 엔티티 단위 변경 추적 대상
+TRACKED_ENTITY_KINDS = ("characters", "chapters")
+
+
+def entity_digest(entity: Dict[str, Any]) -> str:
+    """
+    엔티티 내용 해시 (파일명 등 "_"로 시작하는 내부 키 제외)
+
+    지연 로딩 챕터는 직접 들어 있는 값만 사용한다 (읽지 않은 본문은 파일 그대로이므로 변경 없음).
+    """
+    items = dict.items(entity) if isinstance(entity, dict) else entity.items()
+    payload = {k: v for k, v in items if not str(k).startswith('_')}
+    content = json.dumps(payload, ensure_ascii=False, sort_keys=True,
+                         default=lambda v: json_default(v) if isinstance(v, Entity) else str(v))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def entity_key(kind: str, entity: Dict[str, Any], position: int) -> str:
+    """엔티티 식별 키 (캐릭터: 이름, 챕터: 번호, 없으면 순서)"""
+    if kind == "characters":
+        name = entity.get('name') if isinstance(entity, Mapping) else None
+        if isinstance(name, str) and name.strip():
+            return normalize_character_name(name)
+    elif kind == "chapters":
+        if isinstance(entity, dict):
+            number = dict.get(entity, 'chapter_number')
+        else:
+            number = entity.get('chapter_number') if isinstance(entity, Mapping) else None
+        if number not in (None, ''):
+            return str(number)
+    return f"#{position}"
+
+
+def _character_lookup_key(character: Mapping) -> Optional[str]:
+    name = character.get('name')
+    return normalize_character_name(name) if isinstance(name, str) and name.strip() else None
 
 
 class ProjectData:
     """프로젝트 데이터 관리 클래스"""
 
-    def __init__(self, project_path: str = "01_man/001_gym_romance"):
+    def __init__(self, project_path: str = "01_man/001_gym_romance", typed_entities: bool = True):
+        """
+        Args:
+            project_path: 프로젝트 폴더 경로
+            typed_entities: 로드한 시놉시스/캐릭터/챕터를 __slots__ 엔티티(models.entities)로 변환할지 여부
+        """
         self.project_path = Path(project_path)
+        self.typed_entities = typed_entities
         self.data: Dict[str, Any] = {
             'synopsis': {},
             'characters': [],
             'chapters': []
         }
         self.unsaved_changes: Dict[str, bool] = {}
+        # 엔티티별 변경 추적: 명시적으로 표시된 키, 마지막 저장(또는 로드) 시점의 내용 해시와 순서
+        self._dirty: Dict[str, Set[str]] = {kind: set() for kind in TRACKED_ENTITY_KINDS}
+        self._persisted_hashes: Dict[str, Dict[str, str]] = {kind: {} for kind in TRACKED_ENTITY_KINDS}
+        self._persisted_order: Dict[str, List[str]] = {kind: [] for kind in TRACKED_ENTITY_KINDS}
+        # 조회 인덱스: 종류 -> (키 -> 목록 위치), 만들 때의 목록 (다른 목록으로 바뀌면 다시 생성)
+        self._lookup: Dict[str, Dict[Any, int]] = {}
+        self._lookup_source: Dict[str, Tuple[int, int]] = {}
+
+    def load_data(self, data: Dict[str, Any]):
+        """파일에서 읽은 데이터로 교체 (읽은 내용을 저장된 상태로 기록)"""
+        if self.typed_entities:
+            for kind in ("synopsis", "characters", "chapters"):
+                if kind in data:
+                    data[kind] = to_entity(kind, data[kind])
+        self.data = data
+        self.mark_persisted()
+        self.clear_unsaved()
+
+    def make_entities(self, kind: str, value: Any) -> Any:
+        """
+        파일에서 다시 읽은 값을 현재 설정에 맞는 형태로 변환 (typed_entities면 엔티티)
+
+        Args:
+            kind: "synopsis", "characters", "chapters"
+            value: 딕셔너리 또는 딕셔너리 리스트
+        """
+        return to_entity(kind, value) if self.typed_entities else value
 
     def get_synopsis(self) -> Dict[str, Any]:
         """시놉시스 데이터 반환"""
@@ -46,21 +121,151 @@ class ProjectData:
         self.data['chapters'] = chapters
         self.mark_unsaved('chapters')
 
+    def _build_lookup(self, kind: str, entities: List[Any], key_of) -> Dict[Any, int]:
+        """조회 인덱스 생성 (키가 같은 항목이 여럿이면 앞의 것)"""
+        lookup: Dict[Any, int] = {}
+        for position, entity in enumerate(entities):
+            key = key_of(entity) if isinstance(entity, Mapping) else None
+            if key is not None:
+                try:
+                    lookup.setdefault(key, position)
+                except TypeError:
+                    pass  # 해시할 수 없는 키는 인덱스에서 제외
+        self._lookup[kind] = lookup
+        self._lookup_source[kind] = (id(entities), len(entities))
+        return lookup
+
+    def _find(self, kind: str, key: Any, key_of) -> Optional[Dict[str, Any]]:
+        """
+        인덱스로 엔티티 찾기
+
+        목록을 직접 수정(추가/교체/번호 변경)해도 결과가 선형 탐색과 같도록 찾은 항목의 키를 확인하고,
+        다르거나 없으면 인덱스를 다시 만들어 한 번 더 찾는다.
+        """
+        entities = self.data.get(kind, [])
+        if not isinstance(entities, list):
+            return None
+        lookup = self._lookup.get(kind)
+        rebuilt = lookup is None or self._lookup_source.get(kind) != (id(entities), len(entities))
+        if rebuilt:
+            lookup = self._build_lookup(kind, entities, key_of)
+        position = lookup.get(key)
+        if position is not None and key_of(entities[position]) == key:
+            return entities[position]
+        if not rebuilt:
+            position = self._build_lookup(kind, entities, key_of).get(key)
+            if position is not None:
+                return entities[position]
+        return None
+
     def get_chapter_by_number(self, chapter_num: int) -> Optional[Dict[str, Any]]:
         """챕터 번호로 챕터 찾기"""
-        for chapter in self.get_chapters():
-            if chapter.get('chapter_number') == chapter_num:
-                return chapter
-        return None
+        return self._find('chapters', chapter_num, lambda c: c.get('chapter_number'))
+
+    def get_character_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """캐릭터 이름으로 캐릭터 찾기 (공백 차이 무시)"""
+        if not isinstance(name, str) or not name.strip():
+            return None
+        return self._find('characters', normalize_character_name(name), _character_lookup_key)
 
     def mark_unsaved(self, key: str):
         """저장되지 않은 변경사항 표시"""
         self.unsaved_changes[key] = True
 
-    def clear_unsaved(self):
-        """저장되지 않은 변경사항 초기화"""
-        self.unsaved_changes.clear()
+    def clear_unsaved(self, key: Optional[str] = None):
+        """
+        저장되지 않은 변경사항 초기화
+
+        Args:
+            key: 지정하면 해당 종류만 (None이면 모두)
+        """
+        if key is None:
+            self.unsaved_changes.clear()
+        else:
+            self.unsaved_changes.pop(key, None)
 
     def has_unsaved_changes(self) -> bool:
         """저장되지 않은 변경사항 확인"""
-        return bool(self.unsaved_changes)
+        return bool(self.unsaved_changes) or any(self._dirty.values())
+
+    def _entities(self, kind: str) -> List[Dict[str, Any]]:
+        entities = self.data.get(kind, [])
+        return [e for e in entities if isinstance(e, Mapping)] if isinstance(entities, list) else []
+
+    def mark_entity_dirty(self, kind: str, key: Any):
+        """
+        엔티티 하나를 변경됨으로 표시
+
+        Args:
+            kind: "characters" 또는 "chapters"
+            key: 캐릭터 이름 또는 챕터 번호
+        """
+        self._dirty[kind].add(normalize_character_name(str(key)) if kind == "characters" else str(key))
+        self.mark_unsaved(kind)
+
+    def mark_persisted(self, kind: Optional[str] = None, keys: Optional[Iterable[str]] = None):
+        """
+        현재 내용을 저장된 상태로 기록 (로드 직후, 파일에 쓴 것이 확인된 뒤 호출)
+
+        unsaved_changes는 건드리지 않는다 (저장 실패 시 호출한 쪽에서 변경 표시를 유지할 수 있도록).
+
+        Args:
+            kind: "characters" 또는 "chapters" (None이면 모두)
+            keys: 지정하면 해당 키의 엔티티만 기록 (일부 파일만 써진 경우, 목록 순서는 그대로)
+        """
+        for k in ([kind] if kind else TRACKED_ENTITY_KINDS):
+            entities = self._entities(k)
+            entity_keys = [entity_key(k, e, i) for i, e in enumerate(entities, start=1)]
+            if keys is None:
+                self._persisted_hashes[k] = {key: entity_digest(e) for key, e in zip(entity_keys, entities)}
+                self._persisted_order[k] = entity_keys
+                self._dirty[k].clear()
+                continue
+            wanted = set(keys)
+            for key, entity in zip(entity_keys, entities):
+                if key in wanted:
+                    self._persisted_hashes[k][key] = entity_digest(entity)
+                    self._dirty[k].discard(key)
+
+    def get_dirty_entities(self, kind: str) -> Set[str]:
+        """
+        마지막 저장 이후 바뀐 엔티티 키 (명시적 표시 + 내용 해시 비교, 삭제된 키 포함)
+
+        Args:
+            kind: "characters" 또는 "chapters"
+
+        Returns:
+            바뀐 키 집합 (순서가 바뀌면 파일명이 달라지므로 모든 키)
+        """
+        entities = self._entities(kind)
+        keys = [entity_key(kind, e, i) for i, e in enumerate(entities, start=1)]
+        persisted = self._persisted_hashes[kind]
+        if keys != self._persisted_order[kind]:
+            return set(keys) | set(persisted)
+        dirty = set(self._dirty[kind])
+        for key, entity in zip(keys, entities):
+            if persisted.get(key) != entity_digest(entity):
+                dirty.add(key)
+        return dirty
+
+    def is_entity_dirty(self, kind: str, entity: Dict[str, Any], position: int) -> bool:
+        """
+        엔티티 하나가 마지막 저장 이후 바뀌었는지
+
+        Args:
+            kind: "characters" 또는 "chapters"
+            entity: 엔티티
+            position: 목록에서의 순서 (1부터)
+        """
+        key = entity_key(kind, entity, position)
+        return key in self._dirty[kind] or self._persisted_hashes[kind].get(key) != entity_digest(entity)
+
+    def mark_entity_persisted(self, kind: str, entity: Dict[str, Any], position: int):
+        """엔티티 하나를 저장된 상태로 기록 (파일에서 다시 읽었을 때)"""
+        key = entity_key(kind, entity, position)
+        self._persisted_hashes[kind][key] = entity_digest(entity)
+        self._dirty[kind].discard(key)
+
+    def is_dirty(self, kind: str) -> bool:
+        """해당 종류 엔티티 중 바뀐 것이 있는지"""
+        return bool(self.get_dirty_entities(kind))
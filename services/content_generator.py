@@ -3,8 +3,58 @@
 LLM을 사용하여 대본, 장면, 프로필 등을 생성합니다.
 """
 
-from typing import Dict, List, Any, Optional
+import json
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime
+from pathlib import Path
+
+from utils.token_counter import estimate_tokens, fit_sections
+from services.llm_batch_service import BATCH_ENDED, BATCH_APPLIED
+from services.output_repair import (
+    EXPECTED_SCENE_COUNT, RepairTelemetry, merge_missing, merge_scenes,
+    validate_character_profile, validate_image_prompts, validate_scenes,
+)
+
+
+# 캐릭터 이미지 프롬프트 시스템 프롬프트 (단일/묶음 생성 공용)
+IMAGE_PROMPTS_SYSTEM_PROMPT = """당신은 이미지 생성을 위한 전문 프롬프트 엔지니어입니다.
+주어진 인물 정보를 바탕으로 동일한 인물의 동일성을 반드시 유지하며 7가지 다른 스타일의 상세한 이미지 생성 프롬프트를 영어로 작성해주세요.
+
+**중요 원칙**:
+1. 이미지 프롬프트는 반드시 JSON 구조(character, clothing, pose, background, situation, combined)로 작성해야 합니다.
+2. 모든 키워드는 영어로 작성해야 합니다.
+3. 각 등장인물마다 별도의 JSON 구조를 문자열로 포함시켜야 합니다.
+4. 반드시 유효한 JSON 형식으로만 출력하고, 추가 설명이나 마크다운은 포함하지 마세요.
+5. 한국인은 60대면 15~20살 어린 모습으로 이미지 프롬프트 작성
+6. 멋진 모습 중심으로 작성
+7. 인물 정보(character)는 고정하고, 동작(pose), 옷(clothing), 배경(background), 상황(situation)은 쉽게 변경 가능하도록 JSON 구조로 구분
+
+**JSON 구조 형식**:
+각 등장인물마다 다음과 같은 JSON 구조로 작성:
+{
+  "character": "인물의 고정된 외모 특징 (나이, 체형, 얼굴, 헤어 등) - 영어로 작성",
+  "clothing": "의상 및 스타일 (옷 종류, 색상, 액세서리 등) - 영어로 작성",
+  "pose": "포즈 및 표정 (서 있는, 앉은, 표정, 시선 등) - 영어로 작성",
+  "background": "배경 설정 (실내/실외, 장소, 조명 등) - 영어로 작성",
+  "situation": "상황 및 분위기 (로맨틱, 드라마틱, 일상적 등) - 영어로 작성",
+  "combined": "위의 모든 요소를 쉼표와 줄바꿈(\\n)으로 구분하여 합친 최종 프롬프트. 각 요소(character, clothing, pose, background, situation)는 줄바꿈으로 구분하고, 각 요소 내부는 쉼표로 구분"
+}
+
+**나이 표현 규칙**:
+- 반드시 youth age만 사용하고, 실제 나이는 절대 표시하지 마세요
+- 형식: "Korean man/woman, [youth나이]-year-old, ..."
+- 예시: "Korean man, 27-year-old, ..." 또는 "Korean woman, 25-year-old, ..."
+- Youth age는 건강하고 젊어보이고 세련된 외모를 표현하기 위한 나이입니다.
+- 실제 나이는 이미지 프롬프트에 포함하지 마세요."""
+
+# 캐릭터 1명분 이미지 프롬프트 키 (7종)
+IMAGE_PROMPT_KEYS = (
+    "full_body_shot", "side_profile_full_body_shot", "diagonal_side_profile_full_body_shot",
+    "portrait", "side_profile", "action", "natural_background",
+)
+
+# 캐릭터 1명분 이미지 프롬프트 응답의 대략적인 토큰 수 (묶음 크기 계산용)
+IMAGE_PROMPTS_TOKENS_PER_CHARACTER = 1800
 
 
 class ContentGenerator:
@@ -16,6 +66,7 @@ class ContentGenerator:
             llm_service: LLMService 인스턴스
         """
         self.llm = llm_service
+        self.repair_telemetry = RepairTelemetry()
 
     def generate_character_profile(self, synopsis: Dict, char_name: str, char_info: Dict) -> Optional[Dict]:
         """
@@ -98,13 +149,19 @@ class ContentGenerator:
                 # JSON 추출
                 from utils.json_utils import extract_json_from_text, safe_json_loads
                 json_text = extract_json_from_text(response)
-                return safe_json_loads(json_text)
+                profile = safe_json_loads(json_text)
+                if isinstance(profile, dict):
+                    full_tokens = self.llm.estimate_tokens(system_prompt + user_prompt + response)
+                    profile = self._repair_character_profile(profile, synopsis, char_name, char_info,
+                                                             system_prompt, full_tokens)
+                return profile
         except Exception as e:
             print(f"프로필 생성 오류 ({char_name}): {e}")
 
         return None
 
-    def generate_script(self, chapter: Dict, synopsis: Dict, characters_info: str, previous_script: str = "") -> Optional[str]:
+    def generate_script(self, chapter: Dict, synopsis: Dict, characters_info: str, previous_script: str = "",
+                        use_cache: bool = True) -> Optional[str]:
         """
         챕터 대본 생성
 
@@ -112,11 +169,524 @@ class ContentGenerator:
             chapter: 챕터 데이터
             synopsis: 시놉시스 데이터
             characters_info: 인물 정보 (포맷팅된 문자열)
-            previous_script: 이전 챕터 대본 (연속성 유지용)
+            previous_script: 이전 챕터 흐름 (build_story_context() 결과 또는 이전 대본, 연속성 유지용)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+
+        Returns:
+            생성된 대본 텍스트 또는 None
+        """
+        chapter_num = chapter.get('chapter_number', 0)
+        system_prompt, prefix, user_prompt = self._build_script_prompts(chapter, synopsis, characters_info, previous_script)
+
+        try:
+            script = self.llm.call(user_prompt, system_prompt, use_cache=use_cache, prefix=prefix)
+            return script.strip() if script else None
+        except Exception as e:
+            print(f"대본 생성 오류 (챕터 {chapter_num}): {e}")
+            return None
+
+    def stream_script(self, chapter: Dict, synopsis: Dict, characters_info: str, previous_script: str = "",
+                      use_cache: bool = True, on_delta: Optional[Callable[[str], None]] = None,
+                      partial_path: Optional[Path] = None) -> Optional[str]:
+        """
+        챕터 대본 스트리밍 생성
+
+        Args:
+            chapter: 챕터 데이터
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            previous_script: 이전 챕터 흐름 (build_story_context() 결과 또는 이전 대본, 연속성 유지용)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            on_delta: 텍스트 조각을 받을 때마다 호출되는 콜백 (호출한 스레드에서 실행)
+            partial_path: 받은 내용을 즉시 이어쓸 임시 초안 파일 (중단 시에도 남음)
 
         Returns:
             생성된 대본 텍스트 또는 None
         """
+        chapter_num = chapter.get('chapter_number', 0)
+        system_prompt, prefix, user_prompt = self._build_script_prompts(chapter, synopsis, characters_info, previous_script)
+
+        partial_file = None
+        parts: List[str] = []
+        try:
+            if partial_path is not None:
+                partial_path.parent.mkdir(parents=True, exist_ok=True)
+                partial_file = open(partial_path, 'w', encoding='utf-8')
+
+            for delta in self.llm.stream(user_prompt, system_prompt, use_cache=use_cache, prefix=prefix):
+                parts.append(delta)
+                if partial_file is not None:
+                    partial_file.write(delta)
+                    partial_file.flush()
+                if on_delta is not None:
+                    on_delta(delta)
+        except Exception as e:
+            print(f"대본 스트리밍 오류 (챕터 {chapter_num}): {e}")
+            return None
+        finally:
+            if partial_file is not None:
+                partial_file.close()
+
+        script = "".join(parts).strip()
+        return script if script else None
+
+    def generate_scripts_batch(self, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                               previous_scripts: Optional[List[str]] = None, use_cache: bool = True,
+                               concurrency: Optional[int] = None,
+                               on_result: Optional[Callable[[Dict, Optional[str]], None]] = None
+                               ) -> List[Optional[str]]:
+        """
+        여러 챕터의 대본을 동시에 생성
+
+        이전 챕터 대본이 아직 없는 상태에서 동시에 만들기 때문에 연속성 참고 자료는
+        previous_scripts로 미리 준비된 것만 사용한다.
+
+        Args:
+            chapters: 챕터 데이터 리스트
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            previous_scripts: 챕터별 연속성 참고 텍스트 (chapters와 같은 순서, 선택적)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 챕터 1개가 끝날 때마다 (chapter, script)로 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            chapters와 같은 순서의 대본 리스트 (실패한 챕터는 None)
+        """
+        requests = []
+        for i, chapter in enumerate(chapters):
+            previous_script = previous_scripts[i] if previous_scripts and i < len(previous_scripts) else ""
+            system_prompt, prefix, user_prompt = self._build_script_prompts(
+                chapter, synopsis, characters_info, previous_script
+            )
+            requests.append({
+                "prompt": user_prompt,
+                "system_prompt": system_prompt,
+                "prefix": prefix,
+                "use_cache": use_cache,
+            })
+
+        return self._run_batch(
+            requests, chapters, lambda text: text.strip() if text else None,
+            lambda chapter: f"대본 생성 오류 (챕터 {chapter.get('chapter_number', 0)})",
+            concurrency, on_result
+        )
+
+    def generate_series(self, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                        characters: Optional[List[Dict]] = None, character_prompts_info: str = "",
+                        story_state=None, overwrite_scripts: bool = False, use_cache: bool = True,
+                        concurrency: Optional[int] = None,
+                        on_result: Optional[Callable[[str, Any, Any], None]] = None,
+                        stale: Optional[Dict[str, List[Any]]] = None) -> Dict[str, Dict]:
+        """
+        시리즈 전체 생성 (대본 → 장면, 캐릭터 이미지 프롬프트를 의존 관계에 따라 동시에)
+
+        대본(N)은 대본(N-1)(story_state가 있으면 요약(N-1))이 끝나야 시작하고,
+        장면(N)은 대본(N)만 기다린다. 캐릭터 이미지 프롬프트는 다른 작업과 무관하게 실행된다.
+        따라서 전체 소요 시간은 대본 연쇄(임계 경로)에 가깝다.
+
+        Args:
+            chapters: 챕터 데이터 리스트 (chapter_number 순서)
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            characters: 이미지 프롬프트를 만들 캐릭터 리스트 (선택적)
+            character_prompts_info: 장면 생성용 인물 이미지 프롬프트 참고 정보
+            story_state: StoryStateCache 인스턴스 (있으면 이전 챕터 요약 전체를 연속성 자료로 사용)
+            overwrite_scripts: False면 대본이 이미 있는 챕터는 기존 대본 사용
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 작업 수 (None이면 설정의 llm_concurrency)
+            on_result: 작업 1개가 끝날 때마다 (종류, 챕터 번호 또는 캐릭터, 결과)로 호출되는 콜백
+                       종류는 "script", "scenes", "image_prompts" (스케줄러 스레드에서 호출됨)
+            stale: ProvenanceManifest.plan_stale() 결과 (주어지면 목록에 있는 생성물만 다시 생성하고
+                   나머지 챕터는 기존 대본을 사용)
+
+        Returns:
+            {"scripts": {챕터 번호: 대본}, "scenes": {챕터 번호: 장면 리스트},
+             "image_prompts": {캐릭터 이름: 프롬프트}, "failed": [작업 ID, ...]}
+        """
+        from services.job_scheduler import JobScheduler, Job
+
+        if concurrency is None:
+            concurrency = self.llm.config.get("llm_concurrency", 4)
+        scheduler = JobScheduler(max_workers=concurrency)
+        ordered = sorted(chapters, key=lambda ch: ch.get('chapter_number', 0))
+        scripts: Dict[int, str] = {}
+        reused: set = set()
+
+        def script_job(chapter: Dict):
+            def run(deps: Dict[str, Any]) -> Optional[str]:
+                number = chapter.get('chapter_number', 0)
+                existing = str(chapter.get('script', '') or '')
+                if stale is not None:
+                    keep = number not in stale.get("scripts", [])
+                else:
+                    keep = bool(existing) and not overwrite_scripts
+                if keep:
+                    reused.add(number)
+                    return existing
+                if story_state is not None:
+                    previous = self.build_story_context(number, dict(scripts), story_state)
+                else:
+                    previous = scripts.get(number - 1, "")
+                    previous = "..." + previous[-1000:] if len(previous) > 1000 else previous
+                return self.generate_script(chapter, synopsis, characters_info, previous, use_cache=use_cache)
+            return run
+
+        def scenes_job(chapter: Dict, number: int):
+            def run(deps: Dict[str, Any]) -> Optional[List[Dict]]:
+                target = dict(chapter)
+                target['script'] = deps[f"script:{number}"]
+                return self.generate_scenes(target, synopsis, characters_info, character_prompts_info,
+                                            use_cache=use_cache)
+            return run
+
+        def image_prompts_job(character: Dict):
+            def run(deps: Dict[str, Any]) -> Optional[Dict]:
+                return self.generate_image_prompts(character, synopsis, 0, use_cache=use_cache)
+            return run
+
+        # 임계 경로인 대본 연쇄를 먼저 추가 (준비된 작업은 추가 순서대로 실행)
+        previous_id = None
+        for chapter in ordered:
+            number = chapter.get('chapter_number', 0)
+            job_id = f"script:{number}"
+            scheduler.add(job_id, script_job(chapter), [previous_id] if previous_id else [])
+            previous_id = job_id
+        for chapter in ordered:
+            number = chapter.get('chapter_number', 0)
+            if stale is None or number in stale.get("scenes", []):
+                scheduler.add(f"scenes:{number}", scenes_job(chapter, number), [f"script:{number}"])
+        for i, character in enumerate(characters or []):
+            if stale is None or character.get('name', '') in stale.get("image_prompts", []):
+                scheduler.add(f"image_prompts:{i}", image_prompts_job(character))
+
+        results: Dict[str, Dict] = {"scripts": {}, "scenes": {}, "image_prompts": {}, "failed": []}
+
+        def on_event(job: Job):
+            if job.status in (Job.FAILED, Job.SKIPPED):
+                results["failed"].append(job.job_id)
+                return
+            if job.status != Job.DONE:
+                return
+            kind, key = job.job_id.split(":", 1)
+            if kind == "script":
+                number = int(key)
+                scripts[number] = job.result
+                if number in reused:
+                    return
+                results["scripts"][number] = job.result
+                item = number
+            elif kind == "scenes":
+                item = int(key)
+                results["scenes"][item] = job.result
+            else:
+                item = (characters or [])[int(key)]
+                results["image_prompts"][item.get('name', key)] = job.result
+            if on_result is not None:
+                on_result(kind, item, job.result)
+
+        scheduler.run(on_event=on_event)
+        critical_path = scheduler.get_critical_path()
+        critical_seconds = sum(scheduler.jobs[job_id].elapsed for job_id in critical_path)
+        print(f"시리즈 생성 완료: 대본 {len(results['scripts'])}, 장면 {len(results['scenes'])}, "
+              f"이미지 프롬프트 {len(results['image_prompts'])}, 실패 {len(results['failed'])} "
+              f"(임계 경로 작업 {len(critical_path)}개, {critical_seconds:.1f}초)")
+        return results
+
+    def regenerate_stale(self, manifest, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                         characters: Optional[List[Dict]] = None, character_prompts_info: str = "",
+                         story_state=None, use_cache: bool = True, concurrency: Optional[int] = None,
+                         on_result: Optional[Callable[[str, Any, Any], None]] = None) -> Dict[str, Any]:
+        """
+        입력이 바뀐 생성물만 다시 생성하고 생성 기록 갱신
+
+        Args:
+            manifest: ProvenanceManifest 인스턴스
+            chapters: 챕터 데이터 리스트 (script 포함)
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            characters: 캐릭터 리스트 (선택적)
+            character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            story_state: StoryStateCache 인스턴스 (선택적)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 작업 수 (None이면 설정의 llm_concurrency)
+            on_result: generate_series()와 같은 콜백 (저장은 호출한 쪽에서 처리)
+
+        Returns:
+            generate_series() 결과 + {"plan": plan_stale() 결과}
+        """
+        from services.provenance import script_inputs, scenes_inputs, image_prompts_inputs
+
+        plan = manifest.plan_stale(chapters, synopsis, characters_info, characters, character_prompts_info)
+        if not (plan["scripts"] or plan["scenes"] or plan["image_prompts"]):
+            print("다시 생성할 항목이 없습니다.")
+            return {"scripts": {}, "scenes": {}, "image_prompts": {}, "failed": [], "plan": plan}
+
+        by_number = {ch.get('chapter_number', 0): ch for ch in chapters}
+        scripts = {number: str(ch.get('script', '') or '') for number, ch in by_number.items()}
+
+        def record(kind: str, item: Any, result: Any):
+            if kind == "script":
+                scripts[item] = result
+                manifest.record(kind, item, script_inputs(by_number[item], synopsis, characters_info), result)
+            elif kind == "scenes":
+                manifest.record(kind, item, scenes_inputs(by_number[item], scripts.get(item, ""), synopsis,
+                                                          characters_info, character_prompts_info), result)
+            else:
+                manifest.record(kind, item.get('name', ''), image_prompts_inputs(item, synopsis), result)
+            if on_result is not None:
+                on_result(kind, item, result)
+
+        results = self.generate_series(
+            chapters, synopsis, characters_info, characters, character_prompts_info,
+            story_state=story_state, use_cache=use_cache, concurrency=concurrency,
+            on_result=record, stale=plan
+        )
+        results["plan"] = plan
+        return results
+
+    # ----- 배치 작업 (제공자 Batch API, 즉시 응답이 필요 없는 대량 생성) -----
+
+    def submit_scenes_batch_job(self, store, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                                character_prompts_info: str = "", backend: Optional[str] = None) -> str:
+        """
+        여러 챕터의 장면 생성 요청을 배치 작업으로 제출
+
+        Args:
+            store: BatchJobStore 인스턴스
+            chapters: 챕터 데이터 리스트 (script 포함)
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            backend: "openai", "anthropic", "local" (None이면 설정의 llm_batch_backend)
+
+        Returns:
+            작업 ID (결과는 LLMService.poll_batch_job()으로 받은 뒤 apply_batch_job()으로 저장)
+        """
+        from services.provenance import scenes_inputs
+
+        requests = []
+        for chapter in chapters:
+            chapter_num = chapter.get('chapter_number', 0)
+            system_prompt, prefix, user_prompt = self._build_scenes_prompts(
+                chapter, synopsis, characters_info, character_prompts_info
+            )
+            requests.append({
+                "custom_id": f"scenes-{chapter_num}",
+                "prompt": user_prompt,
+                "system_prompt": system_prompt,
+                "prefix": prefix,
+                "meta": {
+                    "kind": "scenes",
+                    "chapter_number": chapter_num,
+                    "inputs": scenes_inputs(chapter, chapter.get('script', ''), synopsis,
+                                            characters_info, character_prompts_info),
+                },
+            })
+        return self.llm.submit_batch_job(store, requests, backend)
+
+    def submit_image_prompts_batch_job(self, store, characters: List[Dict], synopsis: Dict,
+                                       backend: Optional[str] = None) -> str:
+        """
+        여러 캐릭터의 이미지 프롬프트 생성 요청을 배치 작업으로 제출
+
+        Args:
+            store: BatchJobStore 인스턴스
+            characters: 캐릭터 데이터 리스트 (프로필 순서)
+            synopsis: 시놉시스 데이터
+            backend: "openai", "anthropic", "local" (None이면 설정의 llm_batch_backend)
+
+        Returns:
+            작업 ID
+        """
+        from services.provenance import image_prompts_inputs
+
+        requests = []
+        for index, character in enumerate(characters, start=1):
+            system_prompt, user_prompt = self._build_image_prompts_prompts(character, synopsis, 0)
+            requests.append({
+                "custom_id": f"image_prompts-{index}",
+                "prompt": user_prompt,
+                "system_prompt": system_prompt,
+                "meta": {
+                    "kind": "image_prompts",
+                    "character_name": character.get('name', ''),
+                    "character_index": index,
+                    "inputs": image_prompts_inputs(character, synopsis),
+                },
+            })
+        return self.llm.submit_batch_job(store, requests, backend)
+
+    def apply_batch_job(self, store, job_id: str, file_service, chapters: Optional[List[Dict]] = None,
+                        characters: Optional[List[Dict]] = None, synopsis: Optional[Dict] = None,
+                        manifest=None) -> Dict[str, Any]:
+        """
+        끝난 배치 작업의 응답을 파싱/검사해 일반 저장 경로로 저장
+
+        장면은 save_scenes_to_script(), 이미지 프롬프트는 save_character_image_prompts()로 저장한다.
+        chapters/characters를 넘기면 빠진 부분을 실시간 호출로 보완한 뒤 저장한다.
+
+        Args:
+            store: BatchJobStore 인스턴스
+            job_id: 작업 ID (status가 ended여야 함)
+            file_service: FileService 인스턴스
+            chapters: 챕터 데이터 리스트 (장면 보완용, 선택적)
+            characters: 캐릭터 데이터 리스트 (이미지 프롬프트 보완용, 선택적)
+            synopsis: 시놉시스 데이터 (이미지 프롬프트 보완용, 선택적)
+            manifest: ProvenanceManifest 인스턴스 (선택적, 저장한 생성물의 입력 해시 기록)
+
+        Returns:
+            {"scenes": {챕터 번호: 장면 리스트}, "image_prompts": {캐릭터 이름: 프롬프트}, "failed": [custom_id]}
+        """
+        job = store.get(job_id)
+        if job is None:
+            raise KeyError(f"배치 작업이 없습니다: {job_id}")
+        if job["status"] not in (BATCH_ENDED, BATCH_APPLIED):
+            raise ValueError(f"아직 결과를 받지 않은 배치 작업입니다 ({job_id}: {job['status']})")
+
+        chapters_by_number = {ch.get('chapter_number', 0): ch for ch in chapters or []}
+        characters_by_name = {c.get('name', ''): c for c in characters or []}
+        applied: Dict[str, Any] = {"scenes": {}, "image_prompts": {}, "failed": []}
+
+        for request in job.get("requests", []):
+            custom_id = request["custom_id"]
+            meta = request.get("meta", {})
+            result = job.get("results", {}).get(custom_id, {})
+            text = result.get("text")
+            if not text:
+                print(f"배치 결과 없음 ({custom_id}): {result.get('error', '응답 없음')}")
+                applied["failed"].append(custom_id)
+                continue
+
+            if meta.get("kind") == "scenes":
+                chapter_num = meta.get("chapter_number", 0)
+                scenes = self._parse_scenes_response(text)
+                chapter = chapters_by_number.get(chapter_num)
+                if scenes and chapter is not None:
+                    scenes = self._repair_scenes(chapter, scenes, (
+                        request.get("system_prompt") or "", request.get("prefix") or "", request.get("prompt", "")
+                    ))
+                if not scenes or not file_service.save_scenes_to_script(chapter_num, scenes):
+                    applied["failed"].append(custom_id)
+                    continue
+                applied["scenes"][chapter_num] = scenes
+                if manifest is not None and meta.get("inputs"):
+                    manifest.record("scenes", chapter_num, meta["inputs"], scenes)
+
+            elif meta.get("kind") == "image_prompts":
+                char_name = meta.get("character_name", "")
+                prompts = self._parse_image_prompts_response(text)
+                character = characters_by_name.get(char_name)
+                if prompts and character is not None and synopsis is not None:
+                    full_tokens = self.llm.estimate_tokens((request.get("system_prompt") or "") + request.get("prompt", "") + text)
+                    prompts = self._repair_image_prompts(character, synopsis, prompts, full_tokens)
+                if not prompts or not file_service.save_character_image_prompts(
+                    char_name, self.image_prompts_by_number(prompts), meta.get("character_index")
+                ):
+                    applied["failed"].append(custom_id)
+                    continue
+                applied["image_prompts"][char_name] = prompts
+                if manifest is not None and meta.get("inputs"):
+                    manifest.record("image_prompts", char_name, meta["inputs"], prompts)
+
+        store.update(job_id, status=BATCH_APPLIED, applied_at=datetime.now().isoformat())
+        print(f"배치 결과 저장 ({job_id}): 장면 {len(applied['scenes'])}챕터, "
+              f"이미지 프롬프트 {len(applied['image_prompts'])}명, 실패 {len(applied['failed'])}건")
+        return applied
+
+    @staticmethod
+    def image_prompts_by_number(prompts: Dict) -> Dict[int, Dict[str, Any]]:
+        """
+        이미지 프롬프트 7종을 image_prompts 파일 형식({번호: dict})으로 변환
+
+        Args:
+            prompts: {스타일 키: JSON 문자열 또는 딕셔너리}
+
+        Returns:
+            {1~7: 프롬프트 딕셔너리} (IMAGE_PROMPT_KEYS 순서, JSON이 아닌 값은 combined로 감쌈)
+        """
+        by_number: Dict[int, Dict[str, Any]] = {}
+        for number, key in enumerate(IMAGE_PROMPT_KEYS, start=1):
+            value = prompts.get(key)
+            if isinstance(value, str) and value.strip():
+                try:
+                    parsed = json.loads(value)
+                    value = parsed if isinstance(parsed, dict) else {"combined": value}
+                except ValueError:
+                    value = {"combined": value}
+            if isinstance(value, dict) and value:
+                by_number[number] = value
+        return by_number
+
+    def summarize_chapters(self, scripts: Dict[int, str], use_cache: bool = True,
+                           concurrency: Optional[int] = None) -> Dict[int, Optional[str]]:
+        """
+        챕터 대본 요약 (여러 챕터를 동시에 요약)
+
+        Args:
+            scripts: {챕터 번호: 대본}
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+
+        Returns:
+            {챕터 번호: 요약} (실패한 챕터는 None)
+        """
+        system_prompt = """당신은 연재 소설의 편집자입니다.
+다음 챕터를 쓸 작가가 연속성을 유지할 수 있도록 챕터 대본을 요약해주세요.
+
+요약 규칙:
+- 한국어 400자 이내의 평문 (목록, 제목, 부가 설명 없이)
+- 일어난 주요 사건을 순서대로
+- 인물 간 관계와 감정의 변화
+- 챕터가 끝난 시점의 상황(장소, 시간, 남은 갈등)과 복선"""
+
+        numbers = sorted(scripts)
+        requests = [{
+            "prompt": f"챕터 {number} 대본:\n{scripts[number]}",
+            "system_prompt": system_prompt,
+            "use_cache": use_cache,
+        } for number in numbers]
+
+        results = self._run_batch(
+            requests, numbers, lambda text: text.strip() if text else None,
+            lambda number: f"챕터 요약 오류 (챕터 {number})",
+            concurrency
+        )
+        return dict(zip(numbers, results))
+
+    def build_story_context(self, chapter_number: int, scripts: Dict[int, str], story_state) -> str:
+        """
+        대본 생성용 이전 챕터 흐름 구성 (이전 챕터 전체의 요약)
+
+        Args:
+            chapter_number: 생성할 챕터 번호
+            scripts: {챕터 번호: 대본} (생성할 챕터보다 뒤의 챕터는 무시)
+            story_state: StoryStateCache 인스턴스 (대본이 바뀐 챕터만 새로 요약)
+
+        Returns:
+            연속성 참고 텍스트 (이전 챕터가 없으면 빈 문자열)
+        """
+        previous = {n: text for n, text in scripts.items() if n < chapter_number and (text or "").strip()}
+        if not previous:
+            return ""
+
+        summaries = story_state.get_summaries(previous, self.summarize_chapters)
+        sections = [f"[챕터 {n} 요약]\n{summaries[n]}" for n in sorted(summaries)]
+
+        # 직전 챕터는 요약에 실패해도 끝부분을 그대로 이어 붙임
+        last = max(previous)
+        if last not in summaries:
+            sections.append(f"[챕터 {last} 마지막 부분]\n...{previous[last].strip()[-1000:]}")
+        return "\n\n".join(sections)
+
+    def _build_script_prompts(self, chapter: Dict, synopsis: Dict, characters_info: str,
+                              previous_script: str = "") -> Tuple[str, str, str]:
+        """
+        대본 생성용 프롬프트 구성
+
+        Returns:
+            (system_prompt, prefix, user_prompt) - prefix는 챕터 간 공통 앞부분
+        """
         full_story = synopsis.get('full_story', synopsis.get('synopsis', ''))
         chapter_num = chapter.get('chapter_number', 0)
 
@@ -147,13 +717,16 @@ TTS 최적화:
 - 영웅 서사, 성적 친밀감을 고조시켜주는 로맨스, 성적 긴장감 해설 중심, 성적인 특징에 대한 묘사와 두근두근 거리는 느낌의 긴장감 신비로움, 성적 가까워지는 기대감과 그것의 충족시켜가는 디테일한 과정이 핵심 포인트, 의리와 액션, 카타르시스, 디테일한 묘사
 - 강렬한 로맨스와 성취감 높은 메시지, 성적 친밀감에 대한 치밀한 묘사 중심"""
 
-        user_prompt = f"""다음 정보를 바탕으로 챕터 {chapter_num}의 TTS용 나레이션 대본을 작성해주세요.
-
-1. 전체 시놉시스:
-{full_story}
+        def render(texts: Dict[str, str]) -> Tuple[str, str]:
+            # 모든 챕터가 공유하는 앞부분 (제공자 프롬프트 캐시 대상)
+            prefix = f"""1. 전체 시놉시스:
+{texts['full_story']}
 
 2. 등장인물 정보:
-{characters_info}
+{texts['characters_info']}"""
+
+            previous = texts['previous_script']
+            user_prompt = f"""위 정보를 바탕으로 챕터 {chapter_num}의 TTS용 나레이션 대본을 작성해주세요.
 
 3. 해당 챕터 정보:
 - 챕터 번호: {chapter_num}
@@ -163,8 +736,8 @@ TTS 최적화:
 - 등장 인물: {', '.join(chapter.get('characters_involved', []))}
 - 분위기: {chapter.get('mood', '')}
 
-4. 이전 챕터 대본 (연속성 참고):
-{previous_script if previous_script else "없음 (첫 챕터)"}
+4. 이전 챕터 흐름 (연속성 참고):
+{previous if previous else "없음 (첫 챕터)"}
 
 작성 요구사항:
 1. **반드시** 위의 시놉시스, 인물 정보, 챕터 정보를 숙지하고 일관성 있게 작성할 것
@@ -182,15 +755,50 @@ TTS 최적화:
 - 부가 설명, 주석, 메타 정보는 절대 포함하지 마세요
 - "글자 수", "끝", "완료", "총 XXX자" 같은 문구를 절대 넣지 마세요
 - 대본이 자연스럽게 끝나면 그대로 종료하세요"""
+            return prefix, user_prompt
+
+        # 입력 예산을 넘으면 이전 대본(뒷부분 유지) → 줄거리 → 인물 정보 순으로 줄임
+        texts = self._fit_to_budget(f"챕터 {chapter_num} 대본", system_prompt, render, [
+            {"name": "previous_script", "text": previous_script, "priority": 0, "keep": "tail"},
+            {"name": "full_story", "text": full_story, "priority": 1, "keep": "both", "min_tokens": 500},
+            {"name": "characters_info", "text": characters_info, "priority": 2, "keep": "head", "min_tokens": 300},
+        ])
+        prefix, user_prompt = render(texts)
+        return system_prompt, prefix, user_prompt
+
+    def _fit_to_budget(self, label: str, system_prompt: str, render: Callable[[Dict[str, str]], Tuple[str, str]],
+                       sections: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        프롬프트 입력 토큰이 설정의 llm_input_token_budget을 넘지 않도록 구간 조정
 
-        try:
-            script = self.llm.call(user_prompt, system_prompt)
-            return script.strip() if script else None
-        except Exception as e:
-            print(f"대본 생성 오류 (챕터 {chapter_num}): {e}")
-            return None
+        Args:
+            label: 로그에 표시할 요청 이름
+            system_prompt: 시스템 프롬프트 (줄이지 않음)
+            render: 구간 텍스트로 (prefix, user_prompt)를 만드는 함수
+            sections: token_counter.fit_sections 형식의 구간 리스트
 
-    def generate_scenes(self, chapter: Dict, synopsis: Dict, characters_info: str, character_prompts_info: str = "") -> Optional[List[Dict]]:
+        Returns:
+            {구간 이름: 텍스트}
+        """
+        texts = {section["name"]: section.get("text") or "" for section in sections}
+        budget = int(self.llm.config.get("llm_input_token_budget", 0) or 0)
+        if budget <= 0:
+            return texts
+
+        provider, model_name = self.llm.get_token_target()
+        total = estimate_tokens(system_prompt + "".join(render(texts)), provider, model_name)
+        if total <= budget:
+            return texts
+
+        # 구간을 뺀 나머지(시스템 프롬프트, 지시문)는 고정 비용
+        section_tokens = sum(estimate_tokens(text, provider, model_name) for text in texts.values())
+        fitted = fit_sections(sections, budget, total - section_tokens, provider, model_name)
+        print(f"입력 토큰 예산 초과 ({label}): {fitted['before']} → {fitted['after']} / {budget} "
+              f"(줄인 항목: {', '.join(fitted['trimmed']) or '없음'})")
+        return fitted["texts"]
+
+    def generate_scenes(self, chapter: Dict, synopsis: Dict, characters_info: str, character_prompts_info: str = "",
+                        use_cache: bool = True) -> Optional[List[Dict]]:
         """
         챕터의 10개 장면 생성
 
@@ -199,10 +807,416 @@ TTS 최적화:
             synopsis: 시놉시스 데이터
             characters_info: 인물 정보 (포맷팅된 문자열)
             character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
 
         Returns:
             생성된 장면 리스트 또는 None
         """
+        chapter_num = chapter.get('chapter_number', 0)
+        system_prompt, prefix, user_prompt = self._build_scenes_prompts(
+            chapter, synopsis, characters_info, character_prompts_info
+        )
+
+        try:
+            response = self.llm.call(user_prompt, system_prompt, use_cache=use_cache, prefix=prefix)
+            scenes = self._parse_scenes_response(response)
+            return self._repair_scenes(chapter, scenes, (system_prompt, prefix, user_prompt))
+        except Exception as e:
+            print(f"장면 생성 오류 (챕터 {chapter_num}): {e}")
+
+        return None
+
+    def generate_scenes_batch(self, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                              character_prompts_info: str = "", use_cache: bool = True,
+                              concurrency: Optional[int] = None,
+                              on_result: Optional[Callable[[Dict, Optional[List[Dict]]], None]] = None
+                              ) -> List[Optional[List[Dict]]]:
+        """
+        여러 챕터의 장면을 동시에 생성 (제공자별 요청 한도 내에서 병렬 호출)
+
+        Args:
+            chapters: 챕터 데이터 리스트
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 챕터 1개가 끝날 때마다 (chapter, scenes)로 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            chapters와 같은 순서의 장면 리스트 (실패한 챕터는 None)
+        """
+        requests = []
+        prompts = []
+        for chapter in chapters:
+            system_prompt, prefix, user_prompt = self._build_scenes_prompts(
+                chapter, synopsis, characters_info, character_prompts_info
+            )
+            prompts.append((system_prompt, prefix, user_prompt))
+            requests.append({
+                "prompt": user_prompt,
+                "system_prompt": system_prompt,
+                "prefix": prefix,
+                "use_cache": use_cache,
+            })
+
+        # 검사를 통과하지 못한 챕터는 배치가 끝난 뒤 보완하고 그때 콜백 호출
+        needs_repair: List[int] = []
+        index_of = {id(chapter): i for i, chapter in enumerate(chapters)}
+
+        def on_chapter_done(chapter: Dict, scenes: Optional[List[Dict]]):
+            if validate_scenes(scenes):
+                needs_repair.append(index_of[id(chapter)])
+            elif on_result is not None:
+                on_result(chapter, scenes)
+
+        results = self._run_batch(
+            requests, chapters, self._parse_scenes_response,
+            lambda chapter: f"장면 생성 오류 (챕터 {chapter.get('chapter_number', 0)})",
+            concurrency, on_chapter_done
+        )
+
+        for i in needs_repair:
+            results[i] = self._repair_scenes(chapters[i], results[i], prompts[i])
+            if on_result is not None:
+                on_result(chapters[i], results[i])
+        return results
+
+    def _repair_scenes(self, chapter: Dict, scenes: Optional[List[Dict]],
+                       prompts: Tuple[str, str, str]) -> Optional[List[Dict]]:
+        """
+        장면 응답 검사 후 빠진 장면/필드만 다시 요청
+
+        검사를 통과하지 못한 원래 응답은 캐시에서 지우고, 보완 요청은 캐시를 쓰지 않는다
+        (같은 잘못된 응답을 다시 받지 않도록).
+
+        Args:
+            chapter: 챕터 데이터
+            scenes: 파싱한 장면 리스트
+            prompts: 원래 요청의 (system_prompt, prefix, user_prompt)
+
+        Returns:
+            보완한 장면 리스트 (보완하지 못한 부분은 그대로)
+        """
+        issues = validate_scenes(scenes)
+        if not issues:
+            return scenes
+        system_prompt, prefix, user_prompt = prompts
+        self.llm.invalidate_cache(user_prompt, system_prompt, prefix=prefix)
+        if not scenes or not self.llm.config.get("llm_repair_enabled", True):
+            return scenes
+
+        chapter_num = chapter.get('chapter_number', 0)
+        # 전체 재생성 비용: 원래 요청 + 장면 10개 분량의 응답
+        scene_tokens = self.llm.estimate_tokens(json.dumps(scenes, ensure_ascii=False)) // max(1, len(scenes))
+        full_tokens = self.llm.estimate_tokens(system_prompt + prefix + user_prompt) + scene_tokens * EXPECTED_SCENE_COUNT
+
+        issue_count = len(issues)
+        calls = repair_tokens = 0
+        for _ in range(max(1, int(self.llm.config.get("llm_repair_max_rounds", 2)))):
+            repair_prompt = self._build_scenes_repair_prompt(chapter, scenes, issues)
+            try:
+                response = self.llm.call(repair_prompt, system_prompt, use_cache=False, prefix=prefix)
+            except Exception as e:
+                print(f"장면 보완 오류 (챕터 {chapter_num}): {e}")
+                break
+            calls += 1
+            repair_tokens += self.llm.estimate_tokens(system_prompt + prefix + repair_prompt + (response or ""))
+            scenes = merge_scenes(scenes, self._parse_scenes_response(response) or [])
+            issues = validate_scenes(scenes)
+            if not issues:
+                break
+
+        self.repair_telemetry.record("scenes", f"챕터 {chapter_num}", issue_count, calls,
+                                     repair_tokens, full_tokens, not issues)
+        print(f"장면 보완 (챕터 {chapter_num}): 문제 {issue_count}건 → {len(issues)}건, 호출 {calls}회, "
+              f"추정 토큰 {repair_tokens} (전체 재생성 시 {full_tokens})")
+        return scenes
+
+    @staticmethod
+    def _build_scenes_repair_prompt(chapter: Dict, scenes: List[Dict], issues: Dict[int, List[str]]) -> str:
+        """빠진 장면/필드만 다시 작성하도록 요청하는 프롬프트 (원래 요청의 system_prompt, prefix와 함께 사용)"""
+        chapter_num = chapter.get('chapter_number', 0)
+        existing = "\n".join(
+            f"- 장면 {scene.get('scene_number')}: {scene.get('title', '')}"
+            for scene in scenes if isinstance(scene, dict) and scene.get('scene_number') not in issues
+        )
+        targets = "\n".join(
+            f"- 장면 {number}: " + ("장면 전체 (scene_number, title, image_prompt)" if fields == ["*"]
+                                   else f"{', '.join(fields)} 누락")
+            for number, fields in issues.items()
+        )
+        return f"""위 정보를 바탕으로 챕터 {chapter_num}의 장면 중 아래에 표시한 부분만 작성해주세요.
+
+## 챕터 정보
+- 챕터 번호: {chapter_num}
+- 챕터 제목: {chapter.get('title', '')}
+- 챕터 요약: {chapter.get('summary', '')}
+
+## 대본
+{chapter.get('script', '')}
+
+## 이미 작성된 장면 (다시 작성하지 마세요)
+{existing if existing else "없음"}
+
+## 작성할 부분
+{targets}
+
+**규칙**: 앞뒤 장면과 자연스럽게 이어지도록 하고, 이미지 프롬프트는 영어로
+"[배경 정보]. Korean man/woman, [youth나이]-year-old ([실제나이]-year-old), [복장], [표정], [동작], [화면 위치 및 행동]." 구조를 따르세요.
+
+**반드시 다음 JSON 형식으로, 작성할 장면만 응답하세요. 다른 설명은 포함하지 마세요:**
+
+```json
+{{
+  "scenes": [
+    {{"scene_number": 7, "title": "한글 제목", "image_prompt": "..."}}
+  ]
+}}
+```"""
+
+    def _repair_image_prompts(self, character: Dict, synopsis: Dict, prompts: Dict, full_tokens: int) -> Dict:
+        """
+        캐릭터 1명분 이미지 프롬프트 검사 후 빠졌거나 잘못된 스타일만 다시 요청 (보완 요청은 캐시를 쓰지 않음)
+
+        Args:
+            character: 캐릭터 데이터
+            synopsis: 시놉시스 데이터
+            prompts: 파싱한 프롬프트 딕셔너리
+            full_tokens: 전체를 다시 생성했을 때의 추정 토큰
+
+        Returns:
+            보완한 프롬프트 딕셔너리
+        """
+        invalid = validate_image_prompts(prompts, IMAGE_PROMPT_KEYS)
+        if not invalid or not self.llm.config.get("llm_repair_enabled", True):
+            return prompts
+
+        char_name, _, details = self._build_image_character_details(character, synopsis)
+        synopsis_text = synopsis.get('synopsis', '') or synopsis.get('full_story', '')
+        issue_count = len(invalid)
+        calls = repair_tokens = 0
+        for _ in range(max(1, int(self.llm.config.get("llm_repair_max_rounds", 2)))):
+            user_prompt = f"""다음 인물의 이미지 생성 프롬프트 중 아래 스타일만 JSON 구조로 작성해주세요.
+
+## 시놉시스 정보
+{synopsis_text[:500] if synopsis_text else '정보 없음'}
+
+## 인물 상세 정보
+{details}
+
+## 작성할 스타일
+{', '.join(invalid)}
+
+각 스타일 값은 character, clothing, pose, background, situation, combined 키를 가진 JSON 구조를 문자열로 작성하세요.
+
+**반드시 다음 JSON 형식으로만 응답하세요. 다른 설명이나 마크다운은 포함하지 마세요:**
+
+{{
+  "character_name": {json.dumps(char_name, ensure_ascii=False)},
+  "prompts": {{{', '.join(f'"{key}": "..."' for key in invalid)}}}
+}}"""
+            try:
+                response = self.llm.call(user_prompt, IMAGE_PROMPTS_SYSTEM_PROMPT, use_cache=False)
+            except Exception as e:
+                print(f"이미지 프롬프트 보완 오류 ({char_name}): {e}")
+                break
+            calls += 1
+            repair_tokens += self.llm.estimate_tokens(IMAGE_PROMPTS_SYSTEM_PROMPT + user_prompt + (response or ""))
+            patch = (self._parse_image_prompts_response(response) if response else None) or {}
+            for key in invalid:
+                if key in patch and not validate_image_prompts(patch, [key]):
+                    prompts[key] = patch[key]
+            invalid = validate_image_prompts(prompts, IMAGE_PROMPT_KEYS)
+            if not invalid:
+                break
+
+        self.repair_telemetry.record("image_prompts", char_name, issue_count, calls,
+                                     repair_tokens, full_tokens, not invalid)
+        print(f"이미지 프롬프트 보완 ({char_name}): 문제 {issue_count}건 → {len(invalid)}건, 호출 {calls}회, "
+              f"추정 토큰 {repair_tokens} (전체 재생성 시 {full_tokens})")
+        return prompts
+
+    def _repair_character_profile(self, profile: Dict, synopsis: Dict, char_name: str, char_info: Dict,
+                                  system_prompt: str, full_tokens: int) -> Dict:
+        """
+        캐릭터 프로필 검사 후 빠진 항목만 다시 요청
+
+        Args:
+            profile: 파싱한 프로필
+            synopsis: 시놉시스 데이터
+            char_name: 캐릭터 이름
+            char_info: 캐릭터 기본 정보
+            system_prompt: 원래 요청의 시스템 프롬프트
+            full_tokens: 전체를 다시 생성했을 때의 추정 토큰
+
+        Returns:
+            보완한 프로필
+        """
+        missing = validate_character_profile(profile)
+        if not missing or not self.llm.config.get("llm_repair_enabled", True):
+            return profile
+
+        from utils.json_utils import extract_json_from_text, safe_json_loads
+        full_story = synopsis.get('full_story', synopsis.get('synopsis', ''))
+        issue_count = len(missing)
+        calls = repair_tokens = 0
+        for _ in range(max(1, int(self.llm.config.get("llm_repair_max_rounds", 2)))):
+            user_prompt = f"""다음 캐릭터 프로필에서 빠진 항목만 작성해주세요.
+
+## 전체 스토리 (요약)
+{full_story[:1000]}
+
+## 캐릭터 기본 정보
+- 이름: {char_name}
+- 나이: {char_info.get('age', '')}세
+- 직업: {char_info.get('occupation', '')}
+- 역할: {char_info.get('role', '')}
+
+## 현재 프로필
+{json.dumps(profile, ensure_ascii=False, indent=2)}
+
+## 빠진 항목
+{', '.join(missing)}
+
+**반드시 빠진 항목만 현재 프로필과 같은 구조의 JSON으로 응답하세요. 다른 설명은 포함하지 마세요.**"""
+            try:
+                response = self.llm.call(user_prompt, system_prompt)
+            except Exception as e:
+                print(f"프로필 보완 오류 ({char_name}): {e}")
+                break
+            calls += 1
+            repair_tokens += self.llm.estimate_tokens(system_prompt + user_prompt + (response or ""))
+            merge_missing(profile, safe_json_loads(extract_json_from_text(response)) if response else None)
+            missing = validate_character_profile(profile)
+            if not missing:
+                break
+
+        self.repair_telemetry.record("character_profile", char_name, issue_count, calls,
+                                     repair_tokens, full_tokens, not missing)
+        print(f"프로필 보완 ({char_name}): 빠진 항목 {issue_count}개 → {len(missing)}개, 호출 {calls}회, "
+              f"추정 토큰 {repair_tokens} (전체 재생성 시 {full_tokens})")
+        return profile
+
+    def get_repair_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        부분 보완 누적 통계
+
+        Returns:
+            {"scenes"/"image_prompts"/"character_profile": {repairs, succeeded, repair_calls,
+             repair_tokens, full_tokens, tokens_saved, full_calls_avoided}}
+        """
+        return self.repair_telemetry.get_stats()
+
+    def _run_batch(self, requests: List[Dict[str, Any]], items: List[Any], parse: Callable[[Optional[str]], Any],
+                   error_label: Callable[[Any], str], concurrency: Optional[int] = None,
+                   on_result: Optional[Callable[[Any, Any], None]] = None) -> List[Any]:
+        """
+        배치 요청 실행 후 항목별로 응답 파싱
+
+        Args:
+            requests: LLMService.call_batch() 요청 리스트 (items와 같은 순서)
+            items: 요청에 대응하는 원본 데이터 (챕터, 캐릭터 등)
+            parse: 응답 텍스트 -> 결과 변환 함수
+            error_label: 오류 로그 앞머리 생성 함수
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 항목 1개가 끝날 때마다 (item, result)로 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            items와 같은 순서의 결과 리스트 (실패한 항목은 None)
+        """
+        results: List[Any] = [None] * len(items)
+
+        def handle_result(result):
+            item = items[result.index]
+            parsed = None
+            if result.error is not None:
+                print(f"{error_label(item)}: {result.error}")
+            else:
+                try:
+                    parsed = parse(result.text)
+                except Exception as e:
+                    print(f"{error_label(item)}: {e}")
+            results[result.index] = parsed
+            if on_result is not None:
+                on_result(item, parsed)
+
+        self.llm.call_batch(requests, concurrency=concurrency, on_result=handle_result)
+        return results
+
+    def stream_scenes(self, chapter: Dict, synopsis: Dict, characters_info: str, character_prompts_info: str = "",
+                      use_cache: bool = True, on_scene: Optional[Callable[[Dict], None]] = None
+                      ) -> Optional[List[Dict]]:
+        """
+        챕터 장면 스트리밍 생성 (장면 하나가 완성될 때마다 on_scene 호출)
+
+        Args:
+            chapter: 챕터 데이터
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            on_scene: 완성된 장면을 받을 콜백 (호출한 스레드에서 실행)
+
+        Returns:
+            생성된 장면 리스트 (응답이 중간에 끊겨도 완성된 장면까지는 반환) 또는 None
+        """
+        from utils.json_stream import StreamingJSONParser
+
+        chapter_num = chapter.get('chapter_number', 0)
+        system_prompt, prefix, user_prompt = self._build_scenes_prompts(
+            chapter, synopsis, characters_info, character_prompts_info
+        )
+
+        parser = StreamingJSONParser('scenes')
+        try:
+            for delta in self.llm.stream(user_prompt, system_prompt, use_cache=use_cache, prefix=prefix):
+                for _, scene in parser.feed(delta):
+                    if on_scene is not None:
+                        on_scene(scene)
+                if parser.complete:
+                    break
+        except Exception as e:
+            print(f"장면 스트리밍 오류 (챕터 {chapter_num}): {e}")
+
+        scenes = parser.result()
+        repaired = self._repair_scenes(chapter, scenes, (system_prompt, prefix, user_prompt))
+        if not repaired:
+            return None
+
+        if on_scene is not None:
+            # 보완으로 새로 생긴 장면도 알림
+            known = {scene.get('scene_number') for scene in scenes if isinstance(scene, dict)}
+            for scene in repaired:
+                if scene.get('scene_number') not in known:
+                    on_scene(scene)
+        return repaired
+
+    @staticmethod
+    def _parse_scenes_response(response: Optional[str]) -> Optional[List[Dict]]:
+        """장면 생성 응답에서 장면 리스트 추출 (JSON이 깨졌으면 완성된 장면만 복구)"""
+        if response:
+            from utils.json_utils import extract_json_from_text, safe_json_loads
+            json_text = extract_json_from_text(response)
+            data = safe_json_loads(json_text)
+            if data:
+                return data.get('scenes', [])
+
+            from utils.json_stream import salvage_json_container
+            scenes = salvage_json_container(response, 'scenes')
+            if scenes:
+                print(f"경고: 장면 응답 JSON이 불완전하여 {len(scenes)}개 장면만 복구했습니다.")
+                return scenes
+        return None
+
+    def _build_scenes_prompts(self, chapter: Dict, synopsis: Dict, characters_info: str,
+                              character_prompts_info: str = "") -> Tuple[str, str, str]:
+        """
+        장면 생성용 프롬프트 구성
+
+        Returns:
+            (system_prompt, prefix, user_prompt) - prefix는 챕터 간 공통 앞부분
+        """
         full_story = synopsis.get('full_story', synopsis.get('synopsis', ''))
         chapter_num = chapter.get('chapter_number', 0)
         script = chapter.get('script', '')
@@ -222,20 +1236,22 @@ TTS 최적화:
    - 예시: "Korean man, 35-year-old (youth age: 27), ..."
 7. 반드시 JSON 형식으로만 응답"""
 
-        user_prompt = f"""다음 정보를 바탕으로 챕터 {chapter_num}의 대본을 분석하여 10개의 장면을 생성해주세요:
-
-## 전체 스토리
+        def render(texts: Dict[str, str]) -> Tuple[str, str]:
+            # 모든 챕터가 공유하는 앞부분 (제공자 프롬프트 캐시 대상)
+            prefix = f"""## 전체 스토리
 {full_story[:1000]}
 
 ## 등장인물 정보
-{characters_info}
+{texts['characters_info']}
 
 **중요**: 위 등장인물 정보에 각 캐릭터의 실제 나이와 Youth age가 명시되어 있습니다. 
 각 캐릭터의 이미지 프롬프트를 작성할 때 반드시 해당 캐릭터의 실제 나이와 Youth age를 사용하세요.
 절대로 모든 캐릭터에 동일한 나이(예: 27세)를 사용하지 마세요.
 
 ## 인물 이미지 프롬프트 참고
-{character_prompts_info if character_prompts_info else "없음"}
+{texts['character_prompts_info'] if texts['character_prompts_info'] else "없음"}"""
+
+            user_prompt = f"""위 정보를 바탕으로 챕터 {chapter_num}의 대본을 분석하여 10개의 장면을 생성해주세요:
 
 ## 챕터 정보
 - 챕터 번호: {chapter_num}
@@ -243,7 +1259,7 @@ TTS 최적화:
 - 챕터 요약: {chapter.get('summary', '')}
 
 ## 대본
-{script}
+{texts['script']}
 
 ## 요청사항
 위 대본을 분석하여 다음 조건을 만족하는 10개의 장면을 생성해주세요:
@@ -312,34 +1328,394 @@ TTS 최적화:
   ]
 }}
 ```"""
+            return prefix, user_prompt
+
+        # 입력 예산을 넘으면 인물 이미지 프롬프트 → 인물 정보 → 대본(앞뒤 유지) 순으로 줄임
+        texts = self._fit_to_budget(f"챕터 {chapter_num} 장면", system_prompt, render, [
+            {"name": "character_prompts_info", "text": character_prompts_info, "priority": 0, "keep": "head"},
+            {"name": "characters_info", "text": characters_info, "priority": 1, "keep": "head", "min_tokens": 300},
+            {"name": "script", "text": script, "priority": 2, "keep": "both", "min_tokens": 1000},
+        ])
+        prefix, user_prompt = render(texts)
+        return system_prompt, prefix, user_prompt
+
+    def generate_image_prompts(self, character: Dict, synopsis: Dict, visual_age: int,
+                               use_cache: bool = True) -> Optional[Dict]:
+        """
+        캐릭터 이미지 프롬프트 7종류 생성 (JSON 구조)
+
+        Args:
+            character: 캐릭터 데이터
+            synopsis: 시놉시스 데이터
+            visual_age: 비주얼 나이 (실제 나이보다 젊게)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+
+        Returns:
+            생성된 프롬프트 딕셔너리 또는 None
+        """
+        char_name = character.get('name', '알 수 없음')
+        system_prompt, user_prompt = self._build_image_prompts_prompts(character, synopsis, visual_age)
 
         try:
-            response = self.llm.call(user_prompt, system_prompt)
+            response = self.llm.call(user_prompt, system_prompt, use_cache=use_cache)
             if response:
-                from utils.json_utils import extract_json_from_text, safe_json_loads
-                json_text = extract_json_from_text(response)
-                data = safe_json_loads(json_text)
-                if data:
-                    return data.get('scenes', [])
+                prompts = self._parse_image_prompts_response(response)
+                if self._validate_image_prompts(prompts) is None:
+                    self.llm.invalidate_cache(user_prompt, system_prompt)
+                if prompts:
+                    full_tokens = self.llm.estimate_tokens(system_prompt + user_prompt + response)
+                    prompts = self._repair_image_prompts(character, synopsis, prompts, full_tokens)
+                return prompts
+            else:
+                raise ValueError("LLM 응답이 비어있습니다. API 연결을 확인해주세요.")
+        except ImportError as e:
+            # 패키지 미설치 오류
+            error_msg = str(e)
+            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
+            raise Exception(f"필요한 패키지가 설치되지 않았습니다.\n\n{error_msg}\n\n설정에서 API 제공자를 확인하거나 필요한 패키지를 설치해주세요.")
+        except ValueError as e:
+            # API 키 오류 등
+            error_msg = str(e)
+            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
+            raise Exception(f"API 설정 오류:\n\n{error_msg}\n\n설정 메뉴에서 API 키와 모델을 확인해주세요.")
         except Exception as e:
-            print(f"장면 생성 오류 (챕터 {chapter_num}): {e}")
+            # 기타 오류
+            error_msg = str(e)
+            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
+            raise Exception(f"이미지 프롬프트 생성 중 오류가 발생했습니다:\n\n{error_msg}\n\nAPI 연결 상태와 설정을 확인해주세요.")
 
         return None
 
-    def generate_image_prompts(self, character: Dict, synopsis: Dict, visual_age: int) -> Optional[Dict]:
+    def generate_image_prompts_batch(self, characters: List[Dict], synopsis: Dict, use_cache: bool = True,
+                                     concurrency: Optional[int] = None,
+                                     on_result: Optional[Callable[[Dict, Optional[Dict]], None]] = None
+                                     ) -> List[Optional[Dict]]:
         """
-        캐릭터 이미지 프롬프트 7종류 생성 (JSON 구조)
+        여러 캐릭터의 이미지 프롬프트를 동시에 생성
+
+        Args:
+            characters: 캐릭터 데이터 리스트
+            synopsis: 시놉시스 데이터
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 캐릭터 1명이 끝날 때마다 (character, prompts)로 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            characters와 같은 순서의 프롬프트 딕셔너리 리스트 (실패한 캐릭터는 None)
+        """
+        requests = []
+        for character in characters:
+            # visual_age는 내부에서 나이로 다시 계산하므로 전달값은 참고용
+            system_prompt, user_prompt = self._build_image_prompts_prompts(character, synopsis, 0)
+            requests.append({"prompt": user_prompt, "system_prompt": system_prompt, "use_cache": use_cache})
+
+        results = self._run_batch(
+            requests, characters, lambda text: self._parse_image_prompts_response(text) if text else None,
+            lambda character: f"이미지 프롬프트 생성 오류 ({character.get('name', '알 수 없음')})",
+            concurrency, on_result
+        )
+        for request, prompts in zip(requests, results):
+            if self._validate_image_prompts(prompts) is None:
+                self.llm.invalidate_cache(request["prompt"], request["system_prompt"])
+        return results
+
+    def generate_image_prompts_grouped(self, characters: List[Dict], synopsis: Dict, use_cache: bool = True,
+                                       group_size: Optional[int] = None, concurrency: Optional[int] = None,
+                                       on_result: Optional[Callable[[Dict, Optional[Dict]], None]] = None
+                                       ) -> List[Optional[Dict]]:
+        """
+        여러 캐릭터의 이미지 프롬프트를 한 번의 호출로 묶어 생성
+
+        시놉시스와 시스템 프롬프트를 캐릭터마다 다시 보내지 않도록 K명씩 묶어 요청한다.
+        묶음 크기는 응답 토큰 상한을 넘지 않도록 정하고, 묶음 응답에서 빠졌거나
+        형식이 맞지 않는 캐릭터만 1명씩 다시 생성한다.
+
+        Args:
+            characters: 캐릭터 데이터 리스트
+            synopsis: 시놉시스 데이터
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            group_size: 한 번에 묶을 최대 캐릭터 수 (None이면 설정의 image_prompts_group_size)
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 캐릭터 1명이 끝날 때마다 (character, prompts)로 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            characters와 같은 순서의 프롬프트 딕셔너리 리스트 (실패한 캐릭터는 None)
+        """
+        results: List[Optional[Dict]] = [None] * len(characters)
+        groups = self._group_image_prompt_characters(characters, self._get_image_prompts_group_size(group_size))
+        if not groups:
+            return results
+
+        requests = []
+        for group in groups:
+            system_prompt, prefix, user_prompt = self._build_grouped_image_prompts_prompts(
+                [characters[i] for i in group], synopsis
+            )
+            requests.append({"prompt": user_prompt, "system_prompt": system_prompt, "prefix": prefix,
+                             "use_cache": use_cache})
+
+        partial: Dict[int, Dict] = {}
+        request_of = {id(group): request for group, request in zip(groups, requests)}
+
+        def on_group_done(group: List[int], parsed: Optional[Dict]):
+            # 응답은 묶음 프롬프트에 넣은 이름(_image_character_name)을 키로 함
+            raws = {i: (parsed or {}).get(self._image_character_name(characters[i])) for i in group}
+            if any(self._validate_image_prompts(raw) is None for raw in raws.values()):
+                request = request_of[id(group)]
+                self.llm.invalidate_cache(request["prompt"], request["system_prompt"], prefix=request["prefix"])
+            for i, raw in raws.items():
+                prompts = self._validate_image_prompts(raw)
+                if prompts:
+                    results[i] = prompts
+                    if on_result is not None:
+                        on_result(characters[i], prompts)
+                elif isinstance(raw, dict) and raw:
+                    # 일부 스타일만 빠진 경우 배치가 끝난 뒤 빠진 스타일만 보완
+                    partial[i] = raw.get('prompts') if isinstance(raw.get('prompts'), dict) else raw
+
+        self._run_batch(
+            requests, groups, self._parse_grouped_image_prompts_response,
+            lambda group: f"이미지 프롬프트 묶음 생성 오류 ({len(group)}명)",
+            concurrency, on_group_done
+        )
+
+        for i, raw in partial.items():
+            full_tokens = IMAGE_PROMPTS_TOKENS_PER_CHARACTER + self.llm.estimate_tokens(
+                IMAGE_PROMPTS_SYSTEM_PROMPT + "".join(self._build_image_prompts_prompts(characters[i], synopsis, 0))
+            )
+            prompts = self._validate_image_prompts(
+                self._repair_image_prompts(characters[i], synopsis, dict(raw), full_tokens)
+            )
+            if prompts:
+                results[i] = prompts
+                if on_result is not None:
+                    on_result(characters[i], prompts)
+
+        # 묶음 응답에서 빠진 캐릭터는 1명씩 다시 생성
+        missing = [i for i, prompts in enumerate(results) if prompts is None]
+        if missing:
+            names = ', '.join(characters[i].get('name', '알 수 없음') for i in missing)
+            print(f"이미지 프롬프트 묶음 응답에서 누락된 캐릭터 개별 생성: {names}")
+            retried = self.generate_image_prompts_batch(
+                [characters[i] for i in missing], synopsis, use_cache=use_cache,
+                concurrency=concurrency, on_result=on_result
+            )
+            for i, prompts in zip(missing, retried):
+                results[i] = self._validate_image_prompts(prompts)
+        return results
+
+    def _get_image_prompts_group_size(self, group_size: Optional[int] = None) -> int:
+        """응답 토큰 상한 안에 들어가는 묶음 크기"""
+        if group_size is None:
+            group_size = self.llm.config.get("image_prompts_group_size", 4)
+        by_tokens = int(self.llm.get_max_output_tokens() * 0.9) // IMAGE_PROMPTS_TOKENS_PER_CHARACTER
+        return max(1, min(int(group_size), by_tokens))
+
+    @staticmethod
+    def _group_image_prompt_characters(characters: List[Dict], group_size: int) -> List[List[int]]:
+        """캐릭터 인덱스를 묶음으로 분할 (응답이 이름으로 구분되므로 같은 이름은 다른 묶음으로)"""
+        groups: List[List[int]] = []
+        for i, character in enumerate(characters):
+            name = character.get('name', '')
+            for group in groups:
+                if len(group) < group_size and all(characters[j].get('name', '') != name for j in group):
+                    group.append(i)
+                    break
+            else:
+                groups.append([i])
+        return groups
+
+    @staticmethod
+    def _validate_image_prompts(prompts: Any) -> Optional[Dict]:
+        """
+        캐릭터 1명분 프롬프트 검사 (7종이 모두 있어야 유효)
+
+        Returns:
+            키별 문자열 프롬프트 딕셔너리 또는 None
+        """
+        if not isinstance(prompts, dict):
+            return None
+        if isinstance(prompts.get('prompts'), dict):
+            prompts = prompts['prompts']
+        if validate_image_prompts(prompts, IMAGE_PROMPT_KEYS):
+            return None
+        validated = {}
+        for key in IMAGE_PROMPT_KEYS:
+            value = prompts[key]
+            # 단일 생성 응답과 같이 JSON 문자열로 통일
+            validated[key] = json.dumps(value, ensure_ascii=False) if isinstance(value, dict) else value
+        return validated
+
+    @staticmethod
+    def _parse_grouped_image_prompts_response(response: Optional[str]) -> Optional[Dict]:
+        """묶음 응답에서 {캐릭터 이름: 프롬프트} 추출 (JSON이 깨졌으면 완성된 캐릭터만 복구)"""
+        if not response:
+            return None
+        from utils.json_utils import extract_json_from_text, safe_json_loads
+        data = safe_json_loads(extract_json_from_text(response))
+        if isinstance(data, dict) and isinstance(data.get('characters'), dict):
+            return data['characters']
+
+        from utils.json_stream import salvage_json_container
+        characters = salvage_json_container(response, 'characters')
+        if characters:
+            print(f"경고: 이미지 프롬프트 묶음 응답 JSON이 불완전하여 {len(characters)}명만 복구했습니다.")
+        return characters
+
+    def _build_grouped_image_prompts_prompts(self, characters: List[Dict], synopsis: Dict) -> Tuple[str, str, str]:
+        """
+        여러 캐릭터 이미지 프롬프트 묶음 생성용 프롬프트 구성
+
+        Returns:
+            (system_prompt, prefix, user_prompt) - prefix는 묶음 간 공통 앞부분
+        """
+        synopsis_text = synopsis.get('synopsis', '') or synopsis.get('full_story', '')
+
+        # 모든 묶음이 공유하는 앞부분 (제공자 프롬프트 캐시 대상)
+        prefix = f"""## 시놉시스 정보
+{synopsis_text[:500] if synopsis_text else '정보 없음'}"""
+
+        blocks = []
+        skeleton = []
+        for n, character in enumerate(characters, start=1):
+            char_name, final_visual_age, details = self._build_image_character_details(character, synopsis)
+            blocks.append(f"### 인물 {n}\n{details}")
+            skeleton.append(f'    {json.dumps(char_name, ensure_ascii=False)}: {{"prompts": {{7가지 스타일 키: JSON 문자열, ...}}}}')
+
+        keys = ', '.join(IMAGE_PROMPT_KEYS)
+        user_prompt = f"""위 시놉시스를 바탕으로 다음 {len(characters)}명의 인물 각각에 대해 동일한 인물의 동일성을 유지하며 7가지 이미지 생성 프롬프트를 JSON 구조로 작성해주세요.
+
+**중요: 인물마다 자신의 정보와 youth age만 사용하세요. 다른 인물의 정보를 혼용하지 마세요.**
+
+## 인물 상세 정보
+{(chr(10) * 2).join(blocks)}
+
+**7가지 스타일 키**: {keys}
+(전신샷, 옆모습 전신샷, 대각선 옆모습 전신샷, 초상화, 초상화 옆모습, 액션, 자연스러운 배경)
+
+각 스타일 값은 다음 JSON 구조를 문자열로 작성하세요:
+"{{\\"character\\": \\"Korean man/woman, [youth나이]-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}"
+
+**반드시 다음 JSON 형식으로만 응답하세요. 인물 이름을 키로 사용하고, 다른 설명이나 마크다운은 포함하지 마세요:**
+
+{{
+  "characters": {{
+{(","+chr(10)).join(skeleton)}
+  }}
+}}"""
+
+        return IMAGE_PROMPTS_SYSTEM_PROMPT, prefix, user_prompt
+
+    def stream_image_prompts(self, character: Dict, synopsis: Dict, visual_age: int, use_cache: bool = True,
+                             on_prompt: Optional[Callable[[str, Any], None]] = None) -> Optional[Dict]:
+        """
+        캐릭터 이미지 프롬프트 스트리밍 생성 (프롬프트 하나가 완성될 때마다 on_prompt 호출)
 
         Args:
             character: 캐릭터 데이터
             synopsis: 시놉시스 데이터
             visual_age: 비주얼 나이 (실제 나이보다 젊게)
+            use_cache: False면 응답 캐시를 건너뛰고 새로 생성
+            on_prompt: (프롬프트 키, 프롬프트) 콜백 (호출한 스레드에서 실행)
 
         Returns:
-            생성된 프롬프트 딕셔너리 또는 None
+            생성된 프롬프트 딕셔너리 (응답이 중간에 끊겨도 완성된 항목까지는 반환) 또는 None
         """
+        from utils.json_stream import StreamingJSONParser
+
         char_name = character.get('name', '알 수 없음')
+        system_prompt, user_prompt = self._build_image_prompts_prompts(character, synopsis, visual_age)
+
+        parser = StreamingJSONParser('prompts')
+        try:
+            for delta in self.llm.stream(user_prompt, system_prompt, use_cache=use_cache):
+                for key, prompt in parser.feed(delta):
+                    if on_prompt is not None:
+                        on_prompt(key, prompt)
+                if parser.complete:
+                    break
+        except Exception as e:
+            print(f"이미지 프롬프트 스트리밍 오류 ({char_name}): {e}")
+
+        prompts = parser.result()
+        return prompts if prompts else None
+
+    @staticmethod
+    def _parse_image_prompts_response(response: str) -> Optional[Dict]:
+        """이미지 프롬프트 응답에서 프롬프트 딕셔너리 추출 (JSON이 깨졌으면 완성된 항목만 복구)"""
+        from utils.json_utils import extract_json_from_text, safe_json_loads
+        json_text = extract_json_from_text(response)
+        data = safe_json_loads(json_text)
+        if data:
+            return data.get('prompts', {})
+
+        from utils.json_stream import salvage_json_container
+        prompts = salvage_json_container(response, 'prompts')
+        if prompts:
+            print(f"경고: 이미지 프롬프트 응답 JSON이 불완전하여 {len(prompts)}개 항목만 복구했습니다.")
+            return prompts
+        return None
+
+    def _build_image_prompts_prompts(self, character: Dict, synopsis: Dict, visual_age: int) -> Tuple[str, str]:
+        """
+        캐릭터 이미지 프롬프트 생성용 프롬프트 구성
+
+        Returns:
+            (system_prompt, user_prompt)
+        """
         synopsis_text = synopsis.get('synopsis', '') or synopsis.get('full_story', '')
+        char_name, final_visual_age, details = self._build_image_character_details(character, synopsis)
+        system_prompt = IMAGE_PROMPTS_SYSTEM_PROMPT
+
+        user_prompt = f"""다음 인물에 대한 상세 정보를 바탕으로 동일한 인물의 동일성을 유지하며 7가지 이미지 생성 프롬프트를 JSON 구조로 작성해주세요:
+
+**중요: 이 캐릭터의 정보만 사용하세요. 다른 캐릭터의 정보를 혼용하지 마세요.**
+
+## 시놉시스 정보
+{synopsis_text[:500] if synopsis_text else '정보 없음'}
+
+## 인물 상세 정보
+{details}
+
+**7가지 스타일**:
+1. **Full Body Shot** (전신샷)(자연스러운 배경)
+2. **옆모습 전신샷** (Side Profile Full Body Shot)(자연스러운 배경)
+3. **대각선 옆모습 전신샷** (Diagonal Side Profile Full Body Shot)(자연스러운 배경)
+4. **Portrait** (초상화)(자연스러운 배경)
+5. **Side Profile** (초상화 옆모습)(자연스러운 배경)
+6. **Action** (액션)
+7. **Natural Background** (자연스러운 배경)
+
+**반드시 다음 JSON 형식으로만 응답하세요. 다른 설명이나 마크다운은 포함하지 마세요:**
+
+{{
+  "character_name": "{char_name}",
+  "prompts": {{
+    "full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "side_profile_full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "diagonal_side_profile_full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "portrait": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "side_profile": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "action": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
+    "natural_background": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}"
+  }}
+}}"""
+
+        return system_prompt, user_prompt
+
+    @staticmethod
+    def _image_character_name(character: Dict) -> str:
+        """이미지 프롬프트 요청/응답에 쓰는 캐릭터 이름 (이름이 없으면 '알 수 없음')"""
+        return character.get('name', '알 수 없음')
+
+    def _build_image_character_details(self, character: Dict, synopsis: Dict) -> Tuple[str, int, str]:
+        """
+        이미지 프롬프트 생성용 인물 상세 정보 구성 (단일/묶음 생성 공용)
+
+        Returns:
+            (캐릭터 이름, youth age, 인물 상세 정보 텍스트)
+        """
+        char_name = self._image_character_name(character)
 
         # 캐릭터 정보 수집
         syn_char = {}
@@ -405,45 +1781,7 @@ TTS 최적화:
         char_appearance = character.get('appearance', {})
         char_visual_ref = character.get('visual_reference', '')
 
-        system_prompt = """당신은 이미지 생성을 위한 전문 프롬프트 엔지니어입니다.
-주어진 인물 정보를 바탕으로 동일한 인물의 동일성을 반드시 유지하며 7가지 다른 스타일의 상세한 이미지 생성 프롬프트를 영어로 작성해주세요.
-
-**중요 원칙**:
-1. 이미지 프롬프트는 반드시 JSON 구조(character, clothing, pose, background, situation, combined)로 작성해야 합니다.
-2. 모든 키워드는 영어로 작성해야 합니다.
-3. 각 등장인물마다 별도의 JSON 구조를 문자열로 포함시켜야 합니다.
-4. 반드시 유효한 JSON 형식으로만 출력하고, 추가 설명이나 마크다운은 포함하지 마세요.
-5. 한국인은 60대면 15~20살 어린 모습으로 이미지 프롬프트 작성
-6. 멋진 모습 중심으로 작성
-7. 인물 정보(character)는 고정하고, 동작(pose), 옷(clothing), 배경(background), 상황(situation)은 쉽게 변경 가능하도록 JSON 구조로 구분
-
-**JSON 구조 형식**:
-각 등장인물마다 다음과 같은 JSON 구조로 작성:
-{
-  "character": "인물의 고정된 외모 특징 (나이, 체형, 얼굴, 헤어 등) - 영어로 작성",
-  "clothing": "의상 및 스타일 (옷 종류, 색상, 액세서리 등) - 영어로 작성",
-  "pose": "포즈 및 표정 (서 있는, 앉은, 표정, 시선 등) - 영어로 작성",
-  "background": "배경 설정 (실내/실외, 장소, 조명 등) - 영어로 작성",
-  "situation": "상황 및 분위기 (로맨틱, 드라마틱, 일상적 등) - 영어로 작성",
-  "combined": "위의 모든 요소를 쉼표와 줄바꿈(\\n)으로 구분하여 합친 최종 프롬프트. 각 요소(character, clothing, pose, background, situation)는 줄바꿈으로 구분하고, 각 요소 내부는 쉼표로 구분"
-}
-
-**나이 표현 규칙**:
-- 반드시 youth age만 사용하고, 실제 나이는 절대 표시하지 마세요
-- 형식: "Korean man/woman, [youth나이]-year-old, ..."
-- 예시: "Korean man, 27-year-old, ..." 또는 "Korean woman, 25-year-old, ..."
-- Youth age는 건강하고 젊어보이고 세련된 외모를 표현하기 위한 나이입니다.
-- 실제 나이는 이미지 프롬프트에 포함하지 마세요."""
-
-        user_prompt = f"""다음 인물에 대한 상세 정보를 바탕으로 동일한 인물의 동일성을 유지하며 7가지 이미지 생성 프롬프트를 JSON 구조로 작성해주세요:
-
-**중요: 이 캐릭터의 정보만 사용하세요. 다른 캐릭터의 정보를 혼용하지 마세요.**
-
-## 시놉시스 정보
-{synopsis_text[:500] if synopsis_text else '정보 없음'}
-
-## 인물 상세 정보
-**캐릭터 이름: {char_name}**
+        details = f"""**캐릭터 이름: {char_name}**
 **이 캐릭터의 Youth age: {final_visual_age}세 (건강하고 젊어보이고 세련된 외모를 표현하기 위한 나이)**
 
 **매우 중요**: 
@@ -468,56 +1806,5 @@ TTS 최적화:
 - 특성/특징: {char_traits if char_traits else '정보 없음'}
 - 욕구/동기: {char_desire if char_desire else '정보 없음'}
 - 배경 스토리: {char_background if char_background else '정보 없음'}
-- 시각적 참고: {char_visual_ref if char_visual_ref else '정보 없음'}
-
-**7가지 스타일**:
-1. **Full Body Shot** (전신샷)(자연스러운 배경)
-2. **옆모습 전신샷** (Side Profile Full Body Shot)(자연스러운 배경)
-3. **대각선 옆모습 전신샷** (Diagonal Side Profile Full Body Shot)(자연스러운 배경)
-4. **Portrait** (초상화)(자연스러운 배경)
-5. **Side Profile** (초상화 옆모습)(자연스러운 배경)
-6. **Action** (액션)
-7. **Natural Background** (자연스러운 배경)
-
-**반드시 다음 JSON 형식으로만 응답하세요. 다른 설명이나 마크다운은 포함하지 마세요:**
-
-{{
-  "character_name": "{char_name}",
-  "prompts": {{
-    "full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "side_profile_full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "diagonal_side_profile_full_body_shot": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "portrait": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "side_profile": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "action": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}",
-    "natural_background": "{{\\"character\\": \\"Korean man/woman, {final_visual_age}-year-old, [외모 특징 상세 설명 - 영어]\\", \\"clothing\\": \\"[의상 및 스타일 - 영어]\\", \\"pose\\": \\"[포즈 및 표정 - 영어]\\", \\"background\\": \\"[배경 설정 - 영어]\\", \\"situation\\": \\"[상황 및 분위기 - 영어]\\", \\"combined\\": \\"[character 내용]\\\\n[clothing 내용]\\\\n[pose 내용]\\\\n[background 내용]\\\\n[situation 내용]\\"}}"
-  }}
-}}"""
-
-        try:
-            response = self.llm.call(user_prompt, system_prompt)
-            if response:
-                from utils.json_utils import extract_json_from_text, safe_json_loads
-                json_text = extract_json_from_text(response)
-                data = safe_json_loads(json_text)
-                if data:
-                    return data.get('prompts', {})
-            else:
-                raise ValueError("LLM 응답이 비어있습니다. API 연결을 확인해주세요.")
-        except ImportError as e:
-            # 패키지 미설치 오류
-            error_msg = str(e)
-            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
-            raise Exception(f"필요한 패키지가 설치되지 않았습니다.\n\n{error_msg}\n\n설정에서 API 제공자를 확인하거나 필요한 패키지를 설치해주세요.")
-        except ValueError as e:
-            # API 키 오류 등
-            error_msg = str(e)
-            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
-            raise Exception(f"API 설정 오류:\n\n{error_msg}\n\n설정 메뉴에서 API 키와 모델을 확인해주세요.")
-        except Exception as e:
-            # 기타 오류
-            error_msg = str(e)
-            print(f"이미지 프롬프트 생성 오류 ({char_name}): {error_msg}")
-            raise Exception(f"이미지 프롬프트 생성 중 오류가 발생했습니다:\n\n{error_msg}\n\nAPI 연결 상태와 설정을 확인해주세요.")
-
-        return None
+- 시각적 참고: {char_visual_ref if char_visual_ref else '정보 없음'}"""
+        return char_name, final_visual_age, details
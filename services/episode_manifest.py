@@ -0,0 +1,93 @@
+"""
+에피소드 대본 목록 캐시
+*_episodes 폴더 MD 파일의 글자 수를 파일 stat(mtime, 크기)과 함께 저장합니다.
+목록 화면은 파일 내용을 읽지 않고 stat만 확인해 저장된 글자 수를 재사용합니다.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from services.write_queue import atomic_write_text
+
+# 캐시 형식 (항목 구조가 바뀌면 올려서 이전 캐시를 무시)
+MANIFEST_VERSION = 1
+
+
+class EpisodeScriptManifest:
+    """에피소드 MD 파일별 글자 수 캐시 (프로젝트별 .episode_manifest.json)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 캐시 파일 경로 (FileService.get_episode_manifest_path())
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, int]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, int]]:
+        """캐시 파일 로드 (최초 1회)"""
+        if self._entries is None:
+            entries: Dict[str, Dict[str, int]] = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if (isinstance(data, dict) and data.get("version") == MANIFEST_VERSION
+                            and isinstance(data.get("episodes"), dict)):
+                        entries = data["episodes"]
+                except Exception as e:
+                    print(f"대본 목록 캐시 로드 오류: {e}")
+            self._entries = entries
+        return self._entries
+
+    def get_char_count(self, key: str, mtime_ns: int, size: int) -> Optional[int]:
+        """
+        저장된 글자 수 조회
+
+        Args:
+            key: 파일 식별자 (episodes 폴더 기준 상대 경로)
+            mtime_ns: 현재 파일 수정 시각
+            size: 현재 파일 크기
+
+        Returns:
+            글자 수 또는 None (없거나 파일이 바뀐 경우)
+        """
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            return entry.get("char_count")
+        return None
+
+    def set_char_count(self, key: str, mtime_ns: int, size: int, char_count: int):
+        """글자 수 기록 (save()를 호출해야 파일에 반영)"""
+        entry = {"mtime_ns": mtime_ns, "size": size, "char_count": char_count}
+        with self._lock:
+            entries = self._load()
+            if entries.get(key) != entry:
+                entries[key] = entry
+                self._dirty = True
+
+    def prune(self, keys):
+        """목록에 없는 파일 항목 삭제 (폴더 스캔 후 호출)"""
+        keys = set(keys)
+        with self._lock:
+            entries = self._load()
+            for key in [k for k in entries if k not in keys]:
+                del entries[key]
+                self._dirty = True
+
+    def save(self):
+        """바뀐 내용이 있으면 캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            text = json.dumps({"version": MANIFEST_VERSION, "episodes": self._entries}, ensure_ascii=False)
+            self._dirty = False
+        try:
+            atomic_write_text(self.path, text, fsync=False)
+        except Exception as e:
+            print(f"대본 목록 캐시 저장 오류: {e}")
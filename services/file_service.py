@@ -3,12 +3,17 @@
 프로젝트 데이터의 파일 I/O를 담당합니다.
 """
 
+import copy
+import fnmatch
+import hashlib
 import json
+import mmap
 import os
 import shutil
+from collections.abc import Mapping
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 from utils.file_utils import (
     normalize_filename,
     normalize_character_name,
@@ -21,13 +26,263 @@ from utils.file_utils import (
     normalize_project_folder_name,
     get_next_project_number,
 )
+from utils.parallel_io import read_json_files
+from utils.json_utils import safe_json_loads, decode_prompt, encode_prompt
+from services.project_index import ProjectIndex
+from services.write_queue import WriteBehindQueue, atomic_write_text
+from services.episode_manifest import EpisodeScriptManifest
+from models.entities import ImagePrompt, json_default
+from models.lazy_chapters import LazyChapter, ChapterBodyCache, LAZY_CHAPTER_KEYS, DEFAULT_BODY_CACHE_SIZE
+
+# 프로젝트 인덱스에 저장하는 에피소드 정보 종류 (_build_episode_metadata 결과 형식이 바뀌면 이름 변경)
+EPISODE_METADATA_KIND = "episode_metadata.v1"
+
+# 이 크기 이상의 에피소드 MD 파일은 mmap으로 읽기 (바이트)
+EPISODE_MMAP_THRESHOLD = 256 * 1024
 
 
 class FileService:
     """파일 입출력 서비스 클래스"""
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, index: Optional[ProjectIndex] = None,
+                 lazy_chapters: bool = True, chapter_body_cache_size: int = DEFAULT_BODY_CACHE_SIZE,
+                 write_queue: Optional[WriteBehindQueue] = None):
+        """
+        Args:
+            project_path: 프로젝트 폴더 경로
+            index: 프로젝트 인덱스 (지정하면 stat이 바뀌지 않은 JSON 파일은 다시 파싱하지 않음)
+            lazy_chapters: scenes 폴더 에피소드의 장면 본문을 처음 접근할 때 읽을지 여부
+            chapter_body_cache_size: 메모리에 둘 에피소드 본문 수
+            write_queue: 지연 쓰기 큐 (지정하면 저장은 백그라운드에서, 없으면 바로 원자적 저장)
+        """
         self.project_path = project_path
+        self.index = index
+        self.lazy_chapters = lazy_chapters
+        self.write_queue = write_queue
+        self._episode_bodies = ChapterBodyCache(self._load_episode_body, chapter_body_cache_size)
+        # 경로 -> (내용 해시, mtime_ns, size): 마지막으로 쓰거나 같다고 확인한 파일 내용
+        self._persisted: Dict[str, Tuple[str, int, int]] = {}
+        self.write_stats: Dict[str, int] = {"written": 0, "skipped": 0}
+        self._episode_manifest: Optional[EpisodeScriptManifest] = None
+        # 경로 -> (mtime_ns, size, 내용): 파싱한 image_prompts 파일 (stat이 같으면 다시 읽지 않음)
+        self._sidecar_cache: Dict[str, Tuple[int, int, Any]] = {}
+        # 프롬프트 dict의 정렬된 JSON -> 파일에 있던 원래 문자열 (저장 시 같은 내용이면 원래 문자열 그대로)
+        self._prompt_sources: Dict[str, str] = {}
+
+    def _load_json(self, path: Path) -> Any:
+        """
+        JSON 파일 로드 (인덱스가 있으면 인덱스 경유, 아직 쓰지 않은 저장 내용 우선)
+
+        Raises:
+            파일 읽기/파싱 오류 (json.load와 동일)
+        """
+        _, data, error = self._load_json_files([path])[0]
+        if error is not None:
+            raise error
+        return data
+
+    def _load_json_files(self, paths: List[Path]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        JSON 파일 여러 개 로드 (파일 읽기는 공용 I/O 풀에서 동시에, 인덱스가 있으면 인덱스 경유)
+        지연 쓰기 큐에 대기 중인 경로는 디스크 대신 대기 중인 내용을 읽습니다.
+
+        Returns:
+            [(경로, 데이터, 오류)] - 입력 순서, 실패한 파일은 데이터 None, 오류에 예외
+        """
+        paths = [Path(p) for p in paths]
+        pending = self.write_queue.get_pending(paths) if self.write_queue is not None else {}
+        disk_paths = [p for p in paths if str(p) not in pending]
+        if self.index is not None:
+            loaded = self.index.load_json_files(disk_paths)
+        else:
+            loaded = read_json_files(disk_paths)
+        if not pending:
+            return loaded
+
+        by_path = {str(p): (p, data, error) for p, data, error in loaded}
+        results = []
+        for path in paths:
+            key = str(path)
+            if key not in pending:
+                results.append(by_path[key])
+            elif pending[key] is None:
+                results.append((path, None, FileNotFoundError(2, "삭제 예정인 파일", key)))
+            else:
+                try:
+                    results.append((path, json.loads(pending[key]), None))
+                except Exception as e:
+                    results.append((path, None, e))
+        return results
+
+    def _load_sidecar_json(self, path: Path) -> Any:
+        """
+        image_prompts 파일 로드 (파일 stat이 마지막으로 읽을 때와 같으면 파싱한 내용 재사용)
+
+        반환값은 캐시와 공유되므로 호출 측에서 수정하지 않는다.
+
+        Returns:
+            파일 내용 (파일이 없거나 읽기 실패 시 None)
+        """
+        if self.write_queue is not None and self.write_queue.is_pending(path):
+            # 아직 쓰지 않은 저장 내용 (파일 stat으로 확인할 수 없음)
+            return self._load_json(path) if self._exists(path) else None
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._sidecar_cache.pop(key, None)
+            return None
+        cached = self._sidecar_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            data = self._load_json(path)
+        except Exception as e:
+            print(f"이미지 프롬프트 파일 읽기 오류 ({path.name}): {e}")
+            return None
+        self._sidecar_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    def _exists(self, path: Path) -> bool:
+        """파일 존재 여부 (지연 쓰기 큐의 대기 중인 생성/삭제 반영)"""
+        if self.write_queue is not None:
+            pending = self.write_queue.get_pending([path])
+            if str(path) in pending:
+                return pending[str(path)] is not None
+        return path.exists()
+
+    def _list_json_dir(self, directory: Path, pattern: str = "*.json") -> List[Path]:
+        """폴더의 파일 목록 (파일명 순서, 지연 쓰기 큐의 대기 중인 생성/삭제 반영)"""
+        paths = {str(p): p for p in directory.glob(pattern)}
+        if self.write_queue is not None:
+            for key, content in self.write_queue.get_pending_in(directory).items():
+                if not fnmatch.fnmatch(Path(key).name, pattern):
+                    continue
+                if content is None:
+                    paths.pop(key, None)
+                else:
+                    paths[key] = Path(key)
+        return sorted(paths.values())
+
+    def _load_json_dir(self, directory: Path, pattern: str = "*.json") -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        폴더의 JSON 파일 전체 로드 (파일명 순서, 폴더에서 사라진 파일은 인덱스에서 삭제)
+
+        Returns:
+            [(경로, 데이터, 오류)] - 실패한 파일은 데이터 None, 오류에 예외
+        """
+        results = self._load_json_files(self._list_json_dir(directory, pattern))
+        if self.index is not None:
+            self.index.prune_directory(directory)
+        return results
+
+    def _write_json(self, path: Path, data: Any):
+        """
+        JSON 파일 저장 (지연 쓰기 큐가 있으면 예약, 없으면 바로 원자적 저장)
+
+        Raises:
+            파일 쓰기 오류 (큐를 쓰지 않을 때)
+        """
+        self._write_text(path, json.dumps(data, ensure_ascii=False, indent=2, default=json_default))
+
+    def _write_text(self, path: Path, text: str):
+        self._persisted.pop(str(path), None)
+        if self.write_queue is not None:
+            self.write_queue.submit(path, text)
+        else:
+            atomic_write_text(path, text)
+
+    def _delete_file(self, path: Path):
+        """파일 삭제 (지연 쓰기 큐가 있으면 대기 중인 쓰기 뒤에 삭제되도록 예약)"""
+        self._persisted.pop(str(path), None)
+        if self.write_queue is not None:
+            self.write_queue.delete(path)
+        else:
+            path.unlink()
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        예약된 저장이 모두 끝날 때까지 대기 (종료/프로젝트 전환 시 호출)
+
+        Returns:
+            모두 끝났는지 여부
+        """
+        if self.write_queue is None:
+            return True
+        return self.write_queue.flush(timeout)
+
+    def get_write_failures(self) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        백그라운드 저장 실패 현황 (저장 전후 값을 비교해 새 실패를 찾을 때 사용)
+
+        Returns:
+            (누적 실패 수, 최근 실패 목록 [(경로, 오류 메시지)])
+        """
+        if self.write_queue is None:
+            return 0, []
+        return self.write_queue.get_stats()["failed"], self.write_queue.get_errors()
+
+    def get_write_failures_since(self, failed_before: int) -> List[Tuple[str, str]]:
+        """
+        get_write_failures()로 기록해 둔 시점 이후 새로 실패한 저장 목록
+
+        Args:
+            failed_before: 이전에 읽은 누적 실패 수
+
+        Returns:
+            [(경로, 오류 메시지)]
+        """
+        failed, errors = self.get_write_failures()
+        new_failures = failed - failed_before
+        return errors[-new_failures:] if new_failures > 0 else []
+
+    def _write_json_if_changed(self, path: Path, data: Any) -> bool:
+        """
+        JSON 파일 저장 (직렬화 결과가 파일 내용 또는 대기 중인 저장 내용과 같으면 쓰지 않음)
+
+        Returns:
+            실제로 저장(또는 예약)했는지 여부
+
+        Raises:
+            파일 쓰기 오류 (큐를 쓰지 않을 때)
+        """
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=json_default)
+        key = str(path)
+        pending = self.write_queue.get_pending([path]) if self.write_queue is not None else {}
+        if key in pending:
+            unchanged = pending[key] == text
+        else:
+            digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            unchanged = False
+            if st is not None:
+                # 마지막으로 확인한 뒤 파일이 그대로면 읽지 않고 해시만 비교, 아니면 파일 내용과 비교
+                unchanged = self._persisted.get(key) == (digest, st.st_mtime_ns, st.st_size)
+                if not unchanged:
+                    try:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            unchanged = f.read() == text
+                    except Exception:
+                        unchanged = False
+                if unchanged:
+                    self._persisted[key] = (digest, st.st_mtime_ns, st.st_size)
+        if unchanged:
+            self.write_stats["skipped"] += 1
+            return False
+
+        self._write_text(path, text)
+        if self.write_queue is None:
+            st = os.stat(path)
+            self._persisted[key] = (hashlib.sha1(text.encode('utf-8')).hexdigest(), st.st_mtime_ns, st.st_size)
+        self.write_stats["written"] += 1
+        return True
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """저장 통계 (실제로 쓴 파일 수, 내용이 같아 건너뛴 파일 수)"""
+        return dict(self.write_stats)
 
     def get_characters_dir(self) -> Path:
         """
@@ -88,10 +343,9 @@ class FileService:
     def load_synopsis(self) -> Dict[str, Any]:
         """시놉시스 파일 로드"""
         synopsis_path = self.project_path / "synopsis.json"
-        if synopsis_path.exists():
+        if self._exists(synopsis_path):
             try:
-                with open(synopsis_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_json(synopsis_path)
             except Exception as e:
                 print(f"시놉시스 로드 오류: {e}")
         return {}
@@ -100,8 +354,7 @@ class FileService:
         """시놉시스 파일 저장"""
         synopsis_path = self.project_path / "synopsis.json"
         try:
-            with open(synopsis_path, 'w', encoding='utf-8') as f:
-                json.dump(synopsis, f, ensure_ascii=False, indent=2)
+            self._write_json_if_changed(synopsis_path, synopsis)
             return True
         except Exception as e:
             print(f"시놉시스 저장 오류: {e}")
@@ -194,6 +447,95 @@ class FileService:
 
         return normalized
 
+    def _decode_profile_prompts(self, prompts: Any) -> Dict[str, Any]:
+        """
+        프로필 파일의 image_generation_prompts를 메모리 표현으로 변환 (값마다 decode_prompt)
+
+        파싱한 문자열은 기억해 두었다가 저장할 때 내용이 같으면 그대로 써서, 불러온 뒤 바로 저장해도 파일이 바뀌지 않게 한다.
+        """
+        if isinstance(prompts, str):
+            # 과거 데이터: image_generation_prompts 전체가 JSON 문자열
+            prompts = safe_json_loads(prompts, {}) if prompts.strip() else {}
+        if not isinstance(prompts, dict):
+            return {}
+        decoded: Dict[str, Any] = {}
+        for key, value in prompts.items():
+            parsed = decode_prompt(value)
+            if parsed is not value:
+                self._prompt_sources[json.dumps(parsed, ensure_ascii=False, sort_keys=True)] = value
+            decoded[key] = parsed
+        return decoded
+
+    def _encode_prompt_for_storage(self, value: Any) -> Any:
+        """프롬프트 dict -> 프로필 저장 형식(JSON 문자열), 문자열 등은 그대로"""
+        if not isinstance(value, dict):
+            return value
+        source = self._prompt_sources.get(json.dumps(value, ensure_ascii=False, sort_keys=True))
+        return source if source is not None else encode_prompt(value)
+
+    def _profile_for_storage(self, char: Mapping) -> Dict[str, Any]:
+        """프로필 파일에 쓸 내용 (_filename 제외, 프롬프트 값은 JSON 문자열)"""
+        save_data = {k: v for k, v in char.items() if k != '_filename'}
+        prompts = save_data.get("image_generation_prompts")
+        if isinstance(prompts, dict):
+            save_data["image_generation_prompts"] = {
+                key: self._encode_prompt_for_storage(value) for key, value in prompts.items()
+            }
+        return save_data
+
+    def _prepare_character(self, char_file: Path, raw_data: Dict[str, Any], idx: int) -> Tuple[Dict[str, Any], bool]:
+        """
+        캐릭터 파일 1개의 내용을 프로필 형식으로 정리
+
+        Args:
+            char_file: 캐릭터 파일 경로
+            raw_data: 파일 내용
+            idx: 프로필 순서 (1부터, image_prompts 파일 매칭용)
+
+        Returns:
+            (프로필, 이름 공백 정규화가 일어났는지)
+        """
+        raw_data['_filename'] = char_file.name
+        renamed = False
+
+        # 새 구조/구 구조 통합 처리
+        char_data = self._normalize_character_data(raw_data)
+
+        # name 정규화: 공백 제거(예: "김회장" == "김 회장")
+        raw_name = char_data.get("name", "")
+        if isinstance(raw_name, str):
+            normalized_name = normalize_character_name(raw_name)
+            if normalized_name != raw_name:
+                renamed = True
+            char_data["name"] = normalized_name
+
+        # image_generation_prompts 정규화: 프롬프트 값은 메모리에서 dict (파일의 JSON 문자열은 여기서 한 번만 파싱)
+        char_data["image_generation_prompts"] = self._decode_profile_prompts(char_data.get("image_generation_prompts"))
+
+        # image_prompts 파일이 있으면 프로필에 복원(누락된 prompt만 채움)
+        # 새 구조는 이미 versions에서 가져왔으므로 스킵
+        if char_data.get("_original_structure") != "new":
+            try:
+                self._sync_image_prompts_into_profile_from_file(char_data, character_index=idx)
+            except Exception as e:
+                print(f"이미지 프롬프트 동기화 오류 ({char_file.name}): {e}")
+
+        return char_data, renamed
+
+    def load_character_file(self, char_file: Path, idx: int) -> Dict[str, Any]:
+        """
+        캐릭터 파일 1개 로드 (외부에서 바뀐 파일만 다시 읽을 때 사용, 중복 병합/자동 정리는 하지 않음)
+
+        Args:
+            char_file: 캐릭터 파일 경로
+            idx: 프로필 순서 (1부터)
+
+        Raises:
+            파일 읽기/파싱 오류
+        """
+        char_data, _ = self._prepare_character(char_file, self._load_json(char_file), idx)
+        return char_data
+
     def load_characters(self) -> List[Dict[str, Any]]:
         """캐릭터 파일들 로드 (새 구조 및 구 구조 모두 지원)"""
         characters: List[Dict[str, Any]] = []
@@ -203,71 +545,40 @@ class FileService:
             merged_by_key: Dict[str, Dict[str, Any]] = {}
             ordered_keys: List[str] = []
             needs_cleanup = False
-            for idx, char_file in enumerate(sorted(characters_dir.glob("*.json")), start=1):
+            for idx, (char_file, raw_data, error) in enumerate(self._load_json_dir(characters_dir), start=1):
                 try:
-                    with open(char_file, 'r', encoding='utf-8') as f:
-                        raw_data = json.load(f)
-                        raw_data['_filename'] = char_file.name
-
-                        # 새 구조/구 구조 통합 처리
-                        char_data = self._normalize_character_data(raw_data)
-
-                        # name 정규화: 공백 제거(예: "김회장" == "김 회장")
-                        raw_name = char_data.get("name", "")
-                        if isinstance(raw_name, str):
-                            normalized_name = normalize_character_name(raw_name)
-                            if normalized_name != raw_name:
-                                needs_cleanup = True
-                            char_data["name"] = normalized_name
-
-                        # image_generation_prompts 정규화(과거 데이터 호환)
-                        prompts_obj = char_data.get("image_generation_prompts")
-                        if isinstance(prompts_obj, str):
-                            try:
-                                parsed = json.loads(prompts_obj)
-                                prompts_obj = parsed if isinstance(parsed, dict) else {}
-                            except Exception:
-                                prompts_obj = {}
-                            char_data["image_generation_prompts"] = prompts_obj
-                        elif prompts_obj is None:
-                            char_data["image_generation_prompts"] = {}
-                        elif not isinstance(prompts_obj, dict):
-                            char_data["image_generation_prompts"] = {}
-
-                        # image_prompts 파일이 있으면 프로필에 복원(누락된 prompt만 채움)
-                        # 새 구조는 이미 versions에서 가져왔으므로 스킵
-                        if char_data.get("_original_structure") != "new":
-                            try:
-                                self._sync_image_prompts_into_profile_from_file(char_data, character_index=idx)
-                            except Exception as e:
-                                print(f"이미지 프롬프트 동기화 오류 ({char_file.name}): {e}")
-
-                        # 중복(공백만 다른 이름 등) 병합: 첫 항목 유지 + 빈 값만 채우기
-                        key = normalize_character_name(char_data.get("name", ""))
-                        if not key:
-                            characters.append(char_data)
-                            continue
-
-                        if key not in merged_by_key:
-                            merged_by_key[key] = char_data
-                            ordered_keys.append(key)
-                        else:
-                            needs_cleanup = True
-                            existing = merged_by_key[key]
-                            for k, v in char_data.items():
-                                if k in ["_filename"]:
-                                    continue
-                                if k not in existing or existing.get(k) in ["", None, {}, []]:
-                                    existing[k] = v
-
-                            # image_generation_prompts는 dict 병합
-                            ex_prompts = existing.get("image_generation_prompts", {})
-                            new_prompts = char_data.get("image_generation_prompts", {})
-                            if isinstance(ex_prompts, dict) and isinstance(new_prompts, dict):
-                                for pk, pv in new_prompts.items():
-                                    if pk not in ex_prompts or ex_prompts.get(pk) in ["", None]:
-                                        ex_prompts[pk] = pv
-                                existing["image_generation_prompts"] = ex_prompts
+                    if error is not None:
+                        raise error
+                    char_data, renamed = self._prepare_character(char_file, raw_data, idx)
+                    if renamed:
+                        needs_cleanup = True
+
+                    # 중복(공백만 다른 이름 등) 병합: 첫 항목 유지 + 빈 값만 채우기
+                    key = normalize_character_name(char_data.get("name", ""))
+                    if not key:
+                        characters.append(char_data)
+                        continue
+
+                    if key not in merged_by_key:
+                        merged_by_key[key] = char_data
+                        ordered_keys.append(key)
+                    else:
+                        needs_cleanup = True
+                        existing = merged_by_key[key]
+                        for k, v in char_data.items():
+                            if k in ["_filename"]:
+                                continue
+                            if k not in existing or existing.get(k) in ["", None, {}, []]:
+                                existing[k] = v
+
+                        # image_generation_prompts는 dict 병합
+                        ex_prompts = existing.get("image_generation_prompts", {})
+                        new_prompts = char_data.get("image_generation_prompts", {})
+                        if isinstance(ex_prompts, dict) and isinstance(new_prompts, dict):
+                            for pk, pv in new_prompts.items():
+                                if pk not in ex_prompts or ex_prompts.get(pk) in ["", None]:
+                                    ex_prompts[pk] = pv
+                            existing["image_generation_prompts"] = ex_prompts
                 except Exception as e:
                     print(f"캐릭터 파일 로드 오류 ({char_file.name}): {e}")
 
@@ -304,18 +615,15 @@ class FileService:
                 
                 char_path = characters_dir / filename
 
-                # _filename 제거 후 저장
-                save_data = {k: v for k, v in char.items() if k != '_filename'}
-
-                with open(char_path, 'w', encoding='utf-8') as f:
-                    json.dump(save_data, f, ensure_ascii=False, indent=2)
+                # _filename 제거 후 저장 (내용이 같으면 쓰지 않음)
+                self._write_json_if_changed(char_path, self._profile_for_storage(char))
 
             # (정리) 현재 예상 파일 목록 외, 02_characters/*.json 제거(구버전/중복 파일 정리)
             try:
-                for f in characters_dir.glob("*.json"):
+                for f in self._list_json_dir(characters_dir):
                     if f.name not in expected_files:
                         try:
-                            f.unlink()
+                            self._delete_file(f)
                         except Exception as e:
                             print(f"파일 삭제 오류 ({f.name}): {e}")
             except Exception as e:
@@ -338,12 +646,12 @@ class FileService:
         details_dir = self.project_path / "02_characters" / "details"
 
         if details_dir.exists():
-            for detail_file in sorted(details_dir.glob("*.json")):
+            for detail_file, detail_data, error in self._load_json_dir(details_dir):
                 try:
-                    with open(detail_file, "r", encoding="utf-8") as f:
-                        detail_data = json.load(f)
-                        detail_data["_detail_filename"] = detail_file.name
-                        details.append(detail_data)
+                    if error is not None:
+                        raise error
+                    detail_data["_detail_filename"] = detail_file.name
+                    details.append(detail_data)
                 except Exception as e:
                     print(f"캐릭터 디테일 파일 로드 오류 ({detail_file.name}): {e}")
 
@@ -389,14 +697,14 @@ class FileService:
 
             # 기존 파일이 있으면 병합
             existing_prompts: Dict[str, Any] = {}
-            if file_path.exists():
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        existing = json.load(f)
-                        if isinstance(existing, dict):
-                            existing_prompts = existing.get("image_generation_prompts", {}) if isinstance(existing.get("image_generation_prompts"), dict) else {}
-                except Exception:
-                    existing_prompts = {}
+            existing_name = None
+            try:
+                existing = self._load_sidecar_json(file_path)
+                if isinstance(existing, dict):
+                    existing_name = existing.get("character_name")
+                    existing_prompts = existing.get("image_generation_prompts", {}) if isinstance(existing.get("image_generation_prompts"), dict) else {}
+            except Exception:
+                existing_prompts = {}
 
             merged_prompts = dict(existing_prompts)
             for n, prompt_dict in prompts_by_number.items():
@@ -405,23 +713,27 @@ class FileService:
                 if isinstance(prompt_dict, dict):
                     merged_prompts[f"prompt_{n}"] = prompt_dict
 
+            # 이름과 프롬프트가 그대로면 updated_at만 바꾸는 저장은 하지 않음
+            if existing_name == character_name and merged_prompts == existing_prompts:
+                self.write_stats["skipped"] += 1
+                return True
+
             payload = {
                 "character_name": character_name,
                 "image_generation_prompts": merged_prompts,
                 "updated_at": datetime.now().isoformat(),
             }
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
+            self._write_json_if_changed(file_path, payload)
             return True
         except Exception as e:
             print(f"이미지 프롬프트 파일 저장 오류 ({character_name}): {e}")
             return False
 
-    def load_character_image_prompts(self, character_name: str, character_index: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    def load_character_image_prompts(self, character_name: str, character_index: Optional[int] = None) -> Optional[ImagePrompt]:
         """
         캐릭터 이미지 프롬프트 파일 로드 (02_characters/image_prompts/)
         Returns:
-            {"character_name": str, "image_generation_prompts": {prompt_1: {...}, ...}} 또는 None
+            ImagePrompt {"character_name": str, "image_generation_prompts": {prompt_1: {...}, ...}} 또는 None
         """
         try:
             if not character_name:
@@ -435,13 +747,8 @@ class FileService:
                 character_index = name_to_index.get(norm_name, 1)
 
             filename = get_numbered_character_image_prompts_filename(character_index, character_name)
-            file_path = prompts_dir / filename
-            if not file_path.exists():
-                return None
-
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data if isinstance(data, dict) else None
+            data = self._load_sidecar_json(prompts_dir / filename)
+            return ImagePrompt.from_dict(data) if isinstance(data, dict) else None
         except Exception as e:
             print(f"이미지 프롬프트 파일 로드 오류 ({character_name}): {e}")
             return None
@@ -461,7 +768,7 @@ class FileService:
     def _sync_image_prompts_into_profile_from_file(self, profile: Dict[str, Any], character_index: int) -> None:
         """
         image_prompts 폴더 파일을 읽어, 프로필의 image_generation_prompts에 누락된 prompt만 복원.
-        - 프로필 저장 형식은 "JSON 문자열"이므로 dict -> json.dumps로 변환해 넣는다.
+        - 메모리 표현과 같은 dict로 넣는다 (JSON 문자열 변환은 save_characters에서).
         """
         if not isinstance(profile, dict):
             return
@@ -473,7 +780,7 @@ class FileService:
         name = profile["name"]
 
         data = self.load_character_image_prompts(name, character_index=character_index)
-        if not data or not isinstance(data, dict):
+        if not data:
             return
 
         prompts_from_file = data.get("image_generation_prompts", {})
@@ -489,27 +796,28 @@ class FileService:
             key = f"prompt_{n}"
             existing = prompts_obj.get(key, "")
             # 프로필이 비어있을 때만 파일 값으로 채움
-            if isinstance(existing, str) and existing.strip():
+            if existing and (not isinstance(existing, str) or existing.strip()):
                 continue
             file_val = prompts_from_file.get(key)
             if isinstance(file_val, dict):
-                prompts_obj[key] = json.dumps(file_val, ensure_ascii=False)
+                # 파일 캐시와 공유하지 않도록 복사
+                prompts_obj[key] = copy.deepcopy(file_val)
 
-        # prompt_1이 있고 image_generation_prompt가 비어있으면 동기화
+        # prompt_1이 있고 image_generation_prompt(문자열 필드)가 비어있으면 동기화
         if not (isinstance(profile.get("image_generation_prompt"), str) and profile.get("image_generation_prompt").strip()):
-            p1 = prompts_obj.get("prompt_1", "")
-            if isinstance(p1, str) and p1.strip():
+            p1 = encode_prompt(prompts_obj.get("prompt_1", ""))
+            if p1.strip():
                 profile["image_generation_prompt"] = p1
 
     def _sync_image_prompts_from_profiles(self, characters: List[Dict[str, Any]]) -> None:
         """
-        프로필의 image_generation_prompts(JSON 문자열) -> image_prompts 파일(dict)로 저장
+        프로필의 image_generation_prompts(메모리에서 dict) -> image_prompts 파일로 저장
         """
         if not isinstance(characters, list) or not characters:
             return
 
         for idx, c in enumerate(characters, start=1):
-            if not isinstance(c, dict):
+            if not isinstance(c, Mapping):
                 continue
             name = c.get("name", "")
             if not isinstance(name, str) or not name.strip():
@@ -518,29 +826,15 @@ class FileService:
             name = c["name"]
 
             prompts_obj = c.get("image_generation_prompts", {})
-            if isinstance(prompts_obj, str):
-                try:
-                    parsed = json.loads(prompts_obj)
-                    prompts_obj = parsed if isinstance(parsed, dict) else {}
-                except Exception:
-                    prompts_obj = {}
             if not isinstance(prompts_obj, dict):
                 prompts_obj = {}
 
             prompts_by_number: Dict[int, Dict[str, Any]] = {}
             for n in range(1, 9):
-                key = f"prompt_{n}"
-                val = prompts_obj.get(key, "")
+                # 화면에서 넣은 JSON 문자열도 허용 (JSON 객체가 아닌 텍스트 프롬프트는 파일에 넣지 않음)
+                val = decode_prompt(prompts_obj.get(f"prompt_{n}", ""))
                 if isinstance(val, dict):
                     prompts_by_number[n] = val
-                elif isinstance(val, str) and val.strip():
-                    try:
-                        parsed = json.loads(val)
-                        if isinstance(parsed, dict):
-                            prompts_by_number[n] = parsed
-                    except Exception:
-                        # JSON 문자열이 아니면 무시
-                        pass
 
             if prompts_by_number:
                 self.save_character_image_prompts(
@@ -557,10 +851,10 @@ class FileService:
                 nm = c.get("name", "")
                 if isinstance(nm, str) and nm.strip():
                     expected.add(get_numbered_character_image_prompts_filename(idx, nm))
-            for f in prompts_dir.glob("*.json"):
+            for f in self._list_json_dir(prompts_dir):
                 if f.name not in expected:
                     try:
-                        f.unlink()
+                        self._delete_file(f)
                     except Exception as e:
                         print(f"이미지 프롬프트 파일 삭제 오류 ({f.name}): {e}")
         except Exception as e:
@@ -601,7 +895,7 @@ class FileService:
                 name = _norm(c.get("name", ""))
                 if not name:
                     continue
-                if name in detail_by_name:
+                if name in detail_by_name and c.get("character_detail") != detail_by_name[name]:
                     c["character_detail"] = detail_by_name[name]
                     changed = True
 
@@ -643,16 +937,15 @@ class FileService:
 
                 # 내부 키 제거 후 저장
                 save_data = {k: v for k, v in detail.items() if k not in ["_detail_filename"]}
-                with open(detail_path, "w", encoding="utf-8") as f:
-                    json.dump(save_data, f, ensure_ascii=False, indent=2)
+                self._write_json_if_changed(detail_path, save_data)
 
             # (정리) details 폴더 정리: 현재 details 목록 기준 예상 파일 외 삭제
             try:
                 expected = {d.get("_detail_filename") for d in details if isinstance(d, dict) and d.get("_detail_filename")}
-                for f in details_dir.glob("*.json"):
+                for f in self._list_json_dir(details_dir):
                     if f.name not in expected:
                         try:
-                            f.unlink()
+                            self._delete_file(f)
                         except Exception as e:
                             print(f"디테일 파일 삭제 오류 ({f.name}): {e}")
             except Exception as e:
@@ -689,8 +982,7 @@ class FileService:
 
             detail_path = details_dir / filename
             save_data = {k: v for k, v in detail.items() if k not in ["_detail_filename"]}
-            with open(detail_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            self._write_json_if_changed(detail_path, save_data)
 
             # 저장 후 프로필 파일에도 디테일을 추가로 기록
             try:
@@ -709,12 +1001,12 @@ class FileService:
         # 1. 먼저 03_chapters 폴더 확인 (기존 구조)
         chapters_dir = self.project_path / "03_chapters"
         if chapters_dir.exists():
-            for chapter_file in sorted(chapters_dir.glob("chapter_*.json")):
+            for chapter_file, chapter_data, error in self._load_json_dir(chapters_dir, "chapter_*.json"):
                 try:
-                    with open(chapter_file, 'r', encoding='utf-8') as f:
-                        chapter_data = json.load(f)
-                        chapter_data['_filename'] = chapter_file.name
-                        chapters.append(chapter_data)
+                    if error is not None:
+                        raise error
+                    chapter_data['_filename'] = chapter_file.name
+                    chapters.append(chapter_data)
                 except Exception as e:
                     print(f"챕터 파일 로드 오류 ({chapter_file.name}): {e}")
 
@@ -726,84 +1018,70 @@ class FileService:
 
         return chapters
 
+    def load_chapter_file(self, chapter_file: Path) -> Dict[str, Any]:
+        """
+        03_chapters 챕터 파일 1개 로드
+
+        Raises:
+            파일 읽기/파싱 오류
+        """
+        chapter_data = self._load_json(chapter_file)
+        chapter_data['_filename'] = chapter_file.name
+        return chapter_data
+
+    def load_episode_file(self, ep_file: Path) -> Dict[str, Any]:
+        """
+        scenes 폴더 에피소드 파일 1개 로드 (lazy_chapters 모드면 LazyChapter)
+
+        Raises:
+            파일 읽기/파싱 오류
+        """
+        self._episode_bodies.discard(ep_file)
+        if self.lazy_chapters:
+            _, metadata, error = self._load_episode_metadata_files([ep_file])[0]
+            if error is not None:
+                raise error
+            return LazyChapter(metadata, ep_file, self._episode_bodies)
+        return self._build_episode_chapter(ep_file, self._load_json(ep_file))
+
     def _load_episodes_from_scenes(self, scenes_dir: Path) -> List[Dict[str, Any]]:
         """
         scenes 폴더에서 에피소드 파일들 로드
         지원 파일명: EP01_제목.json, 01화_제목.json
         지원 JSON 구조: episode/episode_info 또는 chapter/chapter_info
+
+        lazy_chapters 모드에서는 장면 본문(scenes, key_objects)을 빼고 읽어 LazyChapter로 감싸며,
+        본문은 처음 접근할 때 읽습니다.
         """
-        import re
         episodes = []
 
         try:
-            # scenes 폴더 내의 모든 하위 폴더(막별) 검색
-            for act_folder in sorted(scenes_dir.iterdir()):
-                if not act_folder.is_dir():
-                    continue
-
-                # 각 막 폴더 내의 모든 JSON 파일 검색
-                all_json_files = list(act_folder.glob("*.json"))
+            # scenes 폴더 내의 모든 하위 폴더(막별)의 JSON 파일 (막 폴더 순서, 폴더 안에서는 파일명 순서)
+            act_folders = [p for p in sorted(scenes_dir.iterdir()) if p.is_dir()]
+            ep_files = [ep_file for act_folder in act_folders for ep_file in sorted(act_folder.glob("*.json"))]
 
-                for ep_file in sorted(all_json_files, key=lambda f: f.name):
+            # 모든 막의 파일을 한 번에 동시 로드
+            if self.lazy_chapters:
+                entries = self._load_episode_metadata_files(ep_files)
+            else:
+                entries = []
+                for ep_file, ep_data, error in self._load_json_files(ep_files):
                     try:
-                        with open(ep_file, 'r', encoding='utf-8') as f:
-                            ep_data = json.load(f)
-
-                        metadata = ep_data.get('metadata', {})
-                        scenes = ep_data.get('scenes', [])
-
-                        # 에피소드 정보 (신버전: episode_info, 구버전: chapter_info)
-                        episode_info = ep_data.get('episode_info', {}) or ep_data.get('chapter_info', {})
-
-                        # 에피소드 번호 추출 (다양한 키 지원)
-                        ep_num = metadata.get('episode') or metadata.get('chapter') or 0
-                        if not ep_num:
-                            # 파일명에서 번호 추출: EP01, 01화 등
-                            match = re.search(r'(?:EP)?(\d+)', ep_file.stem)
-                            if match:
-                                ep_num = int(match.group(1))
-
-                        # 제목 추출 (다양한 키 지원)
-                        ep_title = metadata.get('episode_title') or metadata.get('chapter_title') or ''
-                        if not ep_title:
-                            # 파일명에서 제목 추출: EP01_제목 또는 01화_제목 -> 제목
-                            title_match = re.search(r'(?:EP\d+_|\d+화_)(.+)$', ep_file.stem)
-                            if title_match:
-                                ep_title = title_match.group(1)
-                            else:
-                                ep_title = ep_file.stem
-
-                        # 장소 정보 (다양한 키 지원)
-                        locations = episode_info.get('main_locations') or []
-                        if not locations:
-                            main_loc = episode_info.get('main_location', '')
-                            if main_loc:
-                                locations = [main_loc]
-
-                        # 감정 정보 (다양한 키 지원)
-                        emotion = episode_info.get('core_emotion') or episode_info.get('main_emotion', '')
-
-                        chapter_data = {
-                            '_filename': ep_file.name,
-                            '_folder': act_folder.name,
-                            '_source': 'scenes',
-                            'chapter_number': ep_num,
-                            'title': ep_title,
-                            'act': metadata.get('act', ''),
-                            'act_title': metadata.get('act_title', ''),
-                            'work_title': metadata.get('work_title', ''),
-                            'main_locations': locations,
-                            'characters': episode_info.get('characters', []),
-                            'core_emotion': emotion,
-                            'scenes': scenes,
-                            'total_scenes': metadata.get('total_scenes', len(scenes)),
-                            'key_objects': ep_data.get('key_objects', [])
-                        }
-
-                        episodes.append(chapter_data)
-
+                        if error is not None:
+                            raise error
+                        entries.append((ep_file, self._build_episode_chapter(ep_file, ep_data), None))
                     except Exception as e:
-                        pass  # 개별 파일 오류는 조용히 무시
+                        entries.append((ep_file, None, e))
+            if self.index is not None:
+                for act_folder in act_folders:
+                    self.index.prune_directory(act_folder)
+
+            for ep_file, chapter_data, error in entries:
+                if error is not None:
+                    continue  # 개별 파일 오류는 조용히 무시
+                if self.lazy_chapters:
+                    chapter_data = LazyChapter(chapter_data, ep_file, self._episode_bodies)
+                episodes.append(chapter_data)
 
             # 에피소드 번호로 정렬
             episodes.sort(key=lambda x: x.get('chapter_number', 0))
@@ -813,27 +1091,128 @@ class FileService:
 
         return episodes
 
-    def save_chapters(self, chapters: List[Dict[str, Any]]) -> bool:
-        """챕터 파일들 저장"""
+    def _build_episode_chapter(self, ep_file: Path, ep_data: Dict[str, Any]) -> Dict[str, Any]:
+        """에피소드 JSON을 챕터 딕셔너리로 변환"""
+        import re
+
+        metadata = ep_data.get('metadata', {})
+        scenes = ep_data.get('scenes', [])
+
+        # 에피소드 정보 (신버전: episode_info, 구버전: chapter_info)
+        episode_info = ep_data.get('episode_info', {}) or ep_data.get('chapter_info', {})
+
+        # 에피소드 번호 추출 (다양한 키 지원)
+        ep_num = metadata.get('episode') or metadata.get('chapter') or 0
+        if not ep_num:
+            # 파일명에서 번호 추출: EP01, 01화 등
+            match = re.search(r'(?:EP)?(\d+)', ep_file.stem)
+            if match:
+                ep_num = int(match.group(1))
+
+        # 제목 추출 (다양한 키 지원)
+        ep_title = metadata.get('episode_title') or metadata.get('chapter_title') or ''
+        if not ep_title:
+            # 파일명에서 제목 추출: EP01_제목 또는 01화_제목 -> 제목
+            title_match = re.search(r'(?:EP\d+_|\d+화_)(.+)$', ep_file.stem)
+            if title_match:
+                ep_title = title_match.group(1)
+            else:
+                ep_title = ep_file.stem
+
+        # 장소 정보 (다양한 키 지원)
+        locations = episode_info.get('main_locations') or []
+        if not locations:
+            main_loc = episode_info.get('main_location', '')
+            if main_loc:
+                locations = [main_loc]
+
+        # 감정 정보 (다양한 키 지원)
+        emotion = episode_info.get('core_emotion') or episode_info.get('main_emotion', '')
+
+        return {
+            '_filename': ep_file.name,
+            '_folder': ep_file.parent.name,
+            '_source': 'scenes',
+            'chapter_number': ep_num,
+            'title': ep_title,
+            'act': metadata.get('act', ''),
+            'act_title': metadata.get('act_title', ''),
+            'work_title': metadata.get('work_title', ''),
+            'main_locations': locations,
+            'characters': episode_info.get('characters', []),
+            'core_emotion': emotion,
+            'scenes': scenes,
+            'total_scenes': metadata.get('total_scenes', len(scenes)),
+            'key_objects': ep_data.get('key_objects', [])
+        }
+
+    def _build_episode_metadata(self, ep_file: Path, ep_data: Dict[str, Any]) -> Dict[str, Any]:
+        """에피소드 JSON에서 본문을 뺀 챕터 정보만 추출"""
+        chapter_data = self._build_episode_chapter(ep_file, ep_data)
+        for key in LAZY_CHAPTER_KEYS:
+            chapter_data.pop(key, None)
+        return chapter_data
+
+    def _load_episode_metadata_files(self, ep_files: List[Path]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        에피소드 파일들의 챕터 정보 로드 (인덱스가 있으면 본문 없이 정보만 인덱스에 저장)
+
+        Returns:
+            [(경로, 챕터 정보, 오류)] - 입력 순서
+        """
+        if self.index is not None:
+            return self.index.load_derived(ep_files, EPISODE_METADATA_KIND, self._build_episode_metadata)
+
+        results = []
+        for ep_file, ep_data, error in read_json_files(ep_files):
+            try:
+                if error is not None:
+                    raise error
+                results.append((ep_file, self._build_episode_metadata(ep_file, ep_data), None))
+            except Exception as e:
+                results.append((ep_file, None, e))
+        return results
+
+    def _load_episode_body(self, ep_file: Path) -> Dict[str, Any]:
+        """에피소드 파일의 본문(scenes, key_objects) 로드 (인덱스를 거치지 않음)"""
+        with open(ep_file, 'r', encoding='utf-8') as f:
+            ep_data = json.load(f)
+        return {key: ep_data.get(key, []) for key in LAZY_CHAPTER_KEYS}
+
+    def get_episode_body_cache_stats(self) -> Dict[str, int]:
+        """에피소드 본문 캐시 통계 (적중/로드/삭제 횟수, 현재 항목 수)"""
+        return self._episode_bodies.get_stats()
+
+    def get_chapter_path(self, chapter: Dict[str, Any]) -> Path:
+        """챕터 파일 경로 (기존 _filename이 있으면 사용, 없으면 정규화된 이름 사용)"""
+        if '_filename' in chapter:
+            filename = chapter['_filename']
+        else:
+            filename = get_chapter_filename(chapter.get('chapter_number', 1))
+        return self.project_path / "03_chapters" / filename
+
+    def save_chapters(self, chapters: List[Dict[str, Any]], chapter_numbers: Optional[Set[Any]] = None) -> bool:
+        """
+        챕터 파일들 저장 (내용이 같은 파일은 쓰지 않음)
+
+        Args:
+            chapters: 챕터 목록
+            chapter_numbers: 지정하면 해당 번호의 챕터만 저장 (ProjectData.get_dirty_entities 결과)
+        """
         chapters_dir = self.project_path / "03_chapters"
         chapters_dir.mkdir(parents=True, exist_ok=True)
+        wanted = {str(n) for n in chapter_numbers} if chapter_numbers is not None else None
 
         try:
             for chapter in chapters:
                 chapter_num = chapter.get('chapter_number', 1)
-                # 파일명 생성 (기존 _filename이 있으면 사용, 없으면 정규화된 이름 사용)
-                if '_filename' in chapter:
-                    filename = chapter['_filename']
-                else:
-                    filename = get_chapter_filename(chapter_num)
-                
-                chapter_path = chapters_dir / filename
+                if wanted is not None and str(chapter_num) not in wanted:
+                    continue
+                chapter_path = self.get_chapter_path(chapter)
 
-                # _filename 제거 후 저장
+                # _filename 제거 후 저장 (내용이 같으면 쓰지 않음)
                 save_data = {k: v for k, v in chapter.items() if k != '_filename'}
-
-                with open(chapter_path, 'w', encoding='utf-8') as f:
-                    json.dump(save_data, f, ensure_ascii=False, indent=2)
+                self._write_json_if_changed(chapter_path, save_data)
 
             return True
         except Exception as e:
@@ -846,20 +1225,11 @@ class FileService:
         chapters_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            chapter_num = chapter.get('chapter_number', 1)
-            # 파일명 생성 (기존 _filename이 있으면 사용, 없으면 정규화된 이름 사용)
-            if '_filename' in chapter:
-                filename = chapter['_filename']
-            else:
-                filename = get_chapter_filename(chapter_num)
-            
-            chapter_path = chapters_dir / filename
+            chapter_path = self.get_chapter_path(chapter)
 
-            # _filename 제거 후 저장
+            # _filename 제거 후 저장 (내용이 같으면 쓰지 않음)
             save_data = {k: v for k, v in chapter.items() if k != '_filename'}
-
-            with open(chapter_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            self._write_json_if_changed(chapter_path, save_data)
 
             return True
         except Exception as e:
@@ -1115,7 +1485,12 @@ class FileService:
         Args:
             new_path: 새로운 프로젝트 경로
         """
+        # 이전 프로젝트에 예약된 저장을 마친 뒤 전환
+        self.flush_writes()
         self.project_path = new_path
+        self._episode_bodies.clear()
+        self._sidecar_cache.clear()
+        self._prompt_sources.clear()
 
     def save_script_file(self, chapter_number: int, script: str, scenes: Optional[List[Dict[str, Any]]] = None) -> bool:
         """
@@ -1145,13 +1520,59 @@ class FileService:
         script_path = scripts_dir / filename
         
         try:
-            with open(script_path, 'w', encoding='utf-8') as f:
-                json.dump(script_data, f, ensure_ascii=False, indent=2)
+            self._write_json(script_path, script_data)
             return True
         except Exception as e:
             print(f"대본 파일 저장 오류: {e}")
             return False
 
+    def get_partial_script_path(self, chapter_number: int) -> Path:
+        """
+        스트리밍 생성 중인 대본의 임시 초안 파일 경로
+        Args:
+            chapter_number: 챕터 번호
+        Returns:
+            04_scripts/chapter_XX_script.partial.txt 경로
+        """
+        return self.project_path / "04_scripts" / f"chapter_{chapter_number:02d}_script.partial.txt"
+
+    def remove_partial_script(self, chapter_number: int):
+        """
+        대본 저장 완료 후 임시 초안 파일 삭제
+        Args:
+            chapter_number: 챕터 번호
+        """
+        partial_path = self.get_partial_script_path(chapter_number)
+        try:
+            if partial_path.exists():
+                partial_path.unlink()
+        except Exception as e:
+            print(f"임시 대본 파일 삭제 오류: {e}")
+
+    def get_story_state_path(self) -> Path:
+        """
+        챕터 요약 캐시(StoryStateCache) 파일 경로
+        Returns:
+            04_scripts/story_state.json 경로
+        """
+        return self.project_path / "04_scripts" / "story_state.json"
+
+    def get_provenance_path(self) -> Path:
+        """
+        생성물 입력 해시 기록(ProvenanceManifest) 파일 경로
+        Returns:
+            프로젝트 폴더의 provenance.json 경로
+        """
+        return self.project_path / "provenance.json"
+
+    def get_batch_jobs_path(self) -> Path:
+        """
+        LLM 배치 작업 저장소(BatchJobStore) 파일 경로
+        Returns:
+            프로젝트 폴더의 llm_batches/jobs.json 경로
+        """
+        return self.project_path / "llm_batches" / "jobs.json"
+
     def load_script_file(self, chapter_number: int) -> Optional[Dict[str, Any]]:
         """
         대본 파일 로드
@@ -1164,10 +1585,9 @@ class FileService:
         filename = f"chapter_{chapter_number:02d}_script.json"
         script_path = scripts_dir / filename
         
-        if script_path.exists():
+        if self._exists(script_path):
             try:
-                with open(script_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._load_json(script_path)
             except Exception as e:
                 print(f"대본 파일 로드 오류 ({filename}): {e}")
         
@@ -1207,22 +1627,42 @@ class FileService:
         script_path = scripts_dir / filename
 
         try:
-            with open(script_path, 'w', encoding='utf-8') as f:
-                json.dump(script_data, f, ensure_ascii=False, indent=2)
+            self._write_json(script_path, script_data)
             return True
         except Exception as e:
             print(f"장면 정보 저장 오류: {e}")
             return False
 
-    def load_episode_scripts(self) -> Dict[str, List[Dict[str, Any]]]:
+    def get_episode_manifest_path(self) -> Path:
         """
-        *_episodes 폴더에서 MD 파일들을 막(Act)별로 그룹화하여 로드
+        에피소드 대본 목록 캐시(EpisodeScriptManifest) 파일 경로
+        Returns:
+            프로젝트 폴더의 .episode_manifest.json 경로 (점으로 시작해 폴더 감시 대상에서 제외)
+        """
+        return self.project_path / ".episode_manifest.json"
+
+    def _get_episode_manifest(self) -> EpisodeScriptManifest:
+        """현재 프로젝트의 대본 목록 캐시 (프로젝트가 바뀌면 새로 생성)"""
+        path = self.get_episode_manifest_path()
+        if self._episode_manifest is None or self._episode_manifest.path != path:
+            self._episode_manifest = EpisodeScriptManifest(path)
+        return self._episode_manifest
+
+    def scan_episode_scripts(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        *_episodes 폴더의 MD 파일 목록을 막(Act)별로 그룹화 (파일 내용은 읽지 않음)
+
+        에피소드 번호/제목은 파일명에서, 크기는 stat에서 가져온다.
+        글자 수는 목록 캐시에 stat이 같은 기록이 있을 때만 채우고, 없으면 None
+        (read_episode_script로 읽으면 기록됨).
 
         Returns:
             막별 에피소드 리스트 딕셔너리
             {
                 "Act1_지옥의시작": [
-                    {"episode_num": 1, "title": "원수의장례식", "content": "...", "file_path": "..."},
+                    {"episode_num": 1, "title": "원수의장례식", "act": "Act1_지옥의시작",
+                     "file_path": "...", "filename": "EP01_원수의장례식.md",
+                     "size_bytes": 12345, "char_count": 4567 또는 None},
                     ...
                 ],
                 ...
@@ -1232,17 +1672,13 @@ class FileService:
 
         episodes_by_act: Dict[str, List[Dict[str, Any]]] = {}
 
-        try:
-            # *_episodes 폴더 찾기 (여러 패턴 지원)
-            episodes_folder = None
-            for folder in self.project_path.iterdir():
-                if folder.is_dir() and '_episodes' in folder.name:
-                    episodes_folder = folder
-                    break
-
-            if not episodes_folder or not episodes_folder.exists():
-                return episodes_by_act
+        episodes_folder = self.get_episodes_folder()
+        if not episodes_folder:
+            return episodes_by_act
 
+        manifest = self._get_episode_manifest()
+        seen_keys: List[str] = []
+        try:
             # 각 Act 폴더 검색
             for act_folder in sorted(episodes_folder.iterdir()):
                 if not act_folder.is_dir():
@@ -1251,34 +1687,31 @@ class FileService:
                 act_name = act_folder.name  # 예: "Act1_지옥의시작", "Act2-1_충돌과균열"
                 episodes_list: List[Dict[str, Any]] = []
 
-                # 각 MD 파일 로드
                 for md_file in sorted(act_folder.glob("*.md")):
                     try:
-                        # 에피소드 번호 추출 (EP01, EP02, ...)
-                        ep_match = re.search(r'EP(\d+)', md_file.stem)
-                        ep_num = int(ep_match.group(1)) if ep_match else 0
-
-                        # 제목 추출 (EP01_제목.md -> 제목)
-                        title_match = re.search(r'EP\d+_(.+)$', md_file.stem)
-                        ep_title = title_match.group(1) if title_match else md_file.stem
-
-                        # 파일 내용 로드
-                        with open(md_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-
-                        episode_data = {
-                            "episode_num": ep_num,
-                            "title": ep_title,
-                            "content": content,
-                            "file_path": str(md_file),
-                            "filename": md_file.name,
-                            "char_count": len(content)
-                        }
-
-                        episodes_list.append(episode_data)
-
-                    except Exception as e:
-                        pass  # 개별 파일 오류는 무시
+                        stat = md_file.stat()
+                    except OSError:
+                        continue  # 개별 파일 오류는 무시
+
+                    # 에피소드 번호 추출 (EP01, EP02, ...)
+                    ep_match = re.search(r'EP(\d+)', md_file.stem)
+                    ep_num = int(ep_match.group(1)) if ep_match else 0
+
+                    # 제목 추출 (EP01_제목.md -> 제목)
+                    title_match = re.search(r'EP\d+_(.+)$', md_file.stem)
+                    ep_title = title_match.group(1) if title_match else md_file.stem
+
+                    key = f"{act_name}/{md_file.name}"
+                    seen_keys.append(key)
+                    episodes_list.append({
+                        "episode_num": ep_num,
+                        "title": ep_title,
+                        "act": act_name,
+                        "file_path": str(md_file),
+                        "filename": md_file.name,
+                        "size_bytes": stat.st_size,
+                        "char_count": manifest.get_char_count(key, stat.st_mtime_ns, stat.st_size),
+                    })
 
                 # 에피소드 번호로 정렬
                 episodes_list.sort(key=lambda x: x.get('episode_num', 0))
@@ -1289,6 +1722,67 @@ class FileService:
         except Exception as e:
             pass  # 폴더 오류는 무시
 
+        manifest.prune(seen_keys)
+        manifest.save()
+        return episodes_by_act
+
+    def read_episode_script(self, episode: Dict[str, Any], save_manifest: bool = True) -> str:
+        """
+        에피소드 MD 파일 1개의 내용 읽기 (scan_episode_scripts 항목, char_count도 갱신)
+
+        큰 파일은 mmap으로 읽어 파일 크기만큼의 중간 버퍼를 만들지 않는다.
+
+        Args:
+            episode: scan_episode_scripts 결과의 에피소드 항목
+            save_manifest: 글자 수 캐시를 바로 저장할지 여부 (여러 편을 읽을 때는 False 후 save_episode_manifest)
+
+        Returns:
+            대본 내용 (읽기 실패 시 빈 문자열)
+        """
+        md_file = Path(episode.get("file_path", ""))
+        try:
+            with open(md_file, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_size >= EPISODE_MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, 'utf-8')
+                else:
+                    content = f.read().decode('utf-8')
+        except Exception as e:
+            print(f"대본 파일 읽기 오류 ({md_file.name}): {e}")
+            return ""
+
+        # 텍스트 모드로 읽을 때와 같은 줄바꿈
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        episode["char_count"] = len(content)
+        episode["size_bytes"] = stat.st_size
+        if episode.get("act"):
+            manifest = self._get_episode_manifest()
+            manifest.set_char_count(f"{episode['act']}/{md_file.name}", stat.st_mtime_ns, stat.st_size, len(content))
+            if save_manifest:
+                manifest.save()
+        return content
+
+    def save_episode_manifest(self):
+        """대본 목록 캐시에 기록한 글자 수 저장 (read_episode_script(save_manifest=False) 이후 호출)"""
+        self._get_episode_manifest().save()
+
+    def load_episode_scripts(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        *_episodes 폴더에서 MD 파일들을 막(Act)별로 그룹화하여 내용까지 로드
+
+        목록만 필요하면 scan_episode_scripts + read_episode_script를 사용한다.
+
+        Returns:
+            scan_episode_scripts 결과에 에피소드별 "content"를 추가한 딕셔너리
+        """
+        episodes_by_act = self.scan_episode_scripts()
+        for episodes in episodes_by_act.values():
+            for episode in episodes:
+                episode["content"] = self.read_episode_script(episode, save_manifest=False)
+        self.save_episode_manifest()
         return episodes_by_act
 
     def get_episodes_folder(self) -> Optional[Path]:
@@ -0,0 +1,210 @@
+"""
+의존 관계 기반 작업 스케줄러
+작업 간 선후 관계(DAG)를 받아, 선행 작업이 끝난 작업부터 스레드 풀에서 동시에 실행합니다.
+실패한 작업에 의존하는 작업은 실행하지 않고 건너뜁니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, List, Callable, Iterable
+
+
+class Job:
+    """스케줄러 작업 1건"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    def __init__(self, job_id: str, func: Callable[[Dict[str, Any]], Any], deps: Iterable[str] = ()):
+        """
+        Args:
+            job_id: 작업 ID (예: "script:3")
+            func: {선행 작업 ID: 결과}를 받아 결과를 반환하는 함수
+            deps: 선행 작업 ID 목록
+        """
+        self.job_id = job_id
+        self.func = func
+        self.deps = list(deps)
+        self.status = Job.PENDING
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """실행 시간(초)"""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+
+class JobScheduler:
+    """DAG 작업 스케줄러"""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 작업 수
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.jobs: Dict[str, Job] = {}
+
+    def add(self, job_id: str, func: Callable[[Dict[str, Any]], Any], deps: Iterable[str] = ()) -> Job:
+        """
+        작업 추가
+
+        Args:
+            job_id: 작업 ID (중복 불가)
+            func: {선행 작업 ID: 결과}를 받아 결과를 반환하는 함수 (None 반환은 실패로 처리)
+            deps: 선행 작업 ID 목록
+
+        Returns:
+            추가된 Job
+        """
+        if job_id in self.jobs:
+            raise ValueError(f"중복된 작업 ID: {job_id}")
+        job = Job(job_id, func, deps)
+        self.jobs[job_id] = job
+        return job
+
+    def _validate(self):
+        """존재하지 않는 선행 작업과 순환 의존 검사"""
+        for job in self.jobs.values():
+            for dep in job.deps:
+                if dep not in self.jobs:
+                    raise ValueError(f"작업 {job.job_id}의 선행 작업 {dep}이(가) 없습니다.")
+
+        # 위상 정렬로 순환 검사
+        remaining = {job_id: len(job.deps) for job_id, job in self.jobs.items()}
+        dependents = self._dependents()
+        ready = [job_id for job_id, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            job_id = ready.pop()
+            visited += 1
+            for child in dependents[job_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if visited != len(self.jobs):
+            cycle = sorted(job_id for job_id, count in remaining.items() if count > 0)
+            raise ValueError(f"순환 의존이 있는 작업: {', '.join(cycle)}")
+
+    def _dependents(self) -> Dict[str, List[str]]:
+        """{작업 ID: 이 작업에 의존하는 작업 ID 목록}"""
+        dependents: Dict[str, List[str]] = {job_id: [] for job_id in self.jobs}
+        for job in self.jobs.values():
+            for dep in job.deps:
+                dependents[dep].append(job.job_id)
+        return dependents
+
+    def _skip_dependents(self, job_id: str, dependents: Dict[str, List[str]],
+                         on_event: Optional[Callable[[Job], None]]):
+        """실패한 작업의 후속 작업을 모두 건너뜀"""
+        stack = list(dependents[job_id])
+        while stack:
+            child = self.jobs[stack.pop()]
+            if child.status != Job.PENDING:
+                continue
+            child.status = Job.SKIPPED
+            if on_event is not None:
+                on_event(child)
+            stack.extend(dependents[child.job_id])
+
+    def _execute(self, job: Job) -> Any:
+        """작업 실행 (워커 스레드)"""
+        dep_results = {dep: self.jobs[dep].result for dep in job.deps}
+        job.started_at = time.perf_counter()
+        try:
+            return job.func(dep_results)
+        finally:
+            job.finished_at = time.perf_counter()
+
+    def run(self, on_event: Optional[Callable[[Job], None]] = None) -> Dict[str, Job]:
+        """
+        모든 작업 실행 (선행 작업이 끝난 작업부터 동시에)
+
+        Args:
+            on_event: 작업 상태가 바뀔 때마다(실행 시작/완료/실패/건너뜀) 호출되는 콜백
+                      (스케줄러를 실행한 스레드에서 호출됨)
+
+        Returns:
+            {작업 ID: Job}
+        """
+        self._validate()
+        dependents = self._dependents()
+        waiting = {job_id: len(job.deps) for job_id, job in self.jobs.items()}
+        ready = [job_id for job_id, count in waiting.items() if count == 0]
+        order = {job_id: i for i, job_id in enumerate(self.jobs)}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or running:
+                # 추가된 순서대로 실행 (먼저 추가한 작업이 보통 임계 경로)
+                ready.sort(key=order.get)
+                while ready and len(running) < self.max_workers:
+                    job = self.jobs[ready.pop(0)]
+                    if job.status != Job.PENDING:
+                        continue
+                    job.status = Job.RUNNING
+                    if on_event is not None:
+                        on_event(job)
+                    running[executor.submit(self._execute, job)] = job
+
+                if not running:
+                    break
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = running.pop(future)
+                    try:
+                        job.result = future.result()
+                        if job.result is None:
+                            raise RuntimeError("결과 없음")
+                        job.status = Job.DONE
+                    except Exception as e:
+                        job.error = e
+                        job.status = Job.FAILED
+                        print(f"작업 실패 ({job.job_id}): {e}")
+                    if on_event is not None:
+                        on_event(job)
+
+                    if job.status == Job.DONE:
+                        for child in dependents[job.job_id]:
+                            waiting[child] -= 1
+                            if waiting[child] == 0:
+                                ready.append(child)
+                    else:
+                        self._skip_dependents(job.job_id, dependents, on_event)
+
+        return self.jobs
+
+    def get_critical_path(self) -> List[str]:
+        """
+        실행 시간 기준 가장 긴 의존 경로 (run() 이후)
+
+        Returns:
+            작업 ID 리스트 (시작 → 끝)
+        """
+        best: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        def longest(job_id: str) -> float:
+            if job_id not in best:
+                job = self.jobs[job_id]
+                parent = max(job.deps, key=longest, default=None)
+                previous[job_id] = parent
+                best[job_id] = job.elapsed + (longest(parent) if parent else 0.0)
+            return best[job_id]
+
+        if not self.jobs:
+            return []
+        end = max(self.jobs, key=longest)
+        path = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+        return list(reversed(path))
@@ -0,0 +1,399 @@
+"""
+LLM 배치 작업
+즉시 응답이 필요 없는 대량 생성 요청을 로컬 작업 저장소에 기록한 뒤 제공자 Batch API로 제출하고 결과를 받아옵니다.
+네트워크 없이 흐름을 확인할 수 있도록 파일 기반 로컬 백엔드를 함께 제공합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+from services.write_queue import atomic_write_text
+
+# 작업 상태
+BATCH_SUBMITTED = "submitted"
+BATCH_IN_PROGRESS = "in_progress"
+BATCH_ENDED = "ended"
+BATCH_FAILED = "failed"
+BATCH_APPLIED = "applied"
+
+# 제공자 Batch API 엔드포인트/완료 기한
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_BATCH_WINDOW = "24h"
+
+# 같은 저장소 파일을 쓰는 인스턴스끼리 공유하는 잠금 (서로의 작업 기록을 덮어쓰지 않도록)
+_PATH_LOCKS: Dict[str, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    with _PATH_LOCKS_GUARD:
+        return _PATH_LOCKS.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _write_jsonl(path: Path, rows: List[Dict[str, Any]]):
+    """JSONL 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    atomic_write_text(path, "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows), fsync=False)
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """JSONL 파일 로드 (형식이 잘못된 줄은 무시)"""
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+    return rows
+
+
+class BatchJobStore:
+    """배치 작업 저장소 (프로젝트별 llm_batches/jobs.json)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 저장소 파일 경로 (FileService.get_batch_jobs_path())
+        """
+        self.path = Path(path)
+        self._lock = _path_lock(self.path)
+        self._jobs: Optional[Dict[str, Dict[str, Any]]] = None
+        # 마지막으로 읽거나 쓴 시점의 파일 stat (mtime_ns, size)
+        self._loaded_stat: Optional[Tuple[int, int]] = None
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        저장소 파일 로드 (_lock 안에서 호출)
+
+        Args:
+            force: True면 항상 파일을 다시 읽음 (저장 전 병합용), 아니면 파일 stat이 바뀐 경우만
+        """
+        stat = self._file_stat()
+        if force or self._jobs is None or stat != self._loaded_stat:
+            jobs: Dict[str, Dict[str, Any]] = {}
+            if stat is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict) and isinstance(data.get("jobs"), dict):
+                        jobs = data["jobs"]
+                except Exception as e:
+                    print(f"배치 작업 로드 오류: {e}")
+            self._jobs = jobs
+            self._loaded_stat = stat
+        return self._jobs
+
+    def _save(self):
+        """저장소 파일 저장 (_lock 안에서 호출, 임시 파일에 쓴 뒤 교체)"""
+        try:
+            text = json.dumps({"jobs": self._jobs}, ensure_ascii=False, indent=2)
+            atomic_write_text(self.path, text, fsync=False)
+            self._loaded_stat = self._file_stat()
+        except Exception as e:
+            print(f"배치 작업 저장 오류: {e}")
+
+    def create(self, backend: str, provider: str, model: str, requests: List[Dict[str, Any]]) -> str:
+        """
+        작업 생성 (제출 전 상태로 기록)
+
+        Args:
+            backend: "openai", "anthropic", "local"
+            provider: 응답을 만드는 제공자
+            model: 모델 이름
+            requests: [{"custom_id", "prompt", "system_prompt", "prefix", "meta"}, ...]
+
+        Returns:
+            작업 ID
+        """
+        job_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        now = datetime.now().isoformat()
+        with self._lock:
+            # 다른 인스턴스가 그사이 남긴 작업을 지우지 않도록 파일을 다시 읽어 병합
+            self._load(force=True)[job_id] = {
+                "job_id": job_id,
+                "backend": backend,
+                "provider": provider,
+                "model": model,
+                "remote_id": None,
+                "status": BATCH_SUBMITTED,
+                "error": "",
+                "created_at": now,
+                "updated_at": now,
+                "requests": list(requests),
+                "results": {},
+            }
+            self._save()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            job = self._load().get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id: str, **fields):
+        """
+        작업 필드 갱신
+
+        Args:
+            job_id: 작업 ID
+            **fields: 갱신할 필드 (status, remote_id, results, error 등)
+        """
+        with self._lock:
+            job = self._load(force=True).get(job_id)
+            if job is None:
+                raise KeyError(f"배치 작업이 없습니다: {job_id}")
+            job.update(fields)
+            job["updated_at"] = datetime.now().isoformat()
+            self._save()
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        작업 목록 (요청/결과 본문 제외, 생성 순서)
+
+        Args:
+            status: 지정하면 해당 상태의 작업만
+
+        Returns:
+            [{job_id, backend, provider, model, status, created_at, updated_at, requests, results}, ...]
+            (requests/results는 개수)
+        """
+        with self._lock:
+            jobs = []
+            for job in self._load().values():
+                if status is not None and job.get("status") != status:
+                    continue
+                item = {k: v for k, v in job.items() if k not in ("requests", "results")}
+                item["requests"] = len(job.get("requests", []))
+                item["results"] = len(job.get("results", {}))
+                jobs.append(item)
+            return sorted(jobs, key=lambda job: job.get("created_at", ""))
+
+    def delete(self, job_id: str):
+        """작업 삭제"""
+        with self._lock:
+            if self._load(force=True).pop(job_id, None) is not None:
+                self._save()
+
+
+class LocalBatchBackend:
+    """
+    파일 기반 로컬 배치 백엔드 (네트워크 없이 배치 흐름 확인용)
+
+    제출 시 요청을 <remote_id>.input.jsonl로 쓰고, 조회 시 complete_after초가 지났으면
+    handler로 모든 요청을 처리해 <remote_id>.output.jsonl로 씁니다.
+    """
+
+    name = "local"
+
+    def __init__(self, directory: Path, handler: Callable[[Dict[str, Any]], Optional[str]],
+                 complete_after: float = 0.0):
+        """
+        Args:
+            directory: 입출력 파일 폴더
+            handler: 요청 1건({"prompt", "system_prompt", "prefix"})을 받아 응답 텍스트를 반환하는 함수
+            complete_after: 제출 후 완료로 처리하기까지의 시간(초)
+        """
+        self.directory = Path(directory)
+        self.handler = handler
+        self.complete_after = float(complete_after)
+
+    def _input_path(self, remote_id: str) -> Path:
+        return self.directory / f"{remote_id}.input.jsonl"
+
+    def _output_path(self, remote_id: str) -> Path:
+        return self.directory / f"{remote_id}.output.jsonl"
+
+    def submit(self, requests: List[Dict[str, Any]], model_name: str) -> str:
+        """요청 파일 기록 후 원격 ID 반환"""
+        remote_id = f"local_{uuid.uuid4().hex[:12]}"
+        _write_jsonl(self._input_path(remote_id), [
+            {
+                "custom_id": request["custom_id"],
+                "model": model_name,
+                "prompt": request.get("prompt", ""),
+                "system_prompt": request.get("system_prompt"),
+                "prefix": request.get("prefix"),
+            }
+            for request in requests
+        ])
+        return remote_id
+
+    def poll(self, remote_id: str) -> str:
+        """상태 확인 (기한이 지났고 아직 처리하지 않았으면 이때 처리)"""
+        input_path = self._input_path(remote_id)
+        output_path = self._output_path(remote_id)
+        if output_path.exists():
+            return BATCH_ENDED
+        if not input_path.exists():
+            return BATCH_FAILED
+        if time.time() - input_path.stat().st_mtime < self.complete_after:
+            return BATCH_IN_PROGRESS
+
+        rows = []
+        for request in _read_jsonl(input_path):
+            try:
+                rows.append({"custom_id": request["custom_id"], "text": self.handler(request)})
+            except Exception as e:
+                rows.append({"custom_id": request["custom_id"], "error": f"{type(e).__name__}: {e}"})
+        _write_jsonl(output_path, rows)
+        return BATCH_ENDED
+
+    def fetch(self, remote_id: str) -> Dict[str, Dict[str, Any]]:
+        """결과 {custom_id: {"text": ...} 또는 {"error": ...}}"""
+        results = {}
+        for row in _read_jsonl(self._output_path(remote_id)):
+            custom_id = row.pop("custom_id", None)
+            if custom_id:
+                results[custom_id] = row
+        return results
+
+
+class OpenAIBatchBackend:
+    """OpenAI Batch API 백엔드 (/v1/chat/completions, 24시간 기한)"""
+
+    name = "openai"
+
+    def __init__(self, llm_service):
+        """
+        Args:
+            llm_service: LLMService 인스턴스 (클라이언트/요청 구성 재사용)
+        """
+        self.llm = llm_service
+
+    def _get_client(self):
+        openai, api_key, model_name = self.llm._get_openai_settings()
+        return self.llm._get_client("openai", api_key, model_name, lambda: openai.OpenAI(api_key=api_key))
+
+    def submit(self, requests: List[Dict[str, Any]], model_name: str) -> str:
+        """입력 JSONL 업로드 후 배치 생성"""
+        lines = []
+        for request in requests:
+            prompt = self.llm._join_prompt(request.get("prefix"), request.get("prompt", ""))
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": OPENAI_BATCH_ENDPOINT,
+                "body": self.llm._build_openai_request(model_name, prompt, request.get("system_prompt")),
+            }, ensure_ascii=False))
+
+        client = self._get_client()
+        batch_file = client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id, endpoint=OPENAI_BATCH_ENDPOINT, completion_window=OPENAI_BATCH_WINDOW
+        )
+        return batch.id
+
+    def poll(self, remote_id: str) -> str:
+        """배치 상태 확인 (기한 만료도 받은 결과는 가져오도록 종료로 처리)"""
+        status = self._get_client().batches.retrieve(remote_id).status
+        if status in ("completed", "expired", "cancelled"):
+            return BATCH_ENDED
+        if status == "failed":
+            return BATCH_FAILED
+        return BATCH_IN_PROGRESS
+
+    def fetch(self, remote_id: str) -> Dict[str, Dict[str, Any]]:
+        """출력/오류 파일에서 결과 수집"""
+        client = self._get_client()
+        batch = client.batches.retrieve(remote_id)
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                custom_id = row.get("custom_id")
+                response = row.get("response") or {}
+                body = response.get("body") or {}
+                if row.get("error") or response.get("status_code") != 200:
+                    results[custom_id] = {"error": json.dumps(row.get("error") or body.get("error"), ensure_ascii=False)}
+                    continue
+                try:
+                    text = body["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    results[custom_id] = {"error": "API 응답에 내용이 없습니다."}
+                    continue
+                usage = body.get("usage") or {}
+                self.llm._record_usage(
+                    "openai",
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    cached_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                )
+                results[custom_id] = {"text": text}
+        return results
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API 백엔드"""
+
+    name = "anthropic"
+
+    def __init__(self, llm_service):
+        """
+        Args:
+            llm_service: LLMService 인스턴스 (클라이언트/요청 구성 재사용)
+        """
+        self.llm = llm_service
+
+    def _get_client(self):
+        anthropic, api_key, model_name = self.llm._get_anthropic_settings()
+        return self.llm._get_client("anthropic", api_key, model_name, lambda: anthropic.Anthropic(api_key=api_key))
+
+    def submit(self, requests: List[Dict[str, Any]], model_name: str) -> str:
+        """배치 생성 (고정 앞부분은 실시간 호출과 같이 cache_control 지정)"""
+        batch_requests = []
+        for request in requests:
+            prefix = request.get("prefix")
+            prompt = self.llm._join_prompt(prefix, request.get("prompt", ""))
+            batch_requests.append({
+                "custom_id": request["custom_id"],
+                "params": self.llm._build_anthropic_request(
+                    model_name, prompt, request.get("system_prompt"), None, prefix
+                ),
+            })
+        return self._get_client().messages.batches.create(requests=batch_requests).id
+
+    def poll(self, remote_id: str) -> str:
+        """배치 상태 확인"""
+        status = self._get_client().messages.batches.retrieve(remote_id).processing_status
+        return BATCH_ENDED if status == "ended" else BATCH_IN_PROGRESS
+
+    def fetch(self, remote_id: str) -> Dict[str, Dict[str, Any]]:
+        """요청별 결과 수집 (errored/canceled/expired는 오류로 기록)"""
+        results: Dict[str, Dict[str, Any]] = {}
+        for entry in self._get_client().messages.batches.results(remote_id):
+            result = entry.result
+            if result.type != "succeeded":
+                error = getattr(result, "error", None)
+                results[entry.custom_id] = {"error": f"{result.type}: {error}" if error else result.type}
+                continue
+            try:
+                text = self.llm._parse_anthropic_response(result.message)
+            except ValueError as e:
+                results[entry.custom_id] = {"error": str(e)}
+                continue
+            self.llm._record_anthropic_usage(getattr(result.message, "usage", None))
+            results[entry.custom_id] = {"text": text}
+        return results
@@ -0,0 +1,246 @@
+"""
+LLM 응답 캐시
+프롬프트/모델/샘플링 파라미터 해시를 키로 하는 SQLite 기반 디스크 캐시입니다.
+동일한 요청을 다시 보내면 API 호출 없이 저장된 응답을 반환합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 클래스 (LRU + 용량 제한 + TTL)"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_entries: int = 2000,
+        max_bytes: int = 200 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+            max_bytes: 최대 저장 용량 (압축된 응답 기준)
+            ttl_seconds: 항목 유효 기간 (None이면 만료 없음)
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """SQLite 연결 (최초 사용 시 생성)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT,
+                    model TEXT,
+                    response BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_accessed ON responses(last_accessed)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        params: Dict[str, Any],
+        system_prompt: Optional[str],
+        prompt: str,
+    ) -> str:
+        """
+        캐시 키 생성 (요청 내용의 SHA-256 해시)
+
+        Args:
+            provider: 제공자 이름
+            model: 모델 이름
+            params: 샘플링 파라미터 (temperature, top_p 등)
+            system_prompt: 시스템 프롬프트
+            prompt: 사용자 프롬프트
+
+        Returns:
+            16진수 해시 문자열
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "params": params or {},
+                "system": system_prompt or "",
+                "prompt": prompt,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key()로 만든 키
+
+        Returns:
+            저장된 응답 텍스트 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                row = conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+
+                blob, created_at = row
+                now = time.time()
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    self.stats["expired"] += 1
+                    self.stats["misses"] += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE responses SET last_accessed = ?, hit_count = hit_count + 1 WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                self.stats["hits"] += 1
+                return zlib.decompress(blob).decode("utf-8")
+            except Exception as e:
+                print(f"LLM 캐시 조회 오류: {e}")
+                self.stats["misses"] += 1
+                return None
+
+    def put(self, key: str, response: str, provider: str = "", model: str = ""):
+        """
+        캐시 저장 (저장 후 용량/개수 제한에 맞춰 LRU 정리)
+
+        Args:
+            key: make_key()로 만든 키
+            response: 응답 텍스트
+            provider: 제공자 이름 (통계/정리용)
+            model: 모델 이름 (통계/정리용)
+        """
+        if not response:
+            return
+        blob = zlib.compress(response.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (key, provider, model, response, size, created_at, last_accessed, hit_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (key, provider, model, blob, len(blob), now, now),
+                )
+                self.stats["stores"] += 1
+                self._evict(conn)
+                conn.commit()
+            except Exception as e:
+                print(f"LLM 캐시 저장 오류: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """만료 항목 삭제 후 개수/용량 제한을 넘는 만큼 오래된 항목부터 삭제"""
+        if self.ttl_seconds is not None:
+            cur = conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self.stats["expired"] += max(cur.rowcount, 0)
+
+        count, total_size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY last_accessed ASC").fetchall()
+        to_delete = []
+        for key, size in rows:
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            count -= 1
+            total_size -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        self.stats["evictions"] += len(to_delete)
+
+    def delete(self, key: str):
+        """
+        캐시 항목 삭제 (없으면 무시)
+
+        Args:
+            key: make_key()로 만든 키
+        """
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+            except Exception as e:
+                print(f"LLM 캐시 삭제 오류: {e}")
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+            except Exception as e:
+                print(f"LLM 캐시 삭제 오류: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            적중/실패 횟수, 적중률, 저장 항목 수 및 용량
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self.stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits"] / lookups) if lookups else 0.0
+            try:
+                count, total_size = self._get_conn().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+            except Exception:
+                count, total_size = 0, 0
+            stats["entries"] = count
+            stats["bytes"] = total_size
+            return stats
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,306 @@
+"""
+LLM 재시도 정책
+일시적인 오류(429, 5xx, 타임아웃)를 구분해 지수 백오프로 재시도하고, 시도별 기록을 남깁니다.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, List
+
+# 재시도할 HTTP 상태 코드 (529: Anthropic 과부하)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# 상태 코드가 없는 SDK 예외를 이름으로 구분 (연결 끊김, 타임아웃, 할당량 초과 등)
+RETRYABLE_ERROR_NAMES = (
+    "Timeout",
+    "Connection",
+    "RateLimit",
+    "Overloaded",
+    "InternalServer",
+    "ServiceUnavailable",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+)
+
+# Gemini 오류 메시지의 재시도 대기 시간 ("retry_delay { seconds: 37 }", "Please retry in 37.5s")
+_GEMINI_RETRY_DELAY_PATTERNS = (
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)"),
+    re.compile(r"retry in\s*([\d.]+)\s*s", re.IGNORECASE),
+)
+
+
+def get_error_status(error: Exception) -> Optional[int]:
+    """
+    SDK 예외에서 HTTP 상태 코드 추출
+
+    Args:
+        error: 제공자 SDK 예외
+
+    Returns:
+        상태 코드 또는 None
+    """
+    for attr in ("status_code", "code", "status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    재시도하면 성공할 수 있는 일시적 오류인지 판단
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        재시도 가능 여부 (설정 오류, 잘못된 요청, 인증 오류는 False)
+    """
+    if isinstance(error, (ImportError, ValueError)):
+        return False
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+
+    status = get_error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+
+    name = type(error).__name__
+    return any(token in name for token in RETRYABLE_ERROR_NAMES)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    서버가 알려준 재시도 대기 시간(초) 추출
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        대기 시간(초) 또는 None (정보가 없을 경우)
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        try:
+            retry_after_ms = headers.get("retry-after-ms")
+            if retry_after_ms:
+                return max(0.0, float(retry_after_ms) / 1000.0)
+            retry_after = headers.get("retry-after")
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    # HTTP 날짜 형식
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except Exception:
+            pass
+
+    message = str(error)
+    for pattern in _GEMINI_RETRY_DELAY_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        deadline_seconds: Optional[float] = 600.0,
+    ):
+        """
+        Args:
+            max_attempts: 제공자당 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 대기 시간 기준(초), 시도마다 2배씩 증가
+            max_delay: 백오프 대기 시간 상한(초)
+            deadline_seconds: 요청 1건에 쓸 수 있는 전체 시간(초), None이면 제한 없음
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.deadline_seconds = float(deadline_seconds) if deadline_seconds else None
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """
+        설정 딕셔너리에서 정책 생성
+
+        Args:
+            settings: {"max_attempts": 4, "base_delay": 2.0, "max_delay": 60.0, "deadline_seconds": 600}
+
+        Returns:
+            RetryPolicy 인스턴스
+        """
+        settings = settings or {}
+        return cls(
+            max_attempts=settings.get("max_attempts", 4),
+            base_delay=settings.get("base_delay", 2.0),
+            max_delay=settings.get("max_delay", 60.0),
+            deadline_seconds=settings.get("deadline_seconds", 600.0),
+        )
+
+    def start_deadline(self) -> Optional[float]:
+        """요청 시작 시점 기준 마감 시각 (time.monotonic 기준)"""
+        if self.deadline_seconds is None:
+            return None
+        return time.monotonic() + self.deadline_seconds
+
+    @staticmethod
+    def remaining(deadline: Optional[float]) -> Optional[float]:
+        """마감까지 남은 시간(초), 마감이 없으면 None"""
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    def next_delay(self, attempt: int, error: Exception, deadline: Optional[float]) -> Optional[float]:
+        """
+        다음 재시도까지 대기할 시간 계산
+
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터)
+            error: 발생한 예외
+            deadline: start_deadline() 결과
+
+        Returns:
+            대기 시간(초) 또는 None (재시도하지 않음)
+        """
+        if attempt >= self.max_attempts or not is_retryable_error(error):
+            return None
+
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            # 서버 지정 시간은 지키되, 동시에 대기한 요청이 한꺼번에 몰리지 않도록 약간 분산
+            delay = retry_after + random.uniform(0, min(1.0, self.base_delay))
+        else:
+            # full jitter: 0 ~ min(상한, 기준 * 2^(시도-1))
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+        remaining = self.remaining(deadline)
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+
+class LLMAttemptTelemetry:
+    """LLM 시도별 기록 (최근 기록 보관 + 제공자별 누적 통계)"""
+
+    def __init__(self, max_records: int = 500):
+        """
+        Args:
+            max_records: 보관할 최근 시도 기록 수
+        """
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        attempt: int,
+        latency: float,
+        queue_wait: float = 0.0,
+        backoff: float = 0.0,
+        error: Optional[Exception] = None,
+        estimated_tokens: int = 0,
+        input_tokens: int = 0,
+        cached_tokens: int = 0,
+        output_tokens: int = 0,
+    ):
+        """
+        시도 1건 기록
+
+        Args:
+            provider: 제공자 이름
+            model: 모델 이름
+            attempt: 시도 번호 (1부터)
+            latency: API 호출 소요 시간(초)
+            queue_wait: 요청 한도(RPM/TPM) 대기 시간(초)
+            backoff: 이 시도 실패 후 재시도까지 대기한 시간(초)
+            error: 실패 시 예외
+            estimated_tokens: 요청 전 추정한 입력 토큰
+            input_tokens: 응답 사용량의 실제 입력 토큰 (0이면 정보 없음)
+            cached_tokens: 프롬프트 캐시 적중 토큰
+            output_tokens: 출력 토큰
+        """
+        if error is None:
+            outcome = "ok"
+        elif backoff > 0:
+            outcome = "retry"
+        else:
+            outcome = "error"
+
+        entry = {
+            "time": time.time(),
+            "provider": provider,
+            "model": model,
+            "attempt": attempt,
+            "latency": latency,
+            "queue_wait": queue_wait,
+            "backoff": backoff,
+            "outcome": outcome,
+            "error": f"{type(error).__name__}: {error}" if error is not None else "",
+            "status": get_error_status(error) if error is not None else None,
+            "estimated_tokens": estimated_tokens,
+            "input_tokens": input_tokens,
+            "cached_tokens": cached_tokens,
+            "output_tokens": output_tokens,
+        }
+        with self._lock:
+            self._records.append(entry)
+            totals = self._totals.setdefault(provider, {
+                "attempts": 0, "ok": 0, "retry": 0, "error": 0,
+                "latency": 0.0, "queue_wait": 0.0, "backoff": 0.0,
+                "estimated_tokens": 0, "input_tokens": 0,
+            })
+            totals["attempts"] += 1
+            totals[outcome] += 1
+            totals["latency"] += latency
+            totals["queue_wait"] += queue_wait
+            totals["backoff"] += backoff
+            # 추정 정확도 비교는 실제 사용량이 있는 시도만 합산
+            if input_tokens:
+                totals["estimated_tokens"] += estimated_tokens
+                totals["input_tokens"] += input_tokens
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        제공자별 누적 통계 반환
+
+        Returns:
+            {provider: {attempts, ok, retry, error, latency, queue_wait, backoff, avg_latency,
+                        estimated_tokens, input_tokens}}
+        """
+        with self._lock:
+            stats = {}
+            for provider, totals in self._totals.items():
+                item = dict(totals)
+                item["avg_latency"] = totals["latency"] / totals["attempts"] if totals["attempts"] else 0.0
+                stats[provider] = item
+            return stats
+
+    def get_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        최근 시도 기록 반환
+
+        Args:
+            limit: 반환할 최대 개수
+
+        Returns:
+            오래된 순서의 시도 기록 리스트
+        """
+        with self._lock:
+            return list(self._records)[-limit:]
@@ -4,13 +4,62 @@ Gemini, OpenAI, Anthropic API 호출을 통합 관리합니다.
 Lazy Import 방식으로 프로그램 시작 시간 최적화
 """
 
+import asyncio
+import contextvars
 import os
-from typing import Optional
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Tuple, Any, Callable, List, Iterator
+
+from services.llm_cache import LLMResponseCache
+from services.rate_limiter import TokenBucketRateLimiter, build_rate_limiters
+from services.llm_retry import RetryPolicy, LLMAttemptTelemetry
+from services.mock_llm_provider import MockLLMProvider
+from services.llm_batch_service import (
+    BatchJobStore, LocalBatchBackend, OpenAIBatchBackend, AnthropicBatchBackend,
+    BATCH_IN_PROGRESS, BATCH_ENDED, BATCH_FAILED,
+)
+from utils.token_counter import estimate_tokens
 
 # LLM 모듈 참조 (lazy import)
 _genai = None
 _openai = None
 _anthropic = None
+_httpx = None
+
+# 제공자 클라이언트 공용 HTTP 커넥션 풀 설정 (keep-alive 재사용)
+HTTP_POOL_LIMITS = {
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 120.0,
+}
+HTTP_TIMEOUT = 600.0
+
+# 제공자별 모델 설정 키와 기본 모델
+MODEL_CONFIG_KEYS = {
+    "gemini": ("model", "gemini-1.5-flash"),
+    "openai": ("openai_model", "gpt-4o"),
+    "anthropic": ("anthropic_model", "claude-3-5-haiku-20241022"),
+    # 오프라인 개발/벤치마크용 모의 제공자 (services/mock_llm_provider.py)
+    "mock": ("mock_model", "mock-1"),
+}
+
+# max_tokens를 요청에 넣지 않는 제공자(Gemini 등)의 응답 토큰 상한
+DEFAULT_MAX_OUTPUT_TOKENS = 8192
+
+# Anthropic 프롬프트 캐시 최소 길이 (토큰, 이보다 짧으면 cache_control을 붙여도 캐시되지 않음)
+ANTHROPIC_CACHE_MIN_TOKENS = 1024
+ANTHROPIC_HAIKU_CACHE_MIN_TOKENS = 2048
+
+# 제공자 Batch API가 있는 제공자 (그 외 제공자는 로컬 배치 백엔드 사용)
+BATCH_API_PROVIDERS = ("openai", "anthropic")
+
+# 현재 호출의 실제 사용량을 받는 곳 (스레드/asyncio 태스크별로 분리됨)
+_call_usage: contextvars.ContextVar = contextvars.ContextVar("llm_call_usage", default=None)
+
+# 응답 캐시 기본 위치 (설정 파일과 같은 사용자 홈 디렉토리)
+DEFAULT_CACHE_PATH = Path.home() / ".senior_contents_llm_cache.sqlite3"
 
 
 def _import_genai():
@@ -49,6 +98,41 @@ def _import_anthropic():
     return _anthropic if _anthropic is not False else None
 
 
+def _import_httpx():
+    """httpx lazy import (openai/anthropic SDK 의존성)"""
+    global _httpx
+    if _httpx is None:
+        try:
+            import httpx
+            _httpx = httpx
+        except ImportError:
+            _httpx = False
+    return _httpx if _httpx is not False else None
+
+
+def _create_pooled_http_client(sdk, use_async: bool = False):
+    """
+    keep-alive 커넥션 풀을 사용하는 httpx 클라이언트 생성
+
+    Args:
+        sdk: openai 또는 anthropic 모듈 (DefaultHttpxClient 제공 여부 확인용)
+        use_async: True면 AsyncClient 생성 (async SDK 클라이언트용)
+
+    Returns:
+        httpx.Client/AsyncClient 또는 None (httpx 미설치 시 SDK 기본값 사용)
+    """
+    httpx = _import_httpx()
+    if httpx is None:
+        return None
+    limits = httpx.Limits(**HTTP_POOL_LIMITS)
+    # SDK 기본 설정(리다이렉트, 타임아웃 등)을 유지하기 위해 DefaultHttpxClient 우선 사용
+    if use_async:
+        client_cls = getattr(sdk, "DefaultAsyncHttpxClient", None) or httpx.AsyncClient
+    else:
+        client_cls = getattr(sdk, "DefaultHttpxClient", None) or httpx.Client
+    return client_cls(limits=limits, timeout=HTTP_TIMEOUT)
+
+
 class LLMService:
     """LLM API 호출 서비스 클래스"""
 
@@ -59,30 +143,890 @@ class LLMService:
         """
         self.config = config_manager
 
-    def call(self, prompt: str, system_prompt: str = None) -> Optional[str]:
+        # 클라이언트 레지스트리: (provider, api_key, model) -> client
+        # 설정 값이 바뀐 경우에만 새로 생성하고, 그 외에는 재사용하여
+        # 매 호출마다 발생하던 TLS 핸드셰이크/클라이언트 생성 비용을 제거한다.
+        self._clients: Dict[Tuple[str, str, str], Any] = {}
+        self._clients_lock = threading.Lock()
+        self._gemini_configured_key: Optional[str] = None
+        self.client_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+        # async 클라이언트는 이벤트 루프에 묶이므로 루프별로 따로 보관
+        # (provider, api_key, model, loop id) -> client
+        self._async_clients: Dict[Tuple[str, str, str, int], Any] = {}
+
+        # 디스크 응답 캐시 (최초 사용 시 생성)
+        self._cache: Optional[LLMResponseCache] = None
+        self._cache_lock = threading.Lock()
+
+        # 제공자별 RPM/TPM 리미터 (최초 사용 시 생성)
+        self._rate_limiters: Optional[Dict[str, TokenBucketRateLimiter]] = None
+        self._rate_limiters_lock = threading.Lock()
+
+        # 재시도/대체 제공자 시도 기록
+        self.telemetry = LLMAttemptTelemetry()
+
+        # 모의 제공자 (provider가 "mock"일 때 최초 사용 시 생성)
+        self._mock_provider: Optional[MockLLMProvider] = None
+
+        # 제공자별 토큰 사용량 (프롬프트 캐시 적중 토큰 포함)
+        self.usage_stats: Dict[str, Dict[str, int]] = {}
+        self._usage_lock = threading.Lock()
+
+    def _get_cache(self) -> Optional[LLMResponseCache]:
+        """
+        응답 캐시 반환 (설정에서 비활성화된 경우 None)
+
+        설정 키:
+            llm_cache_enabled, llm_cache_path, llm_cache_max_entries,
+            llm_cache_max_mb, llm_cache_ttl_days
+        """
+        if not self.config.get("llm_cache_enabled", True):
+            return None
+        with self._cache_lock:
+            if self._cache is None:
+                ttl_days = self.config.get("llm_cache_ttl_days", 30)
+                self._cache = LLMResponseCache(
+                    Path(self.config.get("llm_cache_path", "") or DEFAULT_CACHE_PATH),
+                    max_entries=int(self.config.get("llm_cache_max_entries", 2000)),
+                    max_bytes=int(float(self.config.get("llm_cache_max_mb", 200)) * 1024 * 1024),
+                    ttl_seconds=float(ttl_days) * 24 * 3600 if ttl_days else None,
+                )
+            return self._cache
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        응답 캐시 통계 반환 (적중률 등)
+
+        Returns:
+            LLMResponseCache.get_stats() 결과 (캐시 비활성화 시 빈 딕셔너리)
+        """
+        cache = self._get_cache()
+        return cache.get_stats() if cache is not None else {}
+
+    def invalidate_cache(self, prompt: str, system_prompt: str = None, prefix: Optional[str] = None):
+        """
+        요청의 캐시된 응답 삭제 (검사를 통과하지 못한 응답을 다음 요청에서 다시 받지 않도록)
+
+        Args:
+            prompt: call()에 넘긴 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택적)
+            prefix: call()에 넘긴 고정 앞부분
+        """
+        cache = self._get_cache()
+        if cache is None:
+            return
+        prompt = self._join_prompt(prefix, prompt)
+        # 대체 제공자가 응답했으면 그 제공자 키로 저장되므로 체인 전체에서 삭제
+        for provider in self._get_provider_chain(self._get_provider()):
+            model_name = self._get_model_name(provider)
+            cache.delete(cache.make_key(
+                provider, model_name, self._get_sampling_params(provider, model_name), system_prompt, prompt
+            ))
+
+    def _get_model_name(self, provider: str) -> str:
+        """설정에서 제공자의 모델 이름 조회"""
+        config_key, default_model = MODEL_CONFIG_KEYS[provider]
+        return self.config.get(config_key, default_model)
+
+    @staticmethod
+    def _get_sampling_params(provider: str, model_name: str) -> Dict[str, Any]:
+        """
+        제공자/모델별 샘플링 파라미터
+
+        API 호출과 캐시 키 생성이 같은 값을 사용하도록 한 곳에서 정의한다.
+        """
+        if provider == "gemini":
+            return {"temperature": 0.7, "top_p": 0.8, "top_k": 40}
+        if provider == "openai":
+            # O1 시리즈는 temperature/max_tokens를 지원하지 않음
+            if model_name.startswith("o1"):
+                return {}
+            return {"temperature": 0.7, "max_tokens": 4096}
+        if provider == "anthropic":
+            return {"max_tokens": 4096}
+        return {}
+
+    def _get_client(self, provider: str, api_key: str, model_name: str, factory: Callable[[], Any]) -> Any:
+        """
+        레지스트리에서 클라이언트 조회 (없으면 factory로 생성)
+
+        같은 제공자의 키/모델 설정이 바뀌면 이전 클라이언트는 닫고 교체한다.
+
+        Args:
+            provider: 제공자 이름
+            api_key: API 키
+            model_name: 모델 이름
+            factory: 클라이언트 생성 함수
+
+        Returns:
+            재사용 가능한 클라이언트 객체
+        """
+        key = (provider, api_key, model_name)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.client_stats["hits"] += 1
+                return client
+
+            self.client_stats["misses"] += 1
+
+            # 설정 변경으로 무효화된 같은 제공자의 클라이언트 정리
+            stale_keys = [k for k in self._clients if k[0] == provider]
+            for stale_key in stale_keys:
+                self._close_client(self._clients.pop(stale_key))
+
+            client = factory()
+            self._clients[key] = client
+            return client
+
+    def _get_async_client(self, provider: str, api_key: str, model_name: str, factory: Callable[[], Any]) -> Any:
+        """
+        현재 이벤트 루프용 async 클라이언트 조회 (없으면 factory로 생성)
+
+        Args:
+            provider: 제공자 이름
+            api_key: API 키
+            model_name: 모델 이름
+            factory: 클라이언트 생성 함수
+
+        Returns:
+            현재 루프에서 재사용 가능한 async 클라이언트
+        """
+        loop_id = id(asyncio.get_running_loop())
+        key = (provider, api_key, model_name, loop_id)
+        with self._clients_lock:
+            client = self._async_clients.get(key)
+            if client is not None:
+                self.client_stats["hits"] += 1
+                return client
+
+            self.client_stats["misses"] += 1
+            client = factory()
+            self._async_clients[key] = client
+            return client
+
+    async def _aclose_async_clients(self):
+        """현재 이벤트 루프에 묶인 async 클라이언트 정리"""
+        loop_id = id(asyncio.get_running_loop())
+        with self._clients_lock:
+            keys = [k for k in self._async_clients if k[3] == loop_id]
+            clients = [self._async_clients.pop(k) for k in keys]
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    result = close()
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    print(f"LLM async 클라이언트 종료 오류: {e}")
+
+    @staticmethod
+    def _close_client(client: Any):
+        """클라이언트의 HTTP 커넥션 풀 정리 (close 미지원 시 무시)"""
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                print(f"LLM 클라이언트 종료 오류: {e}")
+
+    def get_client_stats(self) -> Dict[str, Any]:
+        """
+        클라이언트 재사용 통계 반환
+
+        Returns:
+            {"hits": int, "misses": int, "hit_rate": float, "active_clients": int}
+        """
+        with self._clients_lock:
+            hits = self.client_stats["hits"]
+            misses = self.client_stats["misses"]
+            total = hits + misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": (hits / total) if total else 0.0,
+                "active_clients": len(self._clients) + len(self._async_clients),
+            }
+
+    def reset_clients(self):
+        """모든 캐시된 클라이언트를 닫고 레지스트리 초기화"""
+        with self._clients_lock:
+            for client in self._clients.values():
+                self._close_client(client)
+            self._clients.clear()
+            self._gemini_configured_key = None
+        # 설정이 바뀌었을 수 있으므로 리미터/모의 제공자도 다음 호출 때 다시 생성
+        with self._rate_limiters_lock:
+            self._rate_limiters = None
+        self._mock_provider = None
+
+    def call(self, prompt: str, system_prompt: str = None, use_cache: bool = True,
+                 prefix: Optional[str] = None) -> Optional[str]:
         """
         LLM 호출
 
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트 (선택적)
+            use_cache: False면 캐시 조회를 건너뛰고 새로 호출 (결과로 캐시 갱신)
+            prefix: 여러 요청이 공유하는 고정 앞부분 (프롬프트 앞에 붙으며 제공자 프롬프트 캐시 대상)
+
+        Returns:
+            LLM 응답 텍스트 또는 None (오류 시)
+        """
+        prompt = self._join_prompt(prefix, prompt)
+        provider = self._get_provider()
+        model_name = self._get_model_name(provider)
+
+        cache, cache_key, cached = self._lookup_cache(provider, model_name, prompt, system_prompt, use_cache)
+        if cached is not None:
+            return cached
+
+        policy = RetryPolicy.from_config(self.config.get("llm_retry", {}))
+        deadline = policy.start_deadline()
+        last_error: Optional[Exception] = None
+
+        for current in self._get_provider_chain(provider):
+            current_model = self._get_model_name(current)
+            for attempt in range(1, policy.max_attempts + 1):
+                timeout = self._check_deadline(policy, deadline, last_error)
+                queue_wait = self._wait_rate_limit(current, current_model, prompt, system_prompt)
+                usage = self._begin_usage_capture()
+                started = time.perf_counter()
+                try:
+                    response = self._call_provider(current, prompt, system_prompt, timeout=timeout, prefix=prefix)
+                except Exception as e:
+                    last_error = e
+                    delay = policy.next_delay(attempt, e, deadline)
+                    self.telemetry.record(current, current_model, attempt, time.perf_counter() - started,
+                                          queue_wait=queue_wait, backoff=delay or 0.0, error=e)
+                    if delay is None:
+                        break
+                    print(f"LLM 호출 재시도 ({current}, {attempt}/{policy.max_attempts}, {delay:.1f}초 후): {e}")
+                    time.sleep(delay)
+                    continue
+
+                self._finish_usage_capture(current, current_model, attempt, time.perf_counter() - started,
+                                           queue_wait, prompt, system_prompt, usage)
+                self._store_response(cache, cache_key, provider, current, current_model,
+                                     prompt, system_prompt, response)
+                return response
+
+        raise last_error
+
+    def stream(self, prompt: str, system_prompt: str = None, use_cache: bool = True,
+                   prefix: Optional[str] = None) -> Iterator[str]:
+        """
+        LLM 스트리밍 호출 (응답을 받는 대로 텍스트 조각을 반환)
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택적)
+            use_cache: False면 캐시 조회를 건너뛰고 새로 호출 (결과로 캐시 갱신)
+            prefix: 여러 요청이 공유하는 고정 앞부분 (프롬프트 앞에 붙으며 제공자 프롬프트 캐시 대상)
+
+        Yields:
+            응답 텍스트 조각 (캐시 적중 시 전체 응답 1개)
+        """
+        prompt = self._join_prompt(prefix, prompt)
+        provider = self._get_provider()
+        model_name = self._get_model_name(provider)
+
+        cache, cache_key, cached = self._lookup_cache(provider, model_name, prompt, system_prompt, use_cache)
+        if cached is not None:
+            yield cached
+            return
+
+        policy = RetryPolicy.from_config(self.config.get("llm_retry", {}))
+        deadline = policy.start_deadline()
+        last_error: Optional[Exception] = None
+
+        # 첫 조각을 받기 전까지만 재시도/대체 제공자 전환 (이미 내보낸 조각은 되돌릴 수 없음)
+        for current in self._get_provider_chain(provider):
+            current_model = self._get_model_name(current)
+            for attempt in range(1, policy.max_attempts + 1):
+                timeout = self._check_deadline(policy, deadline, last_error)
+                queue_wait = self._wait_rate_limit(current, current_model, prompt, system_prompt)
+                usage = self._begin_usage_capture()
+                started = time.perf_counter()
+                try:
+                    deltas = self._stream_provider(current, prompt, system_prompt, timeout=timeout, prefix=prefix)
+                    first = next(deltas, None)
+                except Exception as e:
+                    last_error = e
+                    delay = policy.next_delay(attempt, e, deadline)
+                    self.telemetry.record(current, current_model, attempt, time.perf_counter() - started,
+                                          queue_wait=queue_wait, backoff=delay or 0.0, error=e)
+                    if delay is None:
+                        break
+                    print(f"LLM 스트리밍 재시도 ({current}, {attempt}/{policy.max_attempts}, {delay:.1f}초 후): {e}")
+                    time.sleep(delay)
+                    continue
+
+                # 끝까지 받은 응답만 캐시에 저장 (중간에 끊기면 저장하지 않음)
+                parts: List[str] = []
+                if first:
+                    parts.append(first)
+                    yield first
+                for delta in deltas:
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+
+                self._finish_usage_capture(current, current_model, attempt, time.perf_counter() - started,
+                                           queue_wait, prompt, system_prompt, usage)
+                self._store_response(cache, cache_key, provider, current, current_model,
+                                     prompt, system_prompt, "".join(parts))
+                return
+
+        raise last_error
+
+    async def acall(self, prompt: str, system_prompt: str = None, use_cache: bool = True,
+                    prefix: Optional[str] = None) -> Optional[str]:
+        """
+        LLM 비동기 호출 (각 SDK의 async 클라이언트 사용)
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트 (선택적)
+            use_cache: False면 캐시 조회를 건너뛰고 새로 호출 (결과로 캐시 갱신)
+            prefix: 여러 요청이 공유하는 고정 앞부분 (프롬프트 앞에 붙으며 제공자 프롬프트 캐시 대상)
 
         Returns:
             LLM 응답 텍스트 또는 None (오류 시)
         """
+        prompt = self._join_prompt(prefix, prompt)
+        provider = self._get_provider()
+        model_name = self._get_model_name(provider)
+
+        cache, cache_key, cached = self._lookup_cache(provider, model_name, prompt, system_prompt, use_cache)
+        if cached is not None:
+            return cached
+
+        policy = RetryPolicy.from_config(self.config.get("llm_retry", {}))
+        deadline = policy.start_deadline()
+        last_error: Optional[Exception] = None
+
+        for current in self._get_provider_chain(provider):
+            current_model = self._get_model_name(current)
+            for attempt in range(1, policy.max_attempts + 1):
+                timeout = self._check_deadline(policy, deadline, last_error)
+                queue_wait = 0.0
+                limiter = self._get_rate_limiter(current)
+                if limiter is not None:
+                    queued = time.perf_counter()
+                    await limiter.acquire(self._estimate_request_tokens(current, current_model, prompt, system_prompt))
+                    queue_wait = time.perf_counter() - queued
+                usage = self._begin_usage_capture()
+                started = time.perf_counter()
+                try:
+                    response = await self._acall_provider(current, prompt, system_prompt, timeout=timeout, prefix=prefix)
+                except Exception as e:
+                    last_error = e
+                    delay = policy.next_delay(attempt, e, deadline)
+                    self.telemetry.record(current, current_model, attempt, time.perf_counter() - started,
+                                          queue_wait=queue_wait, backoff=delay or 0.0, error=e)
+                    if delay is None:
+                        break
+                    print(f"LLM 호출 재시도 ({current}, {attempt}/{policy.max_attempts}, {delay:.1f}초 후): {e}")
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._finish_usage_capture(current, current_model, attempt, time.perf_counter() - started,
+                                           queue_wait, prompt, system_prompt, usage)
+                self._store_response(cache, cache_key, provider, current, current_model,
+                                     prompt, system_prompt, response)
+                return response
+
+        raise last_error
+
+    async def acall_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[["LLMBatchResult"], None]] = None,
+    ) -> List["LLMBatchResult"]:
+        """
+        여러 요청을 동시 실행 개수 제한 안에서 병렬 처리
+
+        Args:
+            requests: [{"prompt": str, "system_prompt": str, "prefix": str, "use_cache": bool}, ...]
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 요청 1건이 끝날 때마다 호출되는 콜백 (진행률 표시용)
+
+        Returns:
+            요청 순서와 같은 순서의 LLMBatchResult 리스트 (요청별 오류는 result.error에 담김)
+        """
+        if concurrency is None:
+            concurrency = int(self.config.get("llm_concurrency", 4))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _run(index: int, request: Dict[str, Any]) -> LLMBatchResult:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    text = await self.acall(
+                        request.get("prompt", ""),
+                        request.get("system_prompt"),
+                        use_cache=request.get("use_cache", True),
+                        prefix=request.get("prefix"),
+                    )
+                    result = LLMBatchResult(index, text=text, elapsed=time.perf_counter() - started)
+                except Exception as e:
+                    result = LLMBatchResult(index, error=e, elapsed=time.perf_counter() - started)
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as e:
+                    print(f"배치 결과 콜백 오류: {e}")
+            return result
+
+        try:
+            return list(await asyncio.gather(*[_run(i, r) for i, r in enumerate(requests)]))
+        finally:
+            await self._aclose_async_clients()
+
+    def call_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[["LLMBatchResult"], None]] = None,
+    ) -> List["LLMBatchResult"]:
+        """
+        acall_batch()의 동기 버전 (백그라운드 스레드에서 호출)
+
+        Args:
+            requests: [{"prompt": str, "system_prompt": str, "prefix": str, "use_cache": bool}, ...]
+            concurrency: 동시 실행 개수 (None이면 설정의 llm_concurrency)
+            on_result: 요청 1건이 끝날 때마다 호출되는 콜백 (워커 스레드에서 호출됨)
+
+        Returns:
+            요청 순서와 같은 순서의 LLMBatchResult 리스트
+        """
+        return asyncio.run(self.acall_batch(requests, concurrency=concurrency, on_result=on_result))
+
+    # ----- 제공자 Batch API (비동기 대량 작업) -----
+
+    def _get_batch_backend(self, name: str, store: BatchJobStore):
+        """
+        배치 백엔드 생성
+
+        Args:
+            name: "openai", "anthropic", "local"
+            store: 작업 저장소 (로컬 백엔드 입출력 파일은 저장소 옆 local/ 폴더)
+        """
+        if name == "openai":
+            return OpenAIBatchBackend(self)
+        if name == "anthropic":
+            return AnthropicBatchBackend(self)
+        if name == "local":
+            return LocalBatchBackend(
+                store.path.parent / "local",
+                lambda request: self.call(request.get("prompt", ""), request.get("system_prompt"),
+                                          use_cache=False, prefix=request.get("prefix")),
+                complete_after=float(self.config.get("llm_batch_local_delay_seconds", 0) or 0),
+            )
+        raise ValueError(f"지원하지 않는 배치 백엔드: {name}")
+
+    def _resolve_batch_backend(self, provider: str) -> str:
+        """설정의 llm_batch_backend 해석 ("auto"면 Batch API가 있는 제공자는 해당 API, 그 외는 로컬)"""
+        backend = self.config.get("llm_batch_backend", "auto") or "auto"
+        if backend == "auto":
+            return provider if provider in BATCH_API_PROVIDERS else "local"
+        return backend
+
+    def submit_batch_job(self, store: BatchJobStore, requests: List[Dict[str, Any]],
+                         backend: Optional[str] = None) -> str:
+        """
+        요청을 작업 저장소에 기록하고 배치로 제출
+
+        Args:
+            store: 작업 저장소
+            requests: [{"custom_id": str, "prompt": str, "system_prompt": str, "prefix": str, "meta": dict}, ...]
+                      (custom_id는 영문/숫자/-/_ 64자 이내, 작업 안에서 중복 불가)
+            backend: "openai", "anthropic", "local" (None이면 설정의 llm_batch_backend)
+
+        Returns:
+            작업 ID (제출에 실패해도 작업은 failed 상태로 남음)
+        """
+        provider = self._get_provider()
+        model_name = self._get_model_name(provider)
+        backend = backend or self._resolve_batch_backend(provider)
+        if backend in BATCH_API_PROVIDERS and backend != provider:
+            raise ValueError(f"{backend} 배치는 현재 제공자({provider})로 제출할 수 없습니다.")
+
+        job_id = store.create(backend, provider, model_name, requests)
+        try:
+            remote_id = self._get_batch_backend(backend, store).submit(requests, model_name)
+        except Exception as e:
+            store.update(job_id, status=BATCH_FAILED, error=f"{type(e).__name__}: {e}")
+            raise
+        store.update(job_id, remote_id=remote_id, status=BATCH_IN_PROGRESS)
+        print(f"[LLM] 배치 제출 ({backend}, {provider}/{model_name}): {job_id}, 요청 {len(requests)}건")
+        return job_id
+
+    def poll_batch_job(self, store: BatchJobStore, job_id: str) -> Dict[str, Any]:
+        """
+        배치 상태 확인 (끝났으면 결과를 받아 저장소와 응답 캐시에 기록)
+
+        Args:
+            store: 작업 저장소
+            job_id: 작업 ID
+
+        Returns:
+            작업 데이터 (status: in_progress, ended, failed, applied)
+        """
+        job = store.get(job_id)
+        if job is None:
+            raise KeyError(f"배치 작업이 없습니다: {job_id}")
+        if job["status"] != BATCH_IN_PROGRESS:
+            return job
+
+        backend = self._get_batch_backend(job["backend"], store)
+        try:
+            status = backend.poll(job["remote_id"])
+            if status == BATCH_ENDED:
+                results = backend.fetch(job["remote_id"])
+                self._store_batch_results(job, results)
+                store.update(job_id, status=BATCH_ENDED, results=results)
+            elif status == BATCH_FAILED:
+                store.update(job_id, status=BATCH_FAILED, error="제공자에서 배치가 실패했습니다.")
+        except Exception as e:
+            # 일시적인 조회 오류는 다음 확인 때 다시 시도
+            print(f"배치 상태 확인 오류 ({job_id}): {e}")
+        return store.get(job_id)
+
+    def wait_batch_job(self, store: BatchJobStore, job_id: str, poll_seconds: Optional[float] = None,
+                       timeout: Optional[float] = None,
+                       on_poll: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        배치가 끝날 때까지 주기적으로 확인 (백그라운드 스레드에서 호출)
+
+        Args:
+            store: 작업 저장소
+            job_id: 작업 ID
+            poll_seconds: 확인 간격(초) (None이면 설정의 llm_batch_poll_seconds)
+            timeout: 최대 대기 시간(초) (None이면 제한 없음, 초과 시 진행 중 상태로 반환)
+            on_poll: 확인할 때마다 작업 데이터로 호출되는 콜백
+
+        Returns:
+            작업 데이터
+        """
+        if poll_seconds is None:
+            poll_seconds = float(self.config.get("llm_batch_poll_seconds", 60))
+        started = time.monotonic()
+        while True:
+            job = self.poll_batch_job(store, job_id)
+            if on_poll is not None:
+                on_poll(job)
+            if job["status"] != BATCH_IN_PROGRESS:
+                return job
+            if timeout is not None and time.monotonic() - started >= timeout:
+                return job
+            time.sleep(max(0.0, poll_seconds))
+
+    def _store_batch_results(self, job: Dict[str, Any], results: Dict[str, Dict[str, Any]]):
+        """배치 응답을 응답 캐시에 저장 (같은 요청을 실시간으로 다시 보내면 캐시 적중)"""
+        cache = self._get_cache()
+        if cache is None:
+            return
+        provider, model_name = job["provider"], job["model"]
+        for request in job.get("requests", []):
+            text = results.get(request["custom_id"], {}).get("text")
+            if not text:
+                continue
+            prompt = self._join_prompt(request.get("prefix"), request.get("prompt", ""))
+            cache_key = cache.make_key(
+                provider, model_name, self._get_sampling_params(provider, model_name), request.get("system_prompt"), prompt
+            )
+            cache.put(cache_key, text, provider=provider, model=model_name)
+
+    def _get_provider(self) -> str:
+        """설정에서 현재 제공자 조회 (지원하지 않으면 ValueError)"""
+        provider = self.config.get("provider", "gemini")
+        if provider not in MODEL_CONFIG_KEYS:
+            raise ValueError(f"지원하지 않는 제공자: {provider}")
+        return provider
+
+    def _lookup_cache(self, provider: str, model_name: str, prompt: str, system_prompt: Optional[str], use_cache: bool):
+        """
+        캐시 조회
+
+        Returns:
+            (cache, cache_key, cached_text) - 캐시 비활성화 시 (None, None, None)
+        """
+        cache = self._get_cache()
+        if cache is None:
+            return None, None, None
+        cache_key = cache.make_key(
+            provider, model_name, self._get_sampling_params(provider, model_name), system_prompt, prompt
+        )
+        cached = cache.get(cache_key) if use_cache else None
+        return cache, cache_key, cached
+
+    def _get_rate_limiter(self, provider: str) -> Optional[TokenBucketRateLimiter]:
+        """제공자별 RPM/TPM 리미터 (설정의 llm_rate_limits 기준, 최초 사용 시 생성)"""
+        with self._rate_limiters_lock:
+            if self._rate_limiters is None:
+                self._rate_limiters = build_rate_limiters(self.config.get("llm_rate_limits", {}))
+            return self._rate_limiters.get(provider)
+
+    def _estimate_request_tokens(self, provider: str, model_name: str, prompt: str, system_prompt: Optional[str]) -> int:
+        """TPM 계산용 요청 토큰 추정 (입력 + 최대 출력)"""
+        max_output = self._get_sampling_params(provider, model_name).get("max_tokens", 4096)
+        return self._estimate_input_tokens(provider, model_name, prompt, system_prompt) + max_output
+
+    @staticmethod
+    def _estimate_input_tokens(provider: str, model_name: str, prompt: str, system_prompt: Optional[str]) -> int:
+        """입력 토큰 추정 (시스템 프롬프트 + 프롬프트)"""
+        return estimate_tokens(prompt or "", provider, model_name) + estimate_tokens(system_prompt or "", provider, model_name)
+
+    def get_token_target(self) -> Tuple[str, Optional[str]]:
+        """토큰 수를 셀 기준 (현재 제공자, 모델 이름)"""
         provider = self.config.get("provider", "gemini")
+        model_name = self._get_model_name(provider) if provider in MODEL_CONFIG_KEYS else None
+        return provider, model_name
+
+    def get_max_output_tokens(self) -> int:
+        """현재 제공자/모델의 응답 최대 토큰 수 (요청에 지정하지 않는 제공자는 모델 기본 상한)"""
+        provider, model_name = self.get_token_target()
+        return self._get_sampling_params(provider, model_name or "").get("max_tokens", DEFAULT_MAX_OUTPUT_TOKENS)
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        현재 제공자/모델 기준 토큰 수 추정
+
+        Args:
+            text: 대상 텍스트
+
+        Returns:
+            추정 토큰 수
+        """
+        provider, model_name = self.get_token_target()
+        return estimate_tokens(text, provider, model_name)
+
+    @staticmethod
+    def _begin_usage_capture() -> Dict[str, int]:
+        """이번 시도의 실제 사용량을 받을 딕셔너리 등록"""
+        usage: Dict[str, int] = {}
+        _call_usage.set(usage)
+        return usage
+
+    def _finish_usage_capture(self, provider: str, model_name: str, attempt: int, latency: float,
+                              queue_wait: float, prompt: str, system_prompt: Optional[str], usage: Dict[str, int]):
+        """성공한 시도 기록 (추정 입력 토큰과 응답의 실제 입력 토큰 비교 포함)"""
+        estimated = self._estimate_input_tokens(provider, model_name, prompt, system_prompt)
+        actual = usage.get("input_tokens", 0)
+        self.telemetry.record(provider, model_name, attempt, latency, queue_wait=queue_wait,
+                              estimated_tokens=estimated, input_tokens=actual,
+                              cached_tokens=usage.get("cached_tokens", 0),
+                              output_tokens=usage.get("output_tokens", 0))
+        if self.config.get("llm_log_token_usage", True):
+            if actual:
+                diff = (estimated - actual) / actual * 100
+                print(f"[LLM] {provider}/{model_name} 입력 토큰 추정 {estimated} / 실제 {actual} ({diff:+.0f}%), "
+                      f"캐시 {usage.get('cached_tokens', 0)}, 출력 {usage.get('output_tokens', 0)}")
+            else:
+                print(f"[LLM] {provider}/{model_name} 입력 토큰 추정 {estimated} (실제 사용량 정보 없음)")
+
+    @staticmethod
+    def _join_prompt(prefix: Optional[str], prompt: str) -> str:
+        """고정 앞부분과 요청별 프롬프트 결합 (고정 부분이 항상 맨 앞에 오도록)"""
+        if not prefix:
+            return prompt
+        return f"{prefix}\n\n{prompt}"
+
+    def _record_usage(self, provider: str, input_tokens: int = 0, cached_tokens: int = 0,
+                      cache_write_tokens: int = 0, output_tokens: int = 0):
+        """
+        응답 사용량 누적
+
+        Args:
+            provider: 제공자 이름
+            input_tokens: 전체 입력 토큰 (캐시 적중분 포함)
+            cached_tokens: 프롬프트 캐시에서 읽은 입력 토큰
+            cache_write_tokens: 프롬프트 캐시에 새로 기록한 입력 토큰 (Anthropic)
+            output_tokens: 출력 토큰
+        """
+        current = _call_usage.get()
+        if current is not None:
+            current.update({
+                "input_tokens": int(input_tokens or 0),
+                "cached_tokens": int(cached_tokens or 0),
+                "output_tokens": int(output_tokens or 0),
+            })
+        with self._usage_lock:
+            usage = self.usage_stats.setdefault(provider, {
+                "requests": 0, "input_tokens": 0, "cached_tokens": 0,
+                "cache_write_tokens": 0, "output_tokens": 0,
+            })
+            usage["requests"] += 1
+            usage["input_tokens"] += int(input_tokens or 0)
+            usage["cached_tokens"] += int(cached_tokens or 0)
+            usage["cache_write_tokens"] += int(cache_write_tokens or 0)
+            usage["output_tokens"] += int(output_tokens or 0)
+
+    def _record_gemini_usage(self, response):
+        """Gemini usage_metadata 기록"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        self._record_usage(
+            "gemini",
+            input_tokens=getattr(usage, "prompt_token_count", 0),
+            cached_tokens=getattr(usage, "cached_content_token_count", 0),
+            output_tokens=getattr(usage, "candidates_token_count", 0),
+        )
+
+    def _record_openai_usage(self, usage):
+        """OpenAI usage 기록 (prompt_tokens_details.cached_tokens = 자동 프리픽스 캐시 적중)"""
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self._record_usage(
+            "openai",
+            input_tokens=getattr(usage, "prompt_tokens", 0),
+            cached_tokens=getattr(details, "cached_tokens", 0) if details is not None else 0,
+            output_tokens=getattr(usage, "completion_tokens", 0),
+        )
+
+    def _record_anthropic_usage(self, usage):
+        """Anthropic usage 기록 (input_tokens는 캐시 밖 입력만 포함하므로 합산)"""
+        if usage is None:
+            return
+        uncached = getattr(usage, "input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        self._record_usage(
+            "anthropic",
+            input_tokens=uncached + cache_read + cache_write,
+            cached_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            output_tokens=getattr(usage, "output_tokens", 0),
+        )
+
+    def get_usage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        제공자별 토큰 사용량 반환
+
+        Returns:
+            {provider: {requests, input_tokens, cached_tokens, cache_write_tokens, output_tokens, cached_ratio}}
+        """
+        with self._usage_lock:
+            stats = {}
+            for provider, usage in self.usage_stats.items():
+                item: Dict[str, Any] = dict(usage)
+                item["cached_ratio"] = (usage["cached_tokens"] / usage["input_tokens"]) if usage["input_tokens"] else 0.0
+                stats[provider] = item
+            return stats
+
+    def _get_provider_chain(self, provider: str) -> List[str]:
+        """현재 제공자 + 설정된 대체 제공자 순서 (llm_fallback_providers)"""
+        chain = [provider]
+        for fallback in self.config.get("llm_fallback_providers", []) or []:
+            if fallback in MODEL_CONFIG_KEYS and fallback not in chain:
+                chain.append(fallback)
+        return chain
+
+    @staticmethod
+    def _check_deadline(policy: RetryPolicy, deadline: Optional[float], last_error: Optional[Exception]) -> Optional[float]:
+        """
+        요청 마감 확인
+
+        Returns:
+            이번 시도에 줄 API 타임아웃(초), 마감이 없으면 None
+
+        Raises:
+            TimeoutError: 마감 시간이 지난 경우
+        """
+        remaining = policy.remaining(deadline)
+        if remaining is None:
+            return None
+        if remaining <= 0:
+            raise TimeoutError(
+                f"LLM 요청 제한 시간({policy.deadline_seconds:.0f}초)을 초과했습니다."
+                + (f" 마지막 오류: {last_error}" if last_error else "")
+            )
+        return remaining
+
+    def _wait_rate_limit(self, provider: str, model_name: str, prompt: str, system_prompt: Optional[str]) -> float:
+        """요청 한도 대기 (대기한 시간(초) 반환)"""
+        limiter = self._get_rate_limiter(provider)
+        if limiter is None:
+            return 0.0
+        queued = time.perf_counter()
+        limiter.acquire_blocking(self._estimate_request_tokens(provider, model_name, prompt, system_prompt))
+        return time.perf_counter() - queued
+
+    def _store_response(self, cache: Optional[LLMResponseCache], cache_key: Optional[str], requested: str,
+                        provider: str, model_name: str, prompt: str, system_prompt: Optional[str],
+                        response: Optional[str]):
+        """응답 캐시 저장 (대체 제공자가 응답했으면 해당 제공자/모델 키로 저장)"""
+        if cache is None or not response:
+            return
+        if provider != requested:
+            cache_key = cache.make_key(
+                provider, model_name, self._get_sampling_params(provider, model_name), system_prompt, prompt
+            )
+        cache.put(cache_key, response, provider=provider, model=model_name)
+
+    def get_attempt_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        제공자별 시도 통계 반환 (재시도/실패 횟수, 호출/대기/백오프 시간)
+
+        Returns:
+            LLMAttemptTelemetry.get_stats() 결과
+        """
+        return self.telemetry.get_stats()
 
+    def _call_provider(self, provider: str, prompt: str, system_prompt: str = None,
+                       timeout: Optional[float] = None, prefix: Optional[str] = None) -> Optional[str]:
+        """제공자별 API 호출 분기"""
         if provider == "gemini":
-            return self._call_gemini(prompt, system_prompt)
+            return self._call_gemini(prompt, system_prompt, timeout)
         elif provider == "openai":
-            return self._call_openai(prompt, system_prompt)
+            return self._call_openai(prompt, system_prompt, timeout)
         elif provider == "anthropic":
-            return self._call_anthropic(prompt, system_prompt)
+            return self._call_anthropic(prompt, system_prompt, timeout, prefix)
+        elif provider == "mock":
+            return self._call_mock(prompt, system_prompt)
         else:
             raise ValueError(f"지원하지 않는 제공자: {provider}")
 
-    def _call_gemini(self, prompt: str, system_prompt: str = None) -> Optional[str]:
-        """Gemini API 호출"""
+    def _stream_provider(self, provider: str, prompt: str, system_prompt: str = None,
+                         timeout: Optional[float] = None, prefix: Optional[str] = None) -> Iterator[str]:
+        """제공자별 스트리밍 호출 분기"""
+        if provider == "gemini":
+            return self._stream_gemini(prompt, system_prompt, timeout)
+        elif provider == "openai":
+            return self._stream_openai(prompt, system_prompt, timeout)
+        elif provider == "anthropic":
+            return self._stream_anthropic(prompt, system_prompt, timeout, prefix)
+        elif provider == "mock":
+            return self._stream_mock(prompt, system_prompt)
+        else:
+            raise ValueError(f"지원하지 않는 제공자: {provider}")
+
+    async def _acall_provider(self, provider: str, prompt: str, system_prompt: str = None,
+                              timeout: Optional[float] = None, prefix: Optional[str] = None) -> Optional[str]:
+        """제공자별 비동기 API 호출 분기"""
+        if provider == "gemini":
+            return await self._acall_gemini(prompt, system_prompt, timeout)
+        elif provider == "openai":
+            return await self._acall_openai(prompt, system_prompt, timeout)
+        elif provider == "anthropic":
+            return await self._acall_anthropic(prompt, system_prompt, timeout, prefix)
+        elif provider == "mock":
+            return await self._acall_mock(prompt, system_prompt)
+        else:
+            raise ValueError(f"지원하지 않는 제공자: {provider}")
+
+    # ----- Gemini -----
+
+    def _get_gemini_settings(self):
+        """Gemini SDK/키/모델 확인"""
         genai = _import_genai()
         if genai is None:
             raise ImportError("google-generativeai 패키지가 설치되지 않았습니다.\n설치: pip install google-generativeai")
@@ -94,38 +1038,106 @@ class LLMService:
         if not api_key or len(api_key) < 10:
             raise ValueError("API 키가 유효하지 않습니다.")
 
-        model_name = self.config.get("model", "gemini-1.5-flash")
+        return genai, api_key, self._get_model_name("gemini")
 
-        # 환경변수로 설정
-        os.environ['GOOGLE_API_KEY'] = api_key
-        genai.configure(api_key=api_key)
+    def _create_gemini_model(self, genai, api_key: str, model_name: str):
+        """GenerativeModel 생성 (genai.configure는 전역 설정이므로 키가 바뀐 경우에만 다시 호출)"""
+        if self._gemini_configured_key != api_key:
+            os.environ['GOOGLE_API_KEY'] = api_key
+            genai.configure(api_key=api_key)
+            self._gemini_configured_key = api_key
+        return genai.GenerativeModel(model_name)
 
-        # 모델 생성
-        model = genai.GenerativeModel(model_name)
-
-        # 시스템 프롬프트가 있으면 프롬프트에 포함
-        full_prompt = prompt
+    @staticmethod
+    def _build_gemini_prompt(prompt: str, system_prompt: str = None) -> str:
+        """시스템 프롬프트가 있으면 프롬프트에 포함"""
         if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
 
-        # API 호출
-        response = model.generate_content(
-            full_prompt,
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.8,
-                "top_k": 40,
-            }
-        )
+    @staticmethod
+    def _gemini_request_options(timeout: Optional[float]) -> Dict[str, Any]:
+        """generate_content 타임아웃 인자 (마감이 없으면 SDK 기본값)"""
+        if timeout is None:
+            return {}
+        return {"request_options": {"timeout": timeout}}
 
-        # 응답 확인
+    @staticmethod
+    def _parse_gemini_response(response) -> str:
+        """Gemini 응답 확인 및 텍스트 추출"""
         if not response or not hasattr(response, 'text'):
             raise ValueError("API 응답이 올바르지 않습니다.")
-
         return response.text
 
-    def _call_openai(self, prompt: str, system_prompt: str = None) -> Optional[str]:
-        """OpenAI API 호출"""
+    def _call_gemini(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Optional[str]:
+        """Gemini API 호출"""
+        genai, api_key, model_name = self._get_gemini_settings()
+
+        # 모델 조회 (키/모델이 같으면 재사용)
+        model = self._get_client(
+            "gemini", api_key, model_name,
+            lambda: self._create_gemini_model(genai, api_key, model_name)
+        )
+
+        response = model.generate_content(
+            self._build_gemini_prompt(prompt, system_prompt),
+            generation_config=self._get_sampling_params("gemini", model_name),
+            **self._gemini_request_options(timeout)
+        )
+        self._record_gemini_usage(response)
+        return self._parse_gemini_response(response)
+
+    def _stream_gemini(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Iterator[str]:
+        """Gemini API 스트리밍 호출"""
+        genai, api_key, model_name = self._get_gemini_settings()
+
+        model = self._get_client(
+            "gemini", api_key, model_name,
+            lambda: self._create_gemini_model(genai, api_key, model_name)
+        )
+
+        response = model.generate_content(
+            self._build_gemini_prompt(prompt, system_prompt),
+            generation_config=self._get_sampling_params("gemini", model_name),
+            stream=True,
+            **self._gemini_request_options(timeout)
+        )
+        last_chunk = None
+        for chunk in response:
+            last_chunk = chunk
+            # 안전 필터 등으로 텍스트가 없는 조각은 건너뜀
+            try:
+                text = chunk.text
+            except ValueError:
+                continue
+            if text:
+                yield text
+        # 사용량은 마지막 조각 기준 누적값
+        if last_chunk is not None:
+            self._record_gemini_usage(last_chunk)
+
+    async def _acall_gemini(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Optional[str]:
+        """Gemini API 비동기 호출"""
+        genai, api_key, model_name = self._get_gemini_settings()
+
+        # async 클라이언트는 이벤트 루프에 묶이므로 루프별로 모델을 둔다
+        model = self._get_async_client(
+            "gemini", api_key, model_name,
+            lambda: self._create_gemini_model(genai, api_key, model_name)
+        )
+
+        response = await model.generate_content_async(
+            self._build_gemini_prompt(prompt, system_prompt),
+            generation_config=self._get_sampling_params("gemini", model_name),
+            **self._gemini_request_options(timeout)
+        )
+        self._record_gemini_usage(response)
+        return self._parse_gemini_response(response)
+
+    # ----- OpenAI -----
+
+    def _get_openai_settings(self):
+        """OpenAI SDK/키/모델 확인"""
         openai = _import_openai()
         if openai is None:
             raise ImportError("openai 패키지가 설치되지 않았습니다.\n설치: pip install openai")
@@ -137,11 +1149,11 @@ class LLMService:
         if len(api_key) < 10:
             raise ValueError("API 키가 유효하지 않습니다.")
 
-        model_name = self.config.get("openai_model", "gpt-4o")
-
-        # OpenAI 클라이언트 생성
-        client = openai.OpenAI(api_key=api_key)
+        return openai, api_key, self._get_model_name("openai")
 
+    def _build_openai_request(self, model_name: str, prompt: str, system_prompt: str = None,
+                              timeout: Optional[float] = None) -> Dict[str, Any]:
+        """chat.completions.create 인자 구성"""
         # O1 시리즈는 다른 파라미터 사용
         if model_name.startswith("o1"):
             # O1 모델은 system prompt를 지원하지 않음
@@ -149,26 +1161,29 @@ class LLMService:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
             else:
                 full_prompt = prompt
-
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": full_prompt}]
-            )
+            request = {
+                "model": model_name,
+                "messages": [{"role": "user", "content": full_prompt}],
+            }
         else:
             # 일반 GPT 모델
             messages = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
+            request = {
+                "model": model_name,
+                "messages": messages,
+                **self._get_sampling_params("openai", model_name),
+            }
 
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=4096
-            )
+        if timeout is not None:
+            request["timeout"] = timeout
+        return request
 
-        # 응답 검증
+    @staticmethod
+    def _parse_openai_response(response) -> str:
+        """OpenAI 응답 검증 및 텍스트 추출"""
         if not response or not response.choices or len(response.choices) == 0:
             raise ValueError("API 응답이 올바르지 않습니다.")
 
@@ -177,8 +1192,60 @@ class LLMService:
 
         return response.choices[0].message.content
 
-    def _call_anthropic(self, prompt: str, system_prompt: str = None) -> Optional[str]:
-        """Anthropic API 호출"""
+    def _call_openai(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Optional[str]:
+        """OpenAI API 호출"""
+        openai, api_key, model_name = self._get_openai_settings()
+
+        # OpenAI 클라이언트 조회 (키/모델이 같으면 재사용)
+        client = self._get_client(
+            "openai", api_key, model_name,
+            lambda: openai.OpenAI(api_key=api_key, http_client=_create_pooled_http_client(openai))
+        )
+
+        response = client.chat.completions.create(**self._build_openai_request(model_name, prompt, system_prompt, timeout))
+        self._record_openai_usage(getattr(response, "usage", None))
+        return self._parse_openai_response(response)
+
+    def _stream_openai(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Iterator[str]:
+        """OpenAI API 스트리밍 호출"""
+        openai, api_key, model_name = self._get_openai_settings()
+
+        client = self._get_client(
+            "openai", api_key, model_name,
+            lambda: openai.OpenAI(api_key=api_key, http_client=_create_pooled_http_client(openai))
+        )
+
+        # include_usage: 마지막 조각(choices 비어 있음)에 사용량 포함
+        stream = client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True},
+            **self._build_openai_request(model_name, prompt, system_prompt, timeout)
+        )
+        for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                self._record_openai_usage(chunk.usage)
+            if not chunk.choices:
+                continue
+            text = getattr(chunk.choices[0].delta, 'content', None)
+            if text:
+                yield text
+
+    async def _acall_openai(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None) -> Optional[str]:
+        """OpenAI API 비동기 호출"""
+        openai, api_key, model_name = self._get_openai_settings()
+
+        client = self._get_async_client(
+            "openai", api_key, model_name,
+            lambda: openai.AsyncOpenAI(api_key=api_key, http_client=_create_pooled_http_client(openai, use_async=True))
+        )
+
+        response = await client.chat.completions.create(**self._build_openai_request(model_name, prompt, system_prompt, timeout))
+        self._record_openai_usage(getattr(response, "usage", None))
+        return self._parse_openai_response(response)
+
+    # ----- Anthropic -----
+
+    def _get_anthropic_settings(self):
+        """Anthropic SDK/키/모델 확인"""
         anthropic = _import_anthropic()
         if anthropic is None:
             raise ImportError("anthropic 패키지가 설치되지 않았습니다.\n설치: pip install anthropic")
@@ -187,40 +1254,144 @@ class LLMService:
         if not api_key:
             raise ValueError("Anthropic API 키가 설정되지 않았습니다.")
 
-        model_name = self.config.get("anthropic_model", "claude-3-5-haiku-20241022")
-
-        client = anthropic.Anthropic(api_key=api_key)
+        return anthropic, api_key, self._get_model_name("anthropic")
 
-        # 메시지 구성
-        messages = []
+    def _build_anthropic_request(self, model_name: str, prompt: str, system_prompt: str = None,
+                                 timeout: Optional[float] = None, prefix: Optional[str] = None) -> Dict[str, Any]:
+        """messages.create 인자 구성 (고정 앞부분이 충분히 길면 cache_control 지정)"""
         if system_prompt:
-            messages.append({"role": "user", "content": f"{system_prompt}\n\n{prompt}"})
+            content = f"{system_prompt}\n\n{prompt}"
         else:
-            messages.append({"role": "user", "content": prompt})
+            content = prompt
 
-        response = client.messages.create(
-            model=model_name,
-            max_tokens=4096,
-            messages=messages
-        )
+        # 시스템 프롬프트 + 고정 앞부분까지를 캐시 블록으로 분리 (prompt는 prefix로 시작함)
+        stable_len = len(content) - len(prompt) + len(prefix) if prefix and prompt.startswith(prefix) else 0
+        if stable_len and self._is_prompt_cacheable("anthropic", model_name, content[:stable_len]):
+            content = [
+                {"type": "text", "text": content[:stable_len], "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": content[stable_len:]},
+            ]
+
+        messages = [{"role": "user", "content": content}]
+        request = {
+            "model": model_name,
+            "messages": messages,
+            **self._get_sampling_params("anthropic", model_name),
+        }
+        if timeout is not None:
+            request["timeout"] = timeout
+        return request
 
-        # 응답에서 텍스트 추출
+    def _is_prompt_cacheable(self, provider: str, model_name: str, stable_text: str) -> bool:
+        """고정 앞부분이 제공자 프롬프트 캐시 최소 길이를 넘는지 확인"""
+        if not self.config.get("llm_prompt_cache_enabled", True):
+            return False
+        min_tokens = ANTHROPIC_HAIKU_CACHE_MIN_TOKENS if "haiku" in model_name else ANTHROPIC_CACHE_MIN_TOKENS
+        return estimate_tokens(stable_text, provider, model_name) >= min_tokens
+
+    @staticmethod
+    def _parse_anthropic_response(response) -> str:
+        """Anthropic 응답에서 텍스트 추출"""
         if response.content and len(response.content) > 0:
             return response.content[0].text
         else:
             raise ValueError("API 응답에 내용이 없습니다.")
 
+    def _call_anthropic(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None,
+                        prefix: Optional[str] = None) -> Optional[str]:
+        """Anthropic API 호출"""
+        anthropic, api_key, model_name = self._get_anthropic_settings()
+
+        # Anthropic 클라이언트 조회 (키/모델이 같으면 재사용)
+        client = self._get_client(
+            "anthropic", api_key, model_name,
+            lambda: anthropic.Anthropic(api_key=api_key, http_client=_create_pooled_http_client(anthropic))
+        )
+
+        response = client.messages.create(**self._build_anthropic_request(model_name, prompt, system_prompt, timeout, prefix))
+        self._record_anthropic_usage(getattr(response, "usage", None))
+        return self._parse_anthropic_response(response)
+
+    def _stream_anthropic(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None,
+                          prefix: Optional[str] = None) -> Iterator[str]:
+        """Anthropic API 스트리밍 호출"""
+        anthropic, api_key, model_name = self._get_anthropic_settings()
+
+        client = self._get_client(
+            "anthropic", api_key, model_name,
+            lambda: anthropic.Anthropic(api_key=api_key, http_client=_create_pooled_http_client(anthropic))
+        )
+
+        with client.messages.stream(**self._build_anthropic_request(model_name, prompt, system_prompt, timeout, prefix)) as stream:
+            for text in stream.text_stream:
+                if text:
+                    yield text
+            self._record_anthropic_usage(getattr(stream.get_final_message(), "usage", None))
+
+    async def _acall_anthropic(self, prompt: str, system_prompt: str = None, timeout: Optional[float] = None,
+                               prefix: Optional[str] = None) -> Optional[str]:
+        """Anthropic API 비동기 호출"""
+        anthropic, api_key, model_name = self._get_anthropic_settings()
+
+        client = self._get_async_client(
+            "anthropic", api_key, model_name,
+            lambda: anthropic.AsyncAnthropic(api_key=api_key, http_client=_create_pooled_http_client(anthropic, use_async=True))
+        )
+
+        response = await client.messages.create(**self._build_anthropic_request(model_name, prompt, system_prompt, timeout, prefix))
+        self._record_anthropic_usage(getattr(response, "usage", None))
+        return self._parse_anthropic_response(response)
+
+    # ----- Mock -----
+
+    def _get_mock_provider(self) -> MockLLMProvider:
+        """모의 제공자 조회 (설정의 mock_llm 기준, 최초 사용 시 생성)"""
+        with self._clients_lock:
+            if self._mock_provider is None:
+                self._mock_provider = MockLLMProvider.from_config(self.config.get("mock_llm", {}))
+            return self._mock_provider
+
+    def _record_mock_usage(self, prompt: str, system_prompt: Optional[str], response: str):
+        """모의 응답 사용량 기록 (근사 토큰 수)"""
+        self._record_usage(
+            "mock",
+            input_tokens=estimate_tokens(prompt) + estimate_tokens(system_prompt or ""),
+            output_tokens=estimate_tokens(response),
+        )
+
+    def _call_mock(self, prompt: str, system_prompt: str = None) -> Optional[str]:
+        """모의 제공자 호출"""
+        response = self._get_mock_provider().generate(prompt, system_prompt)
+        self._record_mock_usage(prompt, system_prompt, response)
+        return response
+
+    def _stream_mock(self, prompt: str, system_prompt: str = None) -> Iterator[str]:
+        """모의 제공자 스트리밍 호출"""
+        parts: List[str] = []
+        for chunk in self._get_mock_provider().stream(prompt, system_prompt):
+            parts.append(chunk)
+            yield chunk
+        self._record_mock_usage(prompt, system_prompt, "".join(parts))
+
+    async def _acall_mock(self, prompt: str, system_prompt: str = None) -> Optional[str]:
+        """모의 제공자 비동기 호출"""
+        response = await self._get_mock_provider().agenerate(prompt, system_prompt)
+        self._record_mock_usage(prompt, system_prompt, response)
+        return response
+
     @staticmethod
     def is_provider_available(provider: str) -> bool:
         """
         LLM 제공자가 사용 가능한지 확인
 
         Args:
-            provider: 제공자 이름 (gemini, openai, anthropic)
+            provider: 제공자 이름 (gemini, openai, anthropic, mock)
 
         Returns:
             사용 가능 여부
         """
+        if provider == "mock":
+            return True
         if provider == "gemini":
             return _import_genai() is not None
         elif provider == "openai":
@@ -228,3 +1399,25 @@ class LLMService:
         elif provider == "anthropic":
             return _import_anthropic() is not None
         return False
+
+
+class LLMBatchResult:
+    """배치 요청 1건의 결과"""
+
+    def __init__(self, index: int, text: Optional[str] = None, error: Optional[Exception] = None, elapsed: float = 0.0):
+        """
+        Args:
+            index: 요청 순서 (0부터)
+            text: 응답 텍스트 (성공 시)
+            error: 발생한 예외 (실패 시)
+            elapsed: 소요 시간(초), 대기 시간 포함
+        """
+        self.index = index
+        self.text = text
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.error is None and bool(self.text)
@@ -0,0 +1,251 @@
+"""
+모의 LLM 제공자
+API 호출 없이 기록된 응답을 재생하거나 결정적인 응답을 만들어, 지연 시간/오류율을 흉내냅니다.
+오프라인 개발과 처리량 벤치마크(bench_llm_pipeline.py)에 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator
+
+
+class MockLLMError(Exception):
+    """모의 API 오류 (status_code로 재시도 정책의 오류 분류를 흉내냄)"""
+
+    def __init__(self, message: str, status_code: int = 503):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class MockLLMProvider:
+    """기록 재생/결정적 응답 생성 모의 제공자"""
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_jitter_ms: float = 300.0,
+        latency_distribution: str = "lognormal",
+        error_rate: float = 0.0,
+        rate_limit_ratio: float = 0.5,
+        seed: Optional[int] = None,
+        recordings_path: Optional[str] = None,
+        stream_chunk_chars: int = 40,
+    ):
+        """
+        Args:
+            latency_ms: 평균 응답 지연(ms)
+            latency_jitter_ms: 지연 편차(ms) - uniform은 ±범위, normal/lognormal은 표준편차
+            latency_distribution: "fixed", "uniform", "normal", "lognormal" 중 하나
+            error_rate: 요청이 실패할 확률 (0~1)
+            rate_limit_ratio: 실패 중 429(요청 한도)로 보낼 비율, 나머지는 503
+            seed: 난수 시드 (같은 시드면 같은 지연/오류 순서)
+            recordings_path: 기록된 응답 JSON 파일 ({요청 키: 응답})
+            stream_chunk_chars: 스트리밍 시 조각 크기(글자 수)
+        """
+        self.latency_ms = float(latency_ms)
+        self.latency_jitter_ms = float(latency_jitter_ms)
+        self.latency_distribution = latency_distribution
+        self.error_rate = float(error_rate)
+        self.rate_limit_ratio = float(rate_limit_ratio)
+        self.stream_chunk_chars = max(1, int(stream_chunk_chars))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.recordings: Dict[str, str] = {}
+        self.stats: Dict[str, int] = {"requests": 0, "replayed": 0, "synthesized": 0, "errors": 0}
+
+        if recordings_path:
+            self.load_recordings(Path(recordings_path))
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "MockLLMProvider":
+        """
+        설정 딕셔너리에서 생성
+
+        Args:
+            settings: 설정의 mock_llm 항목
+
+        Returns:
+            MockLLMProvider 인스턴스
+        """
+        settings = settings or {}
+        return cls(
+            latency_ms=settings.get("latency_ms", 800.0),
+            latency_jitter_ms=settings.get("latency_jitter_ms", 300.0),
+            latency_distribution=settings.get("latency_distribution", "lognormal"),
+            error_rate=settings.get("error_rate", 0.0),
+            rate_limit_ratio=settings.get("rate_limit_ratio", 0.5),
+            seed=settings.get("seed"),
+            recordings_path=settings.get("recordings_path") or None,
+            stream_chunk_chars=settings.get("stream_chunk_chars", 40),
+        )
+
+    @staticmethod
+    def make_key(prompt: str, system_prompt: Optional[str] = None) -> str:
+        """기록 조회용 요청 키 (시스템 프롬프트 + 프롬프트의 SHA-256)"""
+        payload = f"{system_prompt or ''}\n\n{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def load_recordings(self, path: Path):
+        """
+        기록된 응답 로드
+
+        Args:
+            path: {요청 키: 응답} JSON 파일 경로
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.recordings.update({str(k): str(v) for k, v in data.items()})
+        except Exception as e:
+            print(f"모의 LLM 기록 로드 오류: {e}")
+
+    def save_recordings(self, path: Path):
+        """
+        현재 기록을 JSON 파일로 저장
+
+        Args:
+            path: 저장할 파일 경로
+        """
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.recordings, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"모의 LLM 기록 저장 오류: {e}")
+
+    def record(self, prompt: str, system_prompt: Optional[str], response: str):
+        """실제 응답을 기록에 추가 (이후 같은 요청은 이 응답으로 재생)"""
+        with self._lock:
+            self.recordings[self.make_key(prompt, system_prompt)] = response
+
+    def _sample_latency(self) -> float:
+        """설정된 분포에서 지연 시간(초) 추출"""
+        mean = self.latency_ms
+        jitter = self.latency_jitter_ms
+        with self._lock:
+            if self.latency_distribution == "fixed" or jitter <= 0:
+                value = mean
+            elif self.latency_distribution == "uniform":
+                value = self._random.uniform(mean - jitter, mean + jitter)
+            elif self.latency_distribution == "normal":
+                value = self._random.gauss(mean, jitter)
+            elif mean > 0:
+                # lognormal: 평균/표준편차가 설정값이 되도록 변환 (긴 꼬리 지연 재현)
+                sigma2 = math.log(1 + (jitter / mean) ** 2)
+                mu = math.log(mean) - sigma2 / 2
+                value = self._random.lognormvariate(mu, math.sqrt(sigma2))
+            else:
+                value = 0.0
+        return max(0.0, value) / 1000.0
+
+    def _maybe_fail(self):
+        """오류율에 따라 모의 오류 발생"""
+        with self._lock:
+            self.stats["requests"] += 1
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            rate_limited = failed and self._random.random() < self.rate_limit_ratio
+            if failed:
+                self.stats["errors"] += 1
+        if rate_limited:
+            raise MockLLMError("모의 요청 한도 초과 (429)", status_code=429)
+        if failed:
+            raise MockLLMError("모의 서버 오류 (503)", status_code=503)
+
+    def _respond(self, prompt: str, system_prompt: Optional[str]) -> str:
+        """기록이 있으면 재생, 없으면 결정적 응답 생성"""
+        key = self.make_key(prompt, system_prompt)
+        with self._lock:
+            recorded = self.recordings.get(key)
+            if recorded is not None:
+                self.stats["replayed"] += 1
+                return recorded
+            self.stats["synthesized"] += 1
+        return self.synthesize(prompt, system_prompt)
+
+    @staticmethod
+    def synthesize(prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        요청 형식에 맞는 결정적 응답 생성 (같은 요청이면 항상 같은 응답)
+
+        Args:
+            prompt: 사용자 프롬프트
+            system_prompt: 시스템 프롬프트
+
+        Returns:
+            장면 JSON / 이미지 프롬프트 JSON / 대본 텍스트 중 하나
+        """
+        text = f"{system_prompt or ''}\n{prompt}"
+        seed = hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
+
+        if '"scenes"' in text:
+            scenes = [
+                {
+                    "scene_number": i,
+                    "title": f"모의 장면 {i} ({seed})",
+                    "image_prompt": f"Mock interior, soft lighting. Korean man, 30-year-old, scene {i}, id {seed}.",
+                }
+                for i in range(1, 11)
+            ]
+            return "```json\n" + json.dumps({"scenes": scenes}, ensure_ascii=False, indent=2) + "\n```"
+
+        if '"prompts"' in text:
+            keys = (
+                "full_body_shot", "side_profile_full_body_shot", "diagonal_side_profile_full_body_shot",
+                "portrait", "side_profile", "action", "natural_background",
+            )
+
+            def make_prompts(name: str) -> Dict[str, str]:
+                return {
+                    key: json.dumps({
+                        "character": f"Korean man, 30-year-old, mock {name} {seed}",
+                        "clothing": "mock clothing",
+                        "pose": key,
+                        "background": "mock background",
+                        "situation": "mock situation",
+                        "combined": f"Korean man, 30-year-old, mock {name} {seed}\nmock clothing\n{key}",
+                    }, ensure_ascii=False)
+                    for key in keys
+                }
+
+            # 여러 캐릭터 묶음 요청: 프롬프트의 캐릭터 이름마다 응답
+            if '"characters"' in text:
+                names = re.findall(r"\*\*캐릭터 이름: (.+?)\*\*", text)
+                characters = {name: {"prompts": make_prompts(name)} for name in names}
+                return json.dumps({"characters": characters}, ensure_ascii=False)
+            return json.dumps({"character_name": "mock", "prompts": make_prompts("mock")}, ensure_ascii=False)
+
+        # 대본 등 일반 텍스트: 5000자 내외
+        sentence = f"모의 응답 문장입니다 ({seed}). "
+        return (sentence * (5000 // len(sentence) + 1))[:5000]
+
+    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """동기 호출 (지연 후 응답)"""
+        time.sleep(self._sample_latency())
+        self._maybe_fail()
+        return self._respond(prompt, system_prompt)
+
+    async def agenerate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """비동기 호출 (이벤트 루프를 막지 않고 지연)"""
+        await asyncio.sleep(self._sample_latency())
+        self._maybe_fail()
+        return self._respond(prompt, system_prompt)
+
+    def stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """스트리밍 호출 (첫 조각까지 지연의 절반, 나머지는 조각마다 나눠서 지연)"""
+        latency = self._sample_latency()
+        time.sleep(latency / 2)
+        self._maybe_fail()
+        response = self._respond(prompt, system_prompt)
+        size = self.stream_chunk_chars
+        chunks = [response[i:i + size] for i in range(0, len(response), size)]
+        per_chunk = (latency / 2) / max(1, len(chunks))
+        for chunk in chunks:
+            yield chunk
+            time.sleep(per_chunk)
@@ -0,0 +1,241 @@
+"""
+LLM JSON 출력 검사 및 부분 보완
+장면/이미지 프롬프트/캐릭터 프로필 응답의 형식을 검사하고, 빠진 부분만 작은 요청으로 다시 받습니다.
+전체를 다시 생성했을 때와 비교해 아낀 호출/토큰 수를 기록합니다.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List
+
+# 장면 1개의 필수 필드
+SCENE_FIELDS = ("scene_number", "title", "image_prompt")
+EXPECTED_SCENE_COUNT = 10
+
+# 이미지 프롬프트 1종의 필수 필드 (JSON 문자열로 받은 경우)
+IMAGE_PROMPT_FIELDS = ("character", "combined")
+
+# 캐릭터 프로필 필수 항목 (점으로 구분한 경로)
+CHARACTER_PROFILE_FIELDS = (
+    "appearance.face", "appearance.body", "appearance.clothing", "appearance.features",
+    "personality.traits", "personality.speech_style",
+    "background", "visual_reference",
+)
+
+
+def _is_empty(value: Any) -> bool:
+    """None, 빈 문자열, 빈 리스트/딕셔너리 여부"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, dict)):
+        return len(value) == 0
+    return False
+
+
+def validate_scenes(scenes: Optional[List[Dict]], expected_count: int = EXPECTED_SCENE_COUNT) -> Dict[int, List[str]]:
+    """
+    장면 리스트 검사
+
+    Args:
+        scenes: 장면 리스트
+        expected_count: 기대하는 장면 수
+
+    Returns:
+        {장면 번호: 빠진 필드 리스트} - 장면 자체가 없으면 ["*"], 문제가 없으면 빈 딕셔너리
+    """
+    issues: Dict[int, List[str]] = {}
+    present = set()
+    for position, scene in enumerate(scenes or [], start=1):
+        if not isinstance(scene, dict):
+            continue
+        number = scene.get("scene_number")
+        if not isinstance(number, int):
+            number = position
+        present.add(number)
+        missing = [field for field in SCENE_FIELDS if field != "scene_number" and _is_empty(scene.get(field))]
+        if missing and number <= expected_count:
+            issues[number] = missing
+
+    for number in range(1, expected_count + 1):
+        if number not in present:
+            issues[number] = ["*"]
+    return dict(sorted(issues.items()))
+
+
+def merge_scenes(scenes: Optional[List[Dict]], repaired: List[Dict],
+                 expected_count: int = EXPECTED_SCENE_COUNT) -> List[Dict]:
+    """
+    보완 응답의 장면을 기존 장면에 합침 (기존 장면은 빠진 필드만 채움)
+
+    Args:
+        scenes: 기존 장면 리스트
+        repaired: 보완 요청으로 받은 장면 리스트
+        expected_count: 기대하는 장면 수 (번호가 이보다 큰 장면은 버림)
+
+    Returns:
+        scene_number 순서로 정렬한 장면 리스트
+    """
+    by_number: Dict[int, Dict] = {}
+    for position, scene in enumerate(scenes or [], start=1):
+        if not isinstance(scene, dict):
+            continue
+        number = scene.get("scene_number") if isinstance(scene.get("scene_number"), int) else position
+        by_number.setdefault(number, dict(scene, scene_number=number))
+
+    for scene in repaired or []:
+        if not isinstance(scene, dict) or not isinstance(scene.get("scene_number"), int):
+            continue
+        number = scene["scene_number"]
+        if number < 1 or number > expected_count:
+            continue
+        current = by_number.setdefault(number, {"scene_number": number})
+        for field, value in scene.items():
+            if _is_empty(current.get(field)) and not _is_empty(value):
+                current[field] = value
+
+    return [by_number[number] for number in sorted(by_number)]
+
+
+def validate_image_prompts(prompts: Optional[Dict], keys) -> List[str]:
+    """
+    캐릭터 1명분 이미지 프롬프트 검사
+
+    Args:
+        prompts: {스타일 키: JSON 문자열 또는 딕셔너리}
+        keys: 필수 스타일 키 목록
+
+    Returns:
+        빠졌거나 형식이 잘못된 스타일 키 리스트
+    """
+    if not isinstance(prompts, dict):
+        return list(keys)
+    invalid = []
+    for key in keys:
+        value = prompts.get(key)
+        if isinstance(value, str) and value.strip().startswith("{"):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                invalid.append(key)
+                continue
+        if isinstance(value, dict):
+            if any(_is_empty(value.get(field)) for field in IMAGE_PROMPT_FIELDS):
+                invalid.append(key)
+        elif _is_empty(value):
+            invalid.append(key)
+    return invalid
+
+
+def _get_path(data: Any, path: str) -> Any:
+    """점으로 구분한 경로의 값 (없으면 None)"""
+    for part in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(part)
+    return data
+
+
+def validate_character_profile(profile: Optional[Dict]) -> List[str]:
+    """
+    캐릭터 프로필 검사
+
+    Returns:
+        빠진 항목 경로 리스트 (예: ["appearance.face", "background"])
+    """
+    if not isinstance(profile, dict):
+        return list(CHARACTER_PROFILE_FIELDS)
+    return [path for path in CHARACTER_PROFILE_FIELDS if _is_empty(_get_path(profile, path))]
+
+
+def merge_missing(target: Dict, patch: Any) -> Dict:
+    """
+    보완 응답에서 target에 빠진 값만 채움 (중첩 딕셔너리는 재귀적으로)
+
+    Args:
+        target: 기존 데이터 (직접 수정됨)
+        patch: 보완 응답 데이터
+
+    Returns:
+        target
+    """
+    if not isinstance(patch, dict):
+        return target
+    for key, value in patch.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merge_missing(current, value)
+        elif _is_empty(current) and not _is_empty(value):
+            target[key] = value
+    return target
+
+
+class RepairTelemetry:
+    """부분 보완 기록 (전체 재생성 대비 아낀 호출/토큰)"""
+
+    def __init__(self, max_records: int = 200):
+        """
+        Args:
+            max_records: 보관할 최근 보완 기록 수
+        """
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def record(self, kind: str, label: str, issues: int, calls: int, repair_tokens: int,
+               full_tokens: int, success: bool):
+        """
+        보완 1건 기록
+
+        Args:
+            kind: "scenes", "image_prompts", "character_profile"
+            label: 대상 (챕터 번호, 캐릭터 이름 등)
+            issues: 보완한 문제 수 (장면 수, 필드 수 등)
+            calls: 보완에 쓴 LLM 호출 수
+            repair_tokens: 보완 요청의 추정 입력+출력 토큰
+            full_tokens: 전체를 다시 생성했다면 쓴 추정 입력+출력 토큰
+            success: 보완 후 검사를 통과했는지
+        """
+        entry = {
+            "time": time.time(),
+            "kind": kind,
+            "label": label,
+            "issues": issues,
+            "calls": calls,
+            "repair_tokens": repair_tokens,
+            "full_tokens": full_tokens,
+            "success": success,
+        }
+        with self._lock:
+            self._records.append(entry)
+            totals = self._totals.setdefault(kind, {
+                "repairs": 0, "succeeded": 0, "repair_calls": 0,
+                "repair_tokens": 0, "full_tokens": 0, "tokens_saved": 0, "full_calls_avoided": 0,
+            })
+            totals["repairs"] += 1
+            totals["repair_calls"] += calls
+            totals["repair_tokens"] += repair_tokens
+            totals["full_tokens"] += full_tokens
+            if success:
+                totals["succeeded"] += 1
+                # 성공한 보완은 전체 재생성 1회를 대신함
+                totals["full_calls_avoided"] += 1
+                totals["tokens_saved"] += max(0, full_tokens - repair_tokens)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        종류별 누적 통계
+
+        Returns:
+            {kind: {repairs, succeeded, repair_calls, repair_tokens, full_tokens, tokens_saved, full_calls_avoided}}
+        """
+        with self._lock:
+            return {kind: dict(totals) for kind, totals in self._totals.items()}
+
+    def get_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 보완 기록 (오래된 순서)"""
+        with self._lock:
+            return list(self._records)[-limit:]
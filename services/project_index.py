@@ -0,0 +1,316 @@
+"""
+프로젝트 인덱스
+프로젝트 JSON 파일의 파싱 결과(또는 요약 값)를 파일 크기/수정 시각과 함께 SQLite에 저장합니다.
+프로젝트를 다시 열 때는 stat이 바뀐 파일만 새로 읽어, 큰 프로젝트 전환 시 JSON 파싱 비용을 줄입니다.
+"""
+
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Callable
+
+from utils.parallel_io import read_json_files
+
+# 인덱스 기본 위치 (설정 파일과 같은 사용자 홈 디렉토리, 공유 프로젝트 폴더에는 두지 않음)
+DEFAULT_INDEX_PATH = Path.home() / ".senior_contents_project_index.sqlite3"
+
+# 메모리에 함께 보관할 최대 파일 수 (같은 실행 중 프로젝트를 다시 열 때는 SQLite도 읽지 않음)
+DEFAULT_MEMORY_ENTRIES = 5000
+
+
+def _copy_json(value: Any) -> Any:
+    """JSON 값 복사 (dict/list만 새로 만들고 문자열/숫자는 공유, deepcopy/pickle보다 빠름)"""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+class ProjectIndex:
+    """프로젝트 파일 인덱스 (경로별 mtime/size + 파싱 결과)"""
+
+    def __init__(self, db_path: Path = DEFAULT_INDEX_PATH, max_memory_entries: int = DEFAULT_MEMORY_ENTRIES):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            max_memory_entries: 메모리에 보관할 최대 파일 수 (0이면 메모리 보관 안 함)
+        """
+        self.db_path = Path(db_path)
+        self.max_memory_entries = max(0, int(max_memory_entries))
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # (경로, 종류) -> (mtime_ns, size, 데이터), 삽입 순서 = 오래된 순서
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[int, int, Any]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "disk_hits": 0, "misses": 0, "removed": 0}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """SQLite 연결 (최초 사용 시 생성)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # kind: "json"(파일 전체 파싱 결과) 또는 load_derived()의 요약 종류
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    directory TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    indexed_at REAL NOT NULL,
+                    PRIMARY KEY (path, kind)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_directory ON entries(directory, kind)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def load_json_files(self, paths: Iterable[Path]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        JSON 파일 여러 개 로드 (stat이 같으면 인덱스의 파싱 결과 사용)
+
+        Args:
+            paths: 파일 경로 목록
+
+        Returns:
+            [(경로, 데이터, 오류)] - 입력 순서, 읽기/파싱 실패 시 데이터는 None이고 오류에 예외
+            (데이터는 호출할 때마다 새 객체이므로 수정해도 인덱스에 영향 없음)
+        """
+        return self._load(paths, "json", None)
+
+    def load_derived(self, paths: Iterable[Path], kind: str,
+                     derive: Callable[[Path, Any], Any]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        JSON 파일에서 뽑은 요약 값 로드 (파일 전체 파싱 결과는 저장하지 않음)
+
+        Args:
+            paths: 파일 경로 목록
+            kind: 요약 종류 (derive가 바뀌면 다른 이름 사용)
+            derive: (경로, 파싱한 데이터)를 받아 요약 값을 반환하는 함수
+
+        Returns:
+            load_json_files()와 같은 형식의 [(경로, 요약 값, 오류)]
+        """
+        return self._load(paths, kind, derive)
+
+    def _load(self, paths: Iterable[Path], kind: str,
+              derive: Optional[Callable[[Path, Any], Any]]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """메모리 → SQLite → 파일 순서로 조회 (stat이 같은 항목만 사용)"""
+        paths = [Path(p) for p in paths]
+        results: List[Tuple[Path, Any, Optional[Exception]]] = []
+        with self._lock:
+            # 1) stat 후 메모리 항목과 비교
+            pending: Dict[int, os.stat_result] = {}
+            for i, path in enumerate(paths):
+                try:
+                    st = os.stat(path)
+                except OSError as e:
+                    results.append((path, None, e))
+                    continue
+                entry = self._memory.get((str(path), kind))
+                if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                    self._memory.move_to_end((str(path), kind))
+                    self.stats["hits"] += 1
+                    results.append((path, _copy_json(entry[2]), None))
+                else:
+                    pending[i] = st
+                    results.append((path, None, None))
+            if not pending:
+                return results
+
+            # 2) 메모리에 없거나 바뀐 파일은 SQLite 항목과 비교
+            rows: Dict[str, Tuple[int, int, bytes]] = {}
+            conn = None
+            try:
+                conn = self._get_conn()
+                for directory in sorted({str(paths[i].parent) for i in pending}):
+                    for path, mtime_ns, size, blob in conn.execute(
+                        "SELECT path, mtime_ns, size, data FROM entries WHERE directory = ? AND kind = ?",
+                        (directory, kind),
+                    ):
+                        rows[path] = (mtime_ns, size, blob)
+            except Exception as e:
+                print(f"프로젝트 인덱스 조회 오류: {e}")
+
+            # 3) 그래도 다르면 파일을 다시 파싱 (파일 읽기는 공용 I/O 풀에서 동시에)
+            to_parse: List[int] = []
+            for i, st in pending.items():
+                path = paths[i]
+                row = rows.get(str(path))
+                if row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                    try:
+                        data = pickle.loads(row[2])
+                    except Exception:
+                        to_parse.append(i)
+                        continue
+                    self.stats["hits"] += 1
+                    self.stats["disk_hits"] += 1
+                    self._remember((str(path), kind), st.st_mtime_ns, st.st_size, data)
+                    results[i] = (path, _copy_json(data), None)
+                else:
+                    to_parse.append(i)
+
+            updates = []
+            parse_paths = [paths[i] for i in to_parse]
+            for i, (_, data, error) in zip(to_parse, read_json_files(parse_paths)):
+                path = paths[i]
+                st = pending[i]
+                self.stats["misses"] += 1
+                if error is None and derive is not None:
+                    try:
+                        data = derive(path, data)
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    results[i] = (path, None, error)
+                    continue
+                updates.append((str(path), kind, str(path.parent), st.st_mtime_ns, st.st_size,
+                                pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), time.time()))
+                self._remember((str(path), kind), st.st_mtime_ns, st.st_size, data)
+                results[i] = (path, _copy_json(data), None)
+
+            if conn is not None and updates:
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO entries (path, kind, directory, mtime_ns, size, data, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        updates,
+                    )
+                    conn.commit()
+                except Exception as e:
+                    print(f"프로젝트 인덱스 저장 오류: {e}")
+        return results
+
+    def _remember(self, key: Tuple[str, str], mtime_ns: int, size: int, data: Any):
+        """메모리 항목 저장 (최대 개수를 넘으면 오래된 항목부터 삭제, _lock 안에서 호출)"""
+        if not self.max_memory_entries:
+            return
+        self._memory[key] = (mtime_ns, size, data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def load_json(self, path: Path) -> Any:
+        """
+        JSON 파일 1개 로드
+
+        Raises:
+            파일 읽기/파싱 오류 (json.load와 동일)
+        """
+        _, data, error = self.load_json_files([path])[0]
+        if error is not None:
+            raise error
+        return data
+
+    def load_json_dir(self, directory: Path, pattern: str = "*.json") -> List[Tuple[Path, Any, Optional[Exception]]]:
+        """
+        폴더의 JSON 파일 전체 로드 (파일명 순서, 폴더에서 사라진 파일은 인덱스에서 삭제)
+
+        Args:
+            directory: 폴더 경로
+            pattern: 파일 패턴
+
+        Returns:
+            load_json_files() 결과
+        """
+        directory = Path(directory)
+        results = self.load_json_files(sorted(directory.glob(pattern)))
+        self.prune_directory(directory)
+        return results
+
+    def prune_directory(self, directory: Path):
+        """폴더에 더 이상 없는 파일 항목 삭제"""
+        directory = Path(directory)
+        existing = {str(p) for p in directory.glob("*")}
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                stale = [
+                    (path, kind) for path, kind in conn.execute(
+                        "SELECT path, kind FROM entries WHERE directory = ?", (str(directory),)
+                    )
+                    if path not in existing
+                ]
+                for entry_key in stale:
+                    self._memory.pop(entry_key, None)
+                if stale:
+                    conn.executemany("DELETE FROM entries WHERE path = ? AND kind = ?", stale)
+                    conn.commit()
+                    self.stats["removed"] += len(stale)
+            except Exception as e:
+                print(f"프로젝트 인덱스 정리 오류: {e}")
+
+    def invalidate(self, path: Path):
+        """파일 항목 삭제 (다음 로드 때 다시 파싱)"""
+        with self._lock:
+            for entry_key in [k for k in self._memory if k[0] == str(path)]:
+                del self._memory[entry_key]
+            try:
+                conn = self._get_conn()
+                conn.execute("DELETE FROM entries WHERE path = ?", (str(path),))
+                conn.commit()
+            except Exception as e:
+                print(f"프로젝트 인덱스 삭제 오류: {e}")
+
+    def clear(self, project_path: Optional[Path] = None):
+        """
+        인덱스 삭제
+
+        Args:
+            project_path: 지정하면 해당 프로젝트 폴더 아래 항목만 삭제
+        """
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                if project_path is None:
+                    self._memory.clear()
+                    conn.execute("DELETE FROM entries")
+                else:
+                    root = str(Path(project_path))
+                    prefix = root.rstrip(os.sep) + os.sep
+                    for entry_key in [k for k in self._memory if k[0].startswith(prefix)]:
+                        del self._memory[entry_key]
+                    conn.execute("DELETE FROM entries WHERE directory = ? OR directory LIKE ?", (root, prefix + "%"))
+                conn.commit()
+            except Exception as e:
+                print(f"프로젝트 인덱스 삭제 오류: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인덱스 통계 반환
+
+        Returns:
+            적중(메모리+SQLite)/SQLite 적중/실패 횟수, 적중률, 저장 항목 수 및 용량, 메모리 항목 수
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self.stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["hits"] / lookups) if lookups else 0.0
+            try:
+                count, total_size = self._get_conn().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM entries"
+                ).fetchone()
+            except Exception:
+                count, total_size = 0, 0
+            stats["entries"] = count
+            stats["bytes"] = total_size
+            stats["memory_entries"] = len(self._memory)
+            return stats
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
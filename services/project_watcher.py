@@ -0,0 +1,395 @@
+"""
+프로젝트 폴더 변경 감시
+앱 밖에서 바뀐 파일(작가 편집, 에피소드 분리, ComfyUI 출력 등)을 감지해 해당 엔티티만 다시 읽습니다.
+watchdog(inotify 등 OS 알림)이 있으면 사용하고, 없으면 주기적으로 폴더를 스캔합니다.
+"""
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Set, Tuple, TYPE_CHECKING
+
+from models.project_data import entity_digest
+
+if TYPE_CHECKING:
+    from models.project_data import ProjectData
+    from services.file_service import FileService
+
+# 선택적 의존성: watchdog (지연 import)
+_watchdog = None
+
+# 감시할 파일 확장자
+WATCHED_SUFFIXES = (".json", ".md", ".txt", ".png", ".jpg", ".jpeg", ".webp", ".wav", ".mp3")
+
+# 변경 종류
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+
+def _import_watchdog():
+    """watchdog lazy import"""
+    global _watchdog
+    if _watchdog is None:
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+            _watchdog = (Observer, FileSystemEventHandler)
+        except ImportError:
+            _watchdog = False
+    return _watchdog if _watchdog is not False else None
+
+
+def _is_watched(path: str) -> bool:
+    """감시 대상 파일인지 (임시 파일, 숨김 파일, 스트리밍 초안 제외)"""
+    name = os.path.basename(path)
+    if name.startswith(".") or name.startswith("~$") or name.endswith(".tmp"):
+        return False
+    if name.endswith(".partial.txt"):
+        return False
+    return name.lower().endswith(WATCHED_SUFFIXES)
+
+
+class FileChange:
+    """파일 변경 1건"""
+
+    def __init__(self, path: Path, action: str):
+        """
+        Args:
+            path: 파일 경로
+            action: CREATED / MODIFIED / DELETED
+        """
+        self.path = Path(path)
+        self.action = action
+
+    def __repr__(self) -> str:
+        return f"FileChange({self.action}, {self.path})"
+
+
+class ProjectWatcher:
+    """활성 프로젝트 폴더 감시 (변경은 drain()으로 모아서 가져감)"""
+
+    def __init__(self, poll_interval: float = 2.0, debounce: float = 0.5, use_native: bool = True):
+        """
+        Args:
+            poll_interval: 스캔 방식일 때 폴더 스캔 간격(초)
+            debounce: 마지막 변경 후 이 시간(초) 동안 조용해야 변경을 전달 (저장 도중 읽기 방지)
+            use_native: watchdog이 있으면 OS 알림 사용
+        """
+        self.poll_interval = max(0.2, float(poll_interval))
+        self.debounce = max(0.0, float(debounce))
+        self.use_native = use_native
+        self.root: Optional[Path] = None
+        self.backend: Optional[str] = None
+        self._lock = threading.Lock()
+        # 경로 -> (변경 종류, 마지막 변경 시각)
+        self._changes: Dict[str, Tuple[str, float]] = {}
+        self._observer = None
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def start(self, root: Path):
+        """
+        프로젝트 폴더 감시 시작 (이전 감시는 중지)
+
+        Args:
+            root: 프로젝트 폴더 경로
+        """
+        self.stop()
+        self.root = Path(root)
+        if not self.root.exists():
+            return
+        self._stop = threading.Event()
+
+        watchdog = _import_watchdog() if self.use_native else None
+        if watchdog is not None:
+            try:
+                self._start_native(watchdog)
+                self.backend = "watchdog"
+                return
+            except Exception as e:
+                print(f"파일 감시(watchdog) 시작 오류, 스캔 방식으로 전환: {e}")
+                self._observer = None
+
+        self._snapshot = self._scan()
+        self._poll_thread = threading.Thread(target=self._poll_loop, name="project-watcher", daemon=True)
+        self._poll_thread.start()
+        self.backend = "polling"
+
+    def _start_native(self, watchdog):
+        """watchdog 관찰자 시작"""
+        Observer, FileSystemEventHandler = watchdog
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    watcher._record(event.src_path, CREATED)
+
+            def on_modified(self, event):
+                if not event.is_directory:
+                    watcher._record(event.src_path, MODIFIED)
+
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    watcher._record(event.src_path, DELETED)
+
+            def on_moved(self, event):
+                # 임시 파일 -> 대상 파일 교체(원자적 저장)는 대상 파일 변경으로 처리
+                if not event.is_directory:
+                    watcher._record(event.src_path, DELETED)
+                    watcher._record(event.dest_path, CREATED)
+
+        observer = Observer()
+        observer.schedule(_Handler(), str(self.root), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+
+    def stop(self):
+        """감시 중지 (모아 둔 변경도 버림)"""
+        self._stop.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2)
+            except Exception as e:
+                print(f"파일 감시 중지 오류: {e}")
+            self._observer = None
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout=2)
+            self._poll_thread = None
+        with self._lock:
+            self._changes.clear()
+        self.backend = None
+
+    def _record(self, path: str, action: str):
+        """변경 기록 (같은 경로의 연속 변경은 하나로 합침)"""
+        if not _is_watched(path):
+            return
+        with self._lock:
+            previous = self._changes.get(path)
+            if previous is not None:
+                if previous[0] == CREATED and action == MODIFIED:
+                    action = CREATED
+                elif previous[0] == DELETED and action == CREATED:
+                    action = MODIFIED
+            self._changes[path] = (action, time.monotonic())
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """프로젝트 폴더 스캔 (경로 -> (mtime_ns, size))"""
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif _is_watched(entry.path):
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _poll_loop(self):
+        """스캔 방식: 주기적으로 폴더를 스캔해 이전 결과와 비교"""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                current = self._scan()
+            except Exception as e:
+                print(f"파일 감시 스캔 오류: {e}")
+                continue
+            previous = self._snapshot
+            for path, signature in current.items():
+                old = previous.get(path)
+                if old is None:
+                    self._record(path, CREATED)
+                elif old != signature:
+                    self._record(path, MODIFIED)
+            for path in previous.keys() - current.keys():
+                self._record(path, DELETED)
+            self._snapshot = current
+
+    def drain(self) -> List[FileChange]:
+        """
+        조용해진(debounce가 지난) 변경 가져오기
+
+        Returns:
+            변경 목록 (경로 순서)
+        """
+        now = time.monotonic()
+        ready: List[FileChange] = []
+        with self._lock:
+            for path, (action, changed_at) in list(self._changes.items()):
+                if now - changed_at >= self.debounce:
+                    ready.append(FileChange(Path(path), action))
+                    del self._changes[path]
+        ready.sort(key=lambda change: str(change.path))
+        return ready
+
+
+def classify_change(project_path: Path, path: Path) -> Tuple[str, Any]:
+    """
+    변경된 경로를 프로젝트 엔티티로 분류
+
+    Returns:
+        (종류, 키) - 종류: synopsis, character, character_detail, image_prompts, chapter, episode,
+        script, episode_script, media, other
+    """
+    try:
+        parts = Path(path).relative_to(project_path).parts
+    except ValueError:
+        return "other", path
+    if not parts:
+        return "other", path
+    name = parts[-1]
+    suffix = Path(name).suffix.lower()
+    top = parts[0]
+
+    if len(parts) == 1 and name == "synopsis.json":
+        return "synopsis", None
+    if top in ("characters", "02_characters") and suffix == ".json":
+        if len(parts) == 2:
+            return "character", name
+        if len(parts) == 3 and parts[1] == "details":
+            return "character_detail", name
+        if len(parts) == 3 and parts[1] == "image_prompts":
+            return "image_prompts", name
+    if top == "03_chapters" and len(parts) == 2 and suffix == ".json":
+        return "chapter", name
+    if top == "scenes" and len(parts) == 3 and suffix == ".json":
+        return "episode", path
+    if top == "04_scripts" and suffix == ".json":
+        match = re.match(r"chapter_(\d+)_script\.json$", name)
+        if match:
+            return "script", int(match.group(1))
+    if suffix == ".md" and any(part.endswith("_episodes") for part in parts[:-1]):
+        return "episode_script", path
+    if suffix in (".png", ".jpg", ".jpeg", ".webp", ".wav", ".mp3"):
+        return "media", path
+    return "other", path
+
+
+def _replace_entity(project_data: "ProjectData", kind: str, entities: List[Dict[str, Any]], position: int,
+                    loaded: Dict[str, Any], conflicts: List[str], change: FileChange) -> bool:
+    """
+    목록의 엔티티 하나를 파일에서 읽은 내용으로 교체
+
+    Returns:
+        교체했는지 여부 (앱이 방금 저장한 내용과 같거나, 편집 중이라 충돌이면 False)
+    """
+    if entity_digest(loaded) == entity_digest(entities[position]):
+        # 앱이 직접 저장한 파일 (내용 동일)
+        project_data.mark_entity_persisted(kind, entities[position], position + 1)
+        return False
+    if project_data.is_entity_dirty(kind, entities[position], position + 1):
+        conflicts.append(change.path.name)
+        return False
+    entities[position] = loaded
+    project_data.mark_entity_persisted(kind, loaded, position + 1)
+    return True
+
+
+def apply_project_changes(project_data: "ProjectData", file_service: "FileService",
+                          changes: List[FileChange]) -> Dict[str, Any]:
+    """
+    파일 변경을 ProjectData에 반영 (바뀐 엔티티만 다시 읽음)
+
+    앱에서 편집 중이라 아직 저장하지 않은 엔티티는 덮어쓰지 않고 충돌로 보고한다.
+    파일이 추가/삭제되어 순서가 바뀌는 경우에는 해당 종류의 목록만 다시 읽는다.
+
+    Args:
+        project_data: 프로젝트 데이터
+        file_service: 파일 서비스 (project_path가 감시 중인 프로젝트여야 함)
+        changes: ProjectWatcher.drain() 결과
+
+    Returns:
+        {"kinds": 바뀐 엔티티 종류 집합, "updated": 반영한 엔티티 수, "conflicts": 충돌 파일 이름 목록}
+    """
+    kinds: Set[str] = set()
+    updated = 0
+    conflicts: List[str] = []
+    reload_characters = False
+    reload_chapters = False
+
+    for change in changes:
+        kind, key = classify_change(file_service.project_path, change.path)
+        if kind == "other":
+            continue
+        kinds.add(kind)
+        try:
+            if kind == "synopsis":
+                if project_data.unsaved_changes.get("synopsis"):
+                    conflicts.append(change.path.name)
+                    continue
+                project_data.data['synopsis'] = project_data.make_entities("synopsis", file_service.load_synopsis())
+                updated += 1
+
+            elif kind == "character":
+                if change.path.parent != file_service.get_characters_dir():
+                    continue
+                characters = project_data.get_characters()
+                position = next((i for i, c in enumerate(characters) if c.get('_filename') == key), None)
+                if change.action == DELETED or position is None:
+                    reload_characters = True
+                    continue
+                loaded = project_data.make_entities("characters", file_service.load_character_file(change.path, position + 1))
+                if _replace_entity(project_data, "characters", characters, position, loaded, conflicts, change):
+                    updated += 1
+
+            elif kind in ("chapter", "episode"):
+                chapters = project_data.get_chapters()
+                from_scenes = bool(chapters) and all(c.get('_source') == 'scenes' for c in chapters)
+                if (kind == "episode") != from_scenes and chapters:
+                    # 화면에 쓰지 않는 쪽 폴더(03_chapters가 있으면 scenes) 변경
+                    continue
+                if kind == "chapter":
+                    position = next((i for i, c in enumerate(chapters) if c.get('_filename') == key), None)
+                else:
+                    position = next((i for i, c in enumerate(chapters)
+                                     if c.get('_filename') == change.path.name
+                                     and c.get('_folder') == change.path.parent.name), None)
+                if change.action == DELETED or position is None:
+                    reload_chapters = True
+                    continue
+                if kind == "chapter":
+                    loaded = file_service.load_chapter_file(change.path)
+                else:
+                    loaded = file_service.load_episode_file(change.path)
+                loaded = project_data.make_entities("chapters", loaded)
+                if _replace_entity(project_data, "chapters", chapters, position, loaded, conflicts, change):
+                    updated += 1
+
+        except Exception as e:
+            print(f"변경 파일 반영 오류 ({change.path.name}): {e}")
+
+    # 파일 추가/삭제: 해당 목록만 다시 읽기 (편집 중인 항목이 있으면 보류)
+    if reload_characters:
+        if project_data.is_dirty("characters"):
+            conflicts.append("characters")
+        else:
+            project_data.data['characters'] = project_data.make_entities("characters", file_service.load_characters())
+            project_data.mark_persisted("characters")
+            project_data.clear_unsaved("characters")
+            updated += 1
+    if reload_chapters:
+        if project_data.is_dirty("chapters"):
+            conflicts.append("chapters")
+        else:
+            project_data.data['chapters'] = project_data.make_entities("chapters", file_service.load_chapters())
+            project_data.mark_persisted("chapters")
+            project_data.clear_unsaved("chapters")
+            updated += 1
+
+    return {"kinds": kinds, "updated": updated, "conflicts": conflicts}
@@ -0,0 +1,261 @@
+"""
+생성물 출처(입력 해시) 기록
+대본/장면/이미지 프롬프트/TTS 음성마다 생성에 사용한 입력의 해시를 프로젝트의 provenance.json에 남깁니다.
+입력이 바뀐 생성물만 골라 다시 생성할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+from services.write_queue import atomic_write_text
+
+# 프롬프트 템플릿 버전 (ContentGenerator의 프롬프트를 바꾸면 해당 항목을 올려 기존 생성물을 무효화)
+TEMPLATE_VERSIONS = {
+    "script": 1,
+    "scenes": 1,
+    "image_prompts": 1,
+    "tts": 1,
+}
+
+# 대본 생성에 쓰이는 챕터 필드
+CHAPTER_INPUT_FIELDS = ("chapter_number", "title", "summary", "key_events", "characters_involved", "mood")
+
+
+# 같은 기록 파일을 쓰는 인스턴스끼리 공유하는 잠금 (탭마다 만든 인스턴스가 서로의 기록을 덮어쓰지 않도록)
+_PATH_LOCKS: Dict[str, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    with _PATH_LOCKS_GUARD:
+        return _PATH_LOCKS.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def hash_value(value: Any) -> str:
+    """
+    값의 안정적인 해시 (dict는 키 정렬 후 JSON으로 직렬화)
+
+    Args:
+        value: 문자열, dict, list 등 JSON으로 표현 가능한 값
+
+    Returns:
+        SHA-256 앞 16자리
+    """
+    if isinstance(value, str):
+        payload = value.strip()
+    else:
+        payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _full_story(synopsis: Dict) -> str:
+    return synopsis.get("full_story", synopsis.get("synopsis", "")) or ""
+
+
+def _character_profile(character: Dict) -> Dict:
+    """이미지 프롬프트 등 생성 결과 필드를 뺀 캐릭터 프로필"""
+    return {k: v for k, v in character.items() if "image" not in k and "prompt" not in k}
+
+
+def script_inputs(chapter: Dict, synopsis: Dict, characters_info: str) -> Dict[str, str]:
+    """대본 생성 입력 해시 (이전 챕터 흐름은 연쇄 무효화를 막기 위해 제외)"""
+    return {
+        "template": str(TEMPLATE_VERSIONS["script"]),
+        "synopsis": hash_value(_full_story(synopsis)),
+        "characters": hash_value(characters_info),
+        "chapter": hash_value({k: chapter.get(k) for k in CHAPTER_INPUT_FIELDS}),
+    }
+
+
+def scenes_inputs(chapter: Dict, script: str, synopsis: Dict, characters_info: str,
+                  character_prompts_info: str = "") -> Dict[str, str]:
+    """장면 생성 입력 해시"""
+    return {
+        "template": str(TEMPLATE_VERSIONS["scenes"]),
+        "script": hash_value(script or ""),
+        "synopsis": hash_value(_full_story(synopsis)[:1000]),
+        "characters": hash_value(characters_info),
+        "character_prompts": hash_value(character_prompts_info or ""),
+        "chapter": hash_value({k: chapter.get(k) for k in ("chapter_number", "title", "summary")}),
+    }
+
+
+def image_prompts_inputs(character: Dict, synopsis: Dict) -> Dict[str, str]:
+    """캐릭터 이미지 프롬프트 생성 입력 해시"""
+    return {
+        "template": str(TEMPLATE_VERSIONS["image_prompts"]),
+        "character": hash_value(_character_profile(character)),
+        "synopsis": hash_value(_full_story(synopsis)),
+    }
+
+
+def tts_inputs(script: str, settings: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """TTS 음성 생성 입력 해시 (settings: 엔진, 음성, 속도 등)"""
+    return {
+        "template": str(TEMPLATE_VERSIONS["tts"]),
+        "script": hash_value(script or ""),
+        "settings": hash_value(settings or {}),
+    }
+
+
+class ProvenanceManifest:
+    """프로젝트별 생성물 입력 해시 기록 (provenance.json)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 기록 파일 경로 (FileService.get_provenance_path())
+        """
+        self.path = Path(path)
+        self._lock = _path_lock(self.path)
+        self._artifacts: Optional[Dict[str, Dict[str, Any]]] = None
+        # 마지막으로 읽거나 쓴 시점의 파일 stat (mtime_ns, size)
+        self._loaded_stat: Optional[Tuple[int, int]] = None
+
+    @staticmethod
+    def artifact_id(kind: str, key: Any) -> str:
+        """생성물 ID (예: "script:3", "image_prompts:홍길동")"""
+        return f"{kind}:{key}"
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        기록 파일 로드 (_lock 안에서 호출)
+
+        Args:
+            force: True면 항상 파일을 다시 읽음 (기록 전 병합용), 아니면 파일 stat이 바뀐 경우만
+        """
+        stat = self._file_stat()
+        if force or self._artifacts is None or stat != self._loaded_stat:
+            artifacts: Dict[str, Dict[str, Any]] = {}
+            if stat is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict) and isinstance(data.get("artifacts"), dict):
+                        artifacts = data["artifacts"]
+                except Exception as e:
+                    print(f"생성 기록 로드 오류: {e}")
+            self._artifacts = artifacts
+            self._loaded_stat = stat
+        return self._artifacts
+
+    def _save(self):
+        """기록 파일 저장 (_lock 안에서 호출, 임시 파일에 쓴 뒤 교체)"""
+        try:
+            text = json.dumps({"artifacts": self._artifacts}, ensure_ascii=False, indent=2)
+            atomic_write_text(self.path, text, fsync=False)
+            self._loaded_stat = self._file_stat()
+        except Exception as e:
+            print(f"생성 기록 저장 오류: {e}")
+
+    def record(self, kind: str, key: Any, inputs: Dict[str, str], output: Any = None):
+        """
+        생성물 기록
+
+        Args:
+            kind: "script", "scenes", "image_prompts", "tts"
+            key: 챕터 번호 또는 캐릭터 이름
+            inputs: *_inputs() 결과
+            output: 생성 결과 (해시만 저장, 이후 생성물이 직접 수정됐는지 확인용)
+        """
+        entry = {
+            "inputs": dict(inputs),
+            "generated_at": datetime.now().isoformat(),
+        }
+        if output is not None:
+            entry["output"] = hash_value(output)
+        with self._lock:
+            # 다른 인스턴스가 그사이 남긴 기록을 지우지 않도록 파일을 다시 읽어 병합
+            self._load(force=True)[self.artifact_id(kind, key)] = entry
+            self._save()
+
+    def get(self, kind: str, key: Any) -> Optional[Dict[str, Any]]:
+        """기록 조회 (없으면 None)"""
+        with self._lock:
+            return self._load().get(self.artifact_id(kind, key))
+
+    def changed_inputs(self, kind: str, key: Any, inputs: Dict[str, str]) -> List[str]:
+        """
+        기록 이후 바뀐 입력 이름 목록
+
+        Args:
+            kind: 생성물 종류
+            key: 챕터 번호 또는 캐릭터 이름
+            inputs: 현재 입력 해시
+
+        Returns:
+            바뀐 입력 이름 리스트 (기록이 없으면 ["missing"])
+        """
+        entry = self.get(kind, key)
+        if entry is None:
+            return ["missing"]
+        recorded = entry.get("inputs", {})
+        return sorted(name for name in set(recorded) | set(inputs) if recorded.get(name) != inputs.get(name))
+
+    def is_stale(self, kind: str, key: Any, inputs: Dict[str, str]) -> bool:
+        """입력이 바뀌었거나 기록이 없으면 True"""
+        return bool(self.changed_inputs(kind, key, inputs))
+
+    def plan_stale(self, chapters: List[Dict], synopsis: Dict, characters_info: str,
+                   characters: Optional[List[Dict]] = None, character_prompts_info: str = "",
+                   tts_settings: Optional[Dict[str, Any]] = None) -> Dict[str, List[Any]]:
+        """
+        다시 생성해야 하는 생성물 목록 계산
+
+        대본이 다시 생성될 챕터는 장면/TTS도 함께 무효로 본다.
+        TTS는 기록이 있는 챕터만 확인한다 (음성을 만든 적 없는 챕터는 대상 아님).
+
+        Args:
+            chapters: 챕터 데이터 리스트 (script 포함)
+            synopsis: 시놉시스 데이터
+            characters_info: 인물 정보 (포맷팅된 문자열)
+            characters: 캐릭터 리스트 (선택적)
+            character_prompts_info: 인물 이미지 프롬프트 참고 정보
+            tts_settings: TTS 설정 (None이면 TTS 확인 안 함)
+
+        Returns:
+            {"scripts": [챕터 번호], "scenes": [챕터 번호], "image_prompts": [캐릭터 이름], "tts": [챕터 번호],
+             "reasons": {생성물 ID: [바뀐 입력]}}
+        """
+        plan: Dict[str, Any] = {"scripts": [], "scenes": [], "image_prompts": [], "tts": [], "reasons": {}}
+
+        def check(kind: str, key: Any, inputs: Dict[str, str], force: bool = False) -> bool:
+            changed = ["script"] if force else self.changed_inputs(kind, key, inputs)
+            if changed:
+                plan["reasons"][self.artifact_id(kind, key)] = changed
+            return bool(changed)
+
+        for chapter in chapters:
+            number = chapter.get("chapter_number", 0)
+            script = str(chapter.get("script", "") or "")
+            script_stale = not script or check("script", number, script_inputs(chapter, synopsis, characters_info))
+            if script_stale:
+                plan["scripts"].append(number)
+                plan["reasons"].setdefault(self.artifact_id("script", number), ["missing"])
+
+            if check("scenes", number, scenes_inputs(chapter, script, synopsis, characters_info,
+                                                     character_prompts_info), force=script_stale):
+                plan["scenes"].append(number)
+
+            if tts_settings is not None and self.get("tts", number) is not None:
+                if check("tts", number, tts_inputs(script, tts_settings), force=script_stale):
+                    plan["tts"].append(number)
+
+        for character in characters or []:
+            name = character.get("name", "")
+            if check("image_prompts", name, image_prompts_inputs(character, synopsis)):
+                plan["image_prompts"].append(name)
+
+        return plan
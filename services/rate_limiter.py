@@ -0,0 +1,98 @@
+"""
+요청 속도 제한
+제공자별 RPM(분당 요청 수)/TPM(분당 토큰 수) 한도를 지키기 위한 토큰 버킷 리미터입니다.
+고정 sleep 대신 한도에 도달했을 때만 필요한 만큼 대기합니다.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional, Dict
+
+
+class TokenBucketRateLimiter:
+    """RPM/TPM 토큰 버킷 리미터 (asyncio/스레드 양쪽에서 사용 가능)"""
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Args:
+            rpm: 분당 최대 요청 수 (None이면 제한 없음)
+            tpm: 분당 최대 토큰 수 (None이면 제한 없음)
+        """
+        self.rpm = float(rpm) if rpm else None
+        self.tpm = float(tpm) if tpm else None
+        self._request_tokens = self.rpm or 0.0
+        self._token_tokens = self.tpm or 0.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    def _refill(self, now: float):
+        """경과 시간만큼 버킷 충전 (lock 안에서 호출)"""
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self.rpm:
+            self._request_tokens = min(self.rpm, self._request_tokens + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._token_tokens = min(self.tpm, self._token_tokens + elapsed * self.tpm / 60.0)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        버킷에서 요청 1건 + tokens만큼 차감 시도
+
+        Returns:
+            0이면 획득 성공, 양수면 다시 시도하기까지 기다려야 할 초
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            # 한 요청이 TPM 전체보다 크면 버킷이 가득 찼을 때 통과시킨다
+            tokens = min(float(tokens), self.tpm) if self.tpm else 0.0
+
+            wait = 0.0
+            if self.rpm and self._request_tokens < 1.0:
+                wait = max(wait, (1.0 - self._request_tokens) * 60.0 / self.rpm)
+            if self.tpm and self._token_tokens < tokens:
+                wait = max(wait, (tokens - self._token_tokens) * 60.0 / self.tpm)
+            if wait > 0:
+                return wait
+
+            if self.rpm:
+                self._request_tokens -= 1.0
+            if self.tpm:
+                self._token_tokens -= tokens
+            return 0.0
+
+    async def acquire(self, tokens: int = 0):
+        """한도 내에서 요청 가능해질 때까지 비동기 대기"""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            self.total_wait += wait
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self, tokens: int = 0):
+        """한도 내에서 요청 가능해질 때까지 현재 스레드에서 대기"""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            self.total_wait += wait
+            time.sleep(wait)
+
+
+def build_rate_limiters(limits: Dict[str, Dict[str, float]]) -> Dict[str, TokenBucketRateLimiter]:
+    """
+    설정 딕셔너리에서 제공자별 리미터 생성
+
+    Args:
+        limits: {"gemini": {"rpm": 15, "tpm": 1000000}, ...}
+
+    Returns:
+        제공자 이름 -> TokenBucketRateLimiter
+    """
+    limiters: Dict[str, TokenBucketRateLimiter] = {}
+    for provider, limit in (limits or {}).items():
+        if isinstance(limit, dict):
+            limiters[provider] = TokenBucketRateLimiter(limit.get("rpm"), limit.get("tpm"))
+    return limiters
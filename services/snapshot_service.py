@@ -0,0 +1,418 @@
+"""
+프로젝트 스냅샷 (버전 기록)
+프로젝트 JSON/MD/TXT 파일을 내용 해시(sha256) 기준으로 압축 저장하고, 스냅샷마다 파일 목록(매니페스트)만 따로 기록합니다.
+같은 내용은 스냅샷이 여러 개여도 한 번만 저장되며, 바뀌지 않은 파일은 stat만 확인해 이전 해시를 재사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+from services.write_queue import atomic_write_text, atomic_write_bytes
+
+# 스냅샷 저장 폴더 (점으로 시작하므로 프로젝트 감시/스캔 대상에서 제외됨)
+SNAPSHOT_DIR_NAME = ".snapshots"
+
+# 스냅샷에 포함하는 파일 (이미지/음성 등 미디어는 제외)
+SNAPSHOT_SUFFIXES = (".json", ".md", ".txt")
+
+# 매니페스트 형식 (구조가 바뀌면 올림)
+MANIFEST_VERSION = 1
+
+# 스냅샷 직전에 수정된 파일은 같은 mtime으로 다시 바뀌었을 수 있으므로 stat을 믿지 않고 다시 읽음
+RACY_WINDOW_NS = 2_000_000_000
+
+# 객체 압축 수준 (zlib)
+COMPRESS_LEVEL = 6
+
+
+def _is_tracked(name: str) -> bool:
+    """스냅샷 대상 파일인지 (숨김 파일, 임시 파일, 스트리밍 초안 제외)"""
+    if name.startswith(".") or name.startswith("~$") or name.endswith(".tmp"):
+        return False
+    if name.endswith(".partial.txt"):
+        return False
+    return name.lower().endswith(SNAPSHOT_SUFFIXES)
+
+
+class SnapshotStore:
+    """
+    프로젝트별 스냅샷 저장소 (project/.snapshots/)
+
+    objects/ab/<sha256>: zlib 압축한 파일 내용 (같은 내용은 한 번만 저장)
+    manifests/<id>.json: 스냅샷 시점의 {상대 경로: {hash, size, mtime_ns}} 목록
+    """
+
+    def __init__(self, project_path: Path, fsync: bool = True):
+        """
+        Args:
+            project_path: 프로젝트 폴더 경로
+            fsync: 객체/매니페스트를 fsync 후 교체할지 여부
+        """
+        self.project_path = Path(project_path)
+        self.root = self.project_path / SNAPSHOT_DIR_NAME
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        # 마지막으로 읽거나 쓴 매니페스트 (다음 스냅샷의 stat 비교 기준)
+        self._latest: Optional[Dict[str, Any]] = None
+
+    # ===== 내부 =====
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _manifest_path(self, snapshot_id: str) -> Path:
+        return self.manifests_dir / f"{snapshot_id}.json"
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """프로젝트 폴더 스캔 (상대 경로(/ 구분) -> stat)"""
+        found: Dict[str, os.stat_result] = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            directory = self.project_path / rel_dir if rel_dir else self.project_path
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not entry.name.startswith("."):
+                                    stack.append(rel)
+                            elif entry.is_file() and _is_tracked(entry.name):
+                                found[rel] = entry.stat()
+                        except OSError:
+                            continue
+            except OSError as e:
+                print(f"스냅샷 폴더 스캔 오류: {directory} ({e})")
+        return found
+
+    def _read_manifest(self, snapshot_id: str) -> Dict[str, Any]:
+        """
+        매니페스트 읽기
+
+        Raises:
+            KeyError: 스냅샷이 없거나 읽을 수 없는 경우
+        """
+        try:
+            with open(self._manifest_path(snapshot_id), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise KeyError(f"스냅샷을 찾을 수 없음: {snapshot_id} ({e})")
+        if manifest.get("version") != MANIFEST_VERSION or not isinstance(manifest.get("files"), dict):
+            raise KeyError(f"지원하지 않는 스냅샷 형식: {snapshot_id}")
+        return manifest
+
+    def _latest_manifest(self) -> Optional[Dict[str, Any]]:
+        """가장 최근 스냅샷의 매니페스트 (없으면 None)"""
+        if self._latest is None:
+            ids = self._snapshot_ids()
+            for snapshot_id in reversed(ids):
+                try:
+                    self._latest = self._read_manifest(snapshot_id)
+                    break
+                except KeyError:
+                    continue
+        return self._latest
+
+    def _snapshot_ids(self) -> List[str]:
+        """스냅샷 ID 목록 (오래된 순, ID가 생성 시각 순으로 정렬됨)"""
+        try:
+            names = os.listdir(self.manifests_dir)
+        except OSError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith(".json") and not name.startswith("."))
+
+    def _new_snapshot_id(self) -> str:
+        """생성 시각 기반 스냅샷 ID (같은 시각이면 뒤에 번호 추가)"""
+        base = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        snapshot_id = base
+        counter = 1
+        while self._manifest_path(snapshot_id).exists():
+            snapshot_id = f"{base}-{counter}"
+            counter += 1
+        return snapshot_id
+
+    def _hash_file(self, rel: str, store: bool, stats: Dict[str, int]) -> Optional[str]:
+        """
+        파일 내용 해시 (store면 객체가 없을 때 압축해서 저장)
+
+        Returns:
+            sha256 해시 또는 None (읽기 실패)
+        """
+        try:
+            with open(self.project_path / rel, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            print(f"스냅샷 파일 읽기 오류: {rel} ({e})")
+            return None
+        stats["hashed"] += 1
+        digest = hashlib.sha256(data).hexdigest()
+        if store:
+            object_path = self._object_path(digest)
+            if not object_path.exists():
+                compressed = zlib.compress(data, COMPRESS_LEVEL)
+                atomic_write_bytes(object_path, compressed, fsync=self.fsync)
+                stats["new_objects"] += 1
+                stats["bytes_written"] += len(compressed)
+        return digest
+
+    def _collect(self, store: bool) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+        """
+        현재 프로젝트 파일 목록과 해시 수집 (최근 매니페스트와 stat이 같은 파일은 읽지 않음)
+
+        Returns:
+            (파일 목록, 통계)
+        """
+        stats = {"files": 0, "hashed": 0, "reused": 0, "new_objects": 0, "bytes_written": 0}
+        latest = self._latest_manifest()
+        previous = latest["files"] if latest else {}
+        trusted_before = (latest.get("created_ns", 0) - RACY_WINDOW_NS) if latest else 0
+
+        files: Dict[str, Dict[str, Any]] = {}
+        for rel, st in sorted(self._scan().items()):
+            entry = previous.get(rel)
+            if (entry is not None and entry.get("size") == st.st_size
+                    and entry.get("mtime_ns") == st.st_mtime_ns and st.st_mtime_ns < trusted_before):
+                digest = entry["hash"]
+                stats["reused"] += 1
+            else:
+                digest = self._hash_file(rel, store, stats)
+                if digest is None:
+                    continue
+            files[rel] = {"hash": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        stats["files"] = len(files)
+        return files, stats
+
+    # ===== 스냅샷 =====
+
+    def create_snapshot(self, label: str = "") -> Dict[str, Any]:
+        """
+        스냅샷 생성 (바뀐 파일만 읽어 새 객체로 저장, 나머지는 매니페스트에 해시만 기록)
+
+        Args:
+            label: 스냅샷 설명
+
+        Returns:
+            {"id", "label", "created_at", "files", "hashed", "reused", "new_objects", "bytes_written"}
+        """
+        with self._lock:
+            files, stats = self._collect(store=True)
+            created_ns = time.time_ns()
+            snapshot_id = self._new_snapshot_id()
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "id": snapshot_id,
+                "label": label,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "created_ns": created_ns,
+                "files": files,
+            }
+            atomic_write_text(self._manifest_path(snapshot_id),
+                              json.dumps(manifest, ensure_ascii=False), fsync=self.fsync)
+            self._latest = manifest
+        result = {"id": snapshot_id, "label": label, "created_at": manifest["created_at"]}
+        result.update(stats)
+        return result
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        스냅샷 목록 (최근 순)
+
+        Returns:
+            [{"id", "label", "created_at", "files", "size"}]
+        """
+        snapshots = []
+        with self._lock:
+            for snapshot_id in reversed(self._snapshot_ids()):
+                try:
+                    manifest = self._read_manifest(snapshot_id)
+                except KeyError as e:
+                    print(f"스냅샷 목록 오류: {e}")
+                    continue
+                files = manifest["files"]
+                snapshots.append({
+                    "id": snapshot_id,
+                    "label": manifest.get("label", ""),
+                    "created_at": manifest.get("created_at", ""),
+                    "files": len(files),
+                    "size": sum(entry.get("size", 0) for entry in files.values()),
+                })
+        return snapshots
+
+    def read_file(self, snapshot_id: str, rel_path: str) -> bytes:
+        """
+        스냅샷에 저장된 파일 내용
+
+        Raises:
+            KeyError: 스냅샷 또는 파일이 없는 경우
+        """
+        with self._lock:
+            entry = self._read_manifest(snapshot_id)["files"].get(rel_path)
+            if entry is None:
+                raise KeyError(f"스냅샷에 없는 파일: {rel_path}")
+            return self._read_object(entry["hash"])
+
+    def _read_object(self, digest: str) -> bytes:
+        """객체 읽기 (압축 해제 후 해시 검증)"""
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                data = zlib.decompress(f.read())
+        except (OSError, zlib.error) as e:
+            raise KeyError(f"스냅샷 객체를 읽을 수 없음: {digest} ({e})")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise KeyError(f"스냅샷 객체가 손상됨: {digest}")
+        return data
+
+    def diff(self, old_id: str, new_id: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        두 스냅샷(또는 스냅샷과 현재 프로젝트) 비교
+
+        Args:
+            old_id: 기준 스냅샷 ID
+            new_id: 비교할 스냅샷 ID (None이면 현재 프로젝트 파일)
+
+        Returns:
+            {"added": [...], "removed": [...], "modified": [...]} (상대 경로)
+        """
+        with self._lock:
+            old_files = self._read_manifest(old_id)["files"]
+            if new_id is None:
+                new_files, _ = self._collect(store=False)
+            else:
+                new_files = self._read_manifest(new_id)["files"]
+        return {
+            "added": sorted(rel for rel in new_files if rel not in old_files),
+            "removed": sorted(rel for rel in old_files if rel not in new_files),
+            "modified": sorted(
+                rel for rel, entry in new_files.items()
+                if rel in old_files and old_files[rel]["hash"] != entry["hash"]
+            ),
+        }
+
+    def restore(self, snapshot_id: str, paths: Optional[Iterable[str]] = None,
+                backup: bool = True) -> Dict[str, Any]:
+        """
+        스냅샷 시점으로 파일 복원 (내용이 다른 파일만 다시 쓰고, 전체 복원이면 스냅샷 이후 생긴 파일 삭제)
+
+        Args:
+            snapshot_id: 복원할 스냅샷 ID
+            paths: 복원할 상대 경로 목록 (None이면 전체)
+            backup: 복원 전에 현재 상태를 스냅샷으로 남길지 여부
+
+        Returns:
+            {"backup_id", "written": [...], "removed": [...]}
+
+        Raises:
+            KeyError: 스냅샷 또는 객체가 없는 경우
+        """
+        with self._lock:
+            target = self._read_manifest(snapshot_id)["files"]
+            backup_id = None
+            if backup:
+                backup_id = self.create_snapshot(f"복원 전 자동 저장 ({snapshot_id})")["id"]
+            current, _ = self._collect(store=False)
+
+            selected = set(paths) if paths is not None else None
+            written = []
+            removed = []
+            for rel, entry in sorted(target.items()):
+                if selected is not None and rel not in selected:
+                    continue
+                existing = current.get(rel)
+                if existing is not None and existing["hash"] == entry["hash"]:
+                    continue
+                atomic_write_bytes(self.project_path / rel, self._read_object(entry["hash"]), fsync=self.fsync)
+                written.append(rel)
+
+            for rel in sorted(current):
+                if rel in target or (selected is not None and rel not in selected):
+                    continue
+                try:
+                    (self.project_path / rel).unlink()
+                    removed.append(rel)
+                except OSError as e:
+                    print(f"스냅샷 복원 중 파일 삭제 오류: {rel} ({e})")
+        return {"backup_id": backup_id, "written": written, "removed": removed}
+
+    # ===== 정리 =====
+
+    def delete_snapshot(self, snapshot_id: str) -> bool:
+        """스냅샷 매니페스트 삭제 (객체는 gc()에서 정리)"""
+        with self._lock:
+            try:
+                self._manifest_path(snapshot_id).unlink()
+            except OSError:
+                return False
+            if self._latest is not None and self._latest.get("id") == snapshot_id:
+                self._latest = None
+            return True
+
+    def prune(self, keep: int) -> Dict[str, int]:
+        """
+        최근 keep개만 남기고 오래된 스냅샷 삭제 후 gc()
+
+        Returns:
+            {"deleted_snapshots", "deleted_objects", "freed_bytes"}
+        """
+        with self._lock:
+            deleted = 0
+            ids = self._snapshot_ids()
+            for snapshot_id in ids[:max(0, len(ids) - max(keep, 0))]:
+                if self.delete_snapshot(snapshot_id):
+                    deleted += 1
+            result = {"deleted_snapshots": deleted}
+            result.update(self.gc())
+        return result
+
+    def gc(self) -> Dict[str, int]:
+        """
+        어떤 매니페스트에서도 참조하지 않는 객체와 남은 임시 파일 삭제
+
+        Returns:
+            {"deleted_objects", "freed_bytes"}
+        """
+        with self._lock:
+            referenced = set()
+            for snapshot_id in self._snapshot_ids():
+                try:
+                    files = self._read_manifest(snapshot_id)["files"]
+                except KeyError as e:
+                    # 읽을 수 없는 매니페스트가 있으면 필요한 객체를 지울 수 있으므로 중단
+                    print(f"스냅샷 정리 중단: {e}")
+                    return {"deleted_objects": 0, "freed_bytes": 0}
+                referenced.update(entry["hash"] for entry in files.values())
+
+            deleted = 0
+            freed = 0
+            try:
+                buckets = list(os.scandir(self.objects_dir))
+            except OSError:
+                buckets = []
+            for bucket in buckets:
+                if not bucket.is_dir():
+                    continue
+                with os.scandir(bucket.path) as entries:
+                    for entry in entries:
+                        if entry.name in referenced:
+                            continue
+                        try:
+                            size = entry.stat().st_size
+                            os.unlink(entry.path)
+                        except OSError:
+                            continue
+                        deleted += 1
+                        freed += size
+                try:
+                    os.rmdir(bucket.path)
+                except OSError:
+                    pass
+        return {"deleted_objects": deleted, "freed_bytes": freed}
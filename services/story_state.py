@@ -0,0 +1,168 @@
+"""
+스토리 진행 상태 캐시
+챕터별 대본 요약을 대본 내용 해시와 함께 프로젝트 폴더에 저장합니다.
+대본이 바뀐 챕터만 다시 요약하고, 다음 챕터 대본 생성 시 이전 챕터 요약 전체를 연속성 자료로 제공합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+from services.write_queue import atomic_write_text
+
+
+# 같은 캐시 파일을 쓰는 인스턴스끼리 공유하는 잠금 (탭마다 만든 인스턴스가 서로의 요약을 덮어쓰지 않도록)
+_PATH_LOCKS: Dict[str, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    with _PATH_LOCKS_GUARD:
+        return _PATH_LOCKS.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class StoryStateCache:
+    """챕터 요약 캐시 (프로젝트별 story_state.json)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 캐시 파일 경로 (FileService.get_story_state_path())
+        """
+        self.path = Path(path)
+        self._lock = _path_lock(self.path)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # 마지막으로 읽거나 쓴 시점의 파일 stat (mtime_ns, size)
+        self._loaded_stat: Optional[Tuple[int, int]] = None
+
+    @staticmethod
+    def hash_script(script: str) -> str:
+        """대본 내용 해시 (앞뒤 공백 무시)"""
+        return hashlib.sha256((script or "").strip().encode("utf-8")).hexdigest()
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시 파일 로드 (_lock 안에서 호출)
+
+        Args:
+            force: True면 항상 파일을 다시 읽음 (저장 전 병합용), 아니면 파일 stat이 바뀐 경우만
+        """
+        stat = self._file_stat()
+        if force or self._entries is None or stat != self._loaded_stat:
+            entries: Dict[str, Dict[str, Any]] = {}
+            if stat is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict) and isinstance(data.get("chapters"), dict):
+                        entries = data["chapters"]
+                except Exception as e:
+                    print(f"스토리 상태 로드 오류: {e}")
+            self._entries = entries
+            self._loaded_stat = stat
+        return self._entries
+
+    def _save(self):
+        """캐시 파일 저장 (_lock 안에서 호출, 임시 파일에 쓴 뒤 교체)"""
+        try:
+            text = json.dumps({"chapters": self._entries}, ensure_ascii=False, indent=2)
+            atomic_write_text(self.path, text, fsync=False)
+            self._loaded_stat = self._file_stat()
+        except Exception as e:
+            print(f"스토리 상태 저장 오류: {e}")
+
+    def get_summary(self, chapter_number: int, script: str) -> Optional[str]:
+        """
+        저장된 챕터 요약 조회
+
+        Args:
+            chapter_number: 챕터 번호
+            script: 현재 대본 (해시가 다르면 무효)
+
+        Returns:
+            요약 또는 None (없거나 대본이 바뀐 경우)
+        """
+        with self._lock:
+            entry = self._load().get(str(chapter_number))
+        if entry and entry.get("script_hash") == self.hash_script(script):
+            return entry.get("summary")
+        return None
+
+    def set_summary(self, chapter_number: int, script: str, summary: str):
+        """
+        챕터 요약 저장
+
+        Args:
+            chapter_number: 챕터 번호
+            script: 요약한 대본
+            summary: 요약 텍스트
+        """
+        with self._lock:
+            # 다른 인스턴스가 그사이 저장한 요약을 지우지 않도록 파일을 다시 읽어 병합
+            self._load(force=True)[str(chapter_number)] = {
+                "script_hash": self.hash_script(script),
+                "summary": summary,
+                "updated_at": datetime.now().isoformat(),
+            }
+            self._save()
+
+    def get_summaries(
+        self,
+        scripts: Dict[int, str],
+        summarize: Callable[[Dict[int, str]], Dict[int, Optional[str]]],
+    ) -> Dict[int, str]:
+        """
+        챕터별 요약 반환 (없거나 대본이 바뀐 챕터만 새로 요약)
+
+        Args:
+            scripts: {챕터 번호: 대본}
+            summarize: {챕터 번호: 대본}을 받아 {챕터 번호: 요약}을 반환하는 함수
+
+        Returns:
+            {챕터 번호: 요약} (요약에 실패한 챕터는 제외)
+        """
+        summaries: Dict[int, str] = {}
+        stale: Dict[int, str] = {}
+        for chapter_number, script in scripts.items():
+            if not (script or "").strip():
+                continue
+            cached = self.get_summary(chapter_number, script)
+            if cached:
+                summaries[chapter_number] = cached
+            else:
+                stale[chapter_number] = script
+
+        if stale:
+            for chapter_number, summary in summarize(stale).items():
+                if summary:
+                    self.set_summary(chapter_number, stale[chapter_number], summary)
+                    summaries[chapter_number] = summary
+
+        return dict(sorted(summaries.items()))
+
+    def prune(self, chapter_numbers: List[int]):
+        """
+        더 이상 없는 챕터의 요약 삭제
+
+        Args:
+            chapter_numbers: 현재 프로젝트의 챕터 번호 리스트
+        """
+        keep = {str(n) for n in chapter_numbers}
+        with self._lock:
+            entries = self._load(force=True)
+            removed = [key for key in entries if key not in keep]
+            for key in removed:
+                del entries[key]
+            if removed:
+                self._save()
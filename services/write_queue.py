@@ -0,0 +1,239 @@
+"""
+지연 쓰기(write-behind) 큐
+파일 저장을 백그라운드 스레드에서 처리하고, 같은 경로에 대한 연속 저장은 마지막 내용만 씁니다.
+모든 쓰기는 임시 파일 + fsync + 교체(os.replace)로 처리해 중간에 종료되어도 파일이 깨지지 않습니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+# 대기 중인 삭제 작업 표시 (내용 대신 저장)
+DELETE = None
+
+
+def atomic_write_text(path: Path, text: str, fsync: bool = True):
+    """
+    텍스트 파일 원자적 저장 (같은 폴더의 임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path: 저장할 파일 경로
+        text: 파일 내용
+        fsync: 교체 전에 디스크에 기록될 때까지 대기할지 여부
+
+    Raises:
+        파일 쓰기 오류 (임시 파일은 삭제)
+    """
+    _atomic_write(path, text, "w", fsync)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = True):
+    """
+    바이너리 파일 원자적 저장 (atomic_write_text와 같은 방식, 내용을 그대로 기록)
+
+    Args:
+        path: 저장할 파일 경로
+        data: 파일 내용
+        fsync: 교체 전에 디스크에 기록될 때까지 대기할지 여부
+
+    Raises:
+        파일 쓰기 오류 (임시 파일은 삭제)
+    """
+    _atomic_write(path, data, "wb", fsync)
+
+
+def _atomic_write(path: Path, content, mode: str, fsync: bool):
+    """임시 파일에 쓰고 fsync 후 교체 (mode: "w" 텍스트, "wb" 바이너리)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if mode == "wb":
+            f = open(tmp_path, "wb")
+        else:
+            f = open(tmp_path, "w", encoding="utf-8")
+        with f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # 교체(이름 변경) 자체도 디스크에 남도록 폴더 fsync (POSIX만)
+        try:
+            fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+class WriteBehindQueue:
+    """경로별 마지막 쓰기/삭제만 남기는 백그라운드 저장 큐 (단일 작업 스레드, 경로 단위 순서 보장)"""
+
+    def __init__(self, fsync: bool = True):
+        """
+        Args:
+            fsync: 파일마다 fsync 후 교체할지 여부
+        """
+        self.fsync = fsync
+        self._cond = threading.Condition()
+        # 경로 -> 내용 (DELETE면 삭제), 삽입 순서 = 처리 순서
+        self._pending: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        # 작업 스레드가 처리 중인 항목 (처리가 끝날 때까지 읽기 요청에 내용을 보여줌)
+        self._in_flight: Optional[Tuple[str, Optional[str]]] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, int] = {"submitted": 0, "coalesced": 0, "written": 0, "deleted": 0, "failed": 0}
+        self.errors: List[Tuple[str, str]] = []
+
+    def _ensure_thread(self):
+        """작업 스레드 시작 (최초 사용 시, _cond 안에서 호출)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def submit(self, path: Path, text: str):
+        """
+        파일 쓰기 예약 (같은 경로에 대기 중인 작업이 있으면 이 내용으로 교체)
+
+        Args:
+            path: 파일 경로
+            text: 파일 내용
+        """
+        self._enqueue(path, text)
+
+    def delete(self, path: Path):
+        """파일 삭제 예약 (대기 중인 쓰기는 취소)"""
+        self._enqueue(path, DELETE)
+
+    def _enqueue(self, path: Path, content: Optional[str]):
+        key = str(path)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("write queue is closed")
+            self.stats["submitted"] += 1
+            if key in self._pending:
+                self.stats["coalesced"] += 1
+                del self._pending[key]
+            self._pending[key] = content
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def is_pending(self, path: Path) -> bool:
+        """해당 경로에 아직 끝나지 않은 작업이 있는지"""
+        key = str(path)
+        with self._cond:
+            return key in self._pending or (self._in_flight is not None and self._in_flight[0] == key)
+
+    def get_pending(self, paths: List[Path]) -> Dict[str, Optional[str]]:
+        """
+        끝나지 않은 작업 조회 (읽기 요청이 방금 저장한 내용을 보도록)
+
+        Returns:
+            {경로 문자열: 내용 또는 DELETE(None)} - 대기 중인 경로만 포함
+        """
+        keys = {str(p) for p in paths}
+        with self._cond:
+            result: Dict[str, Optional[str]] = {}
+            if self._in_flight is not None and self._in_flight[0] in keys:
+                result[self._in_flight[0]] = self._in_flight[1]
+            for key, content in self._pending.items():
+                if key in keys:
+                    result[key] = content
+            return result
+
+    def get_pending_in(self, directory: Path) -> Dict[str, Optional[str]]:
+        """폴더 바로 아래 경로의 끝나지 않은 작업 조회 (get_pending과 같은 형식)"""
+        directory = str(Path(directory))
+        with self._cond:
+            items = list(self._pending.items())
+            if self._in_flight is not None:
+                items.insert(0, self._in_flight)
+        return {key: content for key, content in items if str(Path(key).parent) == directory}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        지금까지 예약한 작업이 모두 끝날 때까지 대기 (종료/프로젝트 전환 시 호출)
+
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+            모두 끝났는지 여부 (시간 초과면 False)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._in_flight is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def _run(self):
+        """작업 스레드: 대기 중인 작업을 순서대로 처리"""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                self._in_flight = self._pending.popitem(last=False)
+            key, content = self._in_flight
+            try:
+                if content is DELETE:
+                    try:
+                        os.unlink(key)
+                    except FileNotFoundError:
+                        pass
+                    outcome = "deleted"
+                else:
+                    atomic_write_text(Path(key), content, fsync=self.fsync)
+                    outcome = "written"
+            except Exception as e:
+                outcome = "failed"
+                print(f"파일 저장 오류 ({Path(key).name}): {e}")
+                with self._cond:
+                    self.errors.append((key, str(e)))
+                    del self.errors[:-50]
+            with self._cond:
+                self.stats[outcome] += 1
+                self._in_flight = None
+                self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """예약/병합/쓰기/삭제/실패 횟수와 대기 중인 작업 수"""
+        with self._cond:
+            stats: Dict[str, Any] = dict(self.stats)
+            stats["pending"] = len(self._pending) + (1 if self._in_flight is not None else 0)
+            return stats
+
+    def get_errors(self) -> List[Tuple[str, str]]:
+        """최근 저장 실패 목록 [(경로, 오류 메시지)] (최대 50건, 오래된 순)"""
+        with self._cond:
+            return list(self.errors)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        남은 작업을 모두 쓰고 작업 스레드 종료
+
+        Returns:
+            남은 작업을 모두 끝냈는지 여부
+        """
+        done = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return done
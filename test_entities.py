@@ -0,0 +1,115 @@
+"""
+Project Entity Model Test Script
+Checks that models.entities round-trips project JSON unchanged and that loaded entities
+still pass through the existing dict-based tab formatting (chapter scenes stay plain dicts).
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.entities import Chapter, Character, to_entity, json_default
+from models.project_data import ProjectData
+
+
+CHAPTER = {
+    "chapter_number": 3,
+    "title": "세 번째 이야기",
+    "summary": "요약",
+    "scenes": [
+        {"scene_number": 1, "description": "시장 골목에서 다시 만난 두 사람", "image_prompt": "market alley"},
+        {"scene_number": 2, "description": "비 오는 버스 정류장", "custom_field": True},
+    ],
+    "custom_key": {"nested": [1, 2]},
+}
+
+CHARACTER = {
+    "name": "김 회장",
+    "age": 72,
+    "personality": {"traits": ["고집", "다정"], "speech_style": "느릿한 말투"},
+    "image_generation_prompts": {"default": {"positive": "old man", "negative": ""}},
+    "extra_note": "메모",
+}
+
+
+def test_round_trip():
+    """Entities serialize back to the same JSON (values and key order)."""
+    print("=" * 50)
+    print("Testing entity JSON round-trip...")
+    print("=" * 50)
+
+    for kind, data in (("chapters", CHAPTER), ("characters", CHARACTER)):
+        entity = to_entity(kind, json.loads(json.dumps(data)))
+        expected = json.dumps(data, ensure_ascii=False, indent=2)
+        actual = json.dumps(entity, ensure_ascii=False, indent=2, default=json_default)
+        assert actual == expected, f"{kind} round-trip changed:\n{actual}"
+        assert entity.to_dict() == data
+        assert list(entity.keys()) == list(data.keys())
+    print("[OK] chapter and character round-trip unchanged")
+    return True
+
+
+def test_nested_values_stay_dicts():
+    """Values inside entities (scene list, nested dicts) keep their JSON types."""
+    print("\n" + "=" * 50)
+    print("Testing nested value types...")
+    print("=" * 50)
+
+    project_data = ProjectData("", typed_entities=True)
+    project_data.load_data({
+        "synopsis": {"title": "테스트", "chapters": {"chapter_01": "시작"}},
+        "characters": [dict(CHARACTER)],
+        "chapters": [json.loads(json.dumps(CHAPTER))],
+    })
+
+    chapter = project_data.get_chapter_by_number(3)
+    character = project_data.get_character_by_name("김회장")
+    assert isinstance(chapter, Chapter) and isinstance(character, Character)
+    assert all(type(scene) is dict for scene in chapter["scenes"])
+    assert type(character["personality"]) is dict
+    assert type(chapter["custom_key"]) is dict
+    print("[OK] scenes and nested fields are plain dicts")
+    return True
+
+
+def test_chapter_display_format():
+    """The chapter details tab formats entity scenes the same way as plain dict scenes."""
+    print("\n" + "=" * 50)
+    print("Testing chapter details display format...")
+    print("=" * 50)
+
+    from gui.tabs.chapter_details_input_tab import ChapterDetailsInputTab
+
+    entity = to_entity("chapters", json.loads(json.dumps(CHAPTER)))
+    formatted = ChapterDetailsInputTab._format_value(None, entity["scenes"])
+    expected = ChapterDetailsInputTab._format_value(None, CHAPTER["scenes"])
+    assert formatted == expected, formatted
+    assert formatted.startswith("[장면 1] 시장 골목에서"), formatted
+    print(formatted)
+    print("[OK] scenes display as [장면 N] lines")
+    return True
+
+
+def main():
+    results = {}
+
+    try:
+        results["round_trip"] = test_round_trip()
+        results["nested_types"] = test_nested_values_stay_dicts()
+        results["display"] = test_chapter_display_format()
+    except AssertionError as e:
+        print(f"[ERROR] {e}")
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("  Test Results Summary")
+    print("=" * 60)
+    for test_name in ("round_trip", "nested_types", "display"):
+        passed = results.get(test_name)
+        print(f"  {test_name}: {'PASSED' if passed else 'FAILED'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+스트리밍 JSON 파싱 유틸리티
+LLM 응답을 받는 대로 읽어, 지정한 배열/객체의 요소가 완성될 때마다 반환합니다.
+마크다운 코드 블록과 뒤쪽의 불필요한 텍스트는 무시하고, 잘린 응답에서도 완성된 요소는 살립니다.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class StreamingJSONParser:
+    """대상 컨테이너(배열 또는 객체)의 요소를 점진적으로 추출하는 파서"""
+
+    def __init__(self, target_key: Optional[str] = None):
+        """
+        Args:
+            target_key: 최상위 객체에서 요소를 추출할 키 (예: "scenes", "prompts")
+                        None이거나 최상위가 배열이면 최상위 컨테이너 자체를 대상으로 함
+        """
+        self.target_key = target_key
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._finished = False
+
+        # 최상위 객체의 키 추적 (대상 컨테이너 찾기용)
+        self._key_start: Optional[int] = None
+        self._last_key: Optional[str] = None
+
+        # 대상 컨테이너 상태
+        self._container_depth: Optional[int] = None
+        self._container_is_object = False
+        self._elem_start: Optional[int] = None
+        self._index = 0
+
+        self.items: List[Tuple[Any, Any]] = []
+        self.errors = 0
+
+    @property
+    def complete(self) -> bool:
+        """대상 컨테이너가 닫혔는지 여부"""
+        return self._finished
+
+    def feed(self, text: str) -> List[Tuple[Any, Any]]:
+        """
+        텍스트 조각 입력
+
+        Args:
+            text: 스트리밍으로 받은 응답 조각
+
+        Returns:
+            이번 입력으로 새로 완성된 (키 또는 인덱스, 값) 리스트
+        """
+        if self._finished or not text:
+            return []
+
+        self._buf += text
+        new_items: List[Tuple[Any, Any]] = []
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+
+        while i < n and not self._finished:
+            ch = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        try:
+                            self._last_key = json.loads(buf[self._key_start:i + 1])
+                        except ValueError:
+                            self._last_key = None
+                        self._key_start = None
+                i += 1
+                continue
+
+            if not self._started:
+                # 코드 블록 표시 등 JSON 시작 전 텍스트는 건너뜀
+                if ch in '{[':
+                    self._started = True
+                    if ch == '[' or self.target_key is None:
+                        self._open_container(ch == '{')
+                    self._depth = 1
+                i += 1
+                continue
+
+            at_container = self._container_depth is not None and self._depth == self._container_depth
+
+            if at_container and self._elem_start is None and ch not in ' \t\r\n,}]':
+                self._elem_start = i
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._container_depth is None:
+                    self._key_start = i
+            elif ch in '{[':
+                if (self._depth == 1 and self._container_depth is None
+                        and self._last_key == self.target_key):
+                    self._depth += 1
+                    self._open_container(ch == '{')
+                    i += 1
+                    continue
+                self._depth += 1
+            elif ch in '}]':
+                if at_container:
+                    self._emit(buf, i, new_items)
+                    self._finished = True
+                self._depth -= 1
+                if self._depth <= 0:
+                    self._finished = True
+            elif ch == ',' and at_container:
+                self._emit(buf, i, new_items)
+            i += 1
+
+        self._pos = i
+        self._compact()
+        return new_items
+
+    def _open_container(self, is_object: bool):
+        """대상 컨테이너 진입"""
+        # 최상위 컨테이너면 깊이 1, 최상위 객체의 값이면 깊이 2에서 요소를 구분
+        self._container_depth = max(self._depth, 1)
+        self._container_is_object = is_object
+        self._elem_start = None
+
+    def _emit(self, buf: str, end: int, new_items: List[Tuple[Any, Any]]):
+        """buf[elem_start:end] 구간을 요소 하나로 파싱"""
+        if self._elem_start is None:
+            return
+        segment = buf[self._elem_start:end].strip()
+        self._elem_start = None
+        if not segment:
+            return
+        try:
+            if self._container_is_object:
+                member = json.loads("{" + segment + "}")
+                if len(member) != 1:
+                    raise ValueError("객체 멤버 구분 오류")
+                item = next(iter(member.items()))
+            else:
+                item = (self._index, json.loads(segment))
+                self._index += 1
+        except ValueError:
+            self.errors += 1
+            return
+        self.items.append(item)
+        new_items.append(item)
+
+    def _compact(self):
+        """이미 처리한 앞부분을 버퍼에서 제거"""
+        if self._container_depth is None:
+            return
+        cut = self._elem_start if self._elem_start is not None else self._pos
+        if cut > 0:
+            self._buf = self._buf[cut:]
+            self._pos -= cut
+            if self._elem_start is not None:
+                self._elem_start -= cut
+
+    def result(self) -> Any:
+        """
+        지금까지 완성된 요소로 컨테이너 재구성
+
+        Returns:
+            객체 컨테이너면 dict, 배열 컨테이너면 list
+        """
+        if self._container_is_object:
+            return {key: value for key, value in self.items}
+        return [value for _, value in self.items]
+
+
+def iter_json_elements(chunks: Iterable[str], target_key: Optional[str] = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    텍스트 조각 스트림에서 대상 컨테이너 요소를 완성되는 대로 반환
+
+    Args:
+        chunks: 응답 텍스트 조각 (LLMService.stream() 결과 등)
+        target_key: 요소를 추출할 최상위 키
+
+    Yields:
+        (키 또는 인덱스, 값)
+    """
+    parser = StreamingJSONParser(target_key)
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.complete:
+            break
+
+
+def salvage_json_container(text: str, target_key: Optional[str] = None) -> Any:
+    """
+    잘렸거나 일부가 깨진 응답에서 완성된 요소만 추출
+
+    Args:
+        text: 전체 응답 텍스트
+        target_key: 요소를 추출할 최상위 키
+
+    Returns:
+        완성된 요소로 구성한 list/dict 또는 None (완성된 요소가 없을 경우)
+    """
+    parser = StreamingJSONParser(target_key)
+    parser.feed(text or "")
+    return parser.result() if parser.items else None
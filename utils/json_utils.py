@@ -79,3 +79,58 @@ def merge_dicts(base: Dict, update: Dict) -> Dict:
             result[key] = value
 
     return result
+
+
+def decode_prompt(value: Any) -> Any:
+    """
+    이미지 프롬프트 값을 메모리 표현으로 변환 (JSON 객체 문자열 -> dict)
+
+    캐릭터의 image_generation_prompts 값은 메모리에서는 dict로 다룬다.
+    JSON 객체가 아닌 문자열(직접 입력한 텍스트 프롬프트)은 그대로 둔다.
+
+    Args:
+        value: 프롬프트 값 (dict 또는 문자열)
+
+    Returns:
+        dict 또는 원래 값
+    """
+    if isinstance(value, str) and value.lstrip().startswith("{"):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            return value
+        if isinstance(parsed, dict):
+            return parsed
+    return value
+
+
+def decode_prompts(prompts: Any) -> Dict[str, Any]:
+    """
+    image_generation_prompts 전체를 메모리 표현으로 변환 (문자열로 저장된 과거 데이터 포함)
+
+    Args:
+        prompts: {"prompt_1": 값, ...}, 그 JSON 문자열, 또는 None
+
+    Returns:
+        값이 decode_prompt로 변환된 새 딕셔너리 (형식이 맞지 않으면 빈 딕셔너리)
+    """
+    if isinstance(prompts, str):
+        prompts = safe_json_loads(prompts, {}) if prompts.strip() else {}
+    if not isinstance(prompts, dict):
+        return {}
+    return {key: decode_prompt(value) for key, value in prompts.items()}
+
+
+def encode_prompt(value: Any) -> str:
+    """
+    이미지 프롬프트 값을 저장/표시용 문자열로 변환 (dict -> JSON 문자열)
+
+    Args:
+        value: 프롬프트 값
+
+    Returns:
+        문자열 (None이면 빈 문자열)
+    """
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return "" if value is None else str(value)
@@ -0,0 +1,142 @@
+"""
+병렬 파일 읽기 유틸리티
+여러 파일을 공용 스레드 풀에서 동시에 읽되, 결과는 입력 순서대로 반환합니다.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 공용 풀의 기본 스레드 수 (디스크/네트워크 드라이브 대기를 겹치기 위한 값, CPU 수와 무관하게 상한 유지)
+DEFAULT_IO_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_max_workers = DEFAULT_IO_WORKERS
+# 풀 스레드 안에서 다시 map_ordered를 호출하면 순차 실행 (풀이 가득 차 서로 기다리는 상황 방지)
+_local = threading.local()
+
+
+def set_io_workers(max_workers: int):
+    """
+    공용 풀 스레드 수 변경 (1 이하면 항상 순차 실행)
+
+    Args:
+        max_workers: 최대 스레드 수
+    """
+    global _executor, _max_workers
+    with _executor_lock:
+        _max_workers = max(1, int(max_workers))
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """공용 풀 반환 (최초 사용 시 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers,
+                thread_name_prefix="file-io",
+                initializer=_mark_worker,
+            )
+        return _executor
+
+
+def _mark_worker():
+    _local.in_pool = True
+
+
+def _chunks(items: List[T]) -> List[List[T]]:
+    """항목을 풀 스레드 수에 맞춰 묶음으로 나누기"""
+    # 항목마다 작업을 넣으면 작은 파일이 많을 때 큐/스레드 전환 비용이 읽기 시간보다 커지므로 묶어서 실행
+    chunk_size = max(1, -(-len(items) // (_max_workers * 4)))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _run_serial(items: List[T]) -> bool:
+    return len(items) < 2 or _max_workers <= 1 or getattr(_local, "in_pool", False)
+
+
+def imap_ordered(func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+    """
+    공용 풀에서 func를 실행하며 입력 순서대로 결과를 하나씩 반환
+
+    앞쪽 결과를 처리하는 동안 뒤쪽 항목은 풀에서 계속 실행된다.
+
+    Args:
+        func: 항목별 함수 (예외를 던지지 않도록 호출 측에서 처리)
+        items: 입력 항목
+    """
+    items = list(items)
+    if _run_serial(items):
+        for item in items:
+            yield func(item)
+        return
+    executor = _get_executor()
+    futures = [executor.submit(lambda chunk: [func(item) for item in chunk], chunk) for chunk in _chunks(items)]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """
+    공용 풀에서 func를 실행하고 입력 순서대로 결과 반환
+
+    Args:
+        func: 항목별 함수 (예외를 던지지 않도록 호출 측에서 처리)
+        items: 입력 항목
+
+    Returns:
+        결과 목록 (items와 같은 순서)
+    """
+    return list(imap_ordered(func, items))
+
+
+def read_file_bytes(path: Path) -> Tuple[Optional[bytes], Optional[Exception]]:
+    """
+    파일 1개를 바이트로 읽기 (예외는 결과에 담아 반환)
+
+    Returns:
+        (내용, 오류) - 실패 시 내용 None
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+
+def read_json_files(paths: Iterable[Path]) -> List[Tuple[Path, Any, Optional[Exception]]]:
+    """
+    JSON 파일 여러 개 읽기
+
+    파일 읽기(GIL을 놓는 I/O 대기)만 공용 풀에서 미리 읽어 두고, 파싱은 호출한 스레드에서 순서대로 한다.
+    json 파싱은 GIL을 잡고 있어 여러 스레드로 나눠도 빨라지지 않고 스레드 전환 비용만 생기기 때문이다.
+
+    Returns:
+        [(경로, 데이터, 오류)] - 입력 순서, 실패 시 데이터 None
+    """
+    paths = list(paths)
+    results: List[Tuple[Path, Any, Optional[Exception]]] = []
+    for path, (raw, error) in zip(paths, imap_ordered(read_file_bytes, paths)):
+        if error is None:
+            try:
+                results.append((path, json.loads(raw.decode("utf-8")), None))
+                continue
+            except Exception as e:
+                error = e
+        results.append((path, None, error))
+    return results
@@ -0,0 +1,172 @@
+"""
+토큰 수 추정 유틸리티
+tiktoken이 설치되어 있으면 OpenAI 모델은 정확히 세고, 그 외에는 한글 비율을 반영한 근사치를 사용합니다.
+프롬프트가 입력 예산을 넘으면 우선순위가 낮은 구간부터 줄입니다.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+# tiktoken 모듈 참조 (lazy import)
+_tiktoken = None
+_encodings: Dict[str, Any] = {}
+
+# 한글 음절/자모, 한자/가나 (대부분의 토크나이저에서 글자당 1토큰 안팎)
+_CJK_PATTERN = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏぀-ヿ一-鿿]")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+# 한글 음절당 토큰 수 (최신 토크나이저 기준 근사치, 보수적으로 높게 잡음)
+CJK_TOKENS_PER_CHAR = 0.8
+# 영문/숫자/기호는 약 4글자당 1토큰
+OTHER_CHARS_PER_TOKEN = 4.0
+
+TRIM_MARKER = "\n...(중략)...\n"
+
+
+def _import_tiktoken():
+    """tiktoken lazy import"""
+    global _tiktoken
+    if _tiktoken is None:
+        try:
+            import tiktoken
+            _tiktoken = tiktoken
+        except ImportError:
+            _tiktoken = False
+    return _tiktoken if _tiktoken is not False else None
+
+
+def _get_encoding(model: Optional[str]):
+    """OpenAI 모델용 tiktoken 인코딩 (없으면 None)"""
+    tiktoken = _import_tiktoken()
+    if tiktoken is None:
+        return None
+    key = model or ""
+    if key not in _encodings:
+        try:
+            _encodings[key] = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding("o200k_base")
+        except Exception:
+            try:
+                _encodings[key] = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                _encodings[key] = None
+    return _encodings[key]
+
+
+def estimate_tokens_heuristic(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수 근사
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    other = len(_SPACE_PATTERN.sub("", text)) - cjk
+    return int(cjk * CJK_TOKENS_PER_CHAR + other / OTHER_CHARS_PER_TOKEN + 0.999)
+
+
+def estimate_tokens(text: str, provider: Optional[str] = None, model: Optional[str] = None) -> int:
+    """
+    토큰 수 추정 (OpenAI + tiktoken이면 정확한 값)
+
+    Args:
+        text: 대상 텍스트
+        provider: 제공자 이름
+        model: 모델 이름
+
+    Returns:
+        토큰 수
+    """
+    if not text:
+        return 0
+    if provider == "openai":
+        encoding = _get_encoding(model)
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+    return estimate_tokens_heuristic(text)
+
+
+def trim_to_tokens(text: str, max_tokens: int, keep: str = "head",
+                   provider: Optional[str] = None, model: Optional[str] = None) -> str:
+    """
+    텍스트를 토큰 수 이내로 줄이기
+
+    Args:
+        text: 대상 텍스트
+        max_tokens: 허용 토큰 수
+        keep: "head"면 앞부분, "tail"이면 뒷부분(최근 내용), "both"면 앞뒤를 남김
+        provider: 제공자 이름
+        model: 모델 이름
+
+    Returns:
+        줄인 텍스트 (잘린 자리에 중략 표시)
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    if estimate_tokens(text, provider, model) <= max_tokens:
+        return text
+
+    def cut(length: int) -> str:
+        if keep == "tail":
+            return TRIM_MARKER.lstrip("\n") + text[len(text) - length:]
+        if keep == "both":
+            half = length // 2
+            return text[:half] + TRIM_MARKER + text[len(text) - (length - half):]
+        return text[:length] + TRIM_MARKER.rstrip("\n")
+
+    # 글자 수 기준 이분 탐색 (토큰 수는 글자 수에 대해 단조 증가)
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(cut(mid), provider, model) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return cut(low) if low > 0 else ""
+
+
+def fit_sections(sections: List[Dict[str, Any]], budget: int, fixed_tokens: int = 0,
+                 provider: Optional[str] = None, model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    구간별 텍스트를 입력 예산에 맞게 조정
+
+    Args:
+        sections: [{"name": str, "text": str, "priority": int, "keep": "head"|"tail"|"both", "min_tokens": int}, ...]
+                  priority가 낮은 구간부터 줄임
+        budget: 전체 입력 토큰 예산 (0 이하면 조정하지 않음)
+        fixed_tokens: 줄일 수 없는 부분(시스템 프롬프트, 지시문 등)의 토큰 수
+        provider: 제공자 이름
+        model: 모델 이름
+
+    Returns:
+        {"texts": {name: text}, "before": 조정 전 토큰, "after": 조정 후 토큰, "trimmed": [name, ...]}
+    """
+    counts = {s["name"]: estimate_tokens(s.get("text") or "", provider, model) for s in sections}
+    texts = {s["name"]: s.get("text") or "" for s in sections}
+    before = fixed_tokens + sum(counts.values())
+    result = {"texts": texts, "before": before, "after": before, "trimmed": []}
+    if budget <= 0 or before <= budget:
+        return result
+
+    overflow = before - budget
+    for section in sorted(sections, key=lambda s: s.get("priority", 0)):
+        if overflow <= 0:
+            break
+        name = section["name"]
+        current = counts[name]
+        floor = min(current, section.get("min_tokens", 0))
+        allowed = max(floor, current - overflow)
+        if allowed >= current:
+            continue
+        texts[name] = trim_to_tokens(texts[name], allowed, section.get("keep", "head"), provider, model)
+        new_count = estimate_tokens(texts[name], provider, model)
+        overflow -= current - new_count
+        counts[name] = new_count
+        result["trimmed"].append(name)
+
+    result["after"] = fixed_tokens + sum(counts.values())
+    return result